@@ -11,23 +11,25 @@ from typing import Any
 from django.contrib import admin
 from django.db.models import QuerySet
 from django.http import HttpRequest
+from core.admin import SoftDeleteAdminMixin
 
 from .models import (
     CategoriaActivo, EstadoActivo, Activo, Ubicacion,
-    Proveniencia, Marca, Taller, TipoMovimientoActivo, MovimientoActivo
+    Proveniencia, Marca, Taller, TipoMovimientoActivo, MovimientoActivo,
+    AuditoriaActivo, LecturaAuditoriaActivo
 )
 
 
 @admin.register(CategoriaActivo)
-class CategoriaActivoAdmin(admin.ModelAdmin):
-    list_display = ['codigo', 'nombre', 'activo', 'eliminado', 'fecha_creacion']
-    list_filter = ['activo', 'eliminado']
+class CategoriaActivoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    list_display = ['codigo', 'nombre', 'vida_util_meses', 'metodo_depreciacion', 'activo', 'eliminado', 'fecha_creacion']
+    list_filter = ['metodo_depreciacion', 'activo', 'eliminado']
     search_fields = ['codigo', 'nombre']
     readonly_fields = ['fecha_creacion', 'fecha_actualizacion']
 
 
 @admin.register(EstadoActivo)
-class EstadoActivoAdmin(admin.ModelAdmin):
+class EstadoActivoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'color', 'es_inicial', 'permite_movimiento', 'activo', 'eliminado']
     list_filter = ['es_inicial', 'permite_movimiento', 'activo', 'eliminado']
     search_fields = ['codigo', 'nombre']
@@ -35,7 +37,7 @@ class EstadoActivoAdmin(admin.ModelAdmin):
 
 
 @admin.register(Activo)
-class ActivoAdmin(admin.ModelAdmin):
+class ActivoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo Activo."""
 
     list_display = ['codigo', 'nombre', 'categoria', 'marca', 'estado', 'precio_unitario', 'activo', 'eliminado']
@@ -52,7 +54,7 @@ class ActivoAdmin(admin.ModelAdmin):
             'fields': ('marca', 'lote', 'numero_serie', 'codigo_barras')
         }),
         ('Precio', {
-            'fields': ('precio_unitario',)
+            'fields': ('precio_unitario', 'fecha_adquisicion')
         }),
         ('Estado del Registro', {
             'fields': ('activo', 'eliminado')
@@ -70,7 +72,7 @@ class ActivoAdmin(admin.ModelAdmin):
 
 
 @admin.register(Ubicacion)
-class UbicacionAdmin(admin.ModelAdmin):
+class UbicacionAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo Ubicacion."""
 
     list_display = ['codigo', 'nombre', 'activo', 'eliminado', 'fecha_creacion']
@@ -80,7 +82,7 @@ class UbicacionAdmin(admin.ModelAdmin):
 
 
 @admin.register(Proveniencia)
-class ProvenienciaAdmin(admin.ModelAdmin):
+class ProvenienciaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'activo', 'eliminado', 'fecha_creacion']
     list_filter = ['activo', 'eliminado']
     search_fields = ['codigo', 'nombre']
@@ -88,7 +90,7 @@ class ProvenienciaAdmin(admin.ModelAdmin):
 
 
 @admin.register(TipoMovimientoActivo)
-class TipoMovimientoActivoAdmin(admin.ModelAdmin):
+class TipoMovimientoActivoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo TipoMovimientoActivo."""
 
     list_display = ['codigo', 'nombre', 'activo', 'eliminado', 'fecha_creacion']
@@ -101,6 +103,9 @@ class TipoMovimientoActivoAdmin(admin.ModelAdmin):
 class MovimientoActivoAdmin(admin.ModelAdmin):
     """Configuración del admin para el modelo MovimientoActivo."""
 
+    # Sin SoftDeleteAdminMixin: el historial de movimientos es de solo inserción
+    # y el último movimiento define la ubicación y el responsable del activo
+
     list_display = [
         'activo', 'tipo_movimiento', 'ubicacion_destino', 'taller',
         'responsable', 'proveniencia', 'fecha_creacion', 'usuario_registro'
@@ -145,8 +150,25 @@ class MovimientoActivoAdmin(admin.ModelAdmin):
         super().save_model(request, obj, form, change)
 
 
+class LecturaAuditoriaActivoInline(admin.TabularInline):
+    model = LecturaAuditoriaActivo
+    extra = 0
+    fields = ['activo', 'usuario', 'fecha_creacion']
+    readonly_fields = ['fecha_creacion']
+    raw_id_fields = ['activo']
+
+
+@admin.register(AuditoriaActivo)
+class AuditoriaActivoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    list_display = ['numero', 'ubicacion', 'estado', 'responsable', 'fecha_creacion', 'fecha_aplicacion']
+    list_filter = ['estado', 'ubicacion']
+    search_fields = ['numero', 'ubicacion__nombre']
+    readonly_fields = ['fecha_creacion', 'fecha_actualizacion', 'fecha_aplicacion']
+    inlines = [LecturaAuditoriaActivoInline]
+
+
 @admin.register(Marca)
-class MarcaAdmin(admin.ModelAdmin):
+class MarcaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo Marca."""
 
     list_display = ['codigo', 'nombre', 'activo', 'eliminado', 'fecha_creacion']
@@ -169,7 +191,7 @@ class MarcaAdmin(admin.ModelAdmin):
 
 
 @admin.register(Taller)
-class TallerAdmin(admin.ModelAdmin):
+class TallerAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo Taller."""
 
     list_display = ['codigo', 'nombre', 'ubicacion', 'responsable', 'activo', 'eliminado']
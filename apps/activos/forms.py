@@ -14,7 +14,8 @@ from django.contrib.auth.models import User
 
 from .models import (
     Activo, CategoriaActivo, EstadoActivo, Ubicacion,
-    Proveniencia, Marca, Taller, TipoMovimientoActivo, MovimientoActivo
+    Proveniencia, Marca, Taller, TipoMovimientoActivo, MovimientoActivo,
+    AuditoriaActivo
 )
 
 
@@ -23,7 +24,10 @@ class CategoriaActivoForm(forms.ModelForm):
 
     class Meta:
         model = CategoriaActivo
-        fields = ['codigo', 'nombre', 'descripcion', 'activo']
+        fields = [
+            'codigo', 'nombre', 'descripcion',
+            'vida_util_meses', 'metodo_depreciacion', 'porcentaje_residual', 'activo'
+        ]
         widgets = {
             'codigo': forms.TextInput(
                 attrs={'class': 'form-control', 'placeholder': 'Ej: COMP'}
@@ -34,6 +38,15 @@ class CategoriaActivoForm(forms.ModelForm):
             'descripcion': forms.Textarea(
                 attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Descripción de la categoría...'}
             ),
+            'vida_util_meses': forms.NumberInput(
+                attrs={'class': 'form-control', 'min': '1', 'placeholder': 'Ej: 36'}
+            ),
+            'metodo_depreciacion': forms.Select(
+                attrs={'class': 'form-select'}
+            ),
+            'porcentaje_residual': forms.NumberInput(
+                attrs={'class': 'form-control', 'min': '0', 'max': '100', 'step': '0.01'}
+            ),
             'activo': forms.CheckboxInput(
                 attrs={'class': 'form-check-input'}
             ),
@@ -85,7 +98,7 @@ class ActivoForm(forms.ModelForm):
             'codigo', 'nombre', 'descripcion',
             'categoria', 'estado', 'marca',
             'lote', 'numero_serie', 'codigo_barras',
-            'precio_unitario', 'activo'
+            'precio_unitario', 'fecha_adquisicion', 'activo'
         ]
         widgets = {
             'codigo': forms.TextInput(
@@ -118,6 +131,10 @@ class ActivoForm(forms.ModelForm):
             'precio_unitario': forms.NumberInput(
                 attrs={'class': 'form-control', 'min': '0', 'step': '0.01'}
             ),
+            'fecha_adquisicion': forms.DateInput(
+                attrs={'class': 'form-control', 'type': 'date'},
+                format='%Y-%m-%d'
+            ),
             'activo': forms.CheckboxInput(
                 attrs={'class': 'form-check-input'}
             ),
@@ -250,6 +267,137 @@ class MovimientoActivoForm(forms.ModelForm):
         self.fields['proveniencia'].required = False
 
 
+class MovimientoMasivoActivoForm(forms.Form):
+    """
+    Formulario para registrar el mismo movimiento para varios activos.
+
+    Los activos se indican seleccionándolos o leyendo sus códigos de barras
+    (uno por línea o separados por comas).
+    """
+
+    activos = forms.ModelMultipleChoiceField(
+        queryset=Activo.objects.none(),
+        required=False,
+        widget=forms.SelectMultiple(attrs={'class': 'form-select', 'size': 8}),
+        label='Activos',
+        help_text='Se suman a los códigos ingresados (Ctrl+clic para seleccionar varios)'
+    )
+    codigos = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={
+            'class': 'form-control',
+            'rows': 8,
+            'placeholder': 'Escanee o escriba los códigos, uno por línea...',
+            'autofocus': True
+        }),
+        label='Códigos / códigos de barras',
+        help_text='Se acepta el código interno o el código de barras del activo'
+    )
+    tipo_movimiento = forms.ModelChoiceField(
+        queryset=TipoMovimientoActivo.objects.none(),
+        widget=forms.Select(attrs={'class': 'form-select'}),
+        label='Tipo de Movimiento'
+    )
+    ubicacion_destino = forms.ModelChoiceField(
+        queryset=Ubicacion.objects.none(),
+        widget=forms.Select(attrs={'class': 'form-select'}),
+        label='Ubicación Destino'
+    )
+    responsable = forms.ModelChoiceField(
+        queryset=User.objects.none(),
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-select'}),
+        label='Responsable'
+    )
+    observaciones = forms.CharField(
+        required=False,
+        widget=forms.Textarea(attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Observaciones adicionales...'}),
+        label='Observaciones'
+    )
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Inicializa el formulario configurando querysets filtrados."""
+        super().__init__(*args, **kwargs)
+        self.fields['activos'].queryset = Activo.objects.filter(activo=True).only('codigo', 'nombre')
+        self.fields['tipo_movimiento'].queryset = TipoMovimientoActivo.objects.filter(activo=True)
+        self.fields['ubicacion_destino'].queryset = Ubicacion.objects.filter(activo=True)
+        self.fields['responsable'].queryset = User.objects.filter(is_active=True).order_by('username')
+
+    def clean_codigos(self) -> list[str]:
+        """Separa los códigos leídos (líneas o comas), sin vacíos ni duplicados."""
+        texto = self.cleaned_data.get('codigos') or ''
+        codigos = [codigo.strip() for codigo in texto.replace(',', '\n').splitlines()]
+        return list(dict.fromkeys(codigo for codigo in codigos if codigo))
+
+    def clean(self) -> dict[str, Any]:
+        """Exige al menos un activo seleccionado o un código."""
+        cleaned_data = super().clean()
+        if not cleaned_data.get('activos') and not cleaned_data.get('codigos'):
+            raise forms.ValidationError('Seleccione activos o ingrese al menos un código.')
+        return cleaned_data
+
+
+class ImportarActivosForm(forms.Form):
+    """Formulario para la importación masiva de activos desde CSV o XLSX."""
+
+    archivo = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={
+            'class': 'form-control',
+            'accept': '.csv,.xlsx'
+        }),
+        label='Archivo',
+        help_text='Planilla CSV o XLSX con una fila de encabezados'
+    )
+    dry_run = forms.BooleanField(
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'}),
+        label='Solo validar (no guardar)'
+    )
+
+    def clean_archivo(self) -> Any:
+        """Valida la extensión del archivo."""
+        archivo = self.cleaned_data['archivo']
+        if not archivo.name.lower().endswith(('.csv', '.xlsx')):
+            raise forms.ValidationError('El archivo debe ser CSV o XLSX.')
+        return archivo
+
+
+class AuditoriaActivoForm(forms.ModelForm):
+    """Formulario para abrir una auditoría de activos en una ubicación."""
+
+    class Meta:
+        model = AuditoriaActivo
+        fields = ['ubicacion', 'observaciones']
+        widgets = {
+            'ubicacion': forms.Select(
+                attrs={'class': 'form-select'}
+            ),
+            'observaciones': forms.Textarea(
+                attrs={'class': 'form-control', 'rows': 3, 'placeholder': 'Observaciones de la auditoría (opcional)'}
+            ),
+        }
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Inicializa el formulario con las ubicaciones activas."""
+        super().__init__(*args, **kwargs)
+        self.fields['ubicacion'].queryset = Ubicacion.objects.filter(activo=True).order_by('nombre')
+
+
+class LecturasAuditoriaForm(forms.Form):
+    """Formulario para escanear los activos de una auditoría."""
+
+    lecturas = forms.CharField(
+        widget=forms.Textarea(attrs={
+            'class': 'form-control font-monospace',
+            'rows': 8,
+            'placeholder': 'Un código por línea',
+            'autofocus': True
+        }),
+        label='Lecturas'
+    )
+
+
 class FiltroActivosForm(forms.Form):
     """Formulario para filtrar activos en la lista"""
 
@@ -0,0 +1,55 @@
+"""
+Comando para calcular los cierres mensuales de depreciación de activos.
+
+Reemplaza los cierres del rango indicado (por defecto, el mes actual).
+Programar en cron a fin de mes, o ejecutar tras corregir costos o vidas útiles.
+
+Ejecutar con:
+    python manage.py calcular_depreciacion_activos
+    python manage.py calcular_depreciacion_activos --desde 2025-01 --hasta 2025-12
+"""
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.activos.services import DepreciacionActivoService
+
+
+def _parsear_mes(valor: str):
+    """Convierte 'AAAA-MM' al primer día del mes."""
+    try:
+        return datetime.strptime(valor, '%Y-%m').date()
+    except ValueError:
+        raise CommandError(f'Mes inválido "{valor}": use el formato AAAA-MM.')
+
+
+class Command(BaseCommand):
+    help = 'Calcula el valor libro mensual de los activos (lineal o saldo decreciente)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--desde',
+            help='Primer mes a calcular, AAAA-MM (default: mes actual)'
+        )
+        parser.add_argument(
+            '--hasta',
+            help='Último mes a calcular, AAAA-MM (default: igual a --desde)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DepreciacionActivoService.TAMANO_LOTE,
+            help='Cantidad de cierres por inserción'
+        )
+
+    def handle(self, *args, **options):
+        desde = _parsear_mes(options['desde']) if options['desde'] else timezone.localdate().replace(day=1)
+        hasta = _parsear_mes(options['hasta']) if options['hasta'] else desde
+        if hasta < desde:
+            raise CommandError('--hasta no puede ser anterior a --desde.')
+
+        total = DepreciacionActivoService().generar(desde, hasta, tamano_lote=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{total} cierre(s) de depreciación generado(s) entre {desde:%m/%Y} y {hasta:%m/%Y}.'
+        ))
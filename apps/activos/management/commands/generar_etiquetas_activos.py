@@ -0,0 +1,109 @@
+"""
+Comando para generar hojas de etiquetas con código de barras de activos.
+
+Pensado para ejecutarse fuera del servidor web (ej: tras ingresar un lote de
+activos). Genera uno o más PDF en MEDIA_ROOT/etiquetas/hojas/ y reutiliza los
+códigos ya dibujados del caché en disco.
+
+Ejecutar con:
+    python manage.py generar_etiquetas_activos --creados-desde 2026-03-01
+    python manage.py generar_etiquetas_activos --categoria COMP --workers 4
+    python manage.py generar_etiquetas_activos --codigos ACT-001 ACT-002
+"""
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from apps.activos.services import EtiquetaActivoService
+
+
+def _inicializar_worker() -> None:
+    """Prepara Django en cada proceso del pool (necesario con spawn/forkserver)."""
+    django.setup()
+
+
+def _generar_parte(parte, directorio):
+    """Genera el PDF de una parte en un proceso del pool."""
+    etiquetas, ruta = parte
+    return EtiquetaActivoService(directorio).generar_pdf(etiquetas, ruta)
+
+
+class Command(BaseCommand):
+    help = 'Genera hojas PDF de etiquetas con código de barras para los activos seleccionados'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--codigos',
+            nargs='+',
+            default=[],
+            help='Códigos o códigos de barras de los activos',
+        )
+        parser.add_argument(
+            '--categoria',
+            help='Código de la categoría de activos',
+        )
+        parser.add_argument(
+            '--creados-desde',
+            help='Solo activos creados desde esta fecha (AAAA-MM-DD)',
+        )
+        parser.add_argument(
+            '--directorio',
+            help='Directorio de salida y del caché (default: MEDIA_ROOT/etiquetas)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Cantidad de procesos en paralelo (default: 1, sin pool)',
+        )
+
+    def handle(self, *args, **options):
+        creados_desde = None
+        if options['creados_desde']:
+            try:
+                creados_desde = datetime.strptime(options['creados_desde'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--creados-desde debe tener el formato AAAA-MM-DD.')
+
+        service = EtiquetaActivoService(options['directorio'])
+        etiquetas = service.obtener_etiquetas(
+            codigos=options['codigos'],
+            categoria_codigo=options['categoria'],
+            creados_desde=creados_desde
+        )
+        if not etiquetas:
+            self.stdout.write(self.style.WARNING('No hay activos con código de barras para los filtros indicados.'))
+            return
+
+        prefijo = f"etiquetas_{timezone.localtime():%Y%m%d_%H%M%S}"
+        partes = [
+            (grupo, Path(service.directorio) / 'hojas' / f'{prefijo}_{numero:03d}.pdf')
+            for numero, grupo in enumerate(service.dividir_partes(etiquetas), start=1)
+        ]
+        self.stdout.write(f'Generando {len(etiquetas)} etiqueta(s) en {len(partes)} archivo(s)...')
+
+        if options['workers'] > 1 and len(partes) > 1:
+            # Los procesos hijos deben abrir sus propias conexiones
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options['workers'], initializer=_inicializar_worker
+            ) as executor:
+                resultados = list(executor.map(partial(_generar_parte, directorio=service.directorio), partes))
+        else:
+            resultados = [service.generar_pdf(etiquetas_parte, ruta) for etiquetas_parte, ruta in partes]
+
+        omitidas = [codigo for resultado in resultados for codigo in resultado['omitidas']]
+        for codigo in omitidas:
+            self.stdout.write(self.style.WARNING(f'{codigo}: código de barras no imprimible en Code 128.'))
+        for resultado in resultados:
+            if resultado['ruta']:
+                self.stdout.write(resultado['ruta'])
+        self.stdout.write(self.style.SUCCESS(
+            f"{sum(resultado['etiquetas'] for resultado in resultados)} etiqueta(s) generada(s)."
+        ))
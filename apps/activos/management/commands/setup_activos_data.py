@@ -47,7 +47,7 @@ class Command(BaseCommand):
 
         ubicaciones_creadas = 0
         for data in ubicaciones_data:
-            obj, created = Ubicacion.objects.get_or_create(
+            obj, created = Ubicacion.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults=data
             )
@@ -99,7 +99,7 @@ class Command(BaseCommand):
 
         tipos_creados = 0
         for data in tipos_movimiento_data:
-            obj, created = TipoMovimientoActivo.objects.get_or_create(
+            obj, created = TipoMovimientoActivo.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults=data
             )
@@ -164,7 +164,7 @@ class Command(BaseCommand):
 
         estados_creados = 0
         for data in estados_data:
-            obj, created = EstadoActivo.objects.get_or_create(
+            obj, created = EstadoActivo.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults=data
             )
@@ -0,0 +1,87 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:06
+
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0002_initial'),
+        ('bajas_inventario', '0002_managers_vigentes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='activo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='categoriaactivo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='estadoactivo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='marca',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='movimientoactivo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='proveniencia',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='taller',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='tipomovimientoactivo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='ubicacion',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='activo',
+            index=models.Index(condition=models.Q(('eliminado', False)), fields=['codigo'], name='ix_activo_codigo_vig'),
+        ),
+        migrations.AddIndex(
+            model_name='activo',
+            index=models.Index(condition=models.Q(('eliminado', False)), fields=['categoria', 'codigo'], name='ix_activo_cat_codigo_vig'),
+        ),
+        migrations.AddIndex(
+            model_name='movimientoactivo',
+            index=models.Index(condition=models.Q(('eliminado', False)), fields=['-fecha_creacion'], name='ix_mov_activo_fecha_vig'),
+        ),
+        migrations.AddIndex(
+            model_name='movimientoactivo',
+            index=models.Index(condition=models.Q(('eliminado', False)), fields=['activo', '-fecha_creacion'], name='ix_mov_activo_act_fecha_vig'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:59
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0003_managers_vigentes_indices_parciales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='activo',
+            name='fecha_adquisicion',
+            field=models.DateField(blank=True, help_text='Inicio de la depreciación (si se omite se usa la fecha de creación)', null=True, verbose_name='Fecha de Adquisición'),
+        ),
+        migrations.AddField(
+            model_name='categoriaactivo',
+            name='metodo_depreciacion',
+            field=models.CharField(choices=[('LINEAL', 'Lineal'), ('SALDO_DECRECIENTE', 'Saldo decreciente')], default='LINEAL', max_length=20, verbose_name='Método de Depreciación'),
+        ),
+        migrations.AddField(
+            model_name='categoriaactivo',
+            name='porcentaje_residual',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Porcentaje del costo que conserva el activo al final de su vida útil', max_digits=5, validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)], verbose_name='Valor Residual (%)'),
+        ),
+        migrations.AddField(
+            model_name='categoriaactivo',
+            name='vida_util_meses',
+            field=models.PositiveIntegerField(blank=True, help_text='Dejar vacío si los activos de la categoría no se deprecian', null=True, validators=[django.core.validators.MinValueValidator(1)], verbose_name='Vida Útil (meses)'),
+        ),
+        migrations.CreateModel(
+            name='DepreciacionActivoMensual',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mes', models.DateField(help_text='Primer día del mes del cierre', verbose_name='Mes')),
+                ('depreciacion_mes', models.DecimalField(decimal_places=2, max_digits=14, verbose_name='Depreciación del Mes')),
+                ('depreciacion_acumulada', models.DecimalField(decimal_places=2, max_digits=14, verbose_name='Depreciación Acumulada')),
+                ('valor_libro', models.DecimalField(decimal_places=2, max_digits=14, verbose_name='Valor Libro')),
+                ('activo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='depreciaciones', to='activos.activo', verbose_name='Activo')),
+                ('categoria', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='depreciaciones', to='activos.categoriaactivo', verbose_name='Categoría')),
+            ],
+            options={
+                'verbose_name': 'Depreciación Mensual de Activo',
+                'verbose_name_plural': 'Depreciaciones Mensuales de Activos',
+                'db_table': 'tba_activo_depreciacion_mensual',
+                'ordering': ['-mes', 'activo'],
+                'indexes': [models.Index(fields=['mes', 'categoria'], name='ix_depreciacion_mes_cat')],
+                'constraints': [models.UniqueConstraint(fields=('activo', 'mes'), name='uq_depreciacion_activo_mes')],
+            },
+        ),
+    ]
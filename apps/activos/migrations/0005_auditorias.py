@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-18 22:04
+
+import django.db.models.deletion
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0004_depreciacion_mensual'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditoriaActivo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=True, help_text='Estado activo/inactivo del registro', verbose_name='Activo')),
+                ('eliminado', models.BooleanField(default=False, help_text='Estado eliminado/no eliminado del registro', verbose_name='Eliminado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de creación del registro', verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Fecha y hora de última actualización', verbose_name='Fecha de Actualización')),
+                ('numero', models.CharField(max_length=30, unique=True, verbose_name='Número')),
+                ('estado', models.CharField(choices=[('ABIERTA', 'Abierta'), ('APLICADA', 'Aplicada'), ('CANCELADA', 'Cancelada')], default='ABIERTA', max_length=20, verbose_name='Estado')),
+                ('fecha_aplicacion', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de Aplicación')),
+                ('observaciones', models.TextField(blank=True, null=True, verbose_name='Observaciones')),
+                ('aplicado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='auditorias_activos_aplicadas', to=settings.AUTH_USER_MODEL, verbose_name='Aplicado por')),
+                ('responsable', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='auditorias_activos', to=settings.AUTH_USER_MODEL, verbose_name='Responsable')),
+                ('ubicacion', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='auditorias', to='activos.ubicacion', verbose_name='Ubicación')),
+            ],
+            options={
+                'verbose_name': 'Auditoría de Activos',
+                'verbose_name_plural': 'Auditorías de Activos',
+                'db_table': 'tba_activo_auditoria',
+                'ordering': ['-fecha_creacion'],
+            },
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LecturaAuditoriaActivo',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('eliminado', models.BooleanField(default=False, help_text='Estado eliminado/no eliminado del registro', verbose_name='Eliminado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de creación del registro', verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Fecha y hora de última actualización', verbose_name='Fecha de Actualización')),
+                ('activo', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='lecturas_auditoria', to='activos.activo', verbose_name='Activo')),
+                ('auditoria', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lecturas', to='activos.auditoriaactivo', verbose_name='Auditoría')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='lecturas_auditoria_activos', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Lectura de Auditoría',
+                'verbose_name_plural': 'Lecturas de Auditoría',
+                'db_table': 'tba_activo_auditoria_lectura',
+                'constraints': [models.UniqueConstraint(fields=('auditoria', 'activo'), name='uq_lectura_auditoria_activo')],
+            },
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
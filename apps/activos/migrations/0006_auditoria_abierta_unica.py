@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 22:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0005_auditorias'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='auditoriaactivo',
+            constraint=models.UniqueConstraint(condition=models.Q(('eliminado', False), ('estado', 'ABIERTA')), fields=('ubicacion',), name='uq_auditoria_abierta_ubicacion', violation_error_message='La ubicación ya tiene una auditoría abierta.'),
+        ),
+    ]
@@ -15,7 +15,7 @@ from typing import Any
 from decimal import Decimal
 
 from django.db import models
-from django.core.validators import MinValueValidator
+from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth.models import User
 
 from core.models import BaseModel
@@ -28,9 +28,38 @@ class CategoriaActivo(BaseModel):
     Hereda de BaseModel para mantener consistencia con el resto del proyecto
     y aprovechar soft delete, campos de auditoría y estado activo/inactivo.
     """
+    METODO_LINEAL = 'LINEAL'
+    METODO_SALDO_DECRECIENTE = 'SALDO_DECRECIENTE'
+    METODOS_DEPRECIACION = [
+        (METODO_LINEAL, 'Lineal'),
+        (METODO_SALDO_DECRECIENTE, 'Saldo decreciente'),
+    ]
+
     codigo = models.CharField(max_length=20, unique=True, verbose_name='Código')
     nombre = models.CharField(max_length=100, verbose_name='Nombre')
     descripcion = models.TextField(blank=True, null=True, verbose_name='Descripción')
+    # Depreciación
+    vida_util_meses = models.PositiveIntegerField(
+        blank=True,
+        null=True,
+        validators=[MinValueValidator(1)],
+        verbose_name='Vida Útil (meses)',
+        help_text='Dejar vacío si los activos de la categoría no se deprecian'
+    )
+    metodo_depreciacion = models.CharField(
+        max_length=20,
+        choices=METODOS_DEPRECIACION,
+        default=METODO_LINEAL,
+        verbose_name='Método de Depreciación'
+    )
+    porcentaje_residual = models.DecimalField(
+        max_digits=5,
+        decimal_places=2,
+        default=0,
+        validators=[MinValueValidator(0), MaxValueValidator(100)],
+        verbose_name='Valor Residual (%)',
+        help_text='Porcentaje del costo que conserva el activo al final de su vida útil'
+    )
 
     class Meta:
         db_table = 'tba_activo_categoria'
@@ -251,6 +280,12 @@ class Activo(BaseModel):
         null=True,
         verbose_name='Precio Unitario'
     )
+    fecha_adquisicion = models.DateField(
+        blank=True,
+        null=True,
+        verbose_name='Fecha de Adquisición',
+        help_text='Inicio de la depreciación (si se omite se usa la fecha de creación)'
+    )
 
     def save(self, *args: Any, **kwargs: Any) -> None:
         """
@@ -264,16 +299,33 @@ class Activo(BaseModel):
             **kwargs: Argumentos nombrados para save()
         """
         if not self.codigo_barras and self.codigo:
-            # Generar código de barras desde el código/SKU
-            codigo_limpio: str = self.codigo.replace('-', '').replace('_', '').upper()[:12]
-            self.codigo_barras = f"COD{codigo_limpio}"
+            self.codigo_barras = self.generar_codigo_barras(self.codigo)
         super().save(*args, **kwargs)
 
+    @staticmethod
+    def generar_codigo_barras(codigo: str) -> str:
+        """
+        Genera el código de barras por defecto desde el código/SKU.
+
+        Args:
+            codigo: Código/SKU del activo
+
+        Returns:
+            'COD' seguido del código sin guiones, en mayúsculas y truncado a 12 caracteres
+        """
+        codigo_limpio: str = codigo.replace('-', '').replace('_', '').upper()[:12]
+        return f"COD{codigo_limpio}"
+
     class Meta:
         db_table = 'tba_activo'
         verbose_name = 'Activo'
         verbose_name_plural = 'Activos'
         ordering = ['codigo']
+        # Índices parciales: solo registros vigentes (eliminado=False)
+        indexes = [
+            models.Index(fields=['codigo'], name='ix_activo_codigo_vig', condition=models.Q(eliminado=False)),
+            models.Index(fields=['categoria', 'codigo'], name='ix_activo_cat_codigo_vig', condition=models.Q(eliminado=False)),
+        ]
         permissions = [
             ('gestionar_inventario', 'Puede gestionar inventario de activos'),
             ('ajustar_inventario', 'Puede realizar ajustes de inventario'),
@@ -369,6 +421,11 @@ class MovimientoActivo(BaseModel):
         verbose_name = 'Movimiento de Activo'
         verbose_name_plural = 'Movimientos de Activos'
         ordering = ['-fecha_creacion']
+        # Índices parciales: solo registros vigentes (eliminado=False)
+        indexes = [
+            models.Index(fields=['-fecha_creacion'], name='ix_mov_activo_fecha_vig', condition=models.Q(eliminado=False)),
+            models.Index(fields=['activo', '-fecha_creacion'], name='ix_mov_activo_act_fecha_vig', condition=models.Q(eliminado=False)),
+        ]
         permissions = [
             ('registrar_movimiento', 'Puede registrar movimientos de activos'),
             ('ver_historial_movimientos', 'Puede ver historial de movimientos'),
@@ -379,3 +436,163 @@ class MovimientoActivo(BaseModel):
         ubicacion: str = self.ubicacion_destino.nombre if self.ubicacion_destino else 'Sin ubicación'
         responsable: str = self.responsable.get_full_name() if self.responsable else 'Sin responsable'
         return f"{self.activo.codigo} - {ubicacion} - {responsable}"
+
+
+class AuditoriaActivo(BaseModel):
+    """
+    Sesión de auditoría física de los activos de una ubicación.
+
+    Las lecturas de códigos de barras se acumulan en LecturaAuditoriaActivo y
+    se comparan contra los activos cuya ubicación actual (último movimiento)
+    es la auditada: encontrados, faltantes y mal ubicados. Al aplicar la
+    auditoría se registran los movimientos correctivos.
+    """
+    ESTADO_ABIERTA = 'ABIERTA'
+    ESTADO_APLICADA = 'APLICADA'
+    ESTADO_CANCELADA = 'CANCELADA'
+
+    RESTRICCION_ABIERTA = 'uq_auditoria_abierta_ubicacion'
+
+    numero = models.CharField(max_length=30, unique=True, verbose_name='Número')
+    ubicacion = models.ForeignKey(
+        Ubicacion,
+        on_delete=models.PROTECT,
+        related_name='auditorias',
+        verbose_name='Ubicación'
+    )
+    estado = models.CharField(
+        max_length=20,
+        choices=[
+            (ESTADO_ABIERTA, 'Abierta'),
+            (ESTADO_APLICADA, 'Aplicada'),
+            (ESTADO_CANCELADA, 'Cancelada'),
+        ],
+        default=ESTADO_ABIERTA,
+        verbose_name='Estado'
+    )
+    responsable = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='auditorias_activos',
+        verbose_name='Responsable'
+    )
+    fecha_aplicacion = models.DateTimeField(null=True, blank=True, verbose_name='Fecha de Aplicación')
+    aplicado_por = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='auditorias_activos_aplicadas',
+        null=True,
+        blank=True,
+        verbose_name='Aplicado por'
+    )
+    observaciones = models.TextField(blank=True, null=True, verbose_name='Observaciones')
+
+    class Meta:
+        db_table = 'tba_activo_auditoria'
+        verbose_name = 'Auditoría de Activos'
+        verbose_name_plural = 'Auditorías de Activos'
+        ordering = ['-fecha_creacion']
+        constraints = [
+            # Una sola auditoría abierta por ubicación
+            models.UniqueConstraint(
+                fields=['ubicacion'],
+                condition=models.Q(estado='ABIERTA', eliminado=False),
+                name='uq_auditoria_abierta_ubicacion',
+                violation_error_message='La ubicación ya tiene una auditoría abierta.'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en string de la auditoría."""
+        return f"{self.numero} - {self.ubicacion.nombre}"
+
+
+class LecturaAuditoriaActivo(BaseModel):
+    """
+    Activo leído (escaneado) durante una auditoría.
+
+    Un activo se registra una sola vez por auditoría: las lecturas repetidas
+    se ignoran.
+    """
+    auditoria = models.ForeignKey(
+        AuditoriaActivo,
+        on_delete=models.CASCADE,
+        related_name='lecturas',
+        verbose_name='Auditoría'
+    )
+    activo = models.ForeignKey(
+        Activo,
+        on_delete=models.PROTECT,
+        related_name='lecturas_auditoria',
+        verbose_name='Activo'
+    )
+    usuario = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='lecturas_auditoria_activos',
+        verbose_name='Usuario'
+    )
+
+    class Meta:
+        db_table = 'tba_activo_auditoria_lectura'
+        verbose_name = 'Lectura de Auditoría'
+        verbose_name_plural = 'Lecturas de Auditoría'
+        constraints = [
+            models.UniqueConstraint(fields=['auditoria', 'activo'], name='uq_lectura_auditoria_activo'),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en string de la lectura."""
+        return f"{self.auditoria.numero} - {self.activo.codigo}"
+
+
+class DepreciacionActivoMensual(models.Model):
+    """
+    Valor libro precalculado de cada activo al cierre de un mes.
+
+    Las filas se generan por lotes (DepreciacionActivoService) a partir del
+    precio unitario, la fecha de adquisición y la vida útil de la categoría,
+    de modo que los reportes financieros leen valores ya calculados.
+    No heredan de BaseModel: no se editan ni se eliminan lógicamente.
+
+    Attributes:
+        activo: Activo depreciado.
+        categoria: Copia de Activo.categoria, para agrupar sin join.
+        mes: Primer día del mes del cierre.
+        depreciacion_mes: Depreciación del mes.
+        depreciacion_acumulada: Depreciación acumulada al cierre del mes.
+        valor_libro: Costo menos depreciación acumulada.
+    """
+
+    activo = models.ForeignKey(
+        Activo,
+        on_delete=models.CASCADE,
+        related_name='depreciaciones',
+        verbose_name='Activo'
+    )
+    categoria = models.ForeignKey(
+        CategoriaActivo,
+        on_delete=models.CASCADE,
+        related_name='depreciaciones',
+        verbose_name='Categoría'
+    )
+    mes = models.DateField(verbose_name='Mes', help_text='Primer día del mes del cierre')
+    depreciacion_mes = models.DecimalField(max_digits=14, decimal_places=2, verbose_name='Depreciación del Mes')
+    depreciacion_acumulada = models.DecimalField(max_digits=14, decimal_places=2, verbose_name='Depreciación Acumulada')
+    valor_libro = models.DecimalField(max_digits=14, decimal_places=2, verbose_name='Valor Libro')
+
+    class Meta:
+        db_table = 'tba_activo_depreciacion_mensual'
+        verbose_name = 'Depreciación Mensual de Activo'
+        verbose_name_plural = 'Depreciaciones Mensuales de Activos'
+        ordering = ['-mes', 'activo']
+        constraints = [
+            models.UniqueConstraint(fields=['activo', 'mes'], name='uq_depreciacion_activo_mes'),
+        ]
+        indexes = [
+            models.Index(fields=['mes', 'categoria'], name='ix_depreciacion_mes_cat'),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en string del cierre."""
+        return f"{self.activo_id} - {self.mes:%m/%Y} - {self.valor_libro}"
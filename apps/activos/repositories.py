@@ -10,14 +10,17 @@ una interfaz limpia para el Service Layer.
 """
 from __future__ import annotations
 
-from typing import Optional
+from typing import Optional, Iterable, List
 
-from django.db.models import QuerySet, Q
+from datetime import date
+
+from django.db.models import QuerySet, Q, Count, Sum, Max, OuterRef, Subquery, Exists
 from django.contrib.auth.models import User
 
 from .models import (
     CategoriaActivo, EstadoActivo, Ubicacion, Proveniencia,
-    Marca, Taller, TipoMovimientoActivo, Activo, MovimientoActivo
+    Marca, Taller, TipoMovimientoActivo, Activo, MovimientoActivo,
+    DepreciacionActivoMensual, AuditoriaActivo, LecturaAuditoriaActivo
 )
 
 
@@ -249,6 +252,13 @@ class TipoMovimientoActivoRepository:
         except TipoMovimientoActivo.DoesNotExist:
             return None
 
+    @staticmethod
+    def get_by_codigo(codigo: str) -> Optional[TipoMovimientoActivo]:
+        """Obtiene un tipo de movimiento activo por su código."""
+        return TipoMovimientoActivo.objects.filter(
+            codigo__iexact=codigo, activo=True, eliminado=False
+        ).first()
+
 
 # ==================== ACTIVO REPOSITORY ====================
 
@@ -327,10 +337,93 @@ class ActivoRepository:
             'categoria', 'estado', 'marca'
         ).order_by('codigo')
 
+    @staticmethod
+    def filter_by_codigos_barras(codigos_barras: Iterable[str]) -> QuerySet:
+        """
+        Búsqueda exacta por código de barras (igualdad sobre el índice único).
+
+        Args:
+            codigos_barras: Códigos de barras a resolver
+
+        Returns:
+            QuerySet de diccionarios con id, codigo, nombre y codigo_barras
+        """
+        return Activo.objects.filter(
+            codigo_barras__in=list(codigos_barras),
+            eliminado=False
+        ).values('id', 'codigo', 'nombre', 'codigo_barras')
+
+    @staticmethod
+    def filter_para_movimiento(activo_ids: Iterable[int], codigos: Iterable[str]) -> QuerySet[Activo]:
+        """
+        Activos vigentes por ID, código o código de barras, bloqueados para moverlos.
+
+        Resuelve toda la selección con una consulta (igualdad sobre los índices
+        únicos de codigo y codigo_barras) e incluye el estado para validarla.
+
+        Args:
+            activo_ids: IDs seleccionados
+            codigos: Códigos o códigos de barras leídos
+
+        Returns:
+            QuerySet de activos con su estado (SELECT ... FOR UPDATE)
+        """
+        activo_ids = list(activo_ids)
+        codigos = list(codigos)
+        return Activo.objects.filter(
+            Q(pk__in=activo_ids) | Q(codigo__in=codigos) | Q(codigo_barras__in=codigos)
+        ).select_related('estado').select_for_update(of=('self',)).only(
+            'codigo', 'codigo_barras', 'nombre', 'estado__nombre', 'estado__permite_movimiento'
+        ).order_by('codigo')
+
+    @staticmethod
+    def get_para_etiquetas(
+        codigos: Iterable[str] = (),
+        categoria_codigo: Optional[str] = None,
+        creados_desde: Optional[date] = None
+    ) -> QuerySet:
+        """
+        Datos para imprimir etiquetas de los activos vigentes con código de barras.
+
+        Args:
+            codigos: Códigos o códigos de barras (vacío = sin filtro)
+            categoria_codigo: Código de categoría (opcional)
+            creados_desde: Fecha mínima de creación (ej: un lote recién ingresado)
+
+        Returns:
+            QuerySet de diccionarios (codigo, nombre, codigo_barras) ordenado por código
+        """
+        queryset = Activo.objects.filter(codigo_barras__isnull=False).exclude(codigo_barras='')
+        codigos = list(codigos)
+        if codigos:
+            queryset = queryset.filter(Q(codigo__in=codigos) | Q(codigo_barras__in=codigos))
+        if categoria_codigo:
+            queryset = queryset.filter(categoria__codigo__iexact=categoria_codigo)
+        if creados_desde:
+            queryset = queryset.filter(fecha_creacion__date__gte=creados_desde)
+        return queryset.values('codigo', 'nombre', 'codigo_barras').order_by('codigo')
+
+    @staticmethod
+    def get_depreciables() -> QuerySet:
+        """
+        Datos para depreciar los activos vigentes con costo y categoría con vida útil.
+
+        Returns:
+            QuerySet de diccionarios ordenado por ID
+        """
+        return Activo.objects.filter(
+            precio_unitario__gt=0,
+            categoria__vida_util_meses__isnull=False
+        ).values(
+            'id', 'categoria_id', 'precio_unitario', 'fecha_adquisicion', 'fecha_creacion',
+            'categoria__vida_util_meses', 'categoria__metodo_depreciacion',
+            'categoria__porcentaje_residual'
+        ).order_by('id')
+
     @staticmethod
     def exists_by_codigo(codigo: str, exclude_id: Optional[int] = None) -> bool:
         """Verifica si existe un activo con el código dado."""
-        queryset = Activo.objects.filter(codigo=codigo)
+        queryset = Activo.all_objects.filter(codigo=codigo)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -413,6 +506,11 @@ class MovimientoActivoRepository:
         """Crea un nuevo movimiento."""
         return MovimientoActivo.objects.create(**kwargs)
 
+    @staticmethod
+    def bulk_create(movimientos: List[MovimientoActivo], batch_size: int) -> List[MovimientoActivo]:
+        """Inserta movimientos en lotes."""
+        return MovimientoActivo.objects.bulk_create(movimientos, batch_size=batch_size)
+
     @staticmethod
     def get_ultimo_por_activo(activo: Activo) -> Optional[MovimientoActivo]:
         """Obtiene el último movimiento de un activo."""
@@ -421,3 +519,106 @@ class MovimientoActivoRepository:
         ).select_related(
             'ubicacion_destino', 'responsable'
         ).order_by('-fecha_creacion').first()
+
+
+# ==================== AUDITORÍA REPOSITORY ====================
+
+class AuditoriaActivoRepository:
+    """Repository para gestionar acceso a datos de AuditoriaActivo."""
+
+    @staticmethod
+    def get_all() -> QuerySet[AuditoriaActivo]:
+        """Retorna todas las auditorías vigentes con relaciones optimizadas."""
+        return AuditoriaActivo.objects.select_related(
+            'ubicacion', 'responsable', 'aplicado_por'
+        ).order_by('-fecha_creacion')
+
+    @staticmethod
+    def create(**kwargs) -> AuditoriaActivo:
+        """Crea una nueva auditoría."""
+        return AuditoriaActivo.objects.create(**kwargs)
+
+    @staticmethod
+    def bulk_create_lecturas(lecturas: List[LecturaAuditoriaActivo], batch_size: int) -> None:
+        """Inserta lecturas en lotes, ignorando los activos ya leídos."""
+        LecturaAuditoriaActivo.objects.bulk_create(lecturas, batch_size=batch_size, ignore_conflicts=True)
+
+    @staticmethod
+    def get_comparacion(auditoria: AuditoriaActivo) -> QuerySet:
+        """
+        Compara en una sola consulta los activos leídos con los esperados.
+
+        Los esperados son los activos cuyo último movimiento los deja en la
+        ubicación auditada. Solo se consideran los activos con algún
+        movimiento hacia la ubicación o con una lectura en la auditoría.
+
+        Args:
+            auditoria: Auditoría
+
+        Returns:
+            QuerySet de diccionarios con id, codigo, nombre, ubicacion_actual_id,
+            ubicacion_actual_nombre y leido
+        """
+        ultimo_movimiento = MovimientoActivo.objects.filter(
+            activo=OuterRef('pk')
+        ).order_by('-fecha_creacion', '-id')
+        lecturas = LecturaAuditoriaActivo.objects.filter(auditoria=auditoria)
+
+        return Activo.objects.filter(
+            Q(pk__in=MovimientoActivo.objects.filter(
+                ubicacion_destino_id=auditoria.ubicacion_id
+            ).values('activo_id'))
+            | Q(pk__in=lecturas.values('activo_id'))
+        ).annotate(
+            ubicacion_actual_id=Subquery(ultimo_movimiento.values('ubicacion_destino_id')[:1]),
+            ubicacion_actual_nombre=Subquery(ultimo_movimiento.values('ubicacion_destino__nombre')[:1]),
+            leido=Exists(lecturas.filter(activo=OuterRef('pk')))
+        ).values(
+            'id', 'codigo', 'nombre', 'ubicacion_actual_id', 'ubicacion_actual_nombre', 'leido'
+        ).order_by('codigo')
+
+
+# ==================== DEPRECIACIÓN REPOSITORY ====================
+
+class DepreciacionActivoRepository:
+    """
+    Repository para acceso a datos de DepreciacionActivoMensual.
+
+    Encapsula las operaciones sobre los cierres mensuales precalculados.
+    """
+
+    @staticmethod
+    def eliminar_meses(desde: date, hasta: date) -> int:
+        """Elimina los cierres de un rango de meses (inclusive)."""
+        eliminados, _ = DepreciacionActivoMensual.objects.filter(
+            mes__gte=desde, mes__lte=hasta
+        ).delete()
+        return eliminados
+
+    @staticmethod
+    def bulk_create(filas: List[DepreciacionActivoMensual], batch_size: int) -> List[DepreciacionActivoMensual]:
+        """Inserta cierres en lotes."""
+        return DepreciacionActivoMensual.objects.bulk_create(filas, batch_size=batch_size)
+
+    @staticmethod
+    def ultimo_mes() -> Optional[date]:
+        """Último mes con cierres calculados."""
+        return DepreciacionActivoMensual.objects.aggregate(ultimo=Max('mes'))['ultimo']
+
+    @staticmethod
+    def totales_por_categoria(mes: date) -> QuerySet:
+        """
+        Valor libro y depreciación de un mes agrupados por categoría.
+
+        Returns:
+            QuerySet de diccionarios con categoria__codigo, categoria__nombre,
+            activos, depreciacion_mes, depreciacion_acumulada y valor_libro
+        """
+        return DepreciacionActivoMensual.objects.filter(mes=mes).values(
+            'categoria__codigo', 'categoria__nombre'
+        ).annotate(
+            activos=Count('id'),
+            depreciacion_mes=Sum('depreciacion_mes'),
+            depreciacion_acumulada=Sum('depreciacion_acumulada'),
+            valor_libro=Sum('valor_libro')
+        ).order_by('categoria__codigo')
@@ -10,23 +10,40 @@ y mantienen las transacciones atómicas cuando es necesario.
 """
 from __future__ import annotations
 
-from typing import Optional, Dict, Any, Tuple
-
-from decimal import Decimal
-from django.db import transaction
+from typing import Optional, Dict, Any, Tuple, Iterable, List
+
+import hashlib
+import os
+from datetime import date
+from pathlib import Path
+from decimal import Decimal, ROUND_HALF_UP
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from PIL import Image, ImageDraw, ImageFont
+
+from core.utils import (
+    leer_filas_archivo, parsear_decimal_planilla, validar_largo_planilla, dibujar_code128
+)
+from core.utils.business import generar_codigo_con_anio
+from core.utils.codigo_barras import simbolos_code128
 
 from .models import (
     CategoriaActivo, EstadoActivo, Ubicacion, Proveniencia,
-    Marca, Taller, TipoMovimientoActivo, Activo, MovimientoActivo
+    Marca, Taller, TipoMovimientoActivo, Activo, MovimientoActivo,
+    DepreciacionActivoMensual, AuditoriaActivo, LecturaAuditoriaActivo
 )
 from .repositories import (
     CategoriaActivoRepository, EstadoActivoRepository,
     UbicacionRepository, ProvenienciaRepository,
     MarcaRepository, TallerRepository,
     TipoMovimientoActivoRepository, ActivoRepository,
-    MovimientoActivoRepository
+    MovimientoActivoRepository, DepreciacionActivoRepository,
+    AuditoriaActivoRepository
 )
 
 
@@ -181,6 +198,248 @@ class ActivoService:
         return list(self.repository.filter_by_estado(estado))
 
 
+# ==================== IMPORTACIÓN DE ACTIVOS ====================
+
+class ImportacionActivoService:
+    """
+    Service para la importación masiva de activos desde CSV o XLSX.
+
+    El archivo se recorre en streaming; los códigos y códigos de barras
+    existentes (incluidos los eliminados) y los catálogos de categorías,
+    estados y marcas se precargan una sola vez en memoria. Los códigos de
+    barras faltantes se generan por lote y los activos se insertan con
+    bulk_create.
+
+    Columnas: codigo, nombre, categoria (requeridas); estado, marca,
+    descripcion, lote, numero_serie, codigo_barras, precio_unitario
+    (opcionales). Las columnas de catálogo usan códigos; sin estado se
+    asigna el estado inicial.
+    """
+
+    TAMANO_LOTE = 1000
+
+    def __init__(self) -> None:
+        self.estado_repo = EstadoActivoRepository()
+
+    @staticmethod
+    def _cargar_catalogos() -> Dict[str, Dict[str, int]]:
+        """Precarga los catálogos como diccionarios {CODIGO: id}."""
+
+        def por_codigo(model) -> Dict[str, int]:
+            return {
+                codigo.upper(): pk
+                for pk, codigo in model.objects.filter(activo=True).values_list('id', 'codigo')
+            }
+
+        return {
+            'categorias': por_codigo(CategoriaActivo),
+            'estados': por_codigo(EstadoActivo),
+            'marcas': por_codigo(Marca),
+        }
+
+    @staticmethod
+    def _parsear_precio(valor: str) -> Optional[Decimal]:
+        """Convierte el precio de la planilla a Decimal validando que quepa en el campo."""
+        return parsear_decimal_planilla(valor, Activo._meta.get_field('precio_unitario'), 'Precio unitario')
+
+    @staticmethod
+    def _validar_largo(valor: Optional[str], campo: str, etiqueta: str) -> Optional[str]:
+        """Verifica que un texto no exceda el max_length del campo del modelo."""
+        if valor:
+            validar_largo_planilla(valor, Activo._meta.get_field(campo), etiqueta)
+        return valor
+
+    def _construir_activo(
+        self,
+        datos: Dict[str, str],
+        catalogos: Dict[str, Dict[str, int]],
+        estado_inicial_id: Optional[int],
+        codigos_usados: set,
+        codigos_barras_usados: set
+    ) -> Activo:
+        """
+        Valida una fila y construye el activo (sin guardar).
+
+        El código de barras solo se valida si viene en la planilla; los
+        faltantes se generan al guardar el lote.
+
+        Raises:
+            ValidationError: Si la fila no es válida
+        """
+        codigo = datos.get('codigo', '').strip().upper()
+        nombre = datos.get('nombre', '').strip()
+        if not codigo or not nombre:
+            raise ValidationError('El código y el nombre son obligatorios.')
+        self._validar_largo(codigo, 'codigo', 'El código')
+        self._validar_largo(nombre, 'nombre', 'El nombre')
+        if codigo in codigos_usados:
+            raise ValidationError(f'Ya existe un activo con el código "{codigo}".')
+
+        categoria_codigo = datos.get('categoria', '').strip().upper()
+        if categoria_codigo not in catalogos['categorias']:
+            raise ValidationError(f'Categoría "{categoria_codigo}" no existe.')
+
+        estado_codigo = datos.get('estado', '').strip().upper()
+        if estado_codigo:
+            if estado_codigo not in catalogos['estados']:
+                raise ValidationError(f'Estado "{estado_codigo}" no existe.')
+            estado_id = catalogos['estados'][estado_codigo]
+        elif estado_inicial_id:
+            estado_id = estado_inicial_id
+        else:
+            raise ValidationError('Indique el estado: no existe un estado inicial configurado.')
+
+        marca_codigo = datos.get('marca', '').strip().upper()
+        if marca_codigo and marca_codigo not in catalogos['marcas']:
+            raise ValidationError(f'Marca "{marca_codigo}" no existe.')
+
+        precio_unitario = self._parsear_precio(datos.get('precio_unitario', ''))
+        lote = self._validar_largo(datos.get('lote') or None, 'lote', 'El lote')
+        numero_serie = self._validar_largo(datos.get('numero_serie') or None, 'numero_serie', 'El número de serie')
+
+        codigo_barras = datos.get('codigo_barras', '').strip() or None
+        if codigo_barras:
+            self._validar_largo(codigo_barras, 'codigo_barras', 'El código de barras')
+            if codigo_barras in codigos_barras_usados:
+                raise ValidationError(f'El código de barras "{codigo_barras}" ya está en uso.')
+            codigos_barras_usados.add(codigo_barras)
+
+        codigos_usados.add(codigo)
+        return Activo(
+            codigo=codigo,
+            nombre=nombre,
+            descripcion=datos.get('descripcion') or None,
+            categoria_id=catalogos['categorias'][categoria_codigo],
+            estado_id=estado_id,
+            marca_id=catalogos['marcas'].get(marca_codigo),
+            lote=lote,
+            numero_serie=numero_serie,
+            codigo_barras=codigo_barras,
+            precio_unitario=precio_unitario
+        )
+
+    @staticmethod
+    def _completar_codigos_barras(
+        lote: List[Tuple[int, Activo]],
+        codigos_barras_usados: set
+    ) -> Tuple[List[Tuple[int, Activo]], List[Dict[str, Any]]]:
+        """
+        Genera los códigos de barras faltantes del lote (bulk_create no invoca save()).
+
+        El código generado trunca el SKU, por lo que dos códigos largos pueden
+        producir el mismo código de barras: esas filas se rechazan.
+
+        Returns:
+            Tupla (filas válidas, errores)
+        """
+        generados = [
+            (numero_fila, activo, Activo.generar_codigo_barras(activo.codigo))
+            for numero_fila, activo in lote
+            if not activo.codigo_barras
+        ]
+        rechazadas = set()
+        errores = []
+        for numero_fila, activo, codigo_barras in generados:
+            if codigo_barras in codigos_barras_usados:
+                rechazadas.add(numero_fila)
+                errores.append({
+                    'fila': numero_fila,
+                    'codigo': activo.codigo,
+                    'mensaje': f'El código de barras generado "{codigo_barras}" ya está en uso. '
+                               'Indíquelo en la columna codigo_barras.'
+                })
+                continue
+            activo.codigo_barras = codigo_barras
+            codigos_barras_usados.add(codigo_barras)
+        return [fila for fila in lote if fila[0] not in rechazadas], errores
+
+    def _procesar_lote(
+        self,
+        lote: List[Tuple[int, Activo]],
+        codigos_barras_usados: set,
+        reporte: Dict[str, Any],
+        dry_run: bool
+    ) -> None:
+        """Completa los códigos de barras del lote, lo inserta y actualiza el reporte."""
+        validas, errores = self._completar_codigos_barras(lote, codigos_barras_usados)
+        reporte['errores'].extend(errores)
+        reporte['validas'] += len(validas)
+        if validas and not dry_run:
+            reporte['creados'] += len(Activo.objects.bulk_create(
+                [activo for _, activo in validas]
+            ))
+
+    def importar(
+        self,
+        archivo,
+        nombre_archivo: str,
+        dry_run: bool = False,
+        tamano_lote: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Importa activos desde una planilla.
+
+        Las filas inválidas se omiten y se informan en el reporte; las válidas
+        se insertan por lotes dentro de una única transacción, tras cuyo
+        commit se invalida la caché de lecturas de códigos de barras. Con
+        dry_run solo se valida, sin escribir en la base de datos.
+
+        Args:
+            archivo: Archivo binario CSV o XLSX
+            nombre_archivo: Nombre del archivo (determina el formato)
+            dry_run: Si True, solo valida y reporta
+            tamano_lote: Filas por bulk_create (default: TAMANO_LOTE)
+
+        Returns:
+            Diccionario con total_filas, validas, creados, errores y dry_run
+
+        Raises:
+            ValidationError: Si el formato del archivo no es soportado
+        """
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+        catalogos = self._cargar_catalogos()
+        estado_inicial = self.estado_repo.get_inicial()
+        estado_inicial_id = estado_inicial.pk if estado_inicial else None
+        codigos_usados = {codigo.upper() for codigo in Activo.all_objects.values_list('codigo', flat=True)}
+        codigos_barras_usados = set(
+            Activo.all_objects.exclude(codigo_barras__isnull=True).values_list('codigo_barras', flat=True)
+        )
+
+        reporte: Dict[str, Any] = {
+            'total_filas': 0, 'validas': 0, 'creados': 0, 'errores': [], 'dry_run': dry_run
+        }
+        lote: List[Tuple[int, Activo]] = []
+
+        with transaction.atomic():
+            for numero_fila, datos in leer_filas_archivo(archivo, nombre_archivo):
+                reporte['total_filas'] += 1
+                try:
+                    lote.append((numero_fila, self._construir_activo(
+                        datos, catalogos, estado_inicial_id, codigos_usados, codigos_barras_usados
+                    )))
+                except ValidationError as e:
+                    reporte['errores'].append({
+                        'fila': numero_fila,
+                        'codigo': datos.get('codigo', ''),
+                        'mensaje': ' '.join(e.messages)
+                    })
+                    continue
+
+                if len(lote) >= tamano_lote:
+                    self._procesar_lote(lote, codigos_barras_usados, reporte, dry_run)
+                    lote = []
+
+            if lote:
+                self._procesar_lote(lote, codigos_barras_usados, reporte, dry_run)
+
+        reporte['errores'].sort(key=lambda error: error['fila'])
+        if reporte['creados']:
+            # Los activos nuevos pueden resolver códigos que la caché guardó como no encontrados
+            from apps.bodega.services import EscaneoCodigoBarrasService
+            transaction.on_commit(EscaneoCodigoBarrasService.invalidar_cache)
+        return reporte
+
+
 # ==================== MOVIMIENTO ACTIVO SERVICE ====================
 
 class MovimientoActivoService:
@@ -191,8 +450,11 @@ class MovimientoActivoService:
     Todas las operaciones de movimiento son transacciones atómicas.
     """
 
+    TAMANO_LOTE = 1000
+
     def __init__(self) -> None:
         self.movimiento_repo = MovimientoActivoRepository()
+        self.activo_repo = ActivoRepository()
 
     @transaction.atomic
     def registrar_movimiento(
@@ -248,6 +510,80 @@ class MovimientoActivoService:
 
         return movimiento
 
+    @transaction.atomic
+    def registrar_movimientos_masivos(
+        self,
+        tipo_movimiento: TipoMovimientoActivo,
+        usuario_registro: User,
+        activo_ids: Iterable[int] = (),
+        codigos: Iterable[str] = (),
+        ubicacion_destino: Optional[Ubicacion] = None,
+        taller: Optional[Taller] = None,
+        responsable: Optional[User] = None,
+        proveniencia: Optional[Proveniencia] = None,
+        observaciones: Optional[str] = None
+    ) -> List[MovimientoActivo]:
+        """
+        Registra el mismo movimiento para varios activos (ej: traslado de una sala).
+
+        Los activos se resuelven y validan con una consulta y los movimientos se
+        insertan con bulk_create. La operación es todo o nada: si algún código no
+        existe o algún activo no permite movimientos, no se registra ninguno.
+
+        Args:
+            tipo_movimiento: Tipo de movimiento
+            usuario_registro: Usuario que registra
+            activo_ids: IDs de activos seleccionados
+            codigos: Códigos o códigos de barras leídos (ej: con lector)
+            ubicacion_destino: Ubicación destino (opcional)
+            taller: Taller (opcional)
+            responsable: Responsable de los activos (opcional)
+            proveniencia: Proveniencia (opcional)
+            observaciones: Observaciones (opcional)
+
+        Returns:
+            Lista de movimientos creados, uno por activo
+
+        Raises:
+            ValidationError: Con la lista de códigos inexistentes y activos que no permiten movimiento
+        """
+        activo_ids = set(activo_ids)
+        codigos = {codigo.strip() for codigo in codigos if codigo and codigo.strip()}
+        if not activo_ids and not codigos:
+            raise ValidationError('Debe indicar al menos un activo.')
+
+        activos = list(self.activo_repo.filter_para_movimiento(activo_ids, codigos))
+
+        errores = []
+        encontrados = set()
+        for activo in activos:
+            encontrados.update((activo.pk, activo.codigo, activo.codigo_barras))
+        faltantes = sorted(str(valor) for valor in (activo_ids | codigos) - encontrados)
+        if faltantes:
+            errores.append(f'No se encontraron activos para: {", ".join(faltantes)}.')
+        for activo in activos:
+            if not activo.estado.permite_movimiento:
+                errores.append(
+                    f'El activo {activo.codigo} está en estado "{activo.estado.nombre}" '
+                    'que no permite movimientos.'
+                )
+        if errores:
+            raise ValidationError(errores)
+
+        return self.movimiento_repo.bulk_create([
+            MovimientoActivo(
+                activo=activo,
+                tipo_movimiento=tipo_movimiento,
+                usuario_registro=usuario_registro,
+                ubicacion_destino=ubicacion_destino,
+                taller=taller,
+                responsable=responsable,
+                proveniencia=proveniencia,
+                observaciones=observaciones
+            )
+            for activo in activos
+        ], self.TAMANO_LOTE)
+
     def obtener_historial_activo(
         self,
         activo: Activo,
@@ -305,6 +641,599 @@ class MovimientoActivoService:
         return list(self.movimiento_repo.filter_by_responsable(responsable))
 
 
+# ==================== DEPRECIACIÓN SERVICE ====================
+
+class DepreciacionActivoService:
+    """
+    Service para el cálculo de la depreciación mensual de activos.
+
+    Los activos depreciables se recorren una vez por lotes y para cada uno se
+    calculan todos los meses del rango pedido; los cierres se insertan con
+    bulk_create en DepreciacionActivoMensual, que es lo que leen los reportes.
+
+    La depreciación comienza en el mes de adquisición (fecha_adquisicion o, si
+    falta, la fecha de creación) y termina al cumplirse la vida útil de la
+    categoría, con el valor residual como piso.
+    """
+
+    TAMANO_LOTE = 1000
+    CENTAVO = Decimal('0.01')
+
+    def __init__(self) -> None:
+        self.activo_repo = ActivoRepository()
+        self.depreciacion_repo = DepreciacionActivoRepository()
+
+    @staticmethod
+    def indice_mes(fecha: date) -> int:
+        """Número correlativo del mes de una fecha (año * 12 + mes - 1)."""
+        return fecha.year * 12 + fecha.month - 1
+
+    @classmethod
+    def valor_libro(
+        cls,
+        costo: Decimal,
+        residual: Decimal,
+        vida_util_meses: int,
+        metodo: str,
+        meses: int
+    ) -> Decimal:
+        """
+        Valor libro de un activo tras una cantidad de meses depreciados.
+
+        El saldo decreciente pasa a lineal sobre la vida útil restante en el
+        primer mes en que la cuota lineal supera a la decreciente, de modo que
+        el valor libro llega al residual justo al cumplirse la vida útil.
+
+        Args:
+            costo: Costo de adquisición
+            residual: Valor residual al final de la vida útil
+            vida_util_meses: Vida útil en meses
+            metodo: CategoriaActivo.METODO_LINEAL o METODO_SALDO_DECRECIENTE
+            meses: Meses depreciados (0 = recién adquirido)
+
+        Returns:
+            Valor libro redondeado a dos decimales
+        """
+        if meses <= 0:
+            return costo
+        if meses >= vida_util_meses:
+            return residual.quantize(cls.CENTAVO, ROUND_HALF_UP)
+
+        if metodo == CategoriaActivo.METODO_SALDO_DECRECIENTE:
+            # Doble saldo decreciente: tasa mensual 2 / vida útil
+            tasa = min(Decimal(2) / vida_util_meses, Decimal(1))
+            valor = costo
+            for mes in range(meses):
+                cuota_lineal = (valor - residual) / (vida_util_meses - mes)
+                if cuota_lineal >= valor * tasa:
+                    # Desde aquí la cuota lineal es mayor y se mantiene hasta el residual
+                    valor -= cuota_lineal * (meses - mes)
+                    break
+                valor -= valor * tasa
+            valor = max(residual, valor)
+        else:
+            valor = costo - (costo - residual) * meses / vida_util_meses
+        return valor.quantize(cls.CENTAVO, ROUND_HALF_UP)
+
+    def calcular_filas(self, datos: Dict[str, Any], meses: List[date]) -> List[DepreciacionActivoMensual]:
+        """
+        Calcula los cierres de un activo para los meses indicados.
+
+        Args:
+            datos: Diccionario de ActivoRepository.get_depreciables()
+            meses: Primer día de cada mes a calcular, en orden
+
+        Returns:
+            Cierres (sin guardar); se omiten los meses anteriores a la adquisición
+        """
+        costo = datos['precio_unitario']
+        residual = costo * datos['categoria__porcentaje_residual'] / 100
+        vida_util = datos['categoria__vida_util_meses']
+        metodo = datos['categoria__metodo_depreciacion']
+        inicio = self.indice_mes(datos['fecha_adquisicion'] or timezone.localtime(datos['fecha_creacion']).date())
+
+        filas = []
+        for mes in meses:
+            transcurridos = self.indice_mes(mes) - inicio + 1
+            if transcurridos <= 0:
+                continue
+            valor = self.valor_libro(costo, residual, vida_util, metodo, transcurridos)
+            anterior = self.valor_libro(costo, residual, vida_util, metodo, transcurridos - 1)
+            filas.append(DepreciacionActivoMensual(
+                activo_id=datos['id'],
+                categoria_id=datos['categoria_id'],
+                mes=mes,
+                depreciacion_mes=anterior - valor,
+                depreciacion_acumulada=costo - valor,
+                valor_libro=valor
+            ))
+        return filas
+
+    @transaction.atomic
+    def generar(
+        self,
+        desde: date,
+        hasta: Optional[date] = None,
+        tamano_lote: Optional[int] = None
+    ) -> int:
+        """
+        Recalcula los cierres de un rango de meses para todos los activos.
+
+        Los cierres existentes del rango se reemplazan, por lo que puede
+        ejecutarse de nuevo tras corregir costos, fechas o vidas útiles.
+
+        Args:
+            desde: Fecha del primer mes a calcular
+            hasta: Fecha del último mes a calcular (default: el mismo mes que desde)
+            tamano_lote: Activos por bulk_create (default: TAMANO_LOTE)
+
+        Returns:
+            Cantidad de cierres generados
+
+        Raises:
+            ValidationError: Si el rango es inválido
+        """
+        desde = desde.replace(day=1)
+        hasta = (hasta or desde).replace(day=1)
+        if hasta < desde:
+            raise ValidationError('El mes final no puede ser anterior al mes inicial.')
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+
+        meses = [
+            date(indice // 12, indice % 12 + 1, 1)
+            for indice in range(self.indice_mes(desde), self.indice_mes(hasta) + 1)
+        ]
+
+        self.depreciacion_repo.eliminar_meses(desde, hasta)
+        total = 0
+        lote: List[DepreciacionActivoMensual] = []
+        for datos in self.activo_repo.get_depreciables().iterator(chunk_size=tamano_lote):
+            lote.extend(self.calcular_filas(datos, meses))
+            if len(lote) >= tamano_lote:
+                total += len(self.depreciacion_repo.bulk_create(lote, tamano_lote))
+                lote = []
+        if lote:
+            total += len(self.depreciacion_repo.bulk_create(lote, tamano_lote))
+        return total
+
+    def resumen(self, mes: Optional[date] = None) -> Optional[Dict[str, Any]]:
+        """
+        Valor libro de los activos en un mes, desde los cierres precalculados.
+
+        Args:
+            mes: Mes a consultar (default: último mes calculado)
+
+        Returns:
+            Diccionario con mes, totales y por_categoria, o None si no hay cierres
+        """
+        mes = mes.replace(day=1) if mes else self.depreciacion_repo.ultimo_mes()
+        if mes is None:
+            return None
+
+        por_categoria = list(self.depreciacion_repo.totales_por_categoria(mes))
+        return {
+            'mes': mes,
+            'activos': sum(fila['activos'] for fila in por_categoria),
+            'depreciacion_mes': sum((fila['depreciacion_mes'] for fila in por_categoria), Decimal('0')),
+            'depreciacion_acumulada': sum((fila['depreciacion_acumulada'] for fila in por_categoria), Decimal('0')),
+            'valor_libro': sum((fila['valor_libro'] for fila in por_categoria), Decimal('0')),
+            'por_categoria': por_categoria,
+        }
+
+
+# ==================== ETIQUETAS SERVICE ====================
+
+class EtiquetaActivoService:
+    """
+    Service para generar hojas de etiquetas con código de barras.
+
+    Cada código se dibuja una sola vez y se guarda como PNG en un caché en
+    disco cuya ruta depende solo del código, de modo que reimprimir no vuelve
+    a dibujarlo. Las hojas (A4, 300 dpi) se componen pegando esas imágenes y
+    se guardan como PDF en partes de HOJAS_POR_ARCHIVO páginas, que pueden
+    generarse en paralelo (ver comando generar_etiquetas_activos).
+    """
+
+    VERSION = 1  # Cambiar si se modifica el dibujo, para invalidar el caché
+    DPI = 300
+    TAMANO_HOJA = (2480, 3508)  # A4 a 300 dpi
+    MARGEN = 118  # 10 mm
+    COLUMNAS = 3
+    FILAS = 8
+    HOJAS_POR_ARCHIVO = 25
+    LARGO_NOMBRE = 40
+
+    def __init__(self, directorio: Optional[Path] = None) -> None:
+        self.directorio = Path(directorio or Path(settings.MEDIA_ROOT) / 'etiquetas')
+        self.directorio_cache = self.directorio / 'codigos'
+        self.repository = ActivoRepository()
+
+    @property
+    def etiquetas_por_hoja(self) -> int:
+        """Cantidad de etiquetas por hoja."""
+        return self.COLUMNAS * self.FILAS
+
+    @property
+    def etiquetas_por_archivo(self) -> int:
+        """Cantidad de etiquetas por archivo PDF."""
+        return self.etiquetas_por_hoja * self.HOJAS_POR_ARCHIVO
+
+    def ruta_cache(self, codigo_barras: str) -> Path:
+        """Ruta del PNG cacheado de un código (hash del código, apto para cualquier carácter)."""
+        clave = hashlib.sha1(f'{self.VERSION}:{codigo_barras}'.encode()).hexdigest()
+        return self.directorio_cache / clave[:2] / f'{clave}.png'
+
+    def imagen_codigo(self, codigo_barras: str) -> Image.Image:
+        """
+        Imagen del código de barras, desde el caché o dibujándola y guardándola.
+
+        Raises:
+            ValueError: Si el código no es codificable en Code 128
+        """
+        ruta = self.ruta_cache(codigo_barras)
+        if ruta.exists():
+            with Image.open(ruta) as imagen:
+                imagen.load()
+            return imagen
+
+        imagen = dibujar_code128(codigo_barras)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        # Escritura atómica: otro proceso puede estar leyendo el mismo código
+        temporal = ruta.with_suffix(f'.{os.getpid()}.tmp')
+        imagen.save(temporal, 'PNG', optimize=True)
+        os.replace(temporal, ruta)
+        return imagen
+
+    def obtener_etiquetas(self, **filtros: Any) -> List[Dict[str, str]]:
+        """
+        Activos a etiquetar.
+
+        Args:
+            **filtros: codigos, categoria_codigo y/o creados_desde
+                (ver ActivoRepository.get_para_etiquetas)
+
+        Returns:
+            Lista de diccionarios (codigo, nombre, codigo_barras)
+        """
+        return list(self.repository.get_para_etiquetas(**filtros))
+
+    def dividir_partes(self, etiquetas: List[Dict[str, str]]) -> List[List[Dict[str, str]]]:
+        """Divide las etiquetas en partes de un archivo PDF cada una."""
+        tamano = self.etiquetas_por_archivo
+        return [etiquetas[inicio:inicio + tamano] for inicio in range(0, len(etiquetas), tamano)]
+
+    def _componer_hoja(self, etiquetas: List[Dict[str, str]], fuente) -> Image.Image:
+        """Compone una hoja con hasta etiquetas_por_hoja etiquetas."""
+        ancho_hoja, alto_hoja = self.TAMANO_HOJA
+        ancho_celda = (ancho_hoja - 2 * self.MARGEN) // self.COLUMNAS
+        alto_celda = (alto_hoja - 2 * self.MARGEN) // self.FILAS
+        alto_nombre = fuente.size + fuente.size // 2
+
+        hoja = Image.new('L', self.TAMANO_HOJA, 255)
+        dibujo = ImageDraw.Draw(hoja)
+        for posicion, etiqueta in enumerate(etiquetas):
+            fila, columna = divmod(posicion, self.COLUMNAS)
+            x = self.MARGEN + columna * ancho_celda
+            y = self.MARGEN + fila * alto_celda
+
+            codigo = self.imagen_codigo(etiqueta['codigo_barras'])
+            escala = min(1, (ancho_celda - 20) / codigo.width, (alto_celda - alto_nombre - 20) / codigo.height)
+            if escala < 1:
+                codigo = codigo.resize(
+                    (int(codigo.width * escala), int(codigo.height * escala)), Image.Resampling.NEAREST
+                )
+            hoja.paste(codigo, (x + (ancho_celda - codigo.width) // 2, y + 10))
+
+            nombre = etiqueta['nombre']
+            if len(nombre) > self.LARGO_NOMBRE:
+                nombre = nombre[:self.LARGO_NOMBRE - 3] + '...'
+            dibujo.text(
+                (x + ancho_celda // 2, y + 10 + codigo.height + alto_nombre // 2),
+                nombre, fill=0, font=fuente, anchor='mm'
+            )
+        return hoja.convert('1', dither=Image.Dither.NONE)
+
+    def generar_pdf(self, etiquetas: List[Dict[str, str]], ruta: Path) -> Dict[str, Any]:
+        """
+        Genera un PDF con las hojas de un grupo de etiquetas.
+
+        Los códigos no codificables (caracteres fuera de ASCII) se omiten y
+        se informan.
+
+        Args:
+            etiquetas: Etiquetas de una parte (ver dividir_partes)
+            ruta: Ruta del PDF a generar
+
+        Returns:
+            Diccionario con ruta, etiquetas impresas y omitidas (lista de códigos)
+        """
+        imprimibles, omitidas = [], []
+        for etiqueta in etiquetas:
+            try:
+                simbolos_code128(etiqueta['codigo_barras'])
+            except ValueError:
+                omitidas.append(etiqueta['codigo'])
+                continue
+            imprimibles.append(etiqueta)
+
+        resultado = {'ruta': None, 'etiquetas': len(imprimibles), 'omitidas': omitidas}
+        if not imprimibles:
+            return resultado
+
+        fuente = ImageFont.load_default(size=30)
+        por_hoja = self.etiquetas_por_hoja
+        hojas = [
+            self._componer_hoja(imprimibles[inicio:inicio + por_hoja], fuente)
+            for inicio in range(0, len(imprimibles), por_hoja)
+        ]
+        ruta = Path(ruta)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        hojas[0].save(ruta, 'PDF', resolution=self.DPI, save_all=True, append_images=hojas[1:])
+        resultado['ruta'] = str(ruta)
+        return resultado
+
+
+# ==================== AUDITORÍA SERVICE ====================
+
+class AuditoriaActivoService:
+    """
+    Service para auditorías físicas de activos por ubicación.
+
+    Las lecturas se resuelven por lote con una consulta y se insertan con
+    bulk_create; la comparación contra los activos esperados es una sola
+    consulta basada en conjuntos y los movimientos correctivos se registran
+    con bulk_create al aplicar la auditoría.
+    """
+
+    TAMANO_LOTE = 1000
+    CODIGO_TIPO_AJUSTE = 'AJUSTE'
+
+    def __init__(self) -> None:
+        self.auditoria_repo = AuditoriaActivoRepository()
+        self.movimiento_repo = MovimientoActivoRepository()
+        self.tipo_repo = TipoMovimientoActivoRepository()
+
+    @transaction.atomic
+    def crear_auditoria(
+        self,
+        ubicacion: Ubicacion,
+        responsable: User,
+        observaciones: Optional[str] = None
+    ) -> AuditoriaActivo:
+        """
+        Abre una nueva auditoría para una ubicación.
+
+        Args:
+            ubicacion: Ubicación a auditar
+            responsable: Usuario responsable de la auditoría
+            observaciones: Observaciones (opcional)
+
+        Returns:
+            AuditoriaActivo creada
+
+        Raises:
+            ValidationError: Si la ubicación ya tiene una auditoría abierta
+        """
+        # La restricción parcial uq_auditoria_abierta_ubicacion garantiza una
+        # sola auditoría abierta por ubicación aun con solicitudes concurrentes
+        try:
+            with transaction.atomic():
+                return self.auditoria_repo.create(
+                    numero=generar_codigo_con_anio('AUD', AuditoriaActivo, 'numero', longitud=6),
+                    ubicacion=ubicacion,
+                    responsable=responsable,
+                    observaciones=observaciones
+                )
+        except IntegrityError as e:
+            if AuditoriaActivo.RESTRICCION_ABIERTA not in str(e):
+                raise
+            raise ValidationError(
+                f'La ubicación "{ubicacion.nombre}" ya tiene una auditoría abierta.'
+            )
+
+    @staticmethod
+    def parsear_lineas(texto: str) -> List[Tuple[int, str]]:
+        """
+        Interpreta el texto escaneado, un código por línea.
+
+        Returns:
+            Lista de tuplas (número de línea, código)
+        """
+        return [
+            (numero, linea.strip())
+            for numero, linea in enumerate(texto.splitlines(), start=1)
+            if linea.strip()
+        ]
+
+    def _bloquear_abierta(self, auditoria: AuditoriaActivo) -> AuditoriaActivo:
+        """
+        Relee la auditoría con bloqueo de fila y valida que siga abierta.
+
+        Debe llamarse dentro de una transacción: serializa lecturas, aplicación
+        y cancelación de una misma auditoría, de modo que no se registren
+        lecturas en una auditoría que otra solicitud ya aplicó.
+
+        Returns:
+            AuditoriaActivo bloqueada
+
+        Raises:
+            ValidationError: Si la auditoría no está abierta
+        """
+        auditoria = AuditoriaActivo.objects.select_for_update().select_related('ubicacion').get(pk=auditoria.pk)
+        if auditoria.estado != AuditoriaActivo.ESTADO_ABIERTA:
+            raise ValidationError(
+                f'La auditoría {auditoria.numero} está {auditoria.get_estado_display().lower()} '
+                'y no admite cambios.'
+            )
+        return auditoria
+
+    @transaction.atomic
+    def registrar_lecturas(
+        self,
+        auditoria: AuditoriaActivo,
+        lecturas: Iterable[Tuple[int, str]],
+        usuario: User
+    ) -> Dict[str, Any]:
+        """
+        Registra un lote de códigos escaneados.
+
+        Los códigos (código o código de barras) del lote se resuelven con una
+        sola consulta; las lecturas repetidas, en el lote o en lotes
+        anteriores, se ignoran.
+
+        Args:
+            auditoria: Auditoría abierta
+            lecturas: Tuplas (línea, código) (ver parsear_lineas)
+            usuario: Usuario que registra
+
+        Returns:
+            Diccionario con leidos (activos distintos del lote) y errores
+            [{linea, codigo, mensaje}]
+
+        Raises:
+            ValidationError: Si la auditoría no está abierta
+        """
+        auditoria = self._bloquear_abierta(auditoria)
+
+        lecturas = list(lecturas)
+        codigos = {codigo.upper() for _, codigo in lecturas} | {codigo for _, codigo in lecturas}
+        activos_por_codigo: Dict[str, int] = {}
+        for activo_id, codigo, codigo_barras in Activo.objects.filter(
+            Q(codigo__in=codigos) | Q(codigo_barras__in=codigos)
+        ).values_list('id', 'codigo', 'codigo_barras'):
+            activos_por_codigo[codigo.upper()] = activo_id
+            if codigo_barras:
+                activos_por_codigo.setdefault(codigo_barras.upper(), activo_id)
+
+        activo_ids = set()
+        errores: List[Dict[str, Any]] = []
+        for linea, codigo in lecturas:
+            activo_id = activos_por_codigo.get(codigo.upper())
+            if activo_id is None:
+                errores.append({
+                    'linea': linea, 'codigo': codigo,
+                    'mensaje': 'No existe un activo con ese código.'
+                })
+                continue
+            activo_ids.add(activo_id)
+
+        self.auditoria_repo.bulk_create_lecturas([
+            LecturaAuditoriaActivo(auditoria=auditoria, activo_id=activo_id, usuario=usuario)
+            for activo_id in activo_ids
+        ], self.TAMANO_LOTE)
+        return {'leidos': len(activo_ids), 'errores': errores}
+
+    def comparar(self, auditoria: AuditoriaActivo) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Clasifica los activos de la auditoría según lo leído.
+
+        Args:
+            auditoria: Auditoría
+
+        Returns:
+            Diccionario con listas encontrados (esperados y leídos), faltantes
+            (esperados no leídos) y mal_ubicados (leídos cuya ubicación actual
+            es otra o ninguna)
+        """
+        resultado: Dict[str, List[Dict[str, Any]]] = {
+            'encontrados': [], 'faltantes': [], 'mal_ubicados': []
+        }
+        for fila in self.auditoria_repo.get_comparacion(auditoria):
+            esperado = fila['ubicacion_actual_id'] == auditoria.ubicacion_id
+            if esperado and fila['leido']:
+                resultado['encontrados'].append(fila)
+            elif esperado:
+                resultado['faltantes'].append(fila)
+            elif fila['leido']:
+                resultado['mal_ubicados'].append(fila)
+        return resultado
+
+    @transaction.atomic
+    def aplicar_auditoria(
+        self,
+        auditoria: AuditoriaActivo,
+        usuario: User,
+        registrar_faltantes: bool = True
+    ) -> Dict[str, int]:
+        """
+        Registra los movimientos correctivos de la auditoría.
+
+        Los activos mal ubicados se mueven a la ubicación auditada y, si se
+        indica, los faltantes quedan sin ubicación. No se valida si el estado
+        del activo permite movimientos: el ajuste refleja lo observado.
+
+        Args:
+            auditoria: Auditoría abierta
+            usuario: Usuario que aplica la auditoría
+            registrar_faltantes: Si True, los faltantes se mueven a "sin ubicación"
+
+        Returns:
+            Diccionario con reubicados y faltantes (movimientos registrados)
+
+        Raises:
+            ValidationError: Si la auditoría no está abierta o no existe el
+                tipo de movimiento de ajuste
+        """
+        auditoria = self._bloquear_abierta(auditoria)
+
+        tipo_ajuste = self.tipo_repo.get_by_codigo(self.CODIGO_TIPO_AJUSTE)
+        if not tipo_ajuste:
+            raise ValidationError(
+                f'No existe el tipo de movimiento "{self.CODIGO_TIPO_AJUSTE}". '
+                'Configúrelo en el catálogo de tipos de movimiento.'
+            )
+
+        comparacion = self.comparar(auditoria)
+        movimientos = [
+            MovimientoActivo(
+                activo_id=fila['id'],
+                tipo_movimiento=tipo_ajuste,
+                ubicacion_destino_id=auditoria.ubicacion_id,
+                usuario_registro=usuario,
+                observaciones=(
+                    f'Encontrado en {auditoria.ubicacion.nombre} durante la auditoría {auditoria.numero}'
+                )
+            )
+            for fila in comparacion['mal_ubicados']
+        ]
+        if registrar_faltantes:
+            movimientos.extend(
+                MovimientoActivo(
+                    activo_id=fila['id'],
+                    tipo_movimiento=tipo_ajuste,
+                    ubicacion_destino=None,
+                    usuario_registro=usuario,
+                    observaciones=(
+                        f'No encontrado en {auditoria.ubicacion.nombre} durante la auditoría {auditoria.numero}'
+                    )
+                )
+                for fila in comparacion['faltantes']
+            )
+        self.movimiento_repo.bulk_create(movimientos, self.TAMANO_LOTE)
+
+        auditoria.estado = AuditoriaActivo.ESTADO_APLICADA
+        auditoria.fecha_aplicacion = timezone.now()
+        auditoria.aplicado_por = usuario
+        auditoria.save(update_fields=['estado', 'fecha_aplicacion', 'aplicado_por', 'fecha_actualizacion'])
+        return {
+            'reubicados': len(comparacion['mal_ubicados']),
+            'faltantes': len(movimientos) - len(comparacion['mal_ubicados']),
+        }
+
+    @transaction.atomic
+    def cancelar_auditoria(self, auditoria: AuditoriaActivo) -> AuditoriaActivo:
+        """
+        Cancela una auditoría abierta sin registrar movimientos.
+
+        Raises:
+            ValidationError: Si la auditoría no está abierta
+        """
+        auditoria = self._bloquear_abierta(auditoria)
+        auditoria.estado = AuditoriaActivo.ESTADO_CANCELADA
+        auditoria.save(update_fields=['estado', 'fecha_actualizacion'])
+        return auditoria
+
+
 # ==================== SERVICIOS DE CATÁLOGOS ====================
 
 class CategoriaActivoService:
@@ -0,0 +1,3 @@
+"""
+Tests para la aplicación de activos.
+"""
@@ -0,0 +1,68 @@
+"""
+Configuración de fixtures y utilidades para tests de activos.
+"""
+import pytest
+from django.contrib.auth.models import User
+from apps.activos.models import (
+    CategoriaActivo, EstadoActivo, Activo, Ubicacion, TipoMovimientoActivo, MovimientoActivo
+)
+
+
+# ==================== FIXTURES DE USUARIOS ====================
+
+@pytest.fixture
+def usuario_admin(db):
+    """Crea un usuario administrador."""
+    return User.objects.create_superuser(
+        username='admin',
+        email='admin@example.com',
+        password='adminpass123'
+    )
+
+
+# ==================== FIXTURES DE CATÁLOGOS ====================
+
+@pytest.fixture
+def categoria(db):
+    """Crea una categoría de activos de test."""
+    return CategoriaActivo.objects.create(codigo='COMP', nombre='Computación')
+
+
+@pytest.fixture
+def estado_inicial(db):
+    """Crea el estado inicial de los activos."""
+    return EstadoActivo.objects.create(codigo='NUEVO', nombre='Nuevo', es_inicial=True)
+
+
+# ==================== FIXTURES DE UBICACIONES ====================
+
+@pytest.fixture
+def ubicaciones(db):
+    """Crea dos ubicaciones: Sala 1 y Sala 2."""
+    return [
+        Ubicacion.objects.create(codigo='SALA-1', nombre='Sala 1'),
+        Ubicacion.objects.create(codigo='SALA-2', nombre='Sala 2'),
+    ]
+
+
+@pytest.fixture
+def activos_ubicados(usuario_admin, categoria, estado_inicial, ubicaciones):
+    """
+    Crea cuatro activos: A-1 y A-2 en Sala 1, A-3 en Sala 2 y A-4 sin ubicación.
+
+    También crea el tipo de movimiento AJUSTE que usan las auditorías.
+    """
+    traslado = TipoMovimientoActivo.objects.create(codigo='TRASLADO', nombre='Traslado')
+    TipoMovimientoActivo.objects.create(codigo='AJUSTE', nombre='Ajuste')
+    activos = [
+        Activo.objects.create(
+            codigo=f'A-{numero}', nombre=f'Equipo {numero}', categoria=categoria,
+            estado=estado_inicial, codigo_barras=f'BC-{numero}'
+        )
+        for numero in range(1, 5)
+    ]
+    for activo, ubicacion in zip(activos, (ubicaciones[0], ubicaciones[0], ubicaciones[1])):
+        MovimientoActivo.objects.create(
+            activo=activo, tipo_movimiento=traslado, ubicacion_destino=ubicacion, usuario_registro=usuario_admin
+        )
+    return activos
@@ -0,0 +1,455 @@
+"""
+Tests para la capa de servicios del módulo de activos.
+
+Siguiendo el patrón Arrange-Act-Assert.
+"""
+import pytest
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from apps.activos.models import (
+    Activo, CategoriaActivo, EstadoActivo, DepreciacionActivoMensual, AuditoriaActivo, MovimientoActivo,
+    TipoMovimientoActivo
+)
+from apps.activos.services import (
+    ImportacionActivoService, MovimientoActivoService, DepreciacionActivoService, AuditoriaActivoService,
+    EtiquetaActivoService
+)
+from apps.bodega.services import EscaneoCodigoBarrasService
+from core.utils.codigo_barras import (
+    PATRONES_CODE128, INICIO_B, PARADA, ZONA_SILENCIO, simbolos_code128, dibujar_code128
+)
+
+
+# ==================== TESTS DE IMPORTACIÓN DE ACTIVOS SERVICE ====================
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures('categoria', 'estado_inicial')
+class TestImportacionActivoService:
+    """Tests para ImportacionActivoService."""
+
+    def importar(self, filas, **kwargs):
+        """Importa un CSV con las columnas obligatorias más lote y precio_unitario."""
+        contenido = 'codigo;nombre;categoria;lote;precio_unitario\n' + '\n'.join(filas)
+        return ImportacionActivoService().importar(
+            BytesIO(contenido.encode('utf-8')), 'activos.csv', **kwargs
+        )
+
+    def test_importar_crea_validos_y_reporta_errores_por_fila(self):
+        """
+        GIVEN: Una planilla con filas válidas, un código duplicado y una categoría inexistente
+        WHEN: Se importa
+        THEN: Se crean solo las válidas y cada error indica su fila
+        """
+        reporte = self.importar([
+            'PC-1;Notebook;COMP;;1500,5',
+            'PC-1;Duplicado;COMP;;',
+            'PC-2;Monitor;NOEXISTE;;',
+            'PC-3;Teclado;COMP;L-1;',
+        ])
+
+        assert (reporte['total_filas'], reporte['creados']) == (4, 2)
+        assert [error['fila'] for error in reporte['errores']] == [3, 4]
+        activo = Activo.objects.get(codigo='PC-1')
+        assert activo.precio_unitario == Decimal('1500.50')
+        assert activo.estado.codigo == 'NUEVO'
+
+    @pytest.mark.parametrize('valor', ['NaN', 'Infinity', '-sNaN', '12345678901', 'abc', '-1'])
+    def test_importar_precio_invalido_es_error_de_fila(self, valor):
+        """NaN, infinitos y precios que exceden max_digits no abortan la importación."""
+        reporte = self.importar([
+            f'PC-1;Notebook;COMP;;{valor}',
+            'PC-2;Monitor;COMP;;100',
+        ])
+
+        assert reporte['creados'] == 1
+        assert [error['codigo'] for error in reporte['errores']] == ['PC-1']
+        assert 'Precio unitario' in reporte['errores'][0]['mensaje']
+
+    def test_importar_texto_mas_largo_que_el_campo_es_error_de_fila(self):
+        """Un código, nombre o lote demasiado largo se informa sin invalidar el lote."""
+        reporte = self.importar([
+            f'{"X" * 51};Notebook;COMP;;',
+            f'PC-2;{"M" * 201};COMP;;',
+            f'PC-3;Teclado;COMP;{"L" * 51};',
+            'PC-4;Mouse;COMP;;',
+        ])
+
+        assert reporte['creados'] == 1
+        assert ['largo máximo' in error['mensaje'] for error in reporte['errores']] == [True, True, True]
+
+    def test_importar_dry_run_no_escribe(self):
+        """Con dry_run solo se valida."""
+        reporte = self.importar(['PC-1;Notebook;COMP;;'], dry_run=True)
+
+        assert reporte['validas'] == 1
+        assert not Activo.objects.filter(codigo='PC-1').exists()
+
+    def test_importar_invalida_cache_de_escaneo_al_confirmar(self, django_capture_on_commit_callbacks):
+        """
+        GIVEN: Un código de barras leído y cacheado como no encontrado
+        WHEN: Se importa un activo con ese código (y, antes, un dry_run)
+        THEN: Solo la importación confirmada invalida la caché y la lectura lo encuentra
+        """
+        EscaneoCodigoBarrasService.invalidar_cache()
+        service = EscaneoCodigoBarrasService()
+        assert service.resolver(['BC-PC1']) == {'BC-PC1': []}
+        contenido = 'codigo;nombre;categoria;codigo_barras\nPC-1;Notebook;COMP;BC-PC1'
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            ImportacionActivoService().importar(BytesIO(contenido.encode('utf-8')), 'a.csv', dry_run=True)
+        assert callbacks == []
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            ImportacionActivoService().importar(BytesIO(contenido.encode('utf-8')), 'a.csv')
+
+        assert len(callbacks) == 1
+        assert service.resolver(['BC-PC1'])['BC-PC1'][0]['codigo'] == 'PC-1'
+
+
+# ==================== TESTS DE MOVIMIENTOS MASIVOS ====================
+
+@pytest.mark.django_db
+class TestMovimientoActivoServiceMasivo:
+    """Tests para MovimientoActivoService.registrar_movimientos_masivos (todo o nada)."""
+
+    @pytest.fixture
+    def traslado(self, activos_ubicados):
+        """Tipo de movimiento TRASLADO creado junto a los activos ubicados."""
+        return TipoMovimientoActivo.objects.get(codigo='TRASLADO')
+
+    def registrar(self, traslado, usuario, destino, **kwargs):
+        """Registra un traslado masivo hacia la ubicación destino."""
+        return MovimientoActivoService().registrar_movimientos_masivos(
+            tipo_movimiento=traslado, usuario_registro=usuario, ubicacion_destino=destino, **kwargs
+        )
+
+    def test_resuelve_por_id_codigo_y_codigo_de_barras(self, activos_ubicados, traslado, ubicaciones, usuario_admin):
+        """
+        GIVEN: A-1 por ID (y repetido por su código de barras), A-2 por código y A-3 por código de barras
+        WHEN: Se registra el traslado masivo a Sala 2
+        THEN: Se crea un solo movimiento por activo, todos con el destino y el usuario indicados
+        """
+        a1, a2, a3, _ = activos_ubicados
+
+        movimientos = self.registrar(
+            traslado, usuario_admin, ubicaciones[1],
+            activo_ids=[a1.pk], codigos=['A-2', ' BC-3 ', 'BC-1', '']
+        )
+
+        creados = MovimientoActivo.objects.filter(pk__in=[movimiento.pk for movimiento in movimientos])
+        assert sorted(creados.values_list('activo__codigo', flat=True)) == ['A-1', 'A-2', 'A-3']
+        assert set(creados.values_list('ubicacion_destino', 'usuario_registro')) == {
+            (ubicaciones[1].pk, usuario_admin.pk)
+        }
+
+    def test_codigo_inexistente_no_registra_ninguno(self, activos_ubicados, traslado, ubicaciones, usuario_admin):
+        """Un código desconocido rechaza el lote completo y lo informa."""
+        total_previo = MovimientoActivo.objects.count()
+
+        with pytest.raises(ValidationError) as error:
+            self.registrar(traslado, usuario_admin, ubicaciones[1], codigos=['A-1', 'NO-EXISTE'])
+
+        assert 'NO-EXISTE' in ' '.join(error.value.messages)
+        assert MovimientoActivo.objects.count() == total_previo
+
+    def test_estado_sin_movimiento_no_registra_ninguno(self, activos_ubicados, traslado, ubicaciones, usuario_admin):
+        """Un activo en un estado que no permite movimientos rechaza el lote completo."""
+        baja = EstadoActivo.objects.create(codigo='BAJA', nombre='De baja', permite_movimiento=False)
+        Activo.objects.filter(pk=activos_ubicados[1].pk).update(estado=baja)
+        total_previo = MovimientoActivo.objects.count()
+
+        with pytest.raises(ValidationError) as error:
+            self.registrar(
+                traslado, usuario_admin, ubicaciones[1], activo_ids=[activo.pk for activo in activos_ubicados]
+            )
+
+        assert error.value.messages == ['El activo A-2 está en estado "De baja" que no permite movimientos.']
+        assert MovimientoActivo.objects.count() == total_previo
+
+    def test_sin_activos_es_error(self, traslado, ubicaciones, usuario_admin):
+        """Sin IDs ni códigos (o solo códigos vacíos) no hay nada que registrar."""
+        with pytest.raises(ValidationError):
+            self.registrar(traslado, usuario_admin, ubicaciones[1], codigos=['', '  '])
+
+
+# ==================== TESTS DE DEPRECIACIÓN SERVICE ====================
+
+class TestDepreciacionActivoService:
+    """Tests para DepreciacionActivoService."""
+
+    def cronograma(self, costo, residual, vida_util, metodo):
+        """Valores libro de los meses 0..vida_util."""
+        return [
+            DepreciacionActivoService.valor_libro(Decimal(costo), Decimal(residual), vida_util, metodo, meses)
+            for meses in range(vida_util + 1)
+        ]
+
+    def test_lineal(self):
+        """La cuota lineal es constante y el valor no baja del residual."""
+        valor_libro = DepreciacionActivoService.valor_libro
+
+        assert valor_libro(Decimal('1200'), Decimal('0'), 12, CategoriaActivo.METODO_LINEAL, 1) == Decimal('1100.00')
+        assert valor_libro(Decimal('1200'), Decimal('120'), 12, CategoriaActivo.METODO_LINEAL, 30) == Decimal('120.00')
+
+    def test_saldo_decreciente_inicia_con_doble_tasa(self):
+        """Los primeros meses aplican la tasa 2 / vida útil sobre el saldo."""
+        valores = self.cronograma('1000', '100', 10, CategoriaActivo.METODO_SALDO_DECRECIENTE)
+
+        assert valores[1:4] == [Decimal('800.00'), Decimal('640.00'), Decimal('512.00')]
+
+    def test_saldo_decreciente_cambia_a_lineal_y_termina_en_residual(self):
+        """
+        GIVEN: Un activo por doble saldo decreciente con valor residual
+        WHEN: Se calcula el cronograma completo
+        THEN: Las cuotas nunca aumentan, terminan en cuotas lineales y el valor llega al residual
+        """
+        valores = self.cronograma('1200', '120', 12, CategoriaActivo.METODO_SALDO_DECRECIENTE)
+        cuotas = [anterior - valor for anterior, valor in zip(valores, valores[1:])]
+
+        assert valores[-1] == Decimal('120.00')
+        assert all(cuota > 0 for cuota in cuotas)
+        assert all(cuota >= siguiente for cuota, siguiente in zip(cuotas, cuotas[1:]))
+        # Tramo lineal: las últimas cuotas difieren solo por redondeo
+        assert abs(cuotas[-1] - cuotas[-2]) <= Decimal('0.01')
+
+    @pytest.mark.django_db
+    def test_generar_cierres_mensuales(self, estado_inicial):
+        """
+        GIVEN: Un activo lineal adquirido a mediados de enero
+        WHEN: Se generan los cierres del año
+        THEN: Hay un cierre por mes y el de diciembre deja el valor libro en cero
+        """
+        categoria = CategoriaActivo.objects.create(codigo='MOB', nombre='Mobiliario', vida_util_meses=12)
+        Activo.objects.create(
+            codigo='M-1', nombre='Escritorio', categoria=categoria, estado=estado_inicial,
+            precio_unitario=Decimal('1200'), fecha_adquisicion=date(2026, 1, 15)
+        )
+
+        assert DepreciacionActivoService().generar(date(2026, 1, 1), date(2026, 12, 31)) == 12
+
+        cierre = DepreciacionActivoMensual.objects.get(mes=date(2026, 12, 1))
+        assert (cierre.depreciacion_mes, cierre.depreciacion_acumulada, cierre.valor_libro) == (
+            Decimal('100'), Decimal('1200'), Decimal('0')
+        )
+
+
+# ==================== TESTS DE CÓDIGOS DE BARRAS Y ETIQUETAS ====================
+
+class TestCode128:
+    """Tests del codificador Code 128-B de core.utils.codigo_barras."""
+
+    def test_simbolos_vector_conocido(self):
+        """
+        GIVEN: El ejemplo clásico 'PJJ123C'
+        WHEN: Se codifica
+        THEN: Los símbolos son inicio B, los valores ASCII - 32, el verificador 55 y la parada
+        """
+        # (104 + 48*1 + 42*2 + 42*3 + 17*4 + 18*5 + 19*6 + 35*7) % 103 = 879 % 103 = 55
+        assert simbolos_code128('PJJ123C') == [104, 48, 42, 42, 17, 18, 19, 35, 55, 106]
+
+    def test_verificador_pondera_por_posicion(self):
+        """El verificador cambia con el orden de los caracteres y puede ser cero."""
+        assert simbolos_code128('AB')[-2] == 102  # (104 + 33*1 + 34*2) % 103
+        assert simbolos_code128('BA')[-2] == 101  # (104 + 34*1 + 33*2) % 103
+        assert simbolos_code128('~$')[-2] == 0  # (104 + 94*1 + 4*2) % 103
+
+    @pytest.mark.parametrize('texto', ['', 'Ñandú', 'A\tB', 'A\x7f'])
+    def test_rechaza_texto_vacio_o_fuera_de_ascii_imprimible(self, texto):
+        """Solo se codifican caracteres entre espacio y '~'."""
+        with pytest.raises(ValueError):
+            simbolos_code128(texto)
+
+    def test_patrones_tienen_11_modulos_y_barras_pares(self):
+        """Cada símbolo ocupa 11 módulos (la parada 13) con un total par de módulos de barra."""
+        assert len(PATRONES_CODE128) == 107
+        for valor, patron in enumerate(PATRONES_CODE128):
+            anchos = [int(ancho) for ancho in patron]
+            assert sum(anchos) == (13 if valor == PARADA else 11), valor
+            assert sum(anchos[::2]) % 2 == 0, valor
+        assert len(set(PATRONES_CODE128)) == 107
+        assert PATRONES_CODE128[INICIO_B] == '211214'
+
+    def test_dibujo_reproduce_los_patrones(self):
+        """Leer una fila de la imagen devuelve los anchos de los patrones de cada símbolo."""
+        ancho_modulo = 2
+        imagen = dibujar_code128('A-1', ancho_modulo=ancho_modulo, alto_barras=40)
+        fila = [imagen.getpixel((x, 0)) for x in range(imagen.width)]
+
+        inicio, fin = ZONA_SILENCIO * ancho_modulo, imagen.width - ZONA_SILENCIO * ancho_modulo
+        assert set(fila[:inicio]) == set(fila[fin:]) == {255}
+        anchos, actual, largo = [], fila[inicio], 0
+        for pixel in fila[inicio:fin]:
+            if pixel != actual:
+                anchos.append(str(largo // ancho_modulo))
+                actual, largo = pixel, 0
+            largo += 1
+        anchos.append(str(largo // ancho_modulo))
+
+        assert ''.join(anchos) == ''.join(PATRONES_CODE128[simbolo] for simbolo in simbolos_code128('A-1'))
+
+
+class TestEtiquetaActivoService:
+    """Tests del caché en disco y la generación de PDF de EtiquetaActivoService."""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        """Service con el directorio de etiquetas en un directorio temporal."""
+        return EtiquetaActivoService(directorio=tmp_path)
+
+    def etiqueta(self, codigo, codigo_barras=None):
+        """Etiqueta con el formato de obtener_etiquetas."""
+        return {'codigo': codigo, 'nombre': f'Equipo {codigo}', 'codigo_barras': codigo_barras or f'BC-{codigo}'}
+
+    def test_imagen_se_dibuja_una_vez_y_luego_se_lee_del_cache(self, service, monkeypatch):
+        """
+        GIVEN: Un código ya dibujado
+        WHEN: Se vuelve a pedir su imagen
+        THEN: Se lee el PNG del caché sin volver a dibujarlo
+        """
+        primera = service.imagen_codigo('BC-1')
+        ruta = service.ruta_cache('BC-1')
+        assert ruta.exists()
+        assert ruta.parent.parent == service.directorio_cache
+        assert list(ruta.parent.glob('*.tmp')) == []
+
+        def no_dibujar(texto):
+            raise AssertionError('No debió redibujarse')
+
+        monkeypatch.setattr('apps.activos.services.dibujar_code128', no_dibujar)
+        segunda = service.imagen_codigo('BC-1')
+
+        assert segunda.size == primera.size
+        assert segunda.tobytes() == primera.tobytes()
+
+    def test_ruta_cache_depende_del_codigo_y_la_version(self, service, monkeypatch):
+        """Códigos distintos (aunque tengan '/' o espacios) y versiones distintas usan otro archivo."""
+        ruta = service.ruta_cache('BC-1')
+
+        assert service.ruta_cache('BC-2') != ruta
+        assert service.ruta_cache('BC/1 ').parent.parent == service.directorio_cache
+        monkeypatch.setattr(EtiquetaActivoService, 'VERSION', EtiquetaActivoService.VERSION + 1)
+        assert service.ruta_cache('BC-1') != ruta
+
+    def test_generar_pdf_omite_codigos_no_codificables(self, service, tmp_path):
+        """Los códigos fuera de ASCII se informan como omitidos y el resto se imprime."""
+        etiquetas = [self.etiqueta('A-1'), self.etiqueta('A-2', 'CÓDIGO-Ñ'), self.etiqueta('A-3')]
+
+        resultado = service.generar_pdf(etiquetas, tmp_path / 'pdf' / 'etiquetas.pdf')
+
+        assert (resultado['etiquetas'], resultado['omitidas']) == (2, ['A-2'])
+        assert (tmp_path / 'pdf' / 'etiquetas.pdf').read_bytes().startswith(b'%PDF')
+        assert not service.ruta_cache('CÓDIGO-Ñ').exists()
+
+    def test_generar_pdf_sin_imprimibles_no_crea_archivo(self, service, tmp_path):
+        """Si todos los códigos se omiten no se genera el PDF."""
+        resultado = service.generar_pdf([self.etiqueta('A-1', 'Ñ')], tmp_path / 'vacio.pdf')
+
+        assert resultado == {'ruta': None, 'etiquetas': 0, 'omitidas': ['A-1']}
+        assert not (tmp_path / 'vacio.pdf').exists()
+
+    def test_dividir_partes_por_archivo(self, service, monkeypatch):
+        """Las etiquetas se reparten en partes de etiquetas_por_archivo."""
+        monkeypatch.setattr(EtiquetaActivoService, 'HOJAS_POR_ARCHIVO', 1)
+        etiquetas = [self.etiqueta(f'A-{numero}') for numero in range(50)]
+
+        partes = service.dividir_partes(etiquetas)
+
+        assert [len(parte) for parte in partes] == [24, 24, 2]
+
+
+# ==================== TESTS DE AUDITORÍA DE ACTIVOS SERVICE ====================
+
+@pytest.mark.django_db
+class TestAuditoriaActivoService:
+    """Tests para AuditoriaActivoService."""
+
+    @pytest.fixture
+    def auditoria(self, activos_ubicados, ubicaciones, usuario_admin):
+        """Auditoría abierta sobre Sala 1."""
+        return AuditoriaActivoService().crear_auditoria(ubicaciones[0], usuario_admin)
+
+    def codigos(self, filas):
+        """Códigos de las filas de una comparación."""
+        return [fila['codigo'] for fila in filas]
+
+    def test_crear_auditoria_rechaza_segunda_abierta_en_la_ubicacion(self, auditoria, ubicaciones, usuario_admin):
+        """
+        GIVEN: Una ubicación con una auditoría abierta
+        WHEN: Se abre otra auditoría en la misma ubicación
+        THEN: La restricción parcial lo impide; tras cancelar la primera se permite
+        """
+        service = AuditoriaActivoService()
+
+        with pytest.raises(ValidationError, match='ya tiene una auditoría abierta'):
+            service.crear_auditoria(ubicaciones[0], usuario_admin)
+
+        service.cancelar_auditoria(auditoria)
+        assert service.crear_auditoria(ubicaciones[0], usuario_admin).estado == AuditoriaActivo.ESTADO_ABIERTA
+
+    def test_restriccion_abierta_en_base_de_datos(self, auditoria, ubicaciones, usuario_admin):
+        """Sin pasar por el service, la base de datos rechaza la segunda auditoría abierta."""
+        with pytest.raises(IntegrityError, match=AuditoriaActivo.RESTRICCION_ABIERTA), transaction.atomic():
+            AuditoriaActivo.objects.create(numero='AUD-MANUAL', ubicacion=ubicaciones[0], responsable=usuario_admin)
+
+    def test_registrar_lecturas_y_comparar(self, auditoria, usuario_admin):
+        """
+        GIVEN: Una auditoría de Sala 1
+        WHEN: Se leen A-1 (por código de barras), A-3, A-4, un repetido y un código inexistente
+        THEN: Se informan los errores por línea y la comparación clasifica cada activo
+        """
+        service = AuditoriaActivoService()
+
+        resultado = service.registrar_lecturas(
+            auditoria, service.parsear_lineas('BC-1\nA-3\nA-1\nNOEXISTE\na-4'), usuario_admin
+        )
+
+        assert resultado['leidos'] == 3
+        assert [error['linea'] for error in resultado['errores']] == [4]
+        comparacion = service.comparar(auditoria)
+        assert self.codigos(comparacion['encontrados']) == ['A-1']
+        assert self.codigos(comparacion['faltantes']) == ['A-2']
+        assert self.codigos(comparacion['mal_ubicados']) == ['A-3', 'A-4']
+
+    def test_aplicar_auditoria_registra_ajustes_y_cierra(self, auditoria, usuario_admin):
+        """Los mal ubicados se trasladan a la ubicación auditada y los faltantes quedan sin ubicación."""
+        service = AuditoriaActivoService()
+        service.registrar_lecturas(auditoria, [(1, 'A-1'), (2, 'A-3')], usuario_admin)
+
+        resultado = service.aplicar_auditoria(auditoria, usuario_admin)
+
+        assert resultado == {'reubicados': 1, 'faltantes': 1}
+        ajustes = dict(
+            MovimientoActivo.objects.filter(tipo_movimiento__codigo='AJUSTE')
+            .values_list('activo__codigo', 'ubicacion_destino_id')
+        )
+        assert ajustes == {'A-3': auditoria.ubicacion_id, 'A-2': None}
+        auditoria.refresh_from_db()
+        assert auditoria.estado == AuditoriaActivo.ESTADO_APLICADA
+
+    def test_registrar_lecturas_con_instancia_desactualizada_no_escribe(self, auditoria, usuario_admin):
+        """
+        GIVEN: Una instancia leída antes de que otra solicitud aplicara la auditoría
+        WHEN: Se registran lecturas con esa instancia
+        THEN: Se relee la auditoría bajo bloqueo y se rechazan las lecturas
+        """
+        service = AuditoriaActivoService()
+        instancia_desactualizada = AuditoriaActivo.objects.get(pk=auditoria.pk)
+        service.aplicar_auditoria(auditoria, usuario_admin)
+
+        with pytest.raises(ValidationError, match='aplicada'):
+            service.registrar_lecturas(instancia_desactualizada, [(1, 'A-1')], usuario_admin)
+        assert not auditoria.lecturas.exists()
+
+    def test_cancelar_con_instancia_desactualizada_falla(self, auditoria, usuario_admin):
+        """No se puede cancelar una auditoría que otra solicitud ya aplicó."""
+        service = AuditoriaActivoService()
+        instancia_desactualizada = AuditoriaActivo.objects.get(pk=auditoria.pk)
+        service.aplicar_auditoria(auditoria, usuario_admin)
+
+        with pytest.raises(ValidationError):
+            service.cancelar_auditoria(instancia_desactualizada)
+        auditoria.refresh_from_db()
+        assert auditoria.estado == AuditoriaActivo.ESTADO_APLICADA
@@ -16,14 +16,24 @@ urlpatterns = [
     path('listado/', views.ActivoListView.as_view(), name='lista_activos'),
     path('<int:pk>/', views.ActivoDetailView.as_view(), name='detalle_activo'),
     path('crear/', views.ActivoCreateView.as_view(), name='crear_activo'),
+    path('importar/', views.ActivoImportarView.as_view(), name='importar_activos'),
     path('<int:pk>/editar/', views.ActivoUpdateView.as_view(), name='editar_activo'),
     path('<int:pk>/eliminar/', views.ActivoDeleteView.as_view(), name='eliminar_activo'),
 
     # ==================== MOVIMIENTOS ====================
     path('movimientos/', views.MovimientoListView.as_view(), name='lista_movimientos'),
     path('movimientos/registrar/', views.MovimientoCreateView.as_view(), name='registrar_movimiento'),
+    path('movimientos/masivo/', views.MovimientoMasivoView.as_view(), name='movimiento_masivo'),
     path('movimientos/<int:pk>/', views.MovimientoDetailView.as_view(), name='detalle_movimiento'),
 
+    # ==================== AUDITORÍAS ====================
+    path('auditorias/', views.AuditoriaListView.as_view(), name='lista_auditorias'),
+    path('auditorias/crear/', views.AuditoriaCreateView.as_view(), name='crear_auditoria'),
+    path('auditorias/<int:pk>/', views.AuditoriaDetailView.as_view(), name='detalle_auditoria'),
+    path('auditorias/<int:pk>/lecturas/', views.AuditoriaLecturasView.as_view(), name='lecturas_auditoria'),
+    path('auditorias/<int:pk>/aplicar/', views.AuditoriaAplicarView.as_view(), name='aplicar_auditoria'),
+    path('auditorias/<int:pk>/cancelar/', views.AuditoriaCancelarView.as_view(), name='cancelar_auditoria'),
+
     # ==================== CATEGORÍAS ====================
     path('categorias/', views.CategoriaListView.as_view(), name='lista_categorias'),
     path('categorias/crear/', views.CategoriaCreateView.as_view(), name='crear_categoria'),
@@ -14,24 +14,31 @@ from typing import Any
 from django.db.models import QuerySet, Q
 from django.urls import reverse_lazy
 from django.views.generic import (
-    TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView
+    TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView, FormView
 )
 from django.contrib import messages
+from django.core.exceptions import ValidationError
 from django.http import HttpResponse
+from django.shortcuts import redirect
 
 from core.mixins import (
     BaseAuditedViewMixin, AtomicTransactionMixin, SoftDeleteMixin,
     PaginatedListMixin, FilteredListMixin
 )
+from core.utils import registrar_log_auditoria
 from .models import (
     Activo, CategoriaActivo, EstadoActivo, Ubicacion,
-    Proveniencia, Marca, Taller, TipoMovimientoActivo, MovimientoActivo
+    Proveniencia, Marca, Taller, TipoMovimientoActivo, MovimientoActivo,
+    AuditoriaActivo
 )
 from .forms import (
     ActivoForm, CategoriaActivoForm, EstadoActivoForm, UbicacionForm,
     ProvenienciaForm, MarcaForm, TallerForm, TipoMovimientoActivoForm,
-    MovimientoActivoForm, FiltroActivosForm
+    MovimientoActivoForm, MovimientoMasivoActivoForm, ImportarActivosForm,
+    AuditoriaActivoForm, LecturasAuditoriaForm, FiltroActivosForm
 )
+from .repositories import AuditoriaActivoRepository
+from .services import MovimientoActivoService, ImportacionActivoService, AuditoriaActivoService
 
 
 # ==================== VISTA MENÚ PRINCIPAL ====================
@@ -196,6 +203,54 @@ class ActivoCreateView(BaseAuditedViewMixin, AtomicTransactionMixin, CreateView)
         return response
 
 
+class ActivoImportarView(BaseAuditedViewMixin, FormView):
+    """
+    Vista para importar activos masivamente desde CSV o XLSX.
+
+    Permite una pasada de validación (dry-run) que solo muestra el reporte.
+    Delega la lógica a ImportacionActivoService.
+
+    Permisos: activos.importar_activos
+    """
+    form_class = ImportarActivosForm
+    template_name = 'activos/importar_activos.html'
+    permission_required = 'activos.importar_activos'
+
+    def form_valid(self, form: ImportarActivosForm) -> HttpResponse:
+        """Ejecuta la importación y muestra el reporte en la misma página."""
+        archivo = form.cleaned_data['archivo']
+        dry_run = form.cleaned_data['dry_run']
+
+        try:
+            reporte = ImportacionActivoService().importar(archivo, archivo.name, dry_run=dry_run)
+        except ValidationError as e:
+            messages.error(self.request, ' '.join(e.messages))
+            return self.form_invalid(form)
+
+        if dry_run:
+            messages.info(
+                self.request,
+                f"Validación completada: {reporte['validas']} de {reporte['total_filas']} fila(s) válidas."
+            )
+        else:
+            registrar_log_auditoria(
+                usuario=self.request.user,
+                accion_glosa='CREAR',
+                descripcion=f"Importación masiva de activos: {reporte['creados']} creado(s) desde {archivo.name}",
+                request=self.request,
+                meta={'errores': len(reporte['errores'])}
+            )
+            messages.success(self.request, f"{reporte['creados']} activo(s) importado(s) exitosamente.")
+
+        return self.render_to_response(self.get_context_data(form=form, reporte=reporte))
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Agrega datos al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Importar Activos'
+        return context
+
+
 class ActivoUpdateView(BaseAuditedViewMixin, AtomicTransactionMixin, UpdateView):
     """
     Vista para editar un activo existente.
@@ -407,6 +462,263 @@ class MovimientoCreateView(BaseAuditedViewMixin, AtomicTransactionMixin, CreateV
         return context
 
 
+class MovimientoMasivoView(BaseAuditedViewMixin, FormView):
+    """
+    Vista para registrar el mismo movimiento para varios activos a la vez.
+
+    Delega en MovimientoActivoService.registrar_movimientos_masivos: todos los
+    activos se validan juntos y, si alguno falla, no se registra ninguno.
+
+    Permisos: activos.add_movimientoactivo
+    """
+    form_class = MovimientoMasivoActivoForm
+    template_name = 'activos/form_movimiento_masivo.html'
+    permission_required = 'activos.add_movimientoactivo'
+
+    def form_valid(self, form: MovimientoMasivoActivoForm) -> HttpResponse:
+        """Registra los movimientos y redirige al historial."""
+        datos = form.cleaned_data
+        try:
+            movimientos = MovimientoActivoService().registrar_movimientos_masivos(
+                tipo_movimiento=datos['tipo_movimiento'],
+                usuario_registro=self.request.user,
+                activo_ids=[activo.pk for activo in datos['activos']],
+                codigos=datos['codigos'],
+                ubicacion_destino=datos['ubicacion_destino'],
+                responsable=datos['responsable'],
+                observaciones=datos['observaciones']
+            )
+        except ValidationError as e:
+            for mensaje in e.messages:
+                form.add_error(None, mensaje)
+            return self.form_invalid(form)
+
+        registrar_log_auditoria(
+            usuario=self.request.user,
+            accion_glosa='CREAR',
+            descripcion=(
+                f'Registró movimiento masivo de {len(movimientos)} activo(s) '
+                f"a {datos['ubicacion_destino'].nombre}"
+            ),
+            request=self.request,
+            meta={'activos': [movimiento.activo.codigo for movimiento in movimientos]}
+        )
+        messages.success(self.request, f'{len(movimientos)} movimiento(s) de activo registrado(s) exitosamente.')
+        return redirect('activos:lista_movimientos')
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Agrega datos al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Movimiento Masivo de Activos'
+        return context
+
+
+# ==================== VISTAS DE AUDITORÍAS ====================
+
+class AuditoriaListView(BaseAuditedViewMixin, PaginatedListMixin, ListView):
+    """
+    Vista para listar auditorías de activos.
+
+    Permisos: activos.view_auditoriaactivo
+    """
+    model = AuditoriaActivo
+    template_name = 'activos/lista_auditorias.html'
+    context_object_name = 'auditorias'
+    permission_required = 'activos.view_auditoriaactivo'
+
+    def get_queryset(self) -> QuerySet[AuditoriaActivo]:
+        """Retorna auditorías con relaciones optimizadas y filtro opcional por estado."""
+        queryset = AuditoriaActivoRepository.get_all()
+        estado = self.request.GET.get('estado', '')
+        if estado:
+            queryset = queryset.filter(estado=estado)
+        return queryset
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Agrega datos adicionales al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Auditorías de Activos'
+        context['estado'] = self.request.GET.get('estado', '')
+        return context
+
+
+class AuditoriaCreateView(BaseAuditedViewMixin, CreateView):
+    """
+    Vista para abrir una auditoría de activos en una ubicación.
+
+    Permisos: activos.add_auditoriaactivo
+    Auditoría: Registra acción CREAR automáticamente
+    Delega lógica de negocio a AuditoriaActivoService
+    """
+    model = AuditoriaActivo
+    form_class = AuditoriaActivoForm
+    template_name = 'activos/form_auditoria.html'
+    permission_required = 'activos.add_auditoriaactivo'
+
+    # Configuración de auditoría
+    audit_action = 'CREAR'
+    audit_description_template = 'Abrió auditoría de activos {obj.numero}'
+
+    def form_valid(self, form: AuditoriaActivoForm) -> HttpResponse:
+        """Crea la auditoría usando AuditoriaActivoService."""
+        try:
+            self.object = AuditoriaActivoService().crear_auditoria(
+                ubicacion=form.cleaned_data['ubicacion'],
+                responsable=self.request.user,
+                observaciones=form.cleaned_data.get('observaciones')
+            )
+        except ValidationError as e:
+            messages.error(self.request, ' '.join(e.messages))
+            return self.form_invalid(form)
+
+        self.log_action(self.object, self.request)
+        messages.success(self.request, f'Auditoría {self.object.numero} abierta.')
+        return redirect('activos:detalle_auditoria', pk=self.object.pk)
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Agrega datos al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Nueva Auditoría de Activos'
+        return context
+
+
+class AuditoriaDetailView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista de detalle de una auditoría: escaneo y comparación contra lo esperado.
+
+    Permisos: activos.view_auditoriaactivo
+    """
+    model = AuditoriaActivo
+    template_name = 'activos/detalle_auditoria.html'
+    context_object_name = 'auditoria'
+    permission_required = 'activos.view_auditoriaactivo'
+
+    def get_queryset(self) -> QuerySet[AuditoriaActivo]:
+        """Optimiza consultas con select_related."""
+        return AuditoriaActivoRepository.get_all()
+
+    def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """Agrega el formulario de lecturas y la comparación al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = f'Auditoría {self.object.numero}'
+        context['form'] = LecturasAuditoriaForm()
+        context['comparacion'] = AuditoriaActivoService().comparar(self.object)
+        return context
+
+
+class AuditoriaLecturasView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista para registrar un lote de códigos escaneados en una auditoría.
+
+    Permisos: activos.change_auditoriaactivo
+    """
+    model = AuditoriaActivo
+    permission_required = 'activos.change_auditoriaactivo'
+    http_method_names = ['post']
+
+    def get_queryset(self) -> QuerySet[AuditoriaActivo]:
+        """Solo auditorías no eliminadas."""
+        return AuditoriaActivoRepository.get_all()
+
+    def post(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Registra las lecturas usando AuditoriaActivoService."""
+        self.object = self.get_object()
+        form = LecturasAuditoriaForm(request.POST)
+
+        if form.is_valid():
+            service = AuditoriaActivoService()
+            try:
+                resultado = service.registrar_lecturas(
+                    self.object,
+                    service.parsear_lineas(form.cleaned_data['lecturas']),
+                    usuario=request.user
+                )
+            except ValidationError as e:
+                messages.error(request, ' '.join(e.messages))
+                return redirect('activos:detalle_auditoria', pk=self.object.pk)
+
+            messages.success(request, f"{resultado['leidos']} activo(s) leído(s).")
+            for error in resultado['errores']:
+                messages.warning(request, f"Línea {error['linea']} ({error['codigo']}): {error['mensaje']}")
+
+        return redirect('activos:detalle_auditoria', pk=self.object.pk)
+
+
+class AuditoriaAplicarView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista para registrar los movimientos correctivos de una auditoría.
+
+    Permisos: activos.change_auditoriaactivo
+    Auditoría: Registra acción APLICAR automáticamente
+    """
+    model = AuditoriaActivo
+    permission_required = 'activos.change_auditoriaactivo'
+    http_method_names = ['post']
+
+    # Configuración de auditoría
+    audit_action = 'APLICAR'
+    audit_description_template = 'Aplicó auditoría de activos {obj.numero}'
+
+    def get_queryset(self) -> QuerySet[AuditoriaActivo]:
+        """Solo auditorías no eliminadas."""
+        return AuditoriaActivoRepository.get_all()
+
+    def post(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Aplica la auditoría usando AuditoriaActivoService."""
+        self.object = self.get_object()
+
+        try:
+            resultado = AuditoriaActivoService().aplicar_auditoria(
+                self.object, request.user,
+                registrar_faltantes=bool(request.POST.get('registrar_faltantes'))
+            )
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
+            return redirect('activos:detalle_auditoria', pk=self.object.pk)
+
+        self.log_action(self.object, request)
+        messages.success(
+            request,
+            f"Auditoría aplicada: {resultado['reubicados']} activo(s) reubicado(s), "
+            f"{resultado['faltantes']} faltante(s) registrado(s)."
+        )
+        return redirect('activos:detalle_auditoria', pk=self.object.pk)
+
+
+class AuditoriaCancelarView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista para cancelar una auditoría sin registrar movimientos.
+
+    Permisos: activos.change_auditoriaactivo
+    Auditoría: Registra acción CANCELAR automáticamente
+    """
+    model = AuditoriaActivo
+    permission_required = 'activos.change_auditoriaactivo'
+    http_method_names = ['post']
+
+    # Configuración de auditoría
+    audit_action = 'CANCELAR'
+    audit_description_template = 'Canceló auditoría de activos {obj.numero}'
+
+    def get_queryset(self) -> QuerySet[AuditoriaActivo]:
+        """Solo auditorías no eliminadas."""
+        return AuditoriaActivoRepository.get_all()
+
+    def post(self, request, *args: Any, **kwargs: Any) -> HttpResponse:
+        """Cancela la auditoría usando AuditoriaActivoService."""
+        self.object = self.get_object()
+
+        try:
+            AuditoriaActivoService().cancelar_auditoria(self.object)
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
+            return redirect('activos:detalle_auditoria', pk=self.object.pk)
+
+        self.log_action(self.object, request)
+        messages.success(request, f'Auditoría {self.object.numero} cancelada.')
+        return redirect('activos:lista_auditorias')
+
+
 # ==================== VISTAS DE CATEGORÍAS ====================
 
 class CategoriaListView(BaseAuditedViewMixin, PaginatedListMixin, ListView):
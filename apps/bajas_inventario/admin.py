@@ -9,12 +9,13 @@ from __future__ import annotations
 from django.contrib import admin
 from django.db.models import QuerySet
 from django.http import HttpRequest
+from core.admin import SoftDeleteAdminMixin
 
 from .models import MotivoBaja, BajaInventario
 
 
 @admin.register(MotivoBaja)
-class MotivoBajaAdmin(admin.ModelAdmin):
+class MotivoBajaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo MotivoBaja."""
 
     list_display = ['codigo', 'nombre', 'activo', 'eliminado', 'fecha_creacion']
@@ -38,7 +39,7 @@ class MotivoBajaAdmin(admin.ModelAdmin):
 
 
 @admin.register(BajaInventario)
-class BajaInventarioAdmin(admin.ModelAdmin):
+class BajaInventarioAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Configuración del admin para el modelo BajaInventario."""
 
     list_display = [
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:06
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bajas_inventario', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='bajainventario',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='motivobaja',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -194,7 +194,7 @@ class BajaInventarioRepository:
     @staticmethod
     def exists_by_numero(numero: str, exclude_id: Optional[int] = None) -> bool:
         """Verifica si existe una baja con el número dado."""
-        queryset = BajaInventario.objects.filter(numero=numero)
+        queryset = BajaInventario.all_objects.filter(numero=numero)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
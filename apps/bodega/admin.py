@@ -1,13 +1,15 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdminMixin
 from .models import (
     Bodega, UnidadMedida, Categoria, Articulo, TipoMovimiento, Movimiento,
+    ConciliacionStock, TomaInventario, DetalleTomaInventario,
     EstadoEntrega, TipoEntrega, EntregaArticulo, DetalleEntregaArticulo,
     EntregaBien, DetalleEntregaBien
 )
 
 
 @admin.register(Bodega)
-class BodegaAdmin(admin.ModelAdmin):
+class BodegaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'responsable', 'activo', 'fecha_creacion']
     list_filter = ['activo', 'fecha_creacion']
     search_fields = ['codigo', 'nombre']
@@ -15,7 +17,7 @@ class BodegaAdmin(admin.ModelAdmin):
 
 
 @admin.register(UnidadMedida)
-class UnidadMedidaAdmin(admin.ModelAdmin):
+class UnidadMedidaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """
     Administración de Unidades de Medida en el panel de Django Admin.
 
@@ -29,7 +31,7 @@ class UnidadMedidaAdmin(admin.ModelAdmin):
 
 
 @admin.register(Categoria)
-class CategoriaAdmin(admin.ModelAdmin):
+class CategoriaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'activo', 'fecha_creacion']
     list_filter = ['activo']
     search_fields = ['codigo', 'nombre']
@@ -37,7 +39,7 @@ class CategoriaAdmin(admin.ModelAdmin):
 
 
 @admin.register(Articulo)
-class ArticuloAdmin(admin.ModelAdmin):
+class ArticuloAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """
     Administración de Artículos en el panel de Django Admin.
     """
@@ -70,7 +72,7 @@ class ArticuloAdmin(admin.ModelAdmin):
 
 
 @admin.register(TipoMovimiento)
-class TipoMovimientoAdmin(admin.ModelAdmin):
+class TipoMovimientoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'activo']
     list_filter = ['activo']
     search_fields = ['codigo', 'nombre']
@@ -79,6 +81,8 @@ class TipoMovimientoAdmin(admin.ModelAdmin):
 
 @admin.register(Movimiento)
 class MovimientoAdmin(admin.ModelAdmin):
+    # Sin SoftDeleteAdminMixin: el log de movimientos es de solo inserción y
+    # respalda el stock_actual que verifica reconcile_stock
     list_display = ['articulo', 'tipo', 'operacion', 'cantidad', 'usuario', 'stock_antes', 'stock_despues', 'fecha_creacion']
     list_filter = ['operacion', 'tipo', 'fecha_creacion']
     search_fields = ['articulo__codigo', 'articulo__nombre', 'usuario__correo', 'motivo']
@@ -86,10 +90,37 @@ class MovimientoAdmin(admin.ModelAdmin):
     date_hierarchy = 'fecha_creacion'
 
 
+@admin.register(ConciliacionStock)
+class ConciliacionStockAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    list_display = ['fecha_inicio', 'fecha_fin', 'total_articulos', 'total_discrepancias', 'corregido']
+    list_filter = ['corregido', 'fecha_inicio']
+    readonly_fields = [
+        'fecha_inicio', 'fecha_fin', 'total_articulos', 'total_discrepancias',
+        'corregido', 'detalle', 'fecha_creacion', 'fecha_actualizacion'
+    ]
+    date_hierarchy = 'fecha_inicio'
+
+
+class DetalleTomaInventarioInline(admin.TabularInline):
+    model = DetalleTomaInventario
+    extra = 0
+    fields = ['articulo', 'cantidad', 'usuario', 'fecha_creacion']
+    readonly_fields = ['fecha_creacion']
+
+
+@admin.register(TomaInventario)
+class TomaInventarioAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    list_display = ['numero', 'bodega', 'estado', 'conteo_completo', 'responsable', 'fecha_creacion', 'fecha_aplicacion']
+    list_filter = ['estado', 'conteo_completo', 'bodega']
+    search_fields = ['numero', 'bodega__nombre']
+    readonly_fields = ['fecha_creacion', 'fecha_actualizacion', 'fecha_aplicacion']
+    inlines = [DetalleTomaInventarioInline]
+
+
 # ==================== ENTREGA ADMIN ====================
 
 @admin.register(EstadoEntrega)
-class EstadoEntregaAdmin(admin.ModelAdmin):
+class EstadoEntregaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'color', 'es_inicial', 'es_final', 'activo']
     list_filter = ['activo', 'es_inicial', 'es_final']
     search_fields = ['codigo', 'nombre']
@@ -97,7 +128,7 @@ class EstadoEntregaAdmin(admin.ModelAdmin):
 
 
 @admin.register(TipoEntrega)
-class TipoEntregaAdmin(admin.ModelAdmin):
+class TipoEntregaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'requiere_autorizacion', 'activo']
     list_filter = ['activo', 'requiere_autorizacion']
     search_fields = ['codigo', 'nombre']
@@ -112,7 +143,7 @@ class DetalleEntregaArticuloInline(admin.TabularInline):
 
 
 @admin.register(EntregaArticulo)
-class EntregaArticuloAdmin(admin.ModelAdmin):
+class EntregaArticuloAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['numero', 'fecha_entrega', 'bodega_origen', 'tipo', 'estado', 'recibido_por', 'entregado_por']
     list_filter = ['estado', 'tipo', 'bodega_origen', 'fecha_entrega']
     search_fields = ['numero', 'recibido_por', 'rut_receptor', 'documento_referencia']
@@ -144,7 +175,7 @@ class DetalleEntregaBienInline(admin.TabularInline):
 
 
 @admin.register(EntregaBien)
-class EntregaBienAdmin(admin.ModelAdmin):
+class EntregaBienAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['numero', 'fecha_entrega', 'tipo', 'estado', 'recibido_por', 'entregado_por']
     list_filter = ['estado', 'tipo', 'fecha_entrega']
     search_fields = ['numero', 'recibido_por', 'rut_receptor', 'documento_referencia']
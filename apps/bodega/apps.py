@@ -5,3 +5,8 @@ class BodegaConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.bodega'
     verbose_name = 'Gestión de Bodegas'
+
+    def ready(self):
+        """Ejecutar configuraciones cuando la app esté lista."""
+        # Importar signals para que se registren automáticamente
+        from . import signals  # noqa: F401
@@ -7,7 +7,7 @@ from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
 from .models import (
     Bodega, UnidadMedida, Categoria, Articulo, TipoMovimiento, Movimiento,
-    TipoEntrega, EntregaArticulo, EntregaBien
+    TipoEntrega, EntregaArticulo, EntregaBien, TomaInventario
 )
 
 
@@ -54,7 +54,7 @@ class UnidadMedidaForm(forms.ModelForm):
         codigo = self.cleaned_data.get('codigo', '').strip().upper()
 
         # Si estamos editando, excluir la instancia actual
-        queryset = UnidadMedida.objects.filter(codigo=codigo)
+        queryset = UnidadMedida.all_objects.filter(codigo=codigo)
         if self.instance and self.instance.pk:
             queryset = queryset.exclude(pk=self.instance.pk)
 
@@ -123,7 +123,7 @@ class CategoriaForm(forms.ModelForm):
         codigo = self.cleaned_data.get('codigo', '').strip().upper()
 
         # Si estamos editando, excluir la instancia actual
-        queryset = Categoria.objects.filter(codigo=codigo)
+        queryset = Categoria.all_objects.filter(codigo=codigo)
         if self.instance and self.instance.pk:
             queryset = queryset.exclude(pk=self.instance.pk)
 
@@ -309,7 +309,7 @@ class ArticuloForm(forms.ModelForm):
         codigo = self.cleaned_data.get('codigo', '').strip().upper()
 
         # Si estamos editando, excluir la instancia actual
-        queryset = Articulo.objects.filter(codigo=codigo)
+        queryset = Articulo.all_objects.filter(codigo=codigo)
         if self.instance and self.instance.pk:
             queryset = queryset.exclude(pk=self.instance.pk)
 
@@ -490,6 +490,84 @@ class ArticuloFiltroForm(forms.Form):
     )
 
 
+class ImportarArticulosForm(forms.Form):
+    """Formulario para la importación masiva de artículos desde CSV o XLSX."""
+
+    archivo = forms.FileField(
+        widget=forms.ClearableFileInput(attrs={
+            'class': 'form-control',
+            'accept': '.csv,.xlsx'
+        }),
+        label='Archivo',
+        help_text='Planilla CSV o XLSX con una fila de encabezados'
+    )
+
+    dry_run = forms.BooleanField(
+        required=False,
+        initial=True,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'form-check-input'
+        }),
+        label='Solo validar (no guardar)'
+    )
+
+    def clean_archivo(self):
+        """Valida la extensión del archivo."""
+        archivo = self.cleaned_data['archivo']
+        if not archivo.name.lower().endswith(('.csv', '.xlsx')):
+            raise ValidationError('El archivo debe ser CSV o XLSX.')
+        return archivo
+
+
+# ==================== FORMULARIOS DE TOMA DE INVENTARIO ====================
+
+class TomaInventarioForm(forms.ModelForm):
+    """Formulario para abrir una toma de inventario."""
+
+    class Meta:
+        model = TomaInventario
+        fields = ['bodega', 'conteo_completo', 'observaciones']
+        widgets = {
+            'bodega': forms.Select(attrs={
+                'class': 'form-select'
+            }),
+            'conteo_completo': forms.CheckboxInput(attrs={
+                'class': 'form-check-input'
+            }),
+            'observaciones': forms.Textarea(attrs={
+                'class': 'form-control',
+                'rows': 3,
+                'placeholder': 'Observaciones de la toma (opcional)'
+            }),
+        }
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields['bodega'].queryset = Bodega.objects.filter(activo=True, eliminado=False).order_by('nombre')
+
+
+class ConteoTomaInventarioForm(forms.Form):
+    """Formulario para ingresar o escanear conteos de una toma de inventario."""
+
+    lecturas = forms.CharField(
+        widget=forms.Textarea(attrs={
+            'class': 'form-control font-monospace',
+            'rows': 8,
+            'placeholder': 'Una lectura por línea: CODIGO o CODIGO;CANTIDAD',
+            'autofocus': True
+        }),
+        label='Lecturas'
+    )
+
+    reemplazar = forms.BooleanField(
+        required=False,
+        widget=forms.CheckboxInput(attrs={
+            'class': 'form-check-input'
+        }),
+        label='Reemplazar conteos previos de los artículos leídos'
+    )
+
+
 # ==================== FORMULARIOS DE ENTREGA ====================
 
 class EntregaArticuloForm(forms.ModelForm):
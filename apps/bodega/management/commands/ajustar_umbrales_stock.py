@@ -0,0 +1,97 @@
+"""
+Comando para recalcular stock mínimo y punto de reorden desde la demanda histórica.
+
+Pensado para ejecutarse de noche; sin --aplicar solo reporta las sugerencias.
+
+Ejecutar con:
+    python manage.py ajustar_umbrales_stock                       # solo reporta
+    python manage.py ajustar_umbrales_stock --aplicar             # guarda los umbrales sugeridos
+    python manage.py ajustar_umbrales_stock --aplicar --workers 4 --meses 24
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from apps.bodega.services import PronosticoDemandaService
+
+
+def _inicializar_worker() -> None:
+    """Prepara Django en cada proceso del pool (necesario con spawn/forkserver)."""
+    django.setup()
+
+
+def _sugerir_bloque(bloque, meses):
+    """Procesa un rango de IDs en un proceso del pool."""
+    id_desde, id_hasta = bloque
+    try:
+        return PronosticoDemandaService().sugerir(id_desde, id_hasta, meses=meses)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Sugiere (y opcionalmente aplica) stock mínimo y punto de reorden según la demanda histórica'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--aplicar',
+            action='store_true',
+            help='Guarda los umbrales sugeridos en los artículos',
+        )
+        parser.add_argument(
+            '--meses',
+            type=int,
+            default=PronosticoDemandaService.MESES_HISTORIA,
+            help='Meses completos de historia a considerar',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Cantidad de procesos en paralelo (default: 1, sin pool)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=PronosticoDemandaService.TAMANO_BLOQUE,
+            help='Cantidad de IDs de artículo por bloque',
+        )
+
+    def handle(self, *args, **options):
+        service = PronosticoDemandaService()
+        bloques = service.calcular_bloques(options['chunk_size'])
+        self.stdout.write(f'Calculando umbrales en {len(bloques)} bloque(s)...')
+
+        if options['workers'] > 1 and len(bloques) > 1:
+            # Los procesos hijos deben abrir sus propias conexiones
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options['workers'], initializer=_inicializar_worker
+            ) as executor:
+                resultados = list(executor.map(partial(_sugerir_bloque, meses=options['meses']), bloques))
+        else:
+            resultados = [
+                service.sugerir(desde, hasta, meses=options['meses'])
+                for desde, hasta in bloques
+            ]
+
+        total_articulos = sum(revisados for revisados, _ in resultados)
+        sugerencias = [item for _, items in resultados for item in items]
+
+        if options['verbosity'] > 1:
+            for item in sugerencias:
+                self.stdout.write(
+                    f"{item['codigo']}: mínimo {item['stock_minimo']} -> {item['stock_minimo_sugerido']}, "
+                    f"reorden {item['punto_reorden']} -> {item['punto_reorden_sugerido']}"
+                )
+
+        if options['aplicar'] and sugerencias:
+            actualizados = service.aplicar(sugerencias)
+            self.stdout.write(self.style.SUCCESS(f'{actualizados} artículo(s) actualizado(s).'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{total_articulos} artículo(s) revisado(s), {len(sugerencias)} con umbrales sugeridos distintos.'
+        ))
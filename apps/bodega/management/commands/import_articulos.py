@@ -0,0 +1,55 @@
+"""
+Comando para importar artículos masivamente desde una planilla CSV o XLSX.
+
+Ejecutar con:
+    python manage.py import_articulos articulos.csv --dry-run
+    python manage.py import_articulos articulos.xlsx --batch-size 2000
+"""
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.bodega.services import ImportacionArticuloService
+
+
+class Command(BaseCommand):
+    help = 'Importa artículos desde un archivo CSV o XLSX usando inserciones por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo', help='Ruta del archivo CSV o XLSX')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo valida el archivo y muestra el reporte, sin guardar',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=ImportacionArticuloService.TAMANO_LOTE,
+            help='Cantidad de artículos por inserción',
+        )
+
+    def handle(self, *args, **options):
+        ruta = options['archivo']
+        try:
+            with open(ruta, 'rb') as archivo:
+                reporte = ImportacionArticuloService().importar(
+                    archivo, ruta, dry_run=options['dry_run'], tamano_lote=options['batch_size']
+                )
+        except OSError as e:
+            raise CommandError(f'No se pudo abrir el archivo: {e}')
+        except ValidationError as e:
+            raise CommandError(' '.join(e.messages))
+
+        for error in reporte['errores']:
+            self.stdout.write(self.style.WARNING(
+                f"Fila {error['fila']} ({error['codigo']}): {error['mensaje']}"
+            ))
+
+        resumen = (
+            f"{reporte['total_filas']} fila(s) leída(s), {reporte['validas']} válida(s), "
+            f"{len(reporte['errores'])} con errores"
+        )
+        if reporte['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Validación: {resumen}.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"{reporte['creados']} artículo(s) creado(s). {resumen}."))
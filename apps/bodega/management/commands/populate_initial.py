@@ -76,8 +76,8 @@ class Command(BaseCommand):
                     else:
                         kwargs[field.name] = val
 
-                obj, created = (model.objects.update_or_create(pk=data.get('pk'), defaults=kwargs)
-                                if data.get('pk') else model.objects.get_or_create(**kwargs))
+                obj, created = (model.all_objects.update_or_create(pk=data.get('pk'), defaults=kwargs)
+                                if data.get('pk') else model.all_objects.get_or_create(**kwargs))
                 self.stdout.write(self.style.SUCCESS(f"Set {model.__name__}: {getattr(obj, 'pk', obj)}"))
 
         # Import models
@@ -0,0 +1,108 @@
+"""
+Comando para conciliar el stock de los artículos contra el log de movimientos.
+
+Ejecutar con:
+    python manage.py reconcile_stock                 # solo reporta
+    python manage.py reconcile_stock --fix           # corrige las discrepancias
+    python manage.py reconcile_stock --workers 4 --chunk-size 10000
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.utils import timezone
+
+from apps.bodega.services import ConciliacionStockService
+
+
+def _inicializar_worker() -> None:
+    """Prepara Django en cada proceso del pool (necesario con spawn/forkserver)."""
+    django.setup()
+
+
+def _conciliar_bloque(bloque):
+    """Procesa un rango de IDs en un proceso del pool."""
+    id_desde, id_hasta, incluir_sin_movimientos = bloque
+    try:
+        return ConciliacionStockService().buscar_discrepancias(
+            id_desde, id_hasta, incluir_sin_movimientos
+        )
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = 'Compara el stock de cada artículo con la suma neta de sus movimientos y registra la ejecución'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fix',
+            action='store_true',
+            help='Ajusta stock_actual al saldo según movimientos en los artículos con diferencias',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Cantidad de procesos en paralelo (default: 1, sin pool)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=ConciliacionStockService.TAMANO_BLOQUE,
+            help='Cantidad de IDs de artículo por bloque',
+        )
+        parser.add_argument(
+            '--include-empty',
+            action='store_true',
+            help='Incluye artículos sin movimientos (su saldo esperado es 0)',
+        )
+
+    def handle(self, *args, **options):
+        service = ConciliacionStockService()
+        fecha_inicio = timezone.now()
+
+        bloques = [
+            (desde, hasta, options['include_empty'])
+            for desde, hasta in service.calcular_bloques(options['chunk_size'])
+        ]
+        self.stdout.write(f'Conciliando stock en {len(bloques)} bloque(s)...')
+
+        if options['workers'] > 1 and len(bloques) > 1:
+            # Los procesos hijos deben abrir sus propias conexiones
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options['workers'], initializer=_inicializar_worker
+            ) as executor:
+                resultados = list(executor.map(_conciliar_bloque, bloques))
+        else:
+            resultados = [
+                service.buscar_discrepancias(desde, hasta, incluir)
+                for desde, hasta, incluir in bloques
+            ]
+
+        total_articulos = sum(revisados for revisados, _ in resultados)
+        discrepancias = [item for _, items in resultados for item in items]
+
+        for item in discrepancias:
+            self.stdout.write(self.style.WARNING(
+                f"{item['codigo']}: stock {item['stock_actual']} / "
+                f"movimientos {item['saldo_movimientos']} (diferencia {item['diferencia']})"
+            ))
+
+        corregido = False
+        if options['fix'] and discrepancias:
+            actualizados = service.corregir_discrepancias(
+                item['articulo_id'] for item in discrepancias
+            )
+            corregido = True
+            self.stdout.write(self.style.SUCCESS(f'{actualizados} artículo(s) corregido(s).'))
+
+        conciliacion = service.registrar_ejecucion(
+            fecha_inicio, total_articulos, discrepancias, corregido
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f'Conciliación #{conciliacion.pk}: {total_articulos} artículo(s) revisado(s), '
+            f'{len(discrepancias)} discrepancia(s).'
+        ))
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-18 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0002_initial'),
+        ('bodega', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConciliacionStock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=True, help_text='Estado activo/inactivo del registro', verbose_name='Activo')),
+                ('eliminado', models.BooleanField(default=False, help_text='Estado eliminado/no eliminado del registro', verbose_name='Eliminado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de creación del registro', verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Fecha y hora de última actualización', verbose_name='Fecha de Actualización')),
+                ('fecha_inicio', models.DateTimeField(verbose_name='Fecha de Inicio')),
+                ('fecha_fin', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de Término')),
+                ('total_articulos', models.PositiveIntegerField(default=0, verbose_name='Artículos Revisados')),
+                ('total_discrepancias', models.PositiveIntegerField(default=0, verbose_name='Discrepancias')),
+                ('corregido', models.BooleanField(default=False, verbose_name='Discrepancias Corregidas')),
+                ('detalle', models.JSONField(blank=True, default=list, help_text='Lista de discrepancias: artículo, stock registrado y saldo según movimientos', verbose_name='Detalle')),
+            ],
+            options={
+                'verbose_name': 'Conciliación de Stock',
+                'verbose_name_plural': 'Conciliaciones de Stock',
+                'db_table': 'tba_bodega_conciliacion_stock',
+                'ordering': ['-fecha_inicio'],
+            },
+        ),
+        migrations.AlterField(
+            model_name='articulo',
+            name='marcas',
+            field=models.ManyToManyField(blank=True, help_text='Marcas asociadas al artículo', related_name='articulos', to='activos.marca', verbose_name='Marcas'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:02
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bodega', '0003_conciliacion_stock'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TomaInventario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=True, help_text='Estado activo/inactivo del registro', verbose_name='Activo')),
+                ('eliminado', models.BooleanField(default=False, help_text='Estado eliminado/no eliminado del registro', verbose_name='Eliminado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de creación del registro', verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Fecha y hora de última actualización', verbose_name='Fecha de Actualización')),
+                ('numero', models.CharField(max_length=30, unique=True, verbose_name='Número')),
+                ('estado', models.CharField(choices=[('ABIERTA', 'Abierta'), ('APLICADA', 'Aplicada'), ('CANCELADA', 'Cancelada')], default='ABIERTA', max_length=20, verbose_name='Estado')),
+                ('conteo_completo', models.BooleanField(default=False, help_text='Si está marcado, los artículos de la bodega que no se contaron se ajustan a cero', verbose_name='Conteo Completo')),
+                ('fecha_aplicacion', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de Aplicación')),
+                ('observaciones', models.TextField(blank=True, null=True, verbose_name='Observaciones')),
+                ('aplicado_por', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='tomas_inventario_aplicadas', to=settings.AUTH_USER_MODEL, verbose_name='Aplicado por')),
+                ('bodega', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='tomas_inventario', to='bodega.bodega', verbose_name='Bodega')),
+                ('responsable', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='tomas_inventario', to=settings.AUTH_USER_MODEL, verbose_name='Responsable')),
+            ],
+            options={
+                'verbose_name': 'Toma de Inventario',
+                'verbose_name_plural': 'Tomas de Inventario',
+                'db_table': 'tba_bodega_toma_inventario',
+                'ordering': ['-fecha_creacion'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DetalleTomaInventario',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=True, help_text='Estado activo/inactivo del registro', verbose_name='Activo')),
+                ('eliminado', models.BooleanField(default=False, help_text='Estado eliminado/no eliminado del registro', verbose_name='Eliminado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de creación del registro', verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Fecha y hora de última actualización', verbose_name='Fecha de Actualización')),
+                ('cantidad', models.DecimalField(decimal_places=2, max_digits=10, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Cantidad Contada')),
+                ('articulo', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='conteos_inventario', to='bodega.articulo', verbose_name='Artículo')),
+                ('usuario', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='conteos_inventario', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+                ('toma', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='conteos', to='bodega.tomainventario', verbose_name='Toma de Inventario')),
+            ],
+            options={
+                'verbose_name': 'Conteo de Inventario',
+                'verbose_name_plural': 'Conteos de Inventario',
+                'db_table': 'tba_bodega_toma_inventario_detalle',
+                'indexes': [models.Index(fields=['toma', 'articulo'], name='tba_bodega__toma_id_ce9f59_idx')],
+            },
+        ),
+    ]
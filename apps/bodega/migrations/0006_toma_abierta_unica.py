@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 22:22
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bodega', '0005_managers_vigentes_indices_parciales'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='tomainventario',
+            constraint=models.UniqueConstraint(condition=models.Q(('eliminado', False), ('estado', 'ABIERTA')), fields=('bodega',), name='uq_toma_abierta_bodega', violation_error_message='La bodega ya tiene una toma de inventario abierta.'),
+        ),
+    ]
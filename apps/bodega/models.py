@@ -175,6 +175,11 @@ class Articulo(BaseModel):
         verbose_name = 'Artículo'
         verbose_name_plural = 'Artículos'
         ordering = ['codigo']
+        # Índices parciales: solo registros vigentes (eliminado=False)
+        indexes = [
+            models.Index(fields=['codigo'], name='ix_articulo_codigo_vig', condition=models.Q(eliminado=False)),
+            models.Index(fields=['categoria', 'codigo'], name='ix_articulo_cat_codigo_vig', condition=models.Q(eliminado=False)),
+        ]
 
     def __str__(self) -> str:
         """Representación en cadena del artículo."""
@@ -261,12 +266,166 @@ class Movimiento(BaseModel):
         verbose_name = 'Movimiento'
         verbose_name_plural = 'Movimientos'
         ordering = ['-fecha_creacion']
+        # Índices parciales: solo registros vigentes (eliminado=False)
+        indexes = [
+            models.Index(fields=['-fecha_creacion'], name='ix_movimiento_fecha_vig', condition=models.Q(eliminado=False)),
+            models.Index(fields=['articulo', '-fecha_creacion'], name='ix_movimiento_art_fecha_vig', condition=models.Q(eliminado=False)),
+        ]
 
     def __str__(self) -> str:
         """Representación en cadena del movimiento."""
         return f"{self.operacion} - {self.articulo.codigo} - {self.cantidad}"
 
 
+class ConciliacionStock(BaseModel):
+    """
+    Registro de cada ejecución de la conciliación de stock.
+
+    Compara el stock_actual de los artículos contra la suma neta de sus
+    movimientos (comando reconcile_stock) y guarda las diferencias encontradas.
+    """
+    fecha_inicio = models.DateTimeField(verbose_name='Fecha de Inicio')
+    fecha_fin = models.DateTimeField(null=True, blank=True, verbose_name='Fecha de Término')
+    total_articulos = models.PositiveIntegerField(default=0, verbose_name='Artículos Revisados')
+    total_discrepancias = models.PositiveIntegerField(default=0, verbose_name='Discrepancias')
+    corregido = models.BooleanField(default=False, verbose_name='Discrepancias Corregidas')
+    detalle = models.JSONField(
+        default=list,
+        blank=True,
+        verbose_name='Detalle',
+        help_text='Lista de discrepancias: artículo, stock registrado y saldo según movimientos'
+    )
+
+    class Meta:
+        db_table = 'tba_bodega_conciliacion_stock'
+        verbose_name = 'Conciliación de Stock'
+        verbose_name_plural = 'Conciliaciones de Stock'
+        ordering = ['-fecha_inicio']
+
+    def __str__(self) -> str:
+        """Representación en cadena de la conciliación."""
+        return f"Conciliación {self.fecha_inicio:%d/%m/%Y %H:%M} - {self.total_discrepancias} discrepancia(s)"
+
+
+# ==================== TOMA DE INVENTARIO ====================
+
+class TomaInventario(BaseModel):
+    """
+    Sesión de toma de inventario físico (conteo) de una bodega.
+
+    Los conteos se registran en DetalleTomaInventario (tabla de staging) y al
+    aplicar la toma se generan los movimientos de ajuste por las diferencias.
+    """
+    ESTADO_ABIERTA = 'ABIERTA'
+    ESTADO_APLICADA = 'APLICADA'
+    ESTADO_CANCELADA = 'CANCELADA'
+
+    RESTRICCION_ABIERTA = 'uq_toma_abierta_bodega'
+
+    numero = models.CharField(max_length=30, unique=True, verbose_name='Número')
+    bodega = models.ForeignKey(
+        Bodega,
+        on_delete=models.PROTECT,
+        related_name='tomas_inventario',
+        verbose_name='Bodega'
+    )
+    estado = models.CharField(
+        max_length=20,
+        choices=[
+            (ESTADO_ABIERTA, 'Abierta'),
+            (ESTADO_APLICADA, 'Aplicada'),
+            (ESTADO_CANCELADA, 'Cancelada'),
+        ],
+        default=ESTADO_ABIERTA,
+        verbose_name='Estado'
+    )
+    conteo_completo = models.BooleanField(
+        default=False,
+        verbose_name='Conteo Completo',
+        help_text='Si está marcado, los artículos de la bodega que no se contaron se ajustan a cero'
+    )
+    responsable = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='tomas_inventario',
+        verbose_name='Responsable'
+    )
+    fecha_aplicacion = models.DateTimeField(null=True, blank=True, verbose_name='Fecha de Aplicación')
+    aplicado_por = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='tomas_inventario_aplicadas',
+        null=True,
+        blank=True,
+        verbose_name='Aplicado por'
+    )
+    observaciones = models.TextField(blank=True, null=True, verbose_name='Observaciones')
+
+    class Meta:
+        db_table = 'tba_bodega_toma_inventario'
+        verbose_name = 'Toma de Inventario'
+        verbose_name_plural = 'Tomas de Inventario'
+        ordering = ['-fecha_creacion']
+        constraints = [
+            # Una sola toma abierta por bodega
+            models.UniqueConstraint(
+                fields=['bodega'],
+                condition=models.Q(estado='ABIERTA', eliminado=False),
+                name='uq_toma_abierta_bodega',
+                violation_error_message='La bodega ya tiene una toma de inventario abierta.'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en cadena de la toma de inventario."""
+        return f"{self.numero} - {self.bodega.nombre}"
+
+
+class DetalleTomaInventario(BaseModel):
+    """
+    Conteo registrado durante una toma de inventario (tabla de staging).
+
+    Cada lectura o ingreso agrega una fila; la cantidad contada de un artículo
+    es la suma de sus filas en la toma.
+    """
+    toma = models.ForeignKey(
+        TomaInventario,
+        on_delete=models.CASCADE,
+        related_name='conteos',
+        verbose_name='Toma de Inventario'
+    )
+    articulo = models.ForeignKey(
+        Articulo,
+        on_delete=models.PROTECT,
+        related_name='conteos_inventario',
+        verbose_name='Artículo'
+    )
+    cantidad = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        validators=[MinValueValidator(0)],
+        verbose_name='Cantidad Contada'
+    )
+    usuario = models.ForeignKey(
+        User,
+        on_delete=models.PROTECT,
+        related_name='conteos_inventario',
+        verbose_name='Usuario'
+    )
+
+    class Meta:
+        db_table = 'tba_bodega_toma_inventario_detalle'
+        verbose_name = 'Conteo de Inventario'
+        verbose_name_plural = 'Conteos de Inventario'
+        indexes = [
+            models.Index(fields=['toma', 'articulo']),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en cadena del conteo."""
+        return f"{self.toma.numero} - {self.articulo.codigo}: {self.cantidad}"
+
+
 # ==================== ENTREGA DE ARTÍCULOS Y BIENES ====================
 
 class EntregaBase(BaseModel):
@@ -412,6 +571,10 @@ class EntregaArticulo(EntregaBase):
         verbose_name = 'Entrega de Artículo'
         verbose_name_plural = 'Entregas de Artículos'
         ordering = ['-fecha_entrega']
+        # Índices parciales: solo registros vigentes (eliminado=False)
+        indexes = [
+            models.Index(fields=['-fecha_entrega'], name='ix_entrega_art_fecha_vig', condition=models.Q(eliminado=False)),
+        ]
 
     def __str__(self) -> str:
         """Representación en cadena de la entrega de artículo."""
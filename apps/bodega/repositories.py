@@ -4,12 +4,17 @@ Repository Pattern para el módulo de bodega.
 Separa la lógica de acceso a datos de la lógica de negocio,
 siguiendo el principio de Inversión de Dependencias (SOLID).
 """
-from typing import Optional, List
+from datetime import date
+from typing import Optional, List, Dict, Iterable, Tuple
 from decimal import Decimal
-from django.db.models import QuerySet, Q
+from django.db.models import (
+    QuerySet, Q, F, Sum, Count, Min, Max, Case, When, Window, DecimalField, Value, OuterRef, Subquery
+)
+from django.db.models.functions import Coalesce, TruncMonth
 from django.contrib.auth.models import User
 from .models import (
-    Bodega, Categoria, Articulo, TipoMovimiento, Movimiento,
+    Bodega, Categoria, Articulo, TipoMovimiento, Movimiento, ConciliacionStock,
+    TomaInventario, DetalleTomaInventario,
     EstadoEntrega, TipoEntrega, EntregaArticulo, DetalleEntregaArticulo,
     EntregaBien, DetalleEntregaBien
 )
@@ -162,7 +167,7 @@ class CategoriaRepository:
         Returns:
             True si existe, False en caso contrario
         """
-        queryset = Categoria.objects.filter(codigo=codigo)
+        queryset = Categoria.all_objects.filter(codigo=codigo)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -294,6 +299,22 @@ class ArticuloRepository:
             'categoria', 'ubicacion_fisica'
         ).order_by('codigo')
 
+    @staticmethod
+    def filter_by_codigos_barras(codigos_barras: Iterable[str]) -> QuerySet:
+        """
+        Búsqueda exacta por código de barras (igualdad sobre el índice único).
+
+        Args:
+            codigos_barras: Códigos de barras a resolver
+
+        Returns:
+            QuerySet de diccionarios con id, codigo, nombre y codigo_barras
+        """
+        return Articulo.objects.filter(
+            codigo_barras__in=list(codigos_barras),
+            eliminado=False
+        ).values('id', 'codigo', 'nombre', 'codigo_barras')
+
     @staticmethod
     def exists_by_codigo(codigo: str, exclude_id: Optional[int] = None) -> bool:
         """
@@ -306,7 +327,7 @@ class ArticuloRepository:
         Returns:
             True si existe, False en caso contrario
         """
-        queryset = Articulo.objects.filter(codigo=codigo)
+        queryset = Articulo.all_objects.filter(codigo=codigo)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -327,6 +348,73 @@ class ArticuloRepository:
         articulo.save(update_fields=['stock_actual', 'fecha_actualizacion'])
         return articulo
 
+    @staticmethod
+    def get_rango_ids() -> Tuple[Optional[int], Optional[int]]:
+        """
+        Retorna el ID mínimo y máximo de los artículos no eliminados.
+
+        Returns:
+            Tupla (id_minimo, id_maximo); (None, None) si no hay artículos
+        """
+        rango = Articulo.objects.filter(eliminado=False).aggregate(
+            id_minimo=Min('id'), id_maximo=Max('id')
+        )
+        return rango['id_minimo'], rango['id_maximo']
+
+    @staticmethod
+    def get_umbrales(id_desde: int, id_hasta: int) -> QuerySet:
+        """
+        Umbrales de stock de los artículos no eliminados de un rango de IDs [desde, hasta).
+
+        Returns:
+            QuerySet de diccionarios con id, codigo, stock_minimo, stock_maximo y punto_reorden
+        """
+        return Articulo.objects.filter(
+            eliminado=False, id__gte=id_desde, id__lt=id_hasta
+        ).order_by('id').values('id', 'codigo', 'stock_minimo', 'stock_maximo', 'punto_reorden')
+
+    @staticmethod
+    def filter_saldos_movimientos(
+        id_desde: Optional[int] = None,
+        id_hasta: Optional[int] = None,
+        articulo_ids: Optional[Iterable[int]] = None
+    ) -> QuerySet:
+        """
+        Retorna el stock registrado junto al saldo neto de movimientos por artículo.
+
+        Se resuelve con un único GROUP BY sobre la tabla de movimientos,
+        filtrado por un rango de IDs [id_desde, id_hasta).
+
+        Args:
+            id_desde: ID inicial inclusivo (opcional)
+            id_hasta: ID final exclusivo (opcional)
+            articulo_ids: IDs puntuales a considerar (opcional)
+
+        Returns:
+            QuerySet de diccionarios con id, codigo, stock_actual,
+            saldo_movimientos y total_movimientos
+        """
+        queryset = Articulo.objects.filter(eliminado=False)
+        if id_desde is not None:
+            queryset = queryset.filter(id__gte=id_desde)
+        if id_hasta is not None:
+            queryset = queryset.filter(id__lt=id_hasta)
+        if articulo_ids is not None:
+            queryset = queryset.filter(id__in=list(articulo_ids))
+
+        movimientos_vigentes = Q(movimientos__eliminado=False)
+        return queryset.values('id', 'codigo', 'stock_actual').annotate(
+            saldo_movimientos=Coalesce(
+                Sum(
+                    MovimientoRepository.expresion_cantidad_neta('movimientos__'),
+                    filter=movimientos_vigentes
+                ),
+                Value(Decimal('0.00')),
+                output_field=DecimalField(max_digits=14, decimal_places=2)
+            ),
+            total_movimientos=Count('movimientos', filter=movimientos_vigentes)
+        ).order_by('id')
+
 
 # ==================== TIPO MOVIMIENTO REPOSITORY ====================
 
@@ -505,6 +593,257 @@ class MovimientoRepository:
             stock_despues=stock_despues
         )
 
+    @staticmethod
+    def expresion_cantidad_neta(prefijo: str = '') -> Case:
+        """
+        Expresión SQL con la cantidad firmada de un movimiento.
+
+        Las entradas suman y las salidas restan, de modo que la suma de la
+        expresión sobre los movimientos de un artículo equivale a su saldo.
+
+        Args:
+            prefijo: Ruta de la relación cuando se usa desde otro modelo
+                (por ejemplo 'movimientos__' desde Articulo)
+
+        Returns:
+            Expresión Case utilizable en annotate/aggregate
+        """
+        return Case(
+            When(**{f'{prefijo}operacion': 'ENTRADA'}, then=F(f'{prefijo}cantidad')),
+            default=-F(f'{prefijo}cantidad'),
+            output_field=DecimalField(max_digits=14, decimal_places=2)
+        )
+
+    @staticmethod
+    def _filtrar_kardex(
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> QuerySet[Movimiento]:
+        """Aplica los filtros comunes del kardex sobre los movimientos no eliminados."""
+        queryset = Movimiento.objects.filter(eliminado=False)
+        if articulo_ids:
+            queryset = queryset.filter(articulo_id__in=list(articulo_ids))
+        if fecha_desde:
+            queryset = queryset.filter(fecha_creacion__date__gte=fecha_desde)
+        if fecha_hasta:
+            queryset = queryset.filter(fecha_creacion__date__lte=fecha_hasta)
+        return queryset
+
+    @staticmethod
+    def get_kardex(
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> QuerySet:
+        """
+        Retorna el kardex (libro de movimientos) con saldo acumulado por artículo.
+
+        El saldo se calcula en la base de datos con una función de ventana
+        (SUM OVER PARTITION BY articulo ORDER BY fecha_creacion, id), por lo que
+        el resultado puede paginarse o recorrerse con un cursor del servidor
+        sin cargar el historial completo en memoria.
+
+        El saldo es relativo al rango consultado: si se indica fecha_desde,
+        debe sumarse el saldo inicial (ver get_saldos_iniciales).
+
+        Args:
+            articulo_ids: IDs de artículos a incluir (None = todos)
+            fecha_desde: Fecha inicial inclusiva (opcional)
+            fecha_hasta: Fecha final inclusiva (opcional)
+
+        Returns:
+            QuerySet de diccionarios ordenado por artículo y fecha
+        """
+        cantidad_neta = MovimientoRepository.expresion_cantidad_neta()
+        return MovimientoRepository._filtrar_kardex(
+            articulo_ids, fecha_desde, fecha_hasta
+        ).annotate(
+            saldo=Window(
+                expression=Sum(cantidad_neta),
+                partition_by=[F('articulo_id')],
+                order_by=[F('fecha_creacion').asc(), F('id').asc()]
+            )
+        ).order_by(
+            'articulo__codigo', 'fecha_creacion', 'id'
+        ).values(
+            'id', 'articulo_id', 'articulo__codigo', 'articulo__nombre',
+            'fecha_creacion', 'operacion', 'tipo__nombre', 'cantidad',
+            'motivo', 'usuario__username', 'saldo'
+        )
+
+    @staticmethod
+    def get_saldos_iniciales(
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None
+    ) -> Dict[int, Decimal]:
+        """
+        Calcula el saldo de cada artículo antes de una fecha con un único GROUP BY.
+
+        Args:
+            articulo_ids: IDs de artículos a incluir (None = todos)
+            fecha_desde: Fecha de corte (exclusiva)
+
+        Returns:
+            Diccionario {articulo_id: saldo}; vacío si no hay fecha de corte
+        """
+        if not fecha_desde:
+            return {}
+
+        queryset = Movimiento.objects.filter(
+            eliminado=False,
+            fecha_creacion__date__lt=fecha_desde
+        )
+        if articulo_ids:
+            queryset = queryset.filter(articulo_id__in=list(articulo_ids))
+
+        filas = queryset.values('articulo_id').annotate(
+            saldo=Sum(MovimientoRepository.expresion_cantidad_neta())
+        ).order_by()
+        return {fila['articulo_id']: fila['saldo'] for fila in filas}
+
+    @staticmethod
+    def get_salidas_mensuales(
+        id_desde: int,
+        id_hasta: int,
+        fecha_desde: date,
+        excluir_tipo: Optional[str] = None
+    ) -> QuerySet:
+        """
+        Cantidad de salidas por artículo y mes desde una fecha (una consulta agrupada).
+
+        Args:
+            id_desde: ID de artículo inicial inclusivo
+            id_hasta: ID de artículo final exclusivo
+            fecha_desde: Fecha inicial (inclusive)
+            excluir_tipo: Código de tipo de movimiento a excluir (ej: ajustes de inventario)
+
+        Returns:
+            QuerySet de tuplas (articulo_id, mes, total)
+        """
+        queryset = Movimiento.objects.filter(
+            operacion='SALIDA',
+            articulo_id__gte=id_desde,
+            articulo_id__lt=id_hasta,
+            fecha_creacion__date__gte=fecha_desde
+        )
+        if excluir_tipo:
+            queryset = queryset.exclude(tipo__codigo=excluir_tipo)
+        return queryset.annotate(mes=TruncMonth('fecha_creacion')).values('articulo_id', 'mes').annotate(
+            total=Sum('cantidad')
+        ).order_by().values_list('articulo_id', 'mes', 'total')
+
+
+# ==================== CONCILIACIÓN STOCK REPOSITORY ====================
+
+class ConciliacionStockRepository:
+    """Repository para gestionar acceso a datos de ConciliacionStock."""
+
+    @staticmethod
+    def get_all() -> QuerySet[ConciliacionStock]:
+        """Retorna todas las conciliaciones no eliminadas, de la más reciente a la más antigua."""
+        return ConciliacionStock.objects.filter(eliminado=False).order_by('-fecha_inicio')
+
+    @staticmethod
+    def get_ultima() -> Optional[ConciliacionStock]:
+        """Retorna la última conciliación ejecutada, si existe."""
+        return ConciliacionStockRepository.get_all().first()
+
+    @staticmethod
+    def create(**kwargs) -> ConciliacionStock:
+        """Crea un nuevo registro de conciliación."""
+        return ConciliacionStock.objects.create(**kwargs)
+
+
+# ==================== TOMA DE INVENTARIO REPOSITORIES ====================
+
+class TomaInventarioRepository:
+    """Repository para gestionar acceso a datos de TomaInventario."""
+
+    @staticmethod
+    def get_all() -> QuerySet[TomaInventario]:
+        """Retorna todas las tomas no eliminadas con relaciones optimizadas."""
+        return TomaInventario.objects.filter(
+            eliminado=False
+        ).select_related(
+            'bodega', 'responsable', 'aplicado_por'
+        ).order_by('-fecha_creacion')
+
+    @staticmethod
+    def get_by_id(toma_id: int) -> Optional[TomaInventario]:
+        """
+        Obtiene una toma de inventario por su ID.
+
+        Args:
+            toma_id: ID de la toma
+
+        Returns:
+            TomaInventario si existe, None en caso contrario
+        """
+        try:
+            return TomaInventario.objects.select_related(
+                'bodega', 'responsable', 'aplicado_por'
+            ).get(id=toma_id, eliminado=False)
+        except TomaInventario.DoesNotExist:
+            return None
+
+    @staticmethod
+    def create(**kwargs) -> TomaInventario:
+        """Crea una nueva toma de inventario."""
+        return TomaInventario.objects.create(**kwargs)
+
+    @staticmethod
+    def get_diferencias(
+        toma: TomaInventario,
+        articulo_ids: Optional[Iterable[int]] = None
+    ) -> QuerySet:
+        """
+        Calcula en una sola consulta la diferencia entre lo contado y el stock.
+
+        La cantidad contada es la suma de los conteos de la toma por artículo
+        (subconsulta correlacionada). Si la toma no es de conteo completo, solo
+        se consideran los artículos con al menos un conteo.
+
+        Args:
+            toma: Toma de inventario
+            articulo_ids: Restringe el cálculo a estos artículos (opcional)
+
+        Returns:
+            QuerySet de diccionarios con id, codigo, nombre, stock_actual,
+            cantidad_contada y diferencia (solo filas con diferencia distinta de 0)
+        """
+        contado = DetalleTomaInventario.objects.filter(
+            toma=toma,
+            articulo=OuterRef('pk'),
+            eliminado=False
+        ).values('articulo').annotate(total=Sum('cantidad')).values('total')
+
+        queryset = Articulo.objects.filter(
+            ubicacion_fisica_id=toma.bodega_id,
+            eliminado=False
+        )
+        if articulo_ids is not None:
+            queryset = queryset.filter(id__in=list(articulo_ids))
+
+        queryset = queryset.annotate(
+            conteo=Subquery(contado, output_field=DecimalField(max_digits=12, decimal_places=2))
+        )
+        if not toma.conteo_completo:
+            queryset = queryset.filter(conteo__isnull=False)
+
+        return queryset.annotate(
+            cantidad_contada=Coalesce(
+                F('conteo'), Value(Decimal('0.00')),
+                output_field=DecimalField(max_digits=12, decimal_places=2)
+            )
+        ).annotate(
+            diferencia=F('cantidad_contada') - F('stock_actual')
+        ).exclude(
+            diferencia=0
+        ).values(
+            'id', 'codigo', 'nombre', 'stock_actual', 'cantidad_contada', 'diferencia'
+        ).order_by('codigo')
+
 
 # ==================== ENTREGA REPOSITORIES ====================
 
@@ -641,6 +980,15 @@ class EntregaArticuloRepository:
             'tipo', 'estado', 'entregado_por', 'bodega_origen', 'recibido_por'
         ).order_by('-fecha_entrega')
 
+    @staticmethod
+    def conteo_por_departamento() -> Dict[int, int]:
+        """Cantidad de entregas vigentes por departamento destino (una consulta agrupada)."""
+        return dict(
+            EntregaArticulo.objects.filter(departamento_destino__isnull=False).order_by().values(
+                'departamento_destino_id'
+            ).annotate(total=Count('id')).values_list('departamento_destino_id', 'total')
+        )
+
 
 class DetalleEntregaArticuloRepository:
     """Repository para gestionar acceso a datos de DetalleEntregaArticulo."""
@@ -717,6 +1065,15 @@ class EntregaBienRepository:
             'tipo', 'estado', 'entregado_por', 'recibido_por'
         ).order_by('-fecha_entrega')
 
+    @staticmethod
+    def conteo_por_departamento() -> Dict[int, int]:
+        """Cantidad de entregas vigentes por departamento destino (una consulta agrupada)."""
+        return dict(
+            EntregaBien.objects.filter(departamento_destino__isnull=False).order_by().values(
+                'departamento_destino_id'
+            ).annotate(total=Count('id')).values_list('departamento_destino_id', 'total')
+        )
+
 
 class DetalleEntregaBienRepository:
     """Repository para gestionar acceso a datos de DetalleEntregaBien."""
@@ -4,15 +4,26 @@ Service Layer para el módulo de bodega.
 Contiene la lógica de negocio y coordina los repositories,
 siguiendo el principio de Single Responsibility (SOLID).
 """
-from typing import Optional, Dict, Any, Tuple
-from decimal import Decimal
-from django.db import transaction
+import csv
+import math
+import re
+from datetime import date, timedelta
+from statistics import fmean, pstdev
+from typing import Optional, Dict, Any, Tuple, Iterable, Iterator, List
+from decimal import Decimal, ROUND_CEILING
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
+from core.utils import (
+    leer_filas_archivo, parsear_decimal_planilla, validar_largo_planilla,
+    CacheLRU, obtener_generacion, incrementar_generacion
+)
+from core.utils.business import generar_codigo_con_anio
 from .models import (
-    Categoria, Articulo, TipoMovimiento, Movimiento, Bodega,
+    Categoria, Articulo, TipoMovimiento, Movimiento, Bodega, UnidadMedida,
     EstadoEntrega, TipoEntrega, EntregaArticulo, DetalleEntregaArticulo,
-    EntregaBien, DetalleEntregaBien
+    EntregaBien, DetalleEntregaBien, ConciliacionStock, TomaInventario, DetalleTomaInventario
 )
 from .repositories import (
     CategoriaRepository,
@@ -25,8 +36,11 @@ from .repositories import (
     EntregaArticuloRepository,
     DetalleEntregaArticuloRepository,
     EntregaBienRepository,
-    DetalleEntregaBienRepository
+    DetalleEntregaBienRepository,
+    ConciliacionStockRepository,
+    TomaInventarioRepository
 )
+from apps.solicitudes.repositories import DetalleSolicitudRepository
 
 
 # ==================== CATEGORÍA SERVICE ====================
@@ -311,6 +325,300 @@ class ArticuloService:
         return list(self.repository.get_reorder_point())
 
 
+# ==================== ESCANEO DE CÓDIGOS DE BARRAS SERVICE ====================
+
+class EscaneoCodigoBarrasService:
+    """
+    Service para resolver lecturas de escáneres de códigos de barras.
+
+    Resuelve lotes de códigos contra Articulo y Activo con igualdad exacta
+    sobre sus índices únicos (una consulta IN por modelo para las lecturas
+    no cacheadas) y mantiene una caché LRU en memoria del proceso. Las claves
+    llevan la generación compartida GENERACION_CACHE, que las señales
+    incrementan al guardar o eliminar artículos y activos (ver
+    apps.bodega.signals), por lo que el cambio invalida la caché de todos los
+    workers; además las entradas expiran por tiempo.
+    """
+
+    MAX_CODIGOS = 500
+    GENERACION_CACHE = 'escaneo_codigos_barras'
+    cache = CacheLRU(max_entradas=20000, ttl=300)
+
+    def __init__(self):
+        self.articulo_repo = ArticuloRepository()
+
+    def resolver(self, codigos_barras: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resuelve un lote de códigos de barras.
+
+        Args:
+            codigos_barras: Códigos leídos (se ignoran vacíos y duplicados)
+
+        Returns:
+            Diccionario {codigo_barras: [coincidencias]}; lista vacía si no existe.
+            Cada coincidencia tiene tipo ('articulo' o 'activo'), id, codigo y nombre.
+
+        Raises:
+            ValidationError: Si el lote excede MAX_CODIGOS
+        """
+        codigos = list(dict.fromkeys(
+            codigo.strip() for codigo in codigos_barras if codigo and codigo.strip()
+        ))
+        if len(codigos) > self.MAX_CODIGOS:
+            raise ValidationError(
+                f'Se pueden consultar como máximo {self.MAX_CODIGOS} códigos por solicitud.'
+            )
+
+        generacion = obtener_generacion(self.GENERACION_CACHE)
+        aciertos, faltantes = self.cache.obtener_varios((generacion, codigo) for codigo in codigos)
+        resultados = {codigo: valor for (_, codigo), valor in aciertos.items()}
+        if faltantes:
+            from apps.activos.repositories import ActivoRepository
+
+            faltantes = [codigo for _, codigo in faltantes]
+            nuevos: Dict[str, List[Dict[str, Any]]] = {codigo: [] for codigo in faltantes}
+            for tipo, filas in (
+                ('articulo', self.articulo_repo.filter_by_codigos_barras(faltantes)),
+                ('activo', ActivoRepository.filter_by_codigos_barras(faltantes)),
+            ):
+                for fila in filas:
+                    nuevos[fila['codigo_barras']].append({
+                        'tipo': tipo,
+                        'id': fila['id'],
+                        'codigo': fila['codigo'],
+                        'nombre': fila['nombre'],
+                    })
+            self.cache.guardar_varios({(generacion, codigo): valor for codigo, valor in nuevos.items()})
+            resultados.update(nuevos)
+
+        return {codigo: resultados[codigo] for codigo in codigos}
+
+    @classmethod
+    def invalidar_cache(cls) -> None:
+        """Invalida la caché de códigos de barras en todos los procesos."""
+        incrementar_generacion(cls.GENERACION_CACHE)
+        cls.cache.limpiar()
+
+
+# ==================== IMPORTACIÓN DE ARTÍCULOS SERVICE ====================
+
+class ImportacionArticuloService:
+    """
+    Service para la importación masiva de artículos desde CSV o XLSX.
+
+    El archivo se recorre en streaming; los códigos existentes y los catálogos
+    (categorías, bodegas, unidades y marcas) se precargan una sola vez en
+    memoria, y los artículos junto a sus relaciones ManyToMany se insertan
+    con bulk_create por lotes.
+
+    Columnas: codigo, nombre, categoria, bodega, unidades_medida (requeridas);
+    descripcion, marcas, codigo_barras, stock_minimo, stock_maximo,
+    punto_reorden, observaciones (opcionales). Las columnas de catálogo usan
+    códigos; unidades_medida y marcas aceptan varios separados por '|'.
+    """
+
+    TAMANO_LOTE = 1000
+    SEPARADOR_MULTIPLE = '|'
+
+    def __init__(self):
+        self.repository = ArticuloRepository()
+
+    def _cargar_catalogos(self) -> Dict[str, Dict[str, int]]:
+        """Precarga los catálogos como diccionarios {CODIGO: id}."""
+        from apps.activos.models import Marca
+
+        def por_codigo(model) -> Dict[str, int]:
+            return {
+                codigo.upper(): pk
+                for pk, codigo in model.objects.filter(eliminado=False).values_list('id', 'codigo')
+            }
+
+        return {
+            'categorias': por_codigo(Categoria),
+            'bodegas': por_codigo(Bodega),
+            'unidades': por_codigo(UnidadMedida),
+            'marcas': por_codigo(Marca),
+        }
+
+    @staticmethod
+    def _parsear_decimal(datos: Dict[str, str], campo: str, etiqueta: str) -> Optional[Decimal]:
+        """Convierte una columna a Decimal validando que quepa en el campo del modelo."""
+        return parsear_decimal_planilla(datos.get(campo, ''), Articulo._meta.get_field(campo), etiqueta)
+
+    @staticmethod
+    def _validar_largo(valor: str, campo: str, etiqueta: str) -> str:
+        """Verifica que un texto no exceda el max_length del campo del modelo."""
+        return validar_largo_planilla(valor, Articulo._meta.get_field(campo), etiqueta)
+
+    def _resolver_codigos(
+        self,
+        valor: str,
+        catalogo: Dict[str, int],
+        nombre: str
+    ) -> List[int]:
+        """Resuelve una lista de códigos separados por '|' contra un catálogo."""
+        ids = []
+        for codigo in filter(None, (parte.strip().upper() for parte in valor.split(self.SEPARADOR_MULTIPLE))):
+            if codigo not in catalogo:
+                raise ValidationError(f'{nombre} "{codigo}" no existe.')
+            ids.append(catalogo[codigo])
+        return ids
+
+    def _construir_articulo(
+        self,
+        datos: Dict[str, str],
+        catalogos: Dict[str, Dict[str, int]],
+        codigos_usados: set,
+        codigos_barras_usados: set
+    ) -> Tuple[Articulo, List[int], List[int]]:
+        """
+        Valida una fila y construye el artículo (sin guardar) y sus relaciones.
+
+        Raises:
+            ValidationError: Si la fila no es válida
+        """
+        codigo = datos.get('codigo', '').strip().upper()
+        nombre = datos.get('nombre', '').strip()
+        if not codigo or not nombre:
+            raise ValidationError('El código y el nombre son obligatorios.')
+        self._validar_largo(codigo, 'codigo', 'El código')
+        self._validar_largo(nombre, 'nombre', 'El nombre')
+        if codigo in codigos_usados:
+            raise ValidationError(f'Ya existe un artículo con el código "{codigo}".')
+
+        categoria_codigo = datos.get('categoria', '').strip().upper()
+        if categoria_codigo not in catalogos['categorias']:
+            raise ValidationError(f'Categoría "{categoria_codigo}" no existe.')
+        bodega_codigo = datos.get('bodega', '').strip().upper()
+        if bodega_codigo not in catalogos['bodegas']:
+            raise ValidationError(f'Bodega "{bodega_codigo}" no existe.')
+
+        unidad_ids = self._resolver_codigos(
+            datos.get('unidades_medida', ''), catalogos['unidades'], 'Unidad de medida'
+        )
+        if not unidad_ids:
+            raise ValidationError('Debe indicar al menos una unidad de medida.')
+        marca_ids = self._resolver_codigos(datos.get('marcas', ''), catalogos['marcas'], 'Marca')
+
+        stock_minimo = self._parsear_decimal(datos, 'stock_minimo', 'Stock mínimo') or Decimal('0')
+        stock_maximo = self._parsear_decimal(datos, 'stock_maximo', 'Stock máximo')
+        punto_reorden = self._parsear_decimal(datos, 'punto_reorden', 'Punto de reorden')
+        if stock_maximo and stock_maximo < stock_minimo:
+            raise ValidationError('El stock máximo no puede ser menor que el stock mínimo.')
+        if punto_reorden and punto_reorden < stock_minimo:
+            raise ValidationError('El punto de reorden no puede ser menor que el stock mínimo.')
+
+        # bulk_create no invoca save(): se replica la generación del código de barras
+        codigo_barras = datos.get('codigo_barras', '').strip() or (
+            f"COD{codigo.replace('-', '').replace('_', '').upper()[:12]}"
+        )
+        self._validar_largo(codigo_barras, 'codigo_barras', 'El código de barras')
+        if codigo_barras in codigos_barras_usados:
+            raise ValidationError(f'El código de barras "{codigo_barras}" ya está en uso.')
+
+        codigos_usados.add(codigo)
+        codigos_barras_usados.add(codigo_barras)
+        articulo = Articulo(
+            codigo=codigo,
+            nombre=nombre,
+            descripcion=datos.get('descripcion') or None,
+            codigo_barras=codigo_barras,
+            categoria_id=catalogos['categorias'][categoria_codigo],
+            ubicacion_fisica_id=catalogos['bodegas'][bodega_codigo],
+            stock_minimo=stock_minimo,
+            stock_maximo=stock_maximo,
+            punto_reorden=punto_reorden,
+            observaciones=datos.get('observaciones') or None
+        )
+        return articulo, unidad_ids, marca_ids
+
+    def _guardar_lote(self, lote: List[Tuple[Articulo, List[int], List[int]]]) -> int:
+        """Inserta un lote de artículos y sus filas de las tablas intermedias."""
+        articulos = Articulo.objects.bulk_create([articulo for articulo, _, _ in lote])
+
+        UnidadesThrough = Articulo.unidades_medida.through
+        MarcasThrough = Articulo.marcas.through
+        UnidadesThrough.objects.bulk_create([
+            UnidadesThrough(articulo_id=articulo.id, unidadmedida_id=unidad_id)
+            for articulo, (_, unidad_ids, _) in zip(articulos, lote)
+            for unidad_id in unidad_ids
+        ], ignore_conflicts=True)
+        MarcasThrough.objects.bulk_create([
+            MarcasThrough(articulo_id=articulo.id, marca_id=marca_id)
+            for articulo, (_, _, marca_ids) in zip(articulos, lote)
+            for marca_id in marca_ids
+        ], ignore_conflicts=True)
+        return len(articulos)
+
+    def importar(
+        self,
+        archivo,
+        nombre_archivo: str,
+        dry_run: bool = False,
+        tamano_lote: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Importa artículos desde una planilla.
+
+        Las filas inválidas se omiten y se informan en el reporte; las válidas
+        se insertan por lotes dentro de una única transacción, tras cuyo
+        commit se invalida la caché de lecturas de códigos de barras. Con
+        dry_run solo se valida, sin escribir en la base de datos.
+
+        Args:
+            archivo: Archivo binario CSV o XLSX
+            nombre_archivo: Nombre del archivo (determina el formato)
+            dry_run: Si True, solo valida y reporta
+            tamano_lote: Filas por bulk_create (default: TAMANO_LOTE)
+
+        Returns:
+            Diccionario con total_filas, validas, creados, errores y dry_run
+
+        Raises:
+            ValidationError: Si el formato del archivo no es soportado
+        """
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+        catalogos = self._cargar_catalogos()
+        codigos_usados = {codigo.upper() for codigo in Articulo.all_objects.values_list('codigo', flat=True)}
+        codigos_barras_usados = set(
+            Articulo.all_objects.exclude(codigo_barras__isnull=True).values_list('codigo_barras', flat=True)
+        )
+
+        reporte: Dict[str, Any] = {
+            'total_filas': 0, 'validas': 0, 'creados': 0, 'errores': [], 'dry_run': dry_run
+        }
+        lote: List[Tuple[Articulo, List[int], List[int]]] = []
+
+        with transaction.atomic():
+            for numero_fila, datos in leer_filas_archivo(archivo, nombre_archivo):
+                reporte['total_filas'] += 1
+                try:
+                    lote.append(self._construir_articulo(
+                        datos, catalogos, codigos_usados, codigos_barras_usados
+                    ))
+                except ValidationError as e:
+                    reporte['errores'].append({
+                        'fila': numero_fila,
+                        'codigo': datos.get('codigo', ''),
+                        'mensaje': ' '.join(e.messages)
+                    })
+                    continue
+
+                reporte['validas'] += 1
+                if len(lote) >= tamano_lote:
+                    if not dry_run:
+                        reporte['creados'] += self._guardar_lote(lote)
+                    lote = []
+
+            if lote and not dry_run:
+                reporte['creados'] += self._guardar_lote(lote)
+
+        if reporte['creados']:
+            # Los artículos nuevos pueden resolver códigos que la caché guardó como no encontrados
+            transaction.on_commit(EscaneoCodigoBarrasService.invalidar_cache)
+        return reporte
+
+
 # ==================== MOVIMIENTO SERVICE ====================
 
 class MovimientoService:
@@ -502,6 +810,738 @@ class MovimientoService:
         return list(self.movimiento_repo.filter_by_articulo(articulo, limit))
 
 
+# ==================== KARDEX SERVICE ====================
+
+class _EcoBuffer:
+    """Pseudo-buffer para csv.writer que retorna la línea escrita en vez de almacenarla."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+class KardexService:
+    """
+    Service para el reporte kardex (libro de movimientos por artículo).
+
+    Los saldos acumulados se calculan en SQL con funciones de ventana y las
+    filas se recorren con cursores del servidor (iterator con chunk_size),
+    por lo que el reporte puede emitirse en streaming sin materializar
+    historiales de varios años en memoria.
+    """
+
+    CHUNK_SIZE = 2000
+
+    COLUMNAS_CSV: List[Tuple[str, str]] = [
+        ('articulo__codigo', 'Código'),
+        ('articulo__nombre', 'Artículo'),
+        ('fecha_creacion', 'Fecha'),
+        ('operacion', 'Operación'),
+        ('tipo__nombre', 'Tipo'),
+        ('entrada', 'Entrada'),
+        ('salida', 'Salida'),
+        ('saldo', 'Saldo'),
+        ('usuario__username', 'Usuario'),
+        ('motivo', 'Motivo'),
+    ]
+
+    def __init__(self):
+        self.movimiento_repo = MovimientoRepository()
+
+    def obtener_kardex(
+        self,
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ):
+        """
+        Retorna el QuerySet del kardex con saldo relativo al rango.
+
+        Útil para paginar en HTML; las filas deben pasar por completar_filas
+        para sumar el saldo inicial de cada artículo.
+
+        Args:
+            articulo_ids: IDs de artículos (None = todos)
+            fecha_desde: Fecha inicial inclusiva
+            fecha_hasta: Fecha final inclusiva
+
+        Returns:
+            QuerySet de diccionarios con la columna saldo
+        """
+        return self.movimiento_repo.get_kardex(articulo_ids, fecha_desde, fecha_hasta)
+
+    def obtener_saldos_iniciales(
+        self,
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None
+    ) -> Dict[int, Decimal]:
+        """
+        Retorna el saldo de cada artículo previo a fecha_desde.
+
+        Args:
+            articulo_ids: IDs de artículos (None = todos)
+            fecha_desde: Fecha de corte
+
+        Returns:
+            Diccionario {articulo_id: saldo}
+        """
+        return self.movimiento_repo.get_saldos_iniciales(articulo_ids, fecha_desde)
+
+    def completar_filas(
+        self,
+        filas: Iterable[Dict[str, Any]],
+        saldos_iniciales: Dict[int, Decimal]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Ajusta el saldo con el saldo inicial y separa entradas de salidas.
+
+        Args:
+            filas: Filas del kardex (diccionarios)
+            saldos_iniciales: Saldo previo por artículo
+
+        Yields:
+            Fila con saldo absoluto y columnas entrada/salida
+        """
+        for fila in filas:
+            fila['saldo'] = fila['saldo'] + saldos_iniciales.get(fila['articulo_id'], Decimal('0'))
+            es_entrada = fila['operacion'] == 'ENTRADA'
+            fila['entrada'] = fila['cantidad'] if es_entrada else None
+            fila['salida'] = None if es_entrada else fila['cantidad']
+            yield fila
+
+    def iterar_kardex(
+        self,
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Recorre el kardex completo con un cursor del servidor.
+
+        Args:
+            articulo_ids: IDs de artículos (None = todos)
+            fecha_desde: Fecha inicial inclusiva
+            fecha_hasta: Fecha final inclusiva
+
+        Yields:
+            Filas del kardex con saldo absoluto
+        """
+        articulo_ids = list(articulo_ids) if articulo_ids else None
+        saldos_iniciales = self.obtener_saldos_iniciales(articulo_ids, fecha_desde)
+        filas = self.obtener_kardex(
+            articulo_ids, fecha_desde, fecha_hasta
+        ).iterator(chunk_size=self.CHUNK_SIZE)
+        return self.completar_filas(filas, saldos_iniciales)
+
+    def iterar_csv(
+        self,
+        articulo_ids: Optional[Iterable[int]] = None,
+        fecha_desde: Optional[date] = None,
+        fecha_hasta: Optional[date] = None
+    ) -> Iterator[str]:
+        """
+        Genera el kardex como líneas CSV, apto para StreamingHttpResponse.
+
+        Args:
+            articulo_ids: IDs de artículos (None = todos)
+            fecha_desde: Fecha inicial inclusiva
+            fecha_hasta: Fecha final inclusiva
+
+        Yields:
+            Líneas CSV (incluye encabezado)
+        """
+        writer = csv.writer(_EcoBuffer())
+        claves = [clave for clave, _ in self.COLUMNAS_CSV]
+
+        yield writer.writerow([titulo for _, titulo in self.COLUMNAS_CSV])
+        for fila in self.iterar_kardex(articulo_ids, fecha_desde, fecha_hasta):
+            fila['fecha_creacion'] = timezone.localtime(fila['fecha_creacion']).strftime('%d/%m/%Y %H:%M')
+            yield writer.writerow([
+                '' if fila[clave] is None else fila[clave] for clave in claves
+            ])
+
+
+# ==================== CONCILIACIÓN DE STOCK SERVICE ====================
+
+class ConciliacionStockService:
+    """
+    Service para conciliar el stock de los artículos contra el log de movimientos.
+
+    El stock_actual se modifica desde varios flujos (movimientos manuales,
+    entregas y recepciones). Este servicio compara cada artículo con la suma
+    neta de sus movimientos mediante agregaciones agrupadas por bloques de
+    IDs, de modo que los bloques pueden procesarse en paralelo.
+    """
+
+    TAMANO_BLOQUE = 5000
+
+    def __init__(self):
+        self.articulo_repo = ArticuloRepository()
+        self.conciliacion_repo = ConciliacionStockRepository()
+
+    def calcular_bloques(self, tamano_bloque: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Divide el catálogo en rangos de IDs [desde, hasta).
+
+        Args:
+            tamano_bloque: Cantidad de IDs por bloque (default: TAMANO_BLOQUE)
+
+        Returns:
+            Lista de tuplas (id_desde, id_hasta)
+        """
+        tamano_bloque = tamano_bloque or self.TAMANO_BLOQUE
+        id_minimo, id_maximo = self.articulo_repo.get_rango_ids()
+        if id_minimo is None:
+            return []
+        return [
+            (desde, min(desde + tamano_bloque, id_maximo + 1))
+            for desde in range(id_minimo, id_maximo + 1, tamano_bloque)
+        ]
+
+    def buscar_discrepancias(
+        self,
+        id_desde: int,
+        id_hasta: int,
+        incluir_sin_movimientos: bool = False
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Compara stock registrado y saldo de movimientos en un rango de IDs.
+
+        Args:
+            id_desde: ID inicial inclusivo
+            id_hasta: ID final exclusivo
+            incluir_sin_movimientos: Si False, se omiten artículos sin movimientos
+                (su stock pudo cargarse al crearlos)
+
+        Returns:
+            Tupla (artículos revisados, lista de discrepancias)
+        """
+        revisados = 0
+        discrepancias = []
+        for fila in self.articulo_repo.filter_saldos_movimientos(id_desde, id_hasta):
+            revisados += 1
+            if not incluir_sin_movimientos and fila['total_movimientos'] == 0:
+                continue
+            if fila['stock_actual'] != fila['saldo_movimientos']:
+                discrepancias.append({
+                    'articulo_id': fila['id'],
+                    'codigo': fila['codigo'],
+                    'stock_actual': str(fila['stock_actual']),
+                    'saldo_movimientos': str(fila['saldo_movimientos']),
+                    'diferencia': str(fila['stock_actual'] - fila['saldo_movimientos']),
+                })
+        return revisados, discrepancias
+
+    @transaction.atomic
+    def corregir_discrepancias(self, articulo_ids: Iterable[int]) -> int:
+        """
+        Ajusta el stock de los artículos al saldo neto de sus movimientos.
+
+        Bloquea los artículos (select_for_update) y recalcula el saldo dentro
+        de la misma transacción, por lo que no pisa movimientos concurrentes.
+
+        Args:
+            articulo_ids: IDs de artículos a corregir
+
+        Returns:
+            Cantidad de artículos actualizados
+        """
+        ids_bloqueados = list(
+            Articulo.objects.select_for_update().filter(
+                id__in=list(articulo_ids)
+            ).values_list('id', flat=True)
+        )
+        ahora = timezone.now()
+        articulos = [
+            Articulo(id=fila['id'], stock_actual=fila['saldo_movimientos'], fecha_actualizacion=ahora)
+            for fila in self.articulo_repo.filter_saldos_movimientos(articulo_ids=ids_bloqueados)
+            if fila['stock_actual'] != fila['saldo_movimientos']
+        ]
+        Articulo.objects.bulk_update(
+            articulos, ['stock_actual', 'fecha_actualizacion'], batch_size=1000
+        )
+        return len(articulos)
+
+    def registrar_ejecucion(
+        self,
+        fecha_inicio,
+        total_articulos: int,
+        discrepancias: List[Dict[str, Any]],
+        corregido: bool
+    ) -> ConciliacionStock:
+        """
+        Registra el resultado de una ejecución de la conciliación.
+
+        Args:
+            fecha_inicio: Momento de inicio de la ejecución
+            total_articulos: Cantidad de artículos revisados
+            discrepancias: Discrepancias encontradas
+            corregido: Si las discrepancias fueron corregidas
+
+        Returns:
+            ConciliacionStock creada
+        """
+        return self.conciliacion_repo.create(
+            fecha_inicio=fecha_inicio,
+            fecha_fin=timezone.now(),
+            total_articulos=total_articulos,
+            total_discrepancias=len(discrepancias),
+            corregido=corregido,
+            detalle=discrepancias
+        )
+
+
+# ==================== PRONÓSTICO DE DEMANDA SERVICE ====================
+
+class PronosticoDemandaService:
+    """
+    Service que sugiere stock mínimo y punto de reorden desde la demanda histórica.
+
+    La demanda mensual de un artículo es el mayor valor entre sus salidas (sin
+    ajustes de inventario) y lo aprobado en solicitudes ese mes: un despacho
+    aprobado genera ambas cosas, por lo que sumarlas lo contaría dos veces.
+    Sobre esa serie se calcula el consumo diario, ajustado por el período
+    escolar en que cae la reposición, y el stock de seguridad.
+
+    Igual que la conciliación de stock, trabaja por bloques de IDs con dos
+    consultas agrupadas por bloque, de modo que el comando
+    ajustar_umbrales_stock puede repartir los bloques en un pool de procesos.
+    """
+
+    TAMANO_BLOQUE = 5000
+    MESES_HISTORIA = 12
+    DIAS_REPOSICION = 15
+    # Nivel de servicio ~95% (distribución normal)
+    FACTOR_SERVICIO = 1.65
+
+    # Período del año escolar de cada mes
+    PERIODO_ESCOLAR = {
+        1: 'VACACIONES', 2: 'VACACIONES',
+        3: 'PRIMER_SEMESTRE', 4: 'PRIMER_SEMESTRE', 5: 'PRIMER_SEMESTRE',
+        6: 'PRIMER_SEMESTRE', 7: 'PRIMER_SEMESTRE',
+        8: 'SEGUNDO_SEMESTRE', 9: 'SEGUNDO_SEMESTRE', 10: 'SEGUNDO_SEMESTRE',
+        11: 'SEGUNDO_SEMESTRE', 12: 'SEGUNDO_SEMESTRE',
+    }
+
+    def __init__(self):
+        self.articulo_repo = ArticuloRepository()
+        self.movimiento_repo = MovimientoRepository()
+        self.detalle_solicitud_repo = DetalleSolicitudRepository()
+
+    def calcular_bloques(self, tamano_bloque: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Divide el catálogo en rangos de IDs [desde, hasta) (ver ConciliacionStockService)."""
+        return ConciliacionStockService().calcular_bloques(tamano_bloque or self.TAMANO_BLOQUE)
+
+    @staticmethod
+    def meses_historia(hoy: date, meses: int) -> List[Tuple[int, int]]:
+        """
+        Meses completos anteriores al mes de hoy, del más antiguo al más reciente.
+
+        Returns:
+            Lista de tuplas (año, mes)
+        """
+        indice = hoy.year * 12 + hoy.month - 1
+        return [(mes // 12, mes % 12 + 1) for mes in range(indice - meses, indice)]
+
+    @staticmethod
+    def _redondear(valor: float) -> Decimal:
+        """Redondea hacia arriba a 2 decimales (los umbrales no deben quedar cortos)."""
+        return Decimal(str(round(valor, 6))).quantize(Decimal('0.01'), rounding=ROUND_CEILING)
+
+    @classmethod
+    def calcular_umbrales(
+        cls,
+        demanda: List[float],
+        meses: List[int],
+        mes_objetivo: int,
+        dias_reposicion: Optional[int] = None,
+        factor_servicio: Optional[float] = None
+    ) -> Optional[Tuple[Decimal, Decimal]]:
+        """
+        Calcula stock mínimo (stock de seguridad) y punto de reorden.
+
+        Args:
+            demanda: Demanda de cada mes de la historia
+            meses: Número de mes (1-12) de cada posición de la demanda
+            mes_objetivo: Mes en que cae la próxima reposición
+            dias_reposicion: Días de reposición (default: DIAS_REPOSICION)
+            factor_servicio: Factor del nivel de servicio (default: FACTOR_SERVICIO)
+
+        Returns:
+            Tupla (stock mínimo, punto de reorden); None si no hubo demanda
+        """
+        dias_reposicion = dias_reposicion or cls.DIAS_REPOSICION
+        factor_servicio = cls.FACTOR_SERVICIO if factor_servicio is None else factor_servicio
+
+        media = fmean(demanda) if demanda else 0
+        if media <= 0:
+            return None
+
+        periodo = cls.PERIODO_ESCOLAR[mes_objetivo]
+        demanda_periodo = [
+            cantidad for cantidad, mes in zip(demanda, meses)
+            if cls.PERIODO_ESCOLAR[mes] == periodo
+        ]
+        estacionalidad = fmean(demanda_periodo) / media if demanda_periodo else 1.0
+
+        consumo_diario = media * estacionalidad / 30
+        seguridad = factor_servicio * pstdev(demanda) * math.sqrt(dias_reposicion / 30)
+        return (
+            cls._redondear(seguridad),
+            cls._redondear(consumo_diario * dias_reposicion + seguridad)
+        )
+
+    def sugerir(
+        self,
+        id_desde: int,
+        id_hasta: int,
+        hoy: Optional[date] = None,
+        meses: Optional[int] = None
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Calcula los umbrales sugeridos de los artículos de un rango de IDs.
+
+        Solo se proponen cambios para artículos con demanda en la historia;
+        se omiten los que superarían su stock máximo (requieren revisión manual).
+
+        Args:
+            id_desde: ID inicial inclusivo
+            id_hasta: ID final exclusivo
+            hoy: Fecha de referencia (por defecto hoy)
+            meses: Meses de historia (default: MESES_HISTORIA)
+
+        Returns:
+            Tupla (artículos revisados, lista de sugerencias con articulo_id, codigo,
+            umbrales actuales y sugeridos)
+        """
+        hoy = hoy or date.today()
+        historia = self.meses_historia(hoy, meses or self.MESES_HISTORIA)
+        posiciones = {año_mes: posicion for posicion, año_mes in enumerate(historia)}
+        numeros_mes = [mes for _, mes in historia]
+        mes_objetivo = (hoy + timedelta(days=self.DIAS_REPOSICION)).month
+        fecha_desde = date(historia[0][0], historia[0][1], 1)
+
+        demanda: Dict[int, List[float]] = {}
+        consultas = (
+            self.movimiento_repo.get_salidas_mensuales(
+                id_desde, id_hasta, fecha_desde, TomaInventarioService.CODIGO_TIPO_AJUSTE
+            ),
+            self.detalle_solicitud_repo.get_aprobado_mensual(id_desde, id_hasta, fecha_desde),
+        )
+        for consulta in consultas:
+            for articulo_id, mes, total in consulta:
+                posicion = posiciones.get((mes.year, mes.month))
+                if posicion is None:
+                    continue
+                serie = demanda.setdefault(articulo_id, [0.0] * len(historia))
+                serie[posicion] = max(serie[posicion], float(total))
+
+        revisados = 0
+        sugerencias = []
+        for fila in self.articulo_repo.get_umbrales(id_desde, id_hasta):
+            revisados += 1
+            if fila['id'] not in demanda:
+                continue
+            umbrales = self.calcular_umbrales(demanda[fila['id']], numeros_mes, mes_objetivo)
+            if umbrales is None:
+                continue
+            stock_minimo, punto_reorden = umbrales
+            if fila['stock_maximo'] and punto_reorden > fila['stock_maximo']:
+                continue
+            if (stock_minimo, punto_reorden) == (fila['stock_minimo'], fila['punto_reorden']):
+                continue
+            sugerencias.append({
+                'articulo_id': fila['id'],
+                'codigo': fila['codigo'],
+                'stock_minimo': fila['stock_minimo'],
+                'punto_reorden': fila['punto_reorden'],
+                'stock_minimo_sugerido': stock_minimo,
+                'punto_reorden_sugerido': punto_reorden,
+            })
+        return revisados, sugerencias
+
+    @transaction.atomic
+    def aplicar(self, sugerencias: Iterable[Dict[str, Any]]) -> int:
+        """
+        Guarda los umbrales sugeridos con un bulk_update.
+
+        Args:
+            sugerencias: Sugerencias retornadas por sugerir()
+
+        Returns:
+            Cantidad de artículos actualizados
+        """
+        ahora = timezone.now()
+        articulos = [
+            Articulo(
+                id=sugerencia['articulo_id'],
+                stock_minimo=sugerencia['stock_minimo_sugerido'],
+                punto_reorden=sugerencia['punto_reorden_sugerido'],
+                fecha_actualizacion=ahora
+            )
+            for sugerencia in sugerencias
+        ]
+        Articulo.objects.bulk_update(
+            articulos, ['stock_minimo', 'punto_reorden', 'fecha_actualizacion'], batch_size=1000
+        )
+        return len(articulos)
+
+
+# ==================== TOMA DE INVENTARIO SERVICE ====================
+
+class TomaInventarioService:
+    """
+    Service para tomas de inventario físico por bodega.
+
+    Los conteos se acumulan en una tabla de staging mediante bulk_create; las
+    diferencias contra stock_actual se calculan con una consulta basada en
+    conjuntos y el ajuste se aplica con bulk_create de movimientos y
+    bulk_update de stock en una sola transacción.
+    """
+
+    TAMANO_LOTE = 1000
+    CODIGO_TIPO_AJUSTE = 'AJUSTE'
+
+    def __init__(self):
+        self.toma_repo = TomaInventarioRepository()
+        self.articulo_repo = ArticuloRepository()
+        self.tipo_repo = TipoMovimientoRepository()
+
+    @transaction.atomic
+    def crear_toma(
+        self,
+        bodega: Bodega,
+        responsable: User,
+        conteo_completo: bool = False,
+        observaciones: Optional[str] = None
+    ) -> TomaInventario:
+        """
+        Abre una nueva toma de inventario para una bodega.
+
+        Args:
+            bodega: Bodega a inventariar
+            responsable: Usuario responsable de la toma
+            conteo_completo: Si True, lo no contado se ajusta a cero
+            observaciones: Observaciones (opcional)
+
+        Returns:
+            TomaInventario creada
+
+        Raises:
+            ValidationError: Si la bodega ya tiene una toma abierta
+        """
+        # La restricción parcial uq_toma_abierta_bodega garantiza una sola toma
+        # abierta por bodega aun con solicitudes concurrentes
+        try:
+            with transaction.atomic():
+                return self.toma_repo.create(
+                    numero=generar_codigo_con_anio('TOMA', TomaInventario, 'numero', longitud=6),
+                    bodega=bodega,
+                    responsable=responsable,
+                    conteo_completo=conteo_completo,
+                    observaciones=observaciones
+                )
+        except IntegrityError as e:
+            if TomaInventario.RESTRICCION_ABIERTA not in str(e):
+                raise
+            raise ValidationError(
+                f'La bodega "{bodega.nombre}" ya tiene una toma de inventario abierta.'
+            )
+
+    @staticmethod
+    def parsear_lineas(texto: str) -> Iterator[Tuple[int, str, str]]:
+        """
+        Interpreta el texto ingresado o escaneado, una lectura por línea.
+
+        Cada línea es "CODIGO" (cuenta 1) o "CODIGO<sep>CANTIDAD" con separador
+        coma, punto y coma o tabulación.
+
+        Yields:
+            Tuplas (número de línea, código, cantidad como texto)
+        """
+        for numero, linea in enumerate(texto.splitlines(), start=1):
+            linea = linea.strip()
+            if not linea:
+                continue
+            partes = [parte.strip() for parte in re.split(r'[,;\t]', linea, maxsplit=1)]
+            yield numero, partes[0], partes[1] if len(partes) > 1 and partes[1] else '1'
+
+    def _bloquear_abierta(self, toma: TomaInventario) -> TomaInventario:
+        """
+        Relee la toma con bloqueo de fila y valida que siga abierta.
+
+        Debe llamarse dentro de una transacción: serializa conteos, aplicación
+        y cancelación de una misma toma, de modo que no se registren conteos
+        en una toma que otra solicitud ya aplicó.
+
+        Returns:
+            TomaInventario bloqueada
+
+        Raises:
+            ValidationError: Si la toma no está abierta
+        """
+        toma = TomaInventario.objects.select_for_update().get(pk=toma.pk)
+        if toma.estado != TomaInventario.ESTADO_ABIERTA:
+            raise ValidationError(
+                f'La toma {toma.numero} está {toma.get_estado_display().lower()} y no admite cambios.'
+            )
+        return toma
+
+    @transaction.atomic
+    def registrar_conteos(
+        self,
+        toma: TomaInventario,
+        lecturas: Iterable[Tuple[int, str, str]],
+        usuario: User,
+        reemplazar: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Registra lecturas de conteo en la tabla de staging.
+
+        Los códigos (código o código de barras) se resuelven contra un
+        diccionario precargado con los artículos de la bodega.
+
+        Args:
+            toma: Toma de inventario abierta
+            lecturas: Tuplas (línea, código, cantidad) (ver parsear_lineas)
+            usuario: Usuario que registra
+            reemplazar: Si True, los conteos previos de los artículos leídos
+                se descartan (la cantidad ingresada pasa a ser el total)
+
+        Returns:
+            Diccionario con registrados y errores [{linea, codigo, mensaje}]
+
+        Raises:
+            ValidationError: Si la toma no está abierta
+        """
+        toma = self._bloquear_abierta(toma)
+
+        articulos_por_codigo: Dict[str, int] = {}
+        for articulo_id, codigo, codigo_barras in Articulo.objects.filter(
+            ubicacion_fisica_id=toma.bodega_id, eliminado=False
+        ).values_list('id', 'codigo', 'codigo_barras'):
+            articulos_por_codigo[codigo.upper()] = articulo_id
+            if codigo_barras:
+                articulos_por_codigo.setdefault(codigo_barras.upper(), articulo_id)
+
+        campo_cantidad = DetalleTomaInventario._meta.get_field('cantidad')
+        conteos: List[DetalleTomaInventario] = []
+        errores: List[Dict[str, Any]] = []
+        for linea, codigo, cantidad_texto in lecturas:
+            articulo_id = articulos_por_codigo.get(codigo.upper())
+            if articulo_id is None:
+                errores.append({
+                    'linea': linea, 'codigo': codigo,
+                    'mensaje': 'No existe un artículo con ese código en la bodega.'
+                })
+                continue
+            try:
+                cantidad = parsear_decimal_planilla(cantidad_texto, campo_cantidad, 'La cantidad')
+            except ValidationError as e:
+                errores.append({'linea': linea, 'codigo': codigo, 'mensaje': ' '.join(e.messages)})
+                continue
+            conteos.append(DetalleTomaInventario(
+                toma=toma, articulo_id=articulo_id, cantidad=cantidad, usuario=usuario
+            ))
+
+        if reemplazar and conteos:
+            DetalleTomaInventario.objects.filter(
+                toma=toma,
+                articulo_id__in={conteo.articulo_id for conteo in conteos}
+            ).delete()
+
+        DetalleTomaInventario.objects.bulk_create(conteos, batch_size=self.TAMANO_LOTE)
+        return {'registrados': len(conteos), 'errores': errores}
+
+    def obtener_diferencias(self, toma: TomaInventario) -> List[Dict[str, Any]]:
+        """
+        Retorna los artículos cuya cantidad contada difiere del stock.
+
+        Args:
+            toma: Toma de inventario
+
+        Returns:
+            Lista de diccionarios con id, codigo, nombre, stock_actual,
+            cantidad_contada y diferencia
+        """
+        return list(self.toma_repo.get_diferencias(toma))
+
+    @transaction.atomic
+    def aplicar_toma(self, toma: TomaInventario, usuario: User) -> int:
+        """
+        Aplica los ajustes de la toma: un movimiento por diferencia y stock = contado.
+
+        Bloquea los artículos de la bodega, recalcula las diferencias bajo el
+        bloqueo y registra todos los movimientos con bulk_create y el nuevo
+        stock con bulk_update, dentro de una única transacción.
+
+        Args:
+            toma: Toma de inventario abierta
+            usuario: Usuario que aplica la toma
+
+        Returns:
+            Cantidad de artículos ajustados
+
+        Raises:
+            ValidationError: Si la toma no está abierta o no existe el tipo de movimiento de ajuste
+        """
+        toma = self._bloquear_abierta(toma)
+
+        tipo_ajuste = self.tipo_repo.get_by_codigo(self.CODIGO_TIPO_AJUSTE)
+        if not tipo_ajuste:
+            raise ValidationError(
+                f'No existe el tipo de movimiento "{self.CODIGO_TIPO_AJUSTE}". '
+                'Configúrelo en el catálogo de tipos de movimiento.'
+            )
+
+        list(Articulo.objects.select_for_update().filter(
+            ubicacion_fisica_id=toma.bodega_id, eliminado=False
+        ).values_list('id', flat=True))
+        diferencias = list(self.toma_repo.get_diferencias(toma))
+
+        ahora = timezone.now()
+        motivo = f'Ajuste por toma de inventario {toma.numero}'
+        movimientos = []
+        articulos = []
+        for fila in diferencias:
+            movimientos.append(Movimiento(
+                articulo_id=fila['id'],
+                tipo=tipo_ajuste,
+                cantidad=abs(fila['diferencia']),
+                operacion='ENTRADA' if fila['diferencia'] > 0 else 'SALIDA',
+                usuario=usuario,
+                motivo=motivo,
+                stock_antes=fila['stock_actual'],
+                stock_despues=fila['cantidad_contada']
+            ))
+            articulos.append(Articulo(
+                id=fila['id'], stock_actual=fila['cantidad_contada'], fecha_actualizacion=ahora
+            ))
+
+        Movimiento.objects.bulk_create(movimientos, batch_size=self.TAMANO_LOTE)
+        Articulo.objects.bulk_update(
+            articulos, ['stock_actual', 'fecha_actualizacion'], batch_size=self.TAMANO_LOTE
+        )
+
+        toma.estado = TomaInventario.ESTADO_APLICADA
+        toma.fecha_aplicacion = ahora
+        toma.aplicado_por = usuario
+        toma.save(update_fields=['estado', 'fecha_aplicacion', 'aplicado_por', 'fecha_actualizacion'])
+        return len(articulos)
+
+    @transaction.atomic
+    def cancelar_toma(self, toma: TomaInventario) -> TomaInventario:
+        """
+        Cancela una toma abierta sin aplicar ajustes.
+
+        Raises:
+            ValidationError: Si la toma no está abierta
+        """
+        toma = self._bloquear_abierta(toma)
+        toma.estado = TomaInventario.ESTADO_CANCELADA
+        toma.save(update_fields=['estado', 'fecha_actualizacion'])
+        return toma
+
+
 # ==================== ENTREGA SERVICE ====================
 
 class EntregaArticuloService:
@@ -531,7 +1571,7 @@ class EntregaArticuloService:
         prefijo = f"ENT-ART-{fecha_actual.strftime('%Y%m%d')}"
 
         # Buscar el último número del día
-        ultimas_entregas = EntregaArticulo.objects.filter(
+        ultimas_entregas = EntregaArticulo.all_objects.filter(
             numero__startswith=prefijo
         ).order_by('-numero')[:1]
 
@@ -609,6 +1649,7 @@ class EntregaArticuloService:
         )
 
         # Procesar detalles y actualizar stock
+        cambios_solicitud: Dict[int, List[Tuple[Decimal, Decimal, Decimal, Decimal]]] = {}
         for detalle_data in detalles:
             articulo_id = detalle_data.get('articulo_id')
             cantidad = Decimal(str(detalle_data.get('cantidad', 0)))
@@ -667,6 +1708,10 @@ class EntregaArticuloService:
 
             # Si hay detalle de solicitud, actualizar cantidad despachada
             if detalle_solicitud:
+                cambios_solicitud.setdefault(detalle_solicitud.solicitud_id, []).append((
+                    detalle_solicitud.cantidad_aprobada, detalle_solicitud.cantidad_despachada,
+                    detalle_solicitud.cantidad_aprobada, detalle_solicitud.cantidad_despachada + cantidad
+                ))
                 detalle_solicitud.cantidad_despachada += cantidad
                 detalle_solicitud.save()
 
@@ -693,31 +1738,36 @@ class EntregaArticuloService:
                     stock_despues=stock_nuevo
                 )
 
+        # Actualizar contadores de las solicitudes despachadas
+        if cambios_solicitud:
+            from apps.solicitudes.models import Solicitud
+            from apps.solicitudes.services import ContadoresSolicitudService
+            contadores_service = ContadoresSolicitudService()
+            for solicitud_id, cambios in cambios_solicitud.items():
+                solicitud_afectada = solicitud if solicitud and solicitud.id == solicitud_id else Solicitud(id=solicitud_id)
+                contadores_service.registrar_cambios(solicitud_afectada, cambios)
+
         # Si hay solicitud asociada, verificar si está completamente despachada
         if solicitud:
-            self._verificar_y_actualizar_estado_solicitud(solicitud)
+            self._verificar_y_actualizar_estado_solicitud(solicitud, entrega)
 
         return entrega
 
-    def _verificar_y_actualizar_estado_solicitud(self, solicitud):
+    def _verificar_y_actualizar_estado_solicitud(self, solicitud, entrega):
         """
         Verifica si todos los artículos de una solicitud están completamente despachados
         y actualiza el estado si corresponde.
 
+        Usa el contador lineas_pendientes de la solicitud, sin recorrer sus detalles.
+
         Args:
-            solicitud: Solicitud a verificar
+            solicitud: Solicitud a verificar (con contadores actualizados)
+            entrega: Entrega que completó el despacho
         """
-        from apps.solicitudes.models import EstadoSolicitud
-
-        # Verificar si todos los detalles están completamente despachados
-        detalles = solicitud.detalles.filter(eliminado=False)
-        todos_despachados = all(
-            detalle.cantidad_despachada >= detalle.cantidad_aprobada
-            for detalle in detalles
-            if detalle.articulo  # Solo artículos
-        )
+        from apps.solicitudes.models import EstadoSolicitud, EventoSolicitud
+        from apps.solicitudes.services import EventoSolicitudService
 
-        if todos_despachados:
+        if solicitud.despacho_completo:
             # Buscar estado "Completado" o similar
             estado_completado = EstadoSolicitud.objects.filter(
                 es_final=True,
@@ -727,7 +1777,11 @@ class EntregaArticuloService:
 
             if estado_completado:
                 solicitud.estado = estado_completado
-                solicitud.save()
+                solicitud.save(update_fields=['estado', 'fecha_actualizacion'])
+                EventoSolicitudService().registrar(
+                    solicitud, EventoSolicitud.TIPO_ESTADO, estado_completado, entrega.entregado_por,
+                    observaciones=f'Despacho completado con la entrega {entrega.numero}'
+                )
 
 
 class EntregaBienService:
@@ -754,7 +1808,7 @@ class EntregaBienService:
         prefijo = f"ENT-BIEN-{fecha_actual.strftime('%Y%m%d')}"
 
         # Buscar el último número del día
-        ultimas_entregas = EntregaBien.objects.filter(
+        ultimas_entregas = EntregaBien.all_objects.filter(
             numero__startswith=prefijo
         ).order_by('-numero')[:1]
 
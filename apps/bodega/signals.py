@@ -0,0 +1,39 @@
+"""
+Señales del módulo de bodega.
+
+Mantienen coherente la caché de lecturas de códigos de barras
+(EscaneoCodigoBarrasService) cuando cambian artículos o activos.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from apps.activos.models import Activo
+from core.signals import eliminacion_logica_masiva
+from .models import Articulo
+from .services import EscaneoCodigoBarrasService
+
+# Campos que afectan el resultado de una lectura de código de barras
+CAMPOS_ESCANEO = {'codigo_barras', 'codigo', 'nombre', 'eliminado'}
+
+
+@receiver(post_save, sender=Articulo)
+@receiver(post_save, sender=Activo)
+def invalidar_cache_escaneo(sender, instance, created=False, update_fields=None, **kwargs):
+    """Invalida la caché salvo en guardados parciales que no tocan campos de escaneo (ej: stock)."""
+    if update_fields is not None and not CAMPOS_ESCANEO.intersection(update_fields):
+        return
+    EscaneoCodigoBarrasService.invalidar_cache()
+
+
+@receiver(post_delete, sender=Articulo)
+@receiver(post_delete, sender=Activo)
+def invalidar_cache_escaneo_eliminacion(sender, instance, **kwargs):
+    """Invalida la caché al eliminar físicamente un artículo o activo."""
+    EscaneoCodigoBarrasService.invalidar_cache()
+
+
+@receiver(eliminacion_logica_masiva, sender=Articulo)
+@receiver(eliminacion_logica_masiva, sender=Activo)
+def invalidar_cache_escaneo_masivo(sender, ids, eliminado, **kwargs):
+    """Invalida la caché al eliminar o restaurar artículos o activos en forma masiva."""
+    EscaneoCodigoBarrasService.invalidar_cache()
@@ -0,0 +1,57 @@
+"""
+Configuración de fixtures y utilidades para tests de bodega.
+"""
+import pytest
+from decimal import Decimal
+from django.contrib.auth.models import User
+from apps.bodega.models import Bodega, Categoria, Articulo, TipoMovimiento
+
+
+# ==================== FIXTURES DE USUARIOS ====================
+
+@pytest.fixture
+def usuario_admin(db):
+    """Crea un usuario administrador."""
+    return User.objects.create_superuser(
+        username='admin',
+        email='admin@example.com',
+        password='adminpass123'
+    )
+
+
+# ==================== FIXTURES DE CATÁLOGOS ====================
+
+@pytest.fixture
+def bodega(usuario_admin):
+    """Crea una bodega de test."""
+    return Bodega.objects.create(codigo='BOD-01', nombre='Bodega Central', responsable=usuario_admin)
+
+
+@pytest.fixture
+def categoria(db):
+    """Crea una categoría de artículos de test."""
+    return Categoria.objects.create(codigo='CAT-01', nombre='Oficina')
+
+
+@pytest.fixture
+def tipo_movimiento(db):
+    """Crea un tipo de movimiento de test."""
+    return TipoMovimiento.objects.create(codigo='AJUSTE', nombre='Ajuste')
+
+
+# ==================== FIXTURES DE ARTÍCULOS ====================
+
+@pytest.fixture
+def articulos(bodega, categoria):
+    """Crea tres artículos sin stock en la bodega de test."""
+    return [
+        Articulo.objects.create(
+            codigo=f'ART-{numero}',
+            nombre=f'Artículo {numero}',
+            categoria=categoria,
+            ubicacion_fisica=bodega,
+            codigo_barras=f'780000000000{numero}',
+            stock_actual=Decimal('0')
+        )
+        for numero in range(1, 4)
+    ]
@@ -0,0 +1,489 @@
+"""
+Tests para la capa de servicios del módulo de bodega.
+
+Siguiendo el patrón Arrange-Act-Assert.
+"""
+import pytest
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from io import BytesIO
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.core.exceptions import ValidationError
+from apps.bodega.models import Articulo, Movimiento, TipoMovimiento, UnidadMedida, TomaInventario
+from apps.bodega.services import (
+    KardexService, ConciliacionStockService, ImportacionArticuloService,
+    EscaneoCodigoBarrasService, PronosticoDemandaService, TomaInventarioService
+)
+from apps.solicitudes.models import Solicitud, DetalleSolicitud, EstadoSolicitud, TipoSolicitud
+from core.utils import incrementar_generacion
+
+
+def crear_movimiento(articulo, tipo, usuario, operacion, cantidad, dias_atras=0):
+    """Crea un movimiento con fecha desplazada; no modifica el stock del artículo."""
+    movimiento = Movimiento.objects.create(
+        articulo=articulo, tipo=tipo, usuario=usuario, operacion=operacion,
+        cantidad=Decimal(cantidad), motivo='Test',
+        stock_antes=Decimal('0'), stock_despues=Decimal('0')
+    )
+    if dias_atras:
+        Movimiento.objects.filter(pk=movimiento.pk).update(
+            fecha_creacion=timezone.now() - timedelta(days=dias_atras)
+        )
+    return movimiento
+
+
+# ==================== TESTS DE KARDEX SERVICE ====================
+
+@pytest.mark.django_db
+class TestKardexService:
+    """Tests para KardexService."""
+
+    @pytest.fixture
+    def movimientos(self, articulos, tipo_movimiento, usuario_admin):
+        """Historial: ART-1 +10 (hace 5 días), -3, +1; ART-2 +5."""
+        art1, art2, _ = articulos
+        crear_movimiento(art1, tipo_movimiento, usuario_admin, 'ENTRADA', 10, dias_atras=5)
+        crear_movimiento(art1, tipo_movimiento, usuario_admin, 'SALIDA', 3)
+        crear_movimiento(art2, tipo_movimiento, usuario_admin, 'ENTRADA', 5)
+        crear_movimiento(art1, tipo_movimiento, usuario_admin, 'ENTRADA', 1)
+        return art1, art2
+
+    def test_iterar_kardex_calcula_saldo_acumulado_por_articulo(self, movimientos):
+        """
+        GIVEN: Movimientos de dos artículos
+        WHEN: Se recorre el kardex completo
+        THEN: El saldo se acumula por artículo y las cantidades se separan en entrada/salida
+        """
+        filas = list(KardexService().iterar_kardex())
+
+        assert [(fila['articulo__codigo'], fila['saldo']) for fila in filas] == [
+            ('ART-1', Decimal('10')), ('ART-1', Decimal('7')),
+            ('ART-1', Decimal('8')), ('ART-2', Decimal('5')),
+        ]
+        assert filas[1]['entrada'] is None
+        assert filas[1]['salida'] == Decimal('3')
+
+    def test_iterar_kardex_con_fecha_desde_suma_saldo_inicial(self, movimientos):
+        """
+        GIVEN: Un movimiento anterior al rango filtrado
+        WHEN: Se filtra desde ayer
+        THEN: El movimiento anterior no aparece pero su saldo se arrastra
+        """
+        art1, _ = movimientos
+
+        filas = list(KardexService().iterar_kardex(
+            [art1.pk], fecha_desde=timezone.localdate() - timedelta(days=1)
+        ))
+
+        assert [fila['saldo'] for fila in filas] == [Decimal('7'), Decimal('8')]
+
+    def test_iterar_csv_incluye_encabezado_y_una_linea_por_movimiento(self, movimientos):
+        """El CSV en streaming emite encabezado más una línea por movimiento."""
+        lineas = list(KardexService().iterar_csv())
+
+        assert lineas[0].startswith('Código,Artículo,Fecha')
+        assert len(lineas) == 5
+
+
+# ==================== TESTS DE CONCILIACIÓN DE STOCK SERVICE ====================
+
+@pytest.mark.django_db
+class TestConciliacionStockService:
+    """Tests para ConciliacionStockService."""
+
+    @pytest.fixture
+    def stock_descuadrado(self, articulos, tipo_movimiento, usuario_admin):
+        """ART-1 y ART-2 con saldo 7; ART-2 registra 9. ART-3 sin movimientos con stock 4."""
+        art1, art2, art3 = articulos
+        for articulo in (art1, art2):
+            crear_movimiento(articulo, tipo_movimiento, usuario_admin, 'ENTRADA', 10)
+            crear_movimiento(articulo, tipo_movimiento, usuario_admin, 'SALIDA', 3)
+        Articulo.objects.filter(pk=art1.pk).update(stock_actual=Decimal('7'))
+        Articulo.objects.filter(pk=art2.pk).update(stock_actual=Decimal('9'))
+        Articulo.objects.filter(pk=art3.pk).update(stock_actual=Decimal('4'))
+        return articulos
+
+    def test_calcular_bloques_cubre_todo_el_rango_de_ids(self, stock_descuadrado):
+        """Los bloques son contiguos y cubren del menor al mayor ID."""
+        ids = sorted(articulo.pk for articulo in stock_descuadrado)
+
+        bloques = ConciliacionStockService().calcular_bloques(tamano_bloque=2)
+
+        assert bloques[0][0] == ids[0]
+        assert bloques[-1][1] == ids[-1] + 1
+        assert all(anterior[1] == siguiente[0] for anterior, siguiente in zip(bloques, bloques[1:]))
+
+    def test_buscar_discrepancias_omite_articulos_sin_movimientos(self, stock_descuadrado):
+        """
+        GIVEN: Un artículo descuadrado y otro sin movimientos
+        WHEN: Se buscan discrepancias sin incluir artículos vacíos
+        THEN: Solo se informa el artículo cuyo stock no coincide con sus movimientos
+        """
+        service = ConciliacionStockService()
+        ids = [articulo.pk for articulo in stock_descuadrado]
+
+        revisados, discrepancias = service.buscar_discrepancias(min(ids), max(ids) + 1)
+
+        assert revisados == 3
+        assert [fila['codigo'] for fila in discrepancias] == ['ART-2']
+        assert discrepancias[0]['diferencia'] == '2.00'
+
+        _, discrepancias = service.buscar_discrepancias(min(ids), max(ids) + 1, incluir_sin_movimientos=True)
+        assert [fila['codigo'] for fila in discrepancias] == ['ART-2', 'ART-3']
+
+    def test_corregir_discrepancias_ajusta_stock_al_saldo(self, stock_descuadrado):
+        """Solo se actualizan los artículos descuadrados."""
+        art1, art2, art3 = stock_descuadrado
+
+        corregidos = ConciliacionStockService().corregir_discrepancias([art1.pk, art2.pk, art3.pk])
+
+        assert corregidos == 2
+        assert Articulo.objects.get(pk=art2.pk).stock_actual == Decimal('7')
+        assert Articulo.objects.get(pk=art3.pk).stock_actual == Decimal('0')
+
+
+# ==================== TESTS DE IMPORTACIÓN DE ARTÍCULOS SERVICE ====================
+
+@pytest.mark.django_db
+class TestImportacionArticuloService:
+    """Tests para ImportacionArticuloService."""
+
+    @pytest.fixture(autouse=True)
+    def unidad(self, bodega, categoria):
+        """Crea la unidad de medida usada por las planillas."""
+        return UnidadMedida.objects.create(codigo='UN', nombre='Unidad', simbolo='un')
+
+    def importar(self, filas, **kwargs):
+        """Importa un CSV con las columnas obligatorias más stock_minimo."""
+        contenido = 'codigo;nombre;categoria;bodega;unidades_medida;stock_minimo\n' + '\n'.join(filas)
+        return ImportacionArticuloService().importar(
+            BytesIO(contenido.encode('utf-8')), 'articulos.csv', **kwargs
+        )
+
+    def test_importar_crea_validos_y_reporta_errores_por_fila(self):
+        """
+        GIVEN: Una planilla con filas válidas, un código duplicado y una categoría inexistente
+        WHEN: Se importa
+        THEN: Se crean solo las válidas y cada error indica su fila
+        """
+        reporte = self.importar([
+            'N-1;Lápiz;CAT-01;BOD-01;UN;2,5',
+            'N-1;Duplicado;CAT-01;BOD-01;UN;',
+            'N-2;Goma;NOEXISTE;BOD-01;UN;',
+            'N-3;Regla;CAT-01;BOD-01;UN;',
+        ])
+
+        assert (reporte['total_filas'], reporte['creados']) == (4, 2)
+        assert [error['fila'] for error in reporte['errores']] == [3, 4]
+        articulo = Articulo.objects.get(codigo='N-1')
+        assert articulo.stock_minimo == Decimal('2.50')
+        assert list(articulo.unidades_medida.values_list('codigo', flat=True)) == ['UN']
+
+    @pytest.mark.parametrize('valor', ['NaN', 'Infinity', '-sNaN', '123456789012'])
+    def test_importar_numero_no_finito_o_fuera_de_rango_es_error_de_fila(self, valor):
+        """NaN, infinitos y números que exceden max_digits no abortan la importación."""
+        reporte = self.importar([
+            f'N-1;Lápiz;CAT-01;BOD-01;UN;{valor}',
+            'N-2;Goma;CAT-01;BOD-01;UN;1',
+        ])
+
+        assert reporte['creados'] == 1
+        assert [error['codigo'] for error in reporte['errores']] == ['N-1']
+        assert 'Stock mínimo' in reporte['errores'][0]['mensaje']
+
+    def test_importar_texto_mas_largo_que_el_campo_es_error_de_fila(self):
+        """Un código o nombre demasiado largo se informa sin invalidar el lote."""
+        reporte = self.importar([
+            f'{"X" * 51};Lápiz;CAT-01;BOD-01;UN;',
+            f'N-2;{"G" * 201};CAT-01;BOD-01;UN;',
+            'N-3;Regla;CAT-01;BOD-01;UN;',
+        ])
+
+        assert reporte['creados'] == 1
+        assert ['largo máximo' in error['mensaje'] for error in reporte['errores']] == [True, True]
+
+    def test_importar_dry_run_no_escribe(self):
+        """Con dry_run solo se valida."""
+        reporte = self.importar(['N-1;Lápiz;CAT-01;BOD-01;UN;'], dry_run=True)
+
+        assert reporte['validas'] == 1
+        assert not Articulo.objects.filter(codigo='N-1').exists()
+
+    def test_importar_invalida_cache_de_escaneo_al_confirmar(self, django_capture_on_commit_callbacks):
+        """
+        GIVEN: Un código de barras leído y cacheado como no encontrado
+        WHEN: Se importa un artículo con ese código (y, antes, un dry_run)
+        THEN: Solo la importación confirmada invalida la caché y la lectura lo encuentra
+        """
+        EscaneoCodigoBarrasService.invalidar_cache()
+        service = EscaneoCodigoBarrasService()
+        assert service.resolver(['BC-N1']) == {'BC-N1': []}
+        contenido = 'codigo;nombre;categoria;bodega;unidades_medida;codigo_barras\nN-1;Lápiz;CAT-01;BOD-01;UN;BC-N1'
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            ImportacionArticuloService().importar(BytesIO(contenido.encode('utf-8')), 'a.csv', dry_run=True)
+        assert callbacks == []
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            ImportacionArticuloService().importar(BytesIO(contenido.encode('utf-8')), 'a.csv')
+
+        assert len(callbacks) == 1
+        assert service.resolver(['BC-N1'])['BC-N1'][0]['codigo'] == 'N-1'
+
+
+# ==================== TESTS DE ESCANEO DE CÓDIGOS DE BARRAS SERVICE ====================
+
+@pytest.mark.django_db
+class TestEscaneoCodigoBarrasService:
+    """Tests para EscaneoCodigoBarrasService."""
+
+    @pytest.fixture(autouse=True)
+    def cache_limpia(self):
+        """Cada test parte con la caché invalidada."""
+        EscaneoCodigoBarrasService.invalidar_cache()
+
+    def test_resolver_usa_cache_en_lecturas_repetidas(self, articulos):
+        """La segunda lectura del mismo lote no consulta la base de datos."""
+        service = EscaneoCodigoBarrasService()
+        codigos = [articulos[0].codigo_barras, 'NO-EXISTE']
+
+        primera = service.resolver(codigos)
+        with CaptureQueriesContext(connection) as consultas:
+            segunda = service.resolver(codigos)
+
+        assert len(consultas) == 0
+        assert primera == segunda
+        assert segunda['NO-EXISTE'] == []
+        assert segunda[articulos[0].codigo_barras][0]['codigo'] == 'ART-1'
+
+    def test_generacion_compartida_invalida_cache_de_otros_procesos(self, articulos):
+        """
+        GIVEN: Una lectura cacheada en este proceso
+        WHEN: Otro proceso cambia el artículo e incrementa la generación compartida
+        THEN: La siguiente lectura ignora la entrada local y ve el cambio
+        """
+        service = EscaneoCodigoBarrasService()
+        codigo_barras = articulos[0].codigo_barras
+        service.resolver([codigo_barras])
+
+        # Cambio sin señales en este proceso: solo la generación compartida lo refleja
+        Articulo.objects.filter(pk=articulos[0].pk).update(nombre='Renombrado')
+        incrementar_generacion(EscaneoCodigoBarrasService.GENERACION_CACHE)
+
+        assert service.resolver([codigo_barras])[codigo_barras][0]['nombre'] == 'Renombrado'
+
+    def test_guardar_articulo_invalida_cache(self, articulos):
+        """Las señales invalidan la caché al cambiar el código de barras."""
+        service = EscaneoCodigoBarrasService()
+        codigo_anterior = articulos[0].codigo_barras
+        service.resolver([codigo_anterior])
+
+        articulos[0].codigo_barras = 'NUEVO-1'
+        articulos[0].save()
+
+        assert service.resolver([codigo_anterior]) == {codigo_anterior: []}
+
+
+# ==================== TESTS DE PRONÓSTICO DE DEMANDA SERVICE ====================
+
+class TestPronosticoDemandaCalculo:
+    """Tests de PronosticoDemandaService.calcular_umbrales (sin base de datos)."""
+
+    MESES = list(range(1, 13))
+
+    def test_demanda_constante_no_requiere_stock_de_seguridad(self):
+        """Sin variación no hay stock de seguridad: el punto de reorden es el consumo de la reposición."""
+        umbrales = PronosticoDemandaService.calcular_umbrales([10.0] * 12, self.MESES, mes_objetivo=3)
+
+        assert umbrales == (Decimal('0.00'), Decimal('5.00'))
+
+    def test_consumo_se_ajusta_al_periodo_escolar_de_la_reposicion(self):
+        """
+        GIVEN: Demanda 0 en vacaciones (enero y febrero) y 12 el resto del año
+        WHEN: La reposición cae en vacaciones o en el primer semestre
+        THEN: El stock de seguridad es el mismo y el consumo esperado cambia con el período
+        """
+        demanda = [0.0, 0.0] + [12.0] * 10
+
+        vacaciones = PronosticoDemandaService.calcular_umbrales(demanda, self.MESES, mes_objetivo=1)
+        semestre = PronosticoDemandaService.calcular_umbrales(demanda, self.MESES, mes_objetivo=3)
+
+        # pstdev = sqrt(20); seguridad = 1.65 * sqrt(20) * sqrt(15 / 30) = 5.2178 (redondeo hacia arriba)
+        assert vacaciones == (Decimal('5.22'), Decimal('5.22'))
+        # consumo diario = 10 * (12 / 10) / 30 = 0.4 -> 6 en 15 días
+        assert semestre == (Decimal('5.22'), Decimal('11.22'))
+
+    @pytest.mark.parametrize('demanda', [[], [0.0] * 12])
+    def test_sin_demanda_no_sugiere(self, demanda):
+        """Sin historia o con demanda cero no hay umbrales que sugerir."""
+        assert PronosticoDemandaService.calcular_umbrales(demanda, self.MESES[:len(demanda)], 3) is None
+
+
+@pytest.mark.django_db
+class TestPronosticoDemandaService:
+    """Tests de PronosticoDemandaService.sugerir sobre salidas y solicitudes aprobadas."""
+
+    HOY = date(2026, 5, 10)
+
+    @pytest.fixture
+    def tipo_salida(self, db):
+        """Tipo de movimiento de consumo (distinto de los ajustes de inventario)."""
+        return TipoMovimiento.objects.create(codigo='SALIDA', nombre='Salida')
+
+    def salida(self, articulo, tipo, usuario, cantidad, fecha):
+        """Registra una salida con la fecha indicada."""
+        movimiento = crear_movimiento(articulo, tipo, usuario, 'SALIDA', cantidad)
+        Movimiento.objects.filter(pk=movimiento.pk).update(
+            fecha_creacion=timezone.make_aware(datetime.combine(fecha, time(12)))
+        )
+
+    def aprobado(self, articulo, usuario, bodega, cantidad, fecha):
+        """Crea una solicitud aprobada en la fecha indicada con un detalle del artículo."""
+        solicitud = Solicitud.objects.create(
+            numero=f'SOL-{articulo.codigo}-{fecha:%m}',
+            fecha_requerida=fecha,
+            fecha_aprobacion=timezone.make_aware(datetime.combine(fecha, time(12))),
+            tipo_solicitud=TipoSolicitud.objects.get_or_create(codigo='NORMAL', defaults={'nombre': 'Normal'})[0],
+            estado=EstadoSolicitud.objects.get_or_create(codigo='APROBADA', defaults={'nombre': 'Aprobada'})[0],
+            solicitante=usuario,
+            area_solicitante='Administración',
+            motivo='Consumo',
+            bodega_origen=bodega
+        )
+        DetalleSolicitud.objects.create(
+            solicitud=solicitud, articulo=articulo,
+            cantidad_solicitada=Decimal(cantidad), cantidad_aprobada=Decimal(cantidad)
+        )
+
+    def serie(self, demanda_por_mes):
+        """Serie de 12 meses (mayo 2025 - abril 2026) con la demanda de los (año, mes) indicados."""
+        historia = PronosticoDemandaService.meses_historia(self.HOY, 12)
+        valores = [demanda_por_mes.get(año_mes, 0.0) for año_mes in historia]
+        return valores, [mes for _, mes in historia]
+
+    def sugerir(self, articulos):
+        """Sugerencias del rango de IDs de los artículos, indexadas por código."""
+        _, sugerencias = PronosticoDemandaService().sugerir(
+            articulos[0].pk, articulos[-1].pk + 1, hoy=self.HOY
+        )
+        return {sugerencia['codigo']: sugerencia for sugerencia in sugerencias}
+
+    def test_demanda_mensual_es_el_mayor_entre_salidas_y_aprobado(
+        self, articulos, bodega, tipo_salida, tipo_movimiento, usuario_admin
+    ):
+        """
+        GIVEN: ART-1 con 30 despachados y 20 aprobados en abril, más un ajuste de inventario,
+               y ART-2 con solo 40 aprobados en marzo
+        WHEN: Se calculan las sugerencias
+        THEN: Abril cuenta 30 (no 50 ni el ajuste) y marzo cuenta lo aprobado
+        """
+        art1, art2, _ = articulos
+        self.salida(art1, tipo_salida, usuario_admin, 30, date(2026, 4, 10))
+        self.salida(art1, tipo_movimiento, usuario_admin, 500, date(2026, 4, 20))
+        self.aprobado(art1, usuario_admin, bodega, 20, date(2026, 4, 8))
+        self.aprobado(art2, usuario_admin, bodega, 40, date(2026, 3, 8))
+
+        sugerencias = self.sugerir(articulos)
+
+        assert set(sugerencias) == {'ART-1', 'ART-2'}
+        mes_objetivo = (self.HOY + timedelta(days=PronosticoDemandaService.DIAS_REPOSICION)).month
+        for codigo, demanda in (('ART-1', {(2026, 4): 30.0}), ('ART-2', {(2026, 3): 40.0})):
+            esperado = PronosticoDemandaService.calcular_umbrales(*self.serie(demanda), mes_objetivo)
+            sugerencia = sugerencias[codigo]
+            assert (sugerencia['stock_minimo_sugerido'], sugerencia['punto_reorden_sugerido']) == esperado
+
+    def test_omite_articulos_que_superarian_su_stock_maximo(
+        self, articulos, tipo_salida, usuario_admin
+    ):
+        """Un punto de reorden sugerido mayor al stock máximo queda para revisión manual."""
+        art1, art2, _ = articulos
+        Articulo.objects.filter(pk=art1.pk).update(stock_maximo=Decimal('1'))
+        for articulo in (art1, art2):
+            self.salida(articulo, tipo_salida, usuario_admin, 30, date(2026, 4, 10))
+
+        sugerencias = self.sugerir(articulos)
+
+        assert set(sugerencias) == {'ART-2'}
+
+    def test_aplicar_guarda_los_umbrales_sugeridos(self, articulos, tipo_salida, usuario_admin):
+        """Aplicar las sugerencias actualiza stock mínimo y punto de reorden; la segunda pasada no sugiere nada."""
+        self.salida(articulos[0], tipo_salida, usuario_admin, 30, date(2026, 4, 10))
+        sugerencia = self.sugerir(articulos)['ART-1']
+
+        assert PronosticoDemandaService().aplicar([sugerencia]) == 1
+
+        articulos[0].refresh_from_db()
+        assert articulos[0].stock_minimo == sugerencia['stock_minimo_sugerido']
+        assert articulos[0].punto_reorden == sugerencia['punto_reorden_sugerido']
+        assert self.sugerir(articulos) == {}
+
+
+# ==================== TESTS DE TOMA DE INVENTARIO SERVICE ====================
+
+@pytest.mark.django_db
+class TestTomaInventarioService:
+    """Tests para TomaInventarioService."""
+
+    @pytest.fixture
+    def toma(self, bodega, articulos, tipo_movimiento, usuario_admin):
+        """Toma abierta sobre artículos con stock 10, 3 y 4."""
+        for articulo, stock in zip(articulos, ('10', '3', '4')):
+            Articulo.objects.filter(pk=articulo.pk).update(stock_actual=Decimal(stock))
+        return TomaInventarioService().crear_toma(bodega, usuario_admin)
+
+    def test_crear_toma_rechaza_segunda_toma_abierta_en_la_bodega(self, toma, bodega, usuario_admin):
+        """
+        GIVEN: Una bodega con una toma abierta
+        WHEN: Se abre otra toma en la misma bodega
+        THEN: La restricción parcial lo impide; tras cancelar la primera se permite
+        """
+        service = TomaInventarioService()
+
+        with pytest.raises(ValidationError, match='ya tiene una toma'):
+            service.crear_toma(bodega, usuario_admin)
+
+        service.cancelar_toma(toma)
+        assert service.crear_toma(bodega, usuario_admin).estado == TomaInventario.ESTADO_ABIERTA
+
+    def test_registrar_conteos_reporta_lineas_invalidas(self, toma, usuario_admin):
+        """Códigos inexistentes y cantidades no finitas se informan por línea."""
+        service = TomaInventarioService()
+
+        resultado = service.registrar_conteos(
+            toma, service.parsear_lineas('ART-1;7\nNOEXISTE\nART-2;NaN\n7800000000002'), usuario_admin
+        )
+
+        assert resultado['registrados'] == 2
+        assert [error['linea'] for error in resultado['errores']] == [2, 3]
+
+    def test_aplicar_toma_ajusta_diferencias_y_cierra(self, toma, usuario_admin):
+        """Se crea un movimiento por diferencia y el stock queda en lo contado."""
+        service = TomaInventarioService()
+        service.registrar_conteos(toma, service.parsear_lineas('ART-1;12\nART-2;3'), usuario_admin)
+
+        ajustados = service.aplicar_toma(toma, usuario_admin)
+
+        assert ajustados == 1
+        movimiento = Movimiento.objects.get()
+        assert (movimiento.operacion, movimiento.cantidad, movimiento.stock_antes) == (
+            'ENTRADA', Decimal('2'), Decimal('10')
+        )
+        assert Articulo.objects.get(codigo='ART-1').stock_actual == Decimal('12')
+        toma.refresh_from_db()
+        assert toma.estado == TomaInventario.ESTADO_APLICADA
+
+    def test_registrar_conteos_con_instancia_desactualizada_no_escribe(self, toma, usuario_admin):
+        """
+        GIVEN: Una instancia leída antes de que otra solicitud aplicara la toma
+        WHEN: Se registran conteos con esa instancia
+        THEN: Se relee la toma bajo bloqueo y se rechazan los conteos
+        """
+        service = TomaInventarioService()
+        instancia_desactualizada = TomaInventario.objects.get(pk=toma.pk)
+        service.aplicar_toma(toma, usuario_admin)
+
+        with pytest.raises(ValidationError, match='aplicada'):
+            service.registrar_conteos(instancia_desactualizada, [(1, 'ART-1', '5')], usuario_admin)
+        assert not toma.conteos.exists()
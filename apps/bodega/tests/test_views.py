@@ -0,0 +1,55 @@
+"""
+Tests para Views del módulo de bodega.
+"""
+import json
+
+import pytest
+from django.contrib.messages import get_messages
+from django.urls import reverse
+
+
+# ==================== TEST KARDEX ====================
+
+@pytest.mark.django_db
+class TestKardexView:
+    """Tests para la vista del kardex."""
+
+    def test_fecha_imposible_omite_filtro_con_aviso(self, client, usuario_admin, articulos):
+        """Una fecha bien formada pero imposible no produce error 500."""
+        client.force_login(usuario_admin)
+
+        response = client.get(reverse('bodega:kardex'), {'fecha_desde': '2024-13-45'})
+
+        assert response.status_code == 200
+        assert response.context['fecha_desde'] == ''
+        mensajes = [str(mensaje) for mensaje in get_messages(response.wsgi_request)]
+        assert any('2024-13-45' in mensaje for mensaje in mensajes)
+
+    def test_csv_con_fecha_imposible_se_emite(self, client, usuario_admin, articulos):
+        """El CSV también omite la fecha inválida."""
+        client.force_login(usuario_admin)
+
+        response = client.get(reverse('bodega:kardex'), {'fecha_hasta': '2024-02-30', 'formato': 'csv'})
+
+        assert response.status_code == 200
+        assert b''.join(response.streaming_content).decode().startswith('Código')
+
+
+# ==================== TEST ESCANEO DE CÓDIGOS DE BARRAS ====================
+
+@pytest.mark.django_db
+class TestEscanearCodigosBarras:
+    """Tests para el endpoint de escaneo."""
+
+    def test_post_ignora_elementos_no_textuales(self, client, usuario_admin, articulos):
+        """Un null en el JSON no se convierte en el código "None"."""
+        client.force_login(usuario_admin)
+
+        response = client.post(
+            reverse('bodega:ajax_escanear_codigos'),
+            json.dumps({'codigos': [articulos[0].codigo_barras, None, 7]}),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 200
+        assert list(response.json()['resultados']) == [articulos[0].codigo_barras]
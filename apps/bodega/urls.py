@@ -22,6 +22,7 @@ urlpatterns = [
     # Artículos
     path('articulos/', views.ArticuloListView.as_view(), name='articulo_lista'),
     path('articulos/crear/', views.ArticuloCreateView.as_view(), name='articulo_crear'),
+    path('articulos/importar/', views.ArticuloImportarView.as_view(), name='articulo_importar'),
     path('articulos/<int:pk>/', views.ArticuloDetailView.as_view(), name='articulo_detalle'),
     path('articulos/<int:pk>/editar/', views.ArticuloUpdateView.as_view(), name='articulo_editar'),
     path('articulos/<int:pk>/eliminar/', views.ArticuloDeleteView.as_view(), name='articulo_eliminar'),
@@ -30,6 +31,15 @@ urlpatterns = [
     path('movimientos/', views.MovimientoListView.as_view(), name='movimiento_lista'),
     path('movimientos/crear/', views.MovimientoCreateView.as_view(), name='movimiento_crear'),
     path('movimientos/<int:pk>/', views.MovimientoDetailView.as_view(), name='movimiento_detalle'),
+    path('movimientos/kardex/', views.KardexView.as_view(), name='kardex'),
+
+    # Tomas de Inventario
+    path('tomas-inventario/', views.TomaInventarioListView.as_view(), name='toma_lista'),
+    path('tomas-inventario/crear/', views.TomaInventarioCreateView.as_view(), name='toma_crear'),
+    path('tomas-inventario/<int:pk>/', views.TomaInventarioDetailView.as_view(), name='toma_detalle'),
+    path('tomas-inventario/<int:pk>/conteos/', views.TomaInventarioConteoView.as_view(), name='toma_conteo'),
+    path('tomas-inventario/<int:pk>/aplicar/', views.TomaInventarioAplicarView.as_view(), name='toma_aplicar'),
+    path('tomas-inventario/<int:pk>/cancelar/', views.TomaInventarioCancelarView.as_view(), name='toma_cancelar'),
 
     # Entregas de Artículos
     path('entregas/articulos/', views.EntregaArticuloListView.as_view(), name='entrega_articulo_lista'),
@@ -43,4 +53,5 @@ urlpatterns = [
 
     # AJAX
     path('ajax/solicitud/<int:solicitud_id>/articulos/', views.obtener_articulos_solicitud, name='ajax_solicitud_articulos'),
+    path('ajax/escanear/', views.escanear_codigos_barras, name='ajax_escanear_codigos'),
 ]
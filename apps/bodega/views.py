@@ -11,38 +11,44 @@ Implementa las mejores prácticas con CBVs siguiendo SOLID y DRY:
 - Paginación automática
 - Auditoría automática
 """
+from datetime import date
 from typing import Any, Optional
 from django.db.models import QuerySet, Q, Sum, Count
 from django.urls import reverse_lazy
+from django.shortcuts import redirect
 from django.views.generic import (
-    TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView
+    TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView, FormView
 )
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.core.exceptions import ValidationError
-from django.http import JsonResponse
+from django.http import JsonResponse, HttpResponse, StreamingHttpResponse
+from django.utils.dateparse import parse_date
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.decorators import login_required
+from core.utils import registrar_log_auditoria
 from core.mixins import (
     BaseAuditedViewMixin, AtomicTransactionMixin, SoftDeleteMixin,
     PaginatedListMixin, FilteredListMixin
 )
 from .models import (
     Bodega, UnidadMedida, Categoria, Articulo, TipoMovimiento, Movimiento,
-    TipoEntrega, EstadoEntrega, EntregaArticulo, EntregaBien
+    TipoEntrega, EstadoEntrega, EntregaArticulo, EntregaBien, TomaInventario
 )
 from .forms import (
     UnidadMedidaForm, CategoriaForm, ArticuloForm, MovimientoForm, ArticuloFiltroForm,
-    EntregaArticuloForm, EntregaBienForm
+    EntregaArticuloForm, EntregaBienForm, ImportarArticulosForm,
+    TomaInventarioForm, ConteoTomaInventarioForm
 )
 from .repositories import (
     BodegaRepository, CategoriaRepository, ArticuloRepository,
     TipoMovimientoRepository, MovimientoRepository,
     EntregaArticuloRepository, EntregaBienRepository,
-    EstadoEntregaRepository, TipoEntregaRepository
+    EstadoEntregaRepository, TipoEntregaRepository, TomaInventarioRepository
 )
 from .services import (
-    CategoriaService, ArticuloService, MovimientoService,
+    CategoriaService, ArticuloService, MovimientoService, KardexService,
+    ImportacionArticuloService, EscaneoCodigoBarrasService, TomaInventarioService,
     EntregaArticuloService, EntregaBienService
 )
 
@@ -488,6 +494,54 @@ class ArticuloCreateView(BaseAuditedViewMixin, CreateView):
         return response
 
 
+class ArticuloImportarView(BaseAuditedViewMixin, FormView):
+    """
+    Vista para importar artículos masivamente desde CSV o XLSX.
+
+    Permite una pasada de validación (dry-run) que solo muestra el reporte.
+    Delega la lógica a ImportacionArticuloService.
+
+    Permisos: bodega.add_articulo
+    """
+    form_class = ImportarArticulosForm
+    template_name = 'bodega/articulo/importar.html'
+    permission_required = 'bodega.add_articulo'
+
+    def form_valid(self, form):
+        """Ejecuta la importación y muestra el reporte en la misma página."""
+        archivo = form.cleaned_data['archivo']
+        dry_run = form.cleaned_data['dry_run']
+
+        try:
+            reporte = ImportacionArticuloService().importar(archivo, archivo.name, dry_run=dry_run)
+        except ValidationError as e:
+            messages.error(self.request, ' '.join(e.messages))
+            return self.form_invalid(form)
+
+        if dry_run:
+            messages.info(
+                self.request,
+                f"Validación completada: {reporte['validas']} de {reporte['total_filas']} fila(s) válidas."
+            )
+        else:
+            registrar_log_auditoria(
+                usuario=self.request.user,
+                accion_glosa='CREAR',
+                descripcion=f"Importación masiva de artículos: {reporte['creados']} creado(s) desde {archivo.name}",
+                request=self.request,
+                meta={'errores': len(reporte['errores'])}
+            )
+            messages.success(self.request, f"{reporte['creados']} artículo(s) importado(s) exitosamente.")
+
+        return self.render_to_response(self.get_context_data(form=form, reporte=reporte))
+
+    def get_context_data(self, **kwargs) -> dict:
+        """Agrega datos al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Importar Artículos'
+        return context
+
+
 class ArticuloUpdateView(BaseAuditedViewMixin, UpdateView):
     """
     Vista para editar un artículo existente.
@@ -732,6 +786,294 @@ class MovimientoDetailView(BaseAuditedViewMixin, DetailView):
         return context
 
 
+class KardexView(BaseAuditedViewMixin, PaginatedListMixin, ListView):
+    """
+    Vista del kardex de artículos con saldo acumulado.
+
+    El saldo se calcula en SQL con funciones de ventana (KardexService).
+    En HTML se pagina; con ?formato=csv el reporte completo se emite en
+    streaming recorriendo un cursor del servidor.
+
+    Parámetros GET: articulo (repetible), fecha_desde, fecha_hasta, formato.
+
+    Permisos: bodega.view_movimiento
+    """
+    template_name = 'bodega/movimiento/kardex.html'
+    context_object_name = 'filas'
+    permission_required = 'bodega.view_movimiento'
+    paginate_by = 100
+
+    def _parsear_fecha(self, nombre: str) -> Optional[date]:
+        """
+        Lee una fecha de la URL; si no es válida se omite el filtro con un aviso.
+
+        parse_date retorna None ante formatos incorrectos, pero lanza ValueError
+        con fechas bien formadas e imposibles (ej: 2024-13-45).
+        """
+        valor = self.request.GET.get(nombre, '') or ''
+        try:
+            fecha = parse_date(valor)
+        except ValueError:
+            fecha = None
+        if valor and fecha is None:
+            messages.warning(self.request, f'La fecha "{valor}" no es válida; se omitió el filtro.')
+        return fecha
+
+    def get_filtros(self) -> dict:
+        """Obtiene y normaliza los filtros del kardex desde la URL (una vez por request)."""
+        if not hasattr(self, '_filtros'):
+            articulo_ids = [
+                int(valor) for valor in self.request.GET.getlist('articulo') if valor.isdigit()
+            ]
+            self._filtros = {
+                'articulo_ids': articulo_ids or None,
+                'fecha_desde': self._parsear_fecha('fecha_desde'),
+                'fecha_hasta': self._parsear_fecha('fecha_hasta'),
+            }
+        return self._filtros
+
+    def get(self, request, *args, **kwargs) -> HttpResponse:
+        """Emite el CSV en streaming si se solicita; si no, renderiza la página HTML."""
+        if request.GET.get('formato') == 'csv':
+            service = KardexService()
+            response = StreamingHttpResponse(
+                service.iterar_csv(**self.get_filtros()),
+                content_type='text/csv; charset=utf-8'
+            )
+            response['Content-Disposition'] = 'attachment; filename="kardex.csv"'
+            return response
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self) -> QuerySet:
+        """Retorna el kardex con saldo relativo al rango filtrado."""
+        return KardexService().obtener_kardex(**self.get_filtros())
+
+    def get_context_data(self, **kwargs) -> dict:
+        """Completa el saldo de la página con el saldo inicial de cada artículo."""
+        context = super().get_context_data(**kwargs)
+        filtros = self.get_filtros()
+        service = KardexService()
+
+        saldos_iniciales = service.obtener_saldos_iniciales(
+            filtros['articulo_ids'], filtros['fecha_desde']
+        )
+        context['filas'] = list(service.completar_filas(context['filas'], saldos_iniciales))
+        context['titulo'] = 'Kardex de Artículos'
+        context['articulos'] = ArticuloRepository.get_all().select_related(None).only('id', 'codigo', 'nombre')
+        context['articulo_ids'] = filtros['articulo_ids'] or []
+        context['fecha_desde'] = filtros['fecha_desde'].isoformat() if filtros['fecha_desde'] else ''
+        context['fecha_hasta'] = filtros['fecha_hasta'].isoformat() if filtros['fecha_hasta'] else ''
+        context['query_string'] = self.request.GET.copy()
+        context['query_string'].pop('page', None)
+        context['query_string'] = context['query_string'].urlencode()
+        return context
+
+
+# ==================== VISTAS DE TOMA DE INVENTARIO ====================
+
+class TomaInventarioListView(BaseAuditedViewMixin, PaginatedListMixin, ListView):
+    """
+    Vista para listar tomas de inventario.
+
+    Permisos: bodega.view_tomainventario
+    """
+    model = TomaInventario
+    template_name = 'bodega/toma_inventario/lista.html'
+    context_object_name = 'tomas'
+    permission_required = 'bodega.view_tomainventario'
+
+    def get_queryset(self) -> QuerySet:
+        """Retorna tomas con relaciones optimizadas y filtro opcional por estado."""
+        queryset = TomaInventarioRepository.get_all()
+        estado = self.request.GET.get('estado', '')
+        if estado:
+            queryset = queryset.filter(estado=estado)
+        return queryset
+
+    def get_context_data(self, **kwargs) -> dict:
+        """Agrega datos adicionales al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Tomas de Inventario'
+        context['estado'] = self.request.GET.get('estado', '')
+        return context
+
+
+class TomaInventarioCreateView(BaseAuditedViewMixin, CreateView):
+    """
+    Vista para abrir una toma de inventario en una bodega.
+
+    Permisos: bodega.add_tomainventario
+    Auditoría: Registra acción CREAR automáticamente
+    Delega lógica de negocio a TomaInventarioService
+    """
+    model = TomaInventario
+    form_class = TomaInventarioForm
+    template_name = 'bodega/toma_inventario/form.html'
+    permission_required = 'bodega.add_tomainventario'
+
+    # Configuración de auditoría
+    audit_action = 'CREAR'
+    audit_description_template = 'Abrió toma de inventario {obj.numero}'
+
+    def form_valid(self, form):
+        """Crea la toma usando TomaInventarioService."""
+        try:
+            self.object = TomaInventarioService().crear_toma(
+                bodega=form.cleaned_data['bodega'],
+                responsable=self.request.user,
+                conteo_completo=form.cleaned_data['conteo_completo'],
+                observaciones=form.cleaned_data.get('observaciones')
+            )
+        except ValidationError as e:
+            messages.error(self.request, ' '.join(e.messages))
+            return self.form_invalid(form)
+
+        self.log_action(self.object, self.request)
+        messages.success(self.request, f'Toma de inventario {self.object.numero} abierta.')
+        return redirect('bodega:toma_detalle', pk=self.object.pk)
+
+    def get_context_data(self, **kwargs) -> dict:
+        """Agrega datos al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = 'Nueva Toma de Inventario'
+        return context
+
+
+class TomaInventarioDetailView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista de detalle de una toma: ingreso de conteos y diferencias contra el stock.
+
+    Permisos: bodega.view_tomainventario
+    """
+    model = TomaInventario
+    template_name = 'bodega/toma_inventario/detalle.html'
+    context_object_name = 'toma'
+    permission_required = 'bodega.view_tomainventario'
+
+    def get_queryset(self) -> QuerySet:
+        """Optimiza consultas con select_related."""
+        return TomaInventarioRepository.get_all()
+
+    def get_context_data(self, **kwargs) -> dict:
+        """Agrega el formulario de conteo, resumen y diferencias al contexto."""
+        context = super().get_context_data(**kwargs)
+        context['titulo'] = f'Toma de Inventario {self.object.numero}'
+        context['form'] = ConteoTomaInventarioForm()
+        context['resumen'] = self.object.conteos.filter(eliminado=False).aggregate(
+            lecturas=Count('id'),
+            articulos_contados=Count('articulo', distinct=True)
+        )
+        context['diferencias'] = TomaInventarioService().obtener_diferencias(self.object)
+        return context
+
+
+class TomaInventarioConteoView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista para registrar conteos (ingresados o escaneados) en una toma.
+
+    Permisos: bodega.change_tomainventario
+    """
+    model = TomaInventario
+    permission_required = 'bodega.change_tomainventario'
+    http_method_names = ['post']
+
+    def get_queryset(self) -> QuerySet:
+        """Solo tomas no eliminadas."""
+        return TomaInventarioRepository.get_all()
+
+    def post(self, request, *args, **kwargs):
+        """Registra las lecturas usando TomaInventarioService."""
+        self.object = self.get_object()
+        form = ConteoTomaInventarioForm(request.POST)
+
+        if form.is_valid():
+            service = TomaInventarioService()
+            try:
+                resultado = service.registrar_conteos(
+                    self.object,
+                    service.parsear_lineas(form.cleaned_data['lecturas']),
+                    usuario=request.user,
+                    reemplazar=form.cleaned_data['reemplazar']
+                )
+            except ValidationError as e:
+                messages.error(request, ' '.join(e.messages))
+                return redirect('bodega:toma_detalle', pk=self.object.pk)
+
+            messages.success(request, f"{resultado['registrados']} lectura(s) registrada(s).")
+            for error in resultado['errores']:
+                messages.warning(request, f"Línea {error['linea']} ({error['codigo']}): {error['mensaje']}")
+
+        return redirect('bodega:toma_detalle', pk=self.object.pk)
+
+
+class TomaInventarioAplicarView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista para aplicar los ajustes de una toma de inventario.
+
+    Permisos: bodega.change_tomainventario
+    Auditoría: Registra acción APLICAR automáticamente
+    """
+    model = TomaInventario
+    permission_required = 'bodega.change_tomainventario'
+    http_method_names = ['post']
+
+    # Configuración de auditoría
+    audit_action = 'APLICAR'
+    audit_description_template = 'Aplicó toma de inventario {obj.numero}'
+
+    def get_queryset(self) -> QuerySet:
+        """Solo tomas no eliminadas."""
+        return TomaInventarioRepository.get_all()
+
+    def post(self, request, *args, **kwargs):
+        """Aplica los ajustes usando TomaInventarioService."""
+        self.object = self.get_object()
+
+        try:
+            ajustados = TomaInventarioService().aplicar_toma(self.object, request.user)
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
+            return redirect('bodega:toma_detalle', pk=self.object.pk)
+
+        self.log_action(self.object, request)
+        messages.success(request, f'Toma aplicada: {ajustados} artículo(s) ajustado(s).')
+        return redirect('bodega:toma_detalle', pk=self.object.pk)
+
+
+class TomaInventarioCancelarView(BaseAuditedViewMixin, DetailView):
+    """
+    Vista para cancelar una toma de inventario sin aplicar ajustes.
+
+    Permisos: bodega.change_tomainventario
+    Auditoría: Registra acción CANCELAR automáticamente
+    """
+    model = TomaInventario
+    permission_required = 'bodega.change_tomainventario'
+    http_method_names = ['post']
+
+    # Configuración de auditoría
+    audit_action = 'CANCELAR'
+    audit_description_template = 'Canceló toma de inventario {obj.numero}'
+
+    def get_queryset(self) -> QuerySet:
+        """Solo tomas no eliminadas."""
+        return TomaInventarioRepository.get_all()
+
+    def post(self, request, *args, **kwargs):
+        """Cancela la toma usando TomaInventarioService."""
+        self.object = self.get_object()
+
+        try:
+            TomaInventarioService().cancelar_toma(self.object)
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
+            return redirect('bodega:toma_detalle', pk=self.object.pk)
+
+        self.log_action(self.object, request)
+        messages.success(request, f'Toma {self.object.numero} cancelada.')
+        return redirect('bodega:toma_lista')
+
+
 # ==================== VISTAS DE ENTREGA DE ARTÍCULOS ====================
 
 class EntregaArticuloListView(BaseAuditedViewMixin, PaginatedListMixin, ListView):
@@ -1111,3 +1453,43 @@ def obtener_articulos_solicitud(request, solicitud_id):
             'success': False,
             'error': str(e)
         }, status=500)
+
+
+@login_required
+@require_http_methods(["GET", "POST"])
+def escanear_codigos_barras(request):
+    """
+    Endpoint AJAX para resolver lecturas de escáner de códigos de barras.
+
+    Acepta un lote de códigos por GET (?codigos=A&codigos=B o ?codigos=A,B)
+    o por POST con cuerpo JSON {"codigos": [...]}. Busca coincidencias exactas
+    en artículos y activos, con caché en memoria (EscaneoCodigoBarrasService).
+
+    Retorna {"success": true, "resultados": {codigo: [{tipo, id, codigo, nombre}]}}.
+    """
+    import json
+
+    if request.method == 'POST':
+        try:
+            codigos = json.loads(request.body or b'{}').get('codigos', [])
+        except (ValueError, AttributeError):
+            return JsonResponse({'success': False, 'error': 'JSON inválido'}, status=400)
+        if not isinstance(codigos, list):
+            return JsonResponse({'success': False, 'error': '"codigos" debe ser una lista'}, status=400)
+    else:
+        codigos = [
+            codigo for valor in request.GET.getlist('codigos') for codigo in valor.split(',')
+        ]
+
+    try:
+        # Se ignoran elementos no textuales (ej: null en el JSON)
+        resultados = EscaneoCodigoBarrasService().resolver(
+            codigo for codigo in codigos if isinstance(codigo, str)
+        )
+    except ValidationError as e:
+        return JsonResponse({'success': False, 'error': ' '.join(e.messages)}, status=400)
+
+    return JsonResponse(
+        {'success': True, 'resultados': resultados},
+        json_dumps_params={'separators': (',', ':'), 'ensure_ascii': False}
+    )
@@ -1,13 +1,15 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdminMixin
 from .models import (
     Proveedor, EstadoOrdenCompra, OrdenCompra, DetalleOrdenCompra, DetalleOrdenCompraArticulo,
     EstadoRecepcion, TipoRecepcion, RecepcionArticulo, DetalleRecepcionArticulo,
     RecepcionActivo, DetalleRecepcionActivo
 )
+from .services import OrdenCompraService, GastoCompraService
 
 
 @admin.register(Proveedor)
-class ProveedorAdmin(admin.ModelAdmin):
+class ProveedorAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del modelo Proveedor."""
 
     list_display = ['rut', 'razon_social', 'telefono', 'email', 'ciudad', 'activo']
@@ -32,7 +34,7 @@ class ProveedorAdmin(admin.ModelAdmin):
 
 
 @admin.register(EstadoOrdenCompra)
-class EstadoOrdenCompraAdmin(admin.ModelAdmin):
+class EstadoOrdenCompraAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del catálogo de estados de órdenes de compra."""
 
     list_display = ['codigo', 'nombre', 'color', 'activo']
@@ -54,7 +56,7 @@ class EstadoOrdenCompraAdmin(admin.ModelAdmin):
 
 
 @admin.register(EstadoRecepcion)
-class EstadoRecepcionAdmin(admin.ModelAdmin):
+class EstadoRecepcionAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del catálogo de estados de recepción."""
 
     list_display = ['codigo', 'nombre', 'color', 'activo']
@@ -76,7 +78,7 @@ class EstadoRecepcionAdmin(admin.ModelAdmin):
 
 
 @admin.register(TipoRecepcion)
-class TipoRecepcionAdmin(admin.ModelAdmin):
+class TipoRecepcionAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del catálogo de tipos de recepción."""
 
     list_display = ['codigo', 'nombre', 'requiere_orden', 'activo']
@@ -119,7 +121,7 @@ class DetalleOrdenCompraArticuloInline(admin.TabularInline):
 
 
 @admin.register(OrdenCompra)
-class OrdenCompraAdmin(admin.ModelAdmin):
+class OrdenCompraAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del modelo Orden de Compra."""
 
     list_display = ['numero', 'fecha_orden', 'proveedor', 'estado', 'total', 'solicitante']
@@ -149,6 +151,16 @@ class OrdenCompraAdmin(admin.ModelAdmin):
         }),
     )
 
+    def save_related(self, request, form, formsets, change):
+        """Recalcula totales y resumen de gasto después de guardar las líneas editadas en línea."""
+        super().save_related(request, form, formsets, change)
+        OrdenCompraService().recalcular_totales(form.instance)
+
+        claves_anteriores = []
+        if change and form.initial.get('proveedor') and form.initial.get('fecha_orden'):
+            claves_anteriores.append((form.initial['proveedor'], form.initial['fecha_orden'].replace(day=1)))
+        GastoCompraService().refrescar_orden(form.instance, claves_anteriores)
+
 
 class DetalleRecepcionArticuloInline(admin.TabularInline):
     """Inline para detalles de artículos en recepción."""
@@ -159,7 +171,7 @@ class DetalleRecepcionArticuloInline(admin.TabularInline):
 
 
 @admin.register(RecepcionArticulo)
-class RecepcionArticuloAdmin(admin.ModelAdmin):
+class RecepcionArticuloAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del modelo Recepción de Artículos."""
 
     list_display = ['numero', 'fecha_recepcion', 'orden_compra', 'bodega', 'estado', 'recibido_por']
@@ -196,7 +208,7 @@ class DetalleRecepcionActivoInline(admin.TabularInline):
 
 
 @admin.register(RecepcionActivo)
-class RecepcionActivoAdmin(admin.ModelAdmin):
+class RecepcionActivoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administrador del modelo Recepción de Activos."""
 
     list_display = ['numero', 'fecha_recepcion', 'orden_compra', 'estado', 'recibido_por']
@@ -12,6 +12,7 @@ from .models import (
     EstadoOrdenCompra, RecepcionArticulo, DetalleRecepcionArticulo,
     RecepcionActivo, DetalleRecepcionActivo, EstadoRecepcion, TipoRecepcion
 )
+from .repositories import ProveedorRepository
 from apps.bodega.models import Bodega, Articulo
 from apps.activos.models import Activo
 
@@ -48,12 +49,9 @@ class ProveedorForm(forms.ModelForm):
         """Validar formato y unicidad del RUT."""
         rut = self.cleaned_data.get('rut', '').strip().upper()
 
-        # Validar unicidad
-        queryset = Proveedor.objects.filter(rut=rut, eliminado=False)
-        if self.instance and self.instance.pk:
-            queryset = queryset.exclude(pk=self.instance.pk)
-
-        if queryset.exists():
+        # Validar unicidad (compara el RUT normalizado, sin importar el formato)
+        exclude_id = self.instance.pk if self.instance else None
+        if ProveedorRepository.exists_by_rut(rut, exclude_id=exclude_id):
             raise ValidationError(f'Ya existe un proveedor con el RUT "{rut}".')
 
         return rut
@@ -64,6 +62,13 @@ class ProveedorForm(forms.ModelForm):
 class OrdenCompraForm(forms.ModelForm):
     """Formulario para crear/editar órdenes de compra."""
 
+    separar_por_proveedor = forms.BooleanField(
+        required=False,
+        label='Separar por proveedor habitual',
+        help_text='Genera una orden adicional por cada proveedor de la última compra de los artículos',
+        widget=forms.CheckboxInput(attrs={'class': 'form-check-input'})
+    )
+
     class Meta:
         model = OrdenCompra
         fields = [
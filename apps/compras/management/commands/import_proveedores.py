@@ -0,0 +1,66 @@
+"""
+Comando para importar proveedores masivamente desde una planilla CSV o XLSX.
+
+Ejecutar con:
+    python manage.py import_proveedores proveedores.csv --dry-run
+    python manage.py import_proveedores proveedores.xlsx --update --batch-size 5000
+"""
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.compras.services import ImportacionProveedorService
+
+
+class Command(BaseCommand):
+    help = 'Importa proveedores desde un archivo CSV o XLSX validando los RUT por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('archivo', help='Ruta del archivo CSV o XLSX')
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo valida el archivo y muestra el reporte, sin guardar',
+        )
+        parser.add_argument(
+            '--update',
+            action='store_true',
+            help='Actualiza los proveedores cuyo RUT ya existe en vez de informarlos como error',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=ImportacionProveedorService.TAMANO_LOTE,
+            help='Cantidad de filas por lote',
+        )
+
+    def handle(self, *args, **options):
+        ruta = options['archivo']
+        try:
+            with open(ruta, 'rb') as archivo:
+                reporte = ImportacionProveedorService().importar(
+                    archivo, ruta,
+                    dry_run=options['dry_run'],
+                    actualizar_existentes=options['update'],
+                    tamano_lote=options['batch_size']
+                )
+        except OSError as e:
+            raise CommandError(f'No se pudo abrir el archivo: {e}')
+        except ValidationError as e:
+            raise CommandError(' '.join(e.messages))
+
+        for error in reporte['errores']:
+            self.stdout.write(self.style.WARNING(
+                f"Fila {error['fila']} ({error['codigo']}): {error['mensaje']}"
+            ))
+
+        resumen = (
+            f"{reporte['total_filas']} fila(s) leída(s), {reporte['validas']} válida(s), "
+            f"{len(reporte['errores'])} con errores"
+        )
+        if reporte['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Validación: {resumen}.'))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"{reporte['creados']} proveedor(es) creado(s), "
+                f"{reporte['actualizados']} actualizado(s). {resumen}."
+            ))
@@ -133,7 +133,7 @@ class Command(BaseCommand):
 
         proveedores_creados = 0
         for prov_data in proveedores_data:
-            obj, created = Proveedor.objects.get_or_create(
+            obj, created = Proveedor.all_objects.get_or_create(
                 rut=prov_data['rut'],
                 defaults={**prov_data, 'activo': True}
             )
@@ -142,7 +142,7 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'[OK] Proveedores: {proveedores_creados} nuevos, {len(proveedores_data) - proveedores_creados} ya existian'))
 
         # ==================== BODEGAS ====================
-        bodega_central, _ = Bodega.objects.get_or_create(
+        bodega_central, _ = Bodega.all_objects.get_or_create(
             codigo='BOD01',
             defaults={
                 'nombre': 'Bodega Central',
@@ -161,7 +161,7 @@ class Command(BaseCommand):
 
         categorias = {}
         for cat_data in categorias_data:
-            cat, _ = Categoria.objects.get_or_create(
+            cat, _ = Categoria.all_objects.get_or_create(
                 codigo=cat_data['codigo'],
                 defaults=cat_data
             )
@@ -178,7 +178,7 @@ class Command(BaseCommand):
 
         unidades = {}
         for und_data in unidades_data:
-            und, _ = UnidadMedida.objects.get_or_create(
+            und, _ = UnidadMedida.all_objects.get_or_create(
                 codigo=und_data['codigo'],
                 defaults=und_data
             )
@@ -303,7 +303,7 @@ class Command(BaseCommand):
         for art_data in articulos_data:
             # Crear copia para no modificar el original
             art_data_copy = art_data.copy()
-            art_obj, created = Articulo.objects.get_or_create(
+            art_obj, created = Articulo.all_objects.get_or_create(
                 codigo=art_data_copy['codigo'],
                 defaults=art_data_copy
             )
@@ -323,14 +323,14 @@ class Command(BaseCommand):
 
         cat_activos = {}
         for cat_data in cat_activos_data:
-            cat, _ = CategoriaActivo.objects.get_or_create(
+            cat, _ = CategoriaActivo.all_objects.get_or_create(
                 codigo=cat_data['codigo'],
                 defaults=cat_data
             )
             cat_activos[cat_data['codigo']] = cat
 
         # ==================== ESTADOS DE ACTIVOS ====================
-        estado_disponible, _ = EstadoActivo.objects.get_or_create(
+        estado_disponible, _ = EstadoActivo.all_objects.get_or_create(
             codigo='DISP',
             defaults={
                 'nombre': 'Disponible',
@@ -351,7 +351,7 @@ class Command(BaseCommand):
 
         marcas = {}
         for marca_data in marcas_data:
-            marca, _ = Marca.objects.get_or_create(
+            marca, _ = Marca.all_objects.get_or_create(
                 codigo=marca_data['codigo'],
                 defaults=marca_data
             )
@@ -367,7 +367,7 @@ class Command(BaseCommand):
 
         ubicaciones = {}
         for ubi_data in ubicaciones_data:
-            ubi, _ = Ubicacion.objects.get_or_create(
+            ubi, _ = Ubicacion.all_objects.get_or_create(
                 codigo=ubi_data['codigo'],
                 defaults=ubi_data
             )
@@ -468,7 +468,7 @@ class Command(BaseCommand):
 
         activos_creados = 0
         for act_data in activos_data:
-            act_obj, created = Activo.objects.get_or_create(
+            act_obj, created = Activo.all_objects.get_or_create(
                 codigo=act_data['codigo'],
                 defaults=act_data
             )
@@ -479,9 +479,10 @@ class Command(BaseCommand):
         # ==================== TIPOS Y ESTADOS PARA SOLICITUDES ====================
         from apps.solicitudes.models import TipoSolicitud, EstadoSolicitud, Solicitud, DetalleSolicitud
         from apps.solicitudes.models import Departamento
+        from apps.solicitudes.services import ContadoresSolicitudService
         
         # Tipos de solicitud
-        tipo_normal, _ = TipoSolicitud.objects.get_or_create(
+        tipo_normal, _ = TipoSolicitud.all_objects.get_or_create(
             codigo='NORMAL',
             defaults={
                 'nombre': 'Solicitud Normal',
@@ -490,7 +491,7 @@ class Command(BaseCommand):
             }
         )
         
-        tipo_urgente, _ = TipoSolicitud.objects.get_or_create(
+        tipo_urgente, _ = TipoSolicitud.all_objects.get_or_create(
             codigo='URGENTE',
             defaults={
                 'nombre': 'Solicitud Urgente',
@@ -500,7 +501,7 @@ class Command(BaseCommand):
         )
         
         # Estados de solicitud
-        estado_borrador, _ = EstadoSolicitud.objects.get_or_create(
+        estado_borrador, _ = EstadoSolicitud.all_objects.get_or_create(
             codigo='BORRADOR',
             defaults={
                 'nombre': 'Borrador',
@@ -512,7 +513,7 @@ class Command(BaseCommand):
             }
         )
         
-        estado_en_aprobacion, _ = EstadoSolicitud.objects.get_or_create(
+        estado_en_aprobacion, _ = EstadoSolicitud.all_objects.get_or_create(
             codigo='EN_APROBACION',
             defaults={
                 'nombre': 'En Aprobación',
@@ -524,7 +525,7 @@ class Command(BaseCommand):
             }
         )
         
-        estado_aprobada, _ = EstadoSolicitud.objects.get_or_create(
+        estado_aprobada, _ = EstadoSolicitud.all_objects.get_or_create(
             codigo='APROBADA',
             defaults={
                 'nombre': 'Aprobada',
@@ -536,7 +537,7 @@ class Command(BaseCommand):
             }
         )
         
-        estado_despachada, _ = EstadoSolicitud.objects.get_or_create(
+        estado_despachada, _ = EstadoSolicitud.all_objects.get_or_create(
             codigo='DESPACHADA',
             defaults={
                 'nombre': 'Despachada',
@@ -549,7 +550,7 @@ class Command(BaseCommand):
         )
         
         # Departamentos
-        dept_docencia, _ = Departamento.objects.get_or_create(
+        dept_docencia, _ = Departamento.all_objects.get_or_create(
             codigo='DOCENCIA',
             defaults={
                 'nombre': 'Docencia',
@@ -558,7 +559,7 @@ class Command(BaseCommand):
             }
         )
         
-        dept_administracion, _ = Departamento.objects.get_or_create(
+        dept_administracion, _ = Departamento.all_objects.get_or_create(
             codigo='ADMIN',
             defaults={
                 'nombre': 'Administración',
@@ -714,7 +715,7 @@ class Command(BaseCommand):
         
         solicitudes_creadas = 0
         for sol_data in solicitudes_data:
-            sol_obj, created = Solicitud.objects.get_or_create(
+            sol_obj, created = Solicitud.all_objects.get_or_create(
                 numero=sol_data['numero'],
                 defaults=sol_data
             )
@@ -725,7 +726,7 @@ class Command(BaseCommand):
                     # Agregar algunos artículos a la solicitud
                     articulos_disponibles = list(Articulo.objects.filter(activo=True, eliminado=False)[:3])
                     for i, articulo in enumerate(articulos_disponibles):
-                        DetalleSolicitud.objects.get_or_create(
+                        DetalleSolicitud.all_objects.get_or_create(
                             solicitud=sol_obj,
                             articulo=articulo,
                             defaults={
@@ -734,12 +735,13 @@ class Command(BaseCommand):
                                 'cantidad_despachada': Decimal(str(5 + i * 2)) if sol_obj.estado.codigo == 'DESPACHADA' else Decimal('0'),
                             }
                         )
+                    ContadoresSolicitudService().recalcular([sol_obj])
         self.stdout.write(self.style.SUCCESS(f'[OK] Solicitudes: {solicitudes_creadas} nuevas, {len(solicitudes_data) - solicitudes_creadas} ya existian'))
         
         # ==================== TIPOS DE MOVIMIENTO (BODEGA) ====================
         from apps.bodega.models import TipoMovimiento, Movimiento
         
-        tipo_entrada, _ = TipoMovimiento.objects.get_or_create(
+        tipo_entrada, _ = TipoMovimiento.all_objects.get_or_create(
             codigo='ENTRADA',
             defaults={
                 'nombre': 'Entrada',
@@ -747,7 +749,7 @@ class Command(BaseCommand):
             }
         )
         
-        tipo_salida, _ = TipoMovimiento.objects.get_or_create(
+        tipo_salida, _ = TipoMovimiento.all_objects.get_or_create(
             codigo='SALIDA',
             defaults={
                 'nombre': 'Salida',
@@ -755,7 +757,7 @@ class Command(BaseCommand):
             }
         )
         
-        tipo_ajuste, _ = TipoMovimiento.objects.get_or_create(
+        tipo_ajuste, _ = TipoMovimiento.all_objects.get_or_create(
             codigo='AJUSTE',
             defaults={
                 'nombre': 'Ajuste',
@@ -820,7 +822,7 @@ class Command(BaseCommand):
         # ==================== TIPOS DE MOVIMIENTO (ACTIVOS) ====================
         from apps.activos.models import TipoMovimientoActivo, MovimientoActivo, Taller, Proveniencia
         
-        tipo_asignacion, _ = TipoMovimientoActivo.objects.get_or_create(
+        tipo_asignacion, _ = TipoMovimientoActivo.all_objects.get_or_create(
             codigo='ASIGNACION',
             defaults={
                 'nombre': 'Asignación',
@@ -828,7 +830,7 @@ class Command(BaseCommand):
             }
         )
         
-        tipo_traslado, _ = TipoMovimientoActivo.objects.get_or_create(
+        tipo_traslado, _ = TipoMovimientoActivo.all_objects.get_or_create(
             codigo='TRASLADO',
             defaults={
                 'nombre': 'Traslado',
@@ -836,7 +838,7 @@ class Command(BaseCommand):
             }
         )
         
-        tipo_mantenimiento, _ = TipoMovimientoActivo.objects.get_or_create(
+        tipo_mantenimiento, _ = TipoMovimientoActivo.all_objects.get_or_create(
             codigo='MANTENIMIENTO',
             defaults={
                 'nombre': 'Mantenimiento',
@@ -845,7 +847,7 @@ class Command(BaseCommand):
         )
         
         # Taller
-        taller_central, _ = Taller.objects.get_or_create(
+        taller_central, _ = Taller.all_objects.get_or_create(
             codigo='TAL01',
             defaults={
                 'nombre': 'Taller Central',
@@ -855,7 +857,7 @@ class Command(BaseCommand):
         )
         
         # Proveniencia
-        proveniencia_compra, _ = Proveniencia.objects.get_or_create(
+        proveniencia_compra, _ = Proveniencia.all_objects.get_or_create(
             codigo='COMPRA',
             defaults={
                 'nombre': 'Compra',
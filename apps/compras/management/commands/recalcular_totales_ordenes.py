@@ -0,0 +1,40 @@
+"""
+Comando para recalcular los totales de las órdenes de compra desde sus detalles.
+
+Los totales se mantienen de forma incremental al agregar, editar o eliminar
+líneas; este comando los reconstruye con agregados en la base de datos
+(reparación tras cargas masivas o ediciones directas).
+
+Ejecutar con:
+    python manage.py recalcular_totales_ordenes
+    python manage.py recalcular_totales_ordenes --numero OC-2025-000001
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.compras.models import OrdenCompra
+from apps.compras.services import OrdenCompraService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula subtotal, impuesto y total de las órdenes de compra desde sus detalles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--numero',
+            action='append',
+            dest='numeros',
+            help='Número de orden a recalcular (puede repetirse; default: todas)',
+        )
+
+    def handle(self, *args, **options):
+        orden_ids = None
+        if options['numeros']:
+            orden_ids = list(OrdenCompra.all_objects.filter(
+                numero__in=options['numeros']
+            ).values_list('pk', flat=True))
+
+        with transaction.atomic():
+            actualizadas = OrdenCompraService().recalcular_totales_masivo(orden_ids)
+
+        self.stdout.write(self.style.SUCCESS(f'{actualizadas} orden(es) recalculada(s).'))
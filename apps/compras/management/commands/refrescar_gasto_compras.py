@@ -0,0 +1,21 @@
+"""
+Comando para reconstruir el resumen mensual de gasto en compras.
+
+Las filas de GastoCompraMensual se actualizan por (proveedor, mes) cuando cambia
+una orden; este comando las reconstruye completas desde las órdenes (carga
+inicial o reparación tras ediciones directas en la base de datos).
+
+Ejecutar con:
+    python manage.py refrescar_gasto_compras
+"""
+from django.core.management.base import BaseCommand
+
+from apps.compras.services import GastoCompraService
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el resumen mensual de gasto por proveedor y categoría'
+
+    def handle(self, *args, **options):
+        filas = GastoCompraService().refrescar()
+        self.stdout.write(self.style.SUCCESS(f'{filas} fila(s) de gasto mensual generada(s).'))
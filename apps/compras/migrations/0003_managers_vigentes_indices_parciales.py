@@ -0,0 +1,92 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:06
+
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bodega', '0005_managers_vigentes_indices_parciales'),
+        ('compras', '0002_remove_estadorecepcion_es_final_and_more'),
+        ('solicitudes', '0002_managers_vigentes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='detalleordencompra',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='detalleordencompraarticulo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='detallerecepcionactivo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='detallerecepcionarticulo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='estadoordencompra',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='estadorecepcion',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='ordencompra',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='proveedor',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='recepcionactivo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='recepcionarticulo',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AlterModelManagers(
+            name='tiporecepcion',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='ordencompra',
+            index=models.Index(condition=models.Q(('eliminado', False)), fields=['-fecha_orden', '-numero'], name='ix_orden_fecha_numero_vig'),
+        ),
+        migrations.AddIndex(
+            model_name='ordencompra',
+            index=models.Index(condition=models.Q(('eliminado', False)), fields=['estado', '-fecha_orden'], name='ix_orden_estado_fecha_vig'),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:14
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0003_managers_vigentes_indices_parciales'),
+        ('bodega', '0005_managers_vigentes_indices_parciales'),
+        ('compras', '0003_managers_vigentes_indices_parciales'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='detalleordencompra',
+            name='cantidad_pendiente',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('cantidad'), '-', models.F('cantidad_recibida')), output_field=models.DecimalField(decimal_places=2, max_digits=10), verbose_name='Cantidad Pendiente'),
+        ),
+        migrations.AddField(
+            model_name='detalleordencompraarticulo',
+            name='cantidad_pendiente',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.expressions.CombinedExpression(models.F('cantidad'), '-', models.F('cantidad_recibida')), output_field=models.DecimalField(decimal_places=2, max_digits=10), verbose_name='Cantidad Pendiente'),
+        ),
+        migrations.AddIndex(
+            model_name='detalleordencompra',
+            index=models.Index(fields=['orden_compra', 'activo'], name='tba_compras_orden_c_0a79db_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detalleordencompraarticulo',
+            index=models.Index(fields=['orden_compra', 'articulo'], name='tba_compras_orden_c_835ffd_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-18 22:05
+
+from django.db import migrations, models
+
+
+def normalizar(rut):
+    """Copia de core.utils.normalizar_rut (las migraciones no dependen del código vivo)."""
+    return (rut or '').replace('.', '').replace('-', '').replace(' ', '').upper().lstrip('0')
+
+
+def poblar_rut_normalizado(apps, schema_editor):
+    """
+    Carga inicial de rut_normalizado.
+
+    Si dos proveedores normalizan al mismo RUT (ej: '12.345.678-9' y '12345678-9'),
+    solo el primero (menor id) recibe el valor; el resto queda en NULL para
+    revisión manual, ya que el índice único no admite el duplicado.
+    """
+    Proveedor = apps.get_model('compras', 'Proveedor')
+
+    vistos = set()
+    pendientes = []
+    for proveedor in Proveedor.all_objects.only('id', 'rut').order_by('id').iterator(chunk_size=2000):
+        rut_normalizado = normalizar(proveedor.rut)
+        if not rut_normalizado or rut_normalizado in vistos:
+            continue
+        vistos.add(rut_normalizado)
+        proveedor.rut_normalizado = rut_normalizado
+        pendientes.append(proveedor)
+
+    Proveedor.all_objects.bulk_update(pendientes, ['rut_normalizado'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('compras', '0004_cantidad_pendiente_detalles_orden'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='proveedor',
+            name='rut_normalizado',
+            field=models.CharField(editable=False, help_text='RUT sin puntos ni guion (número + DV), usado para búsquedas exactas', max_length=12, null=True, verbose_name='RUT Normalizado'),
+        ),
+        migrations.RunPython(poblar_rut_normalizado, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='proveedor',
+            name='rut_normalizado',
+            field=models.CharField(editable=False, help_text='RUT sin puntos ni guion (número + DV), usado para búsquedas exactas', max_length=12, null=True, unique=True, verbose_name='RUT Normalizado'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:28
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('activos', '0003_managers_vigentes_indices_parciales'),
+        ('bodega', '0005_managers_vigentes_indices_parciales'),
+        ('compras', '0005_proveedor_rut_normalizado'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GastoCompraMensual',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('mes', models.DateField(help_text='Primer día del mes de la orden', verbose_name='Mes')),
+                ('tipo_item', models.CharField(choices=[('ARTICULO', 'Artículo'), ('ACTIVO', 'Activo/Bien')], max_length=10, verbose_name='Tipo de Ítem')),
+                ('monto', models.DecimalField(decimal_places=2, default=0, max_digits=14, verbose_name='Monto')),
+                ('cantidad_ordenes', models.PositiveIntegerField(default=0, verbose_name='Órdenes')),
+                ('cantidad_lineas', models.PositiveIntegerField(default=0, verbose_name='Líneas')),
+                ('ordenes_entregadas', models.PositiveIntegerField(default=0, help_text='Órdenes con fecha de entrega real', verbose_name='Órdenes Entregadas')),
+                ('dias_entrega_total', models.IntegerField(default=0, help_text='Suma de días entre la fecha de la orden y la entrega real', verbose_name='Días de Entrega (suma)')),
+                ('ordenes_con_plazo', models.PositiveIntegerField(default=0, help_text='Órdenes con fecha de entrega esperada y real', verbose_name='Órdenes con Plazo')),
+                ('dias_atraso_total', models.IntegerField(default=0, help_text='Suma de días entre la entrega esperada y la real (negativo = anticipada)', verbose_name='Días de Atraso (suma)')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')),
+                ('categoria', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='gastos_mensuales', to='bodega.categoria', verbose_name='Categoría de Artículo')),
+                ('categoria_activo', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='gastos_mensuales', to='activos.categoriaactivo', verbose_name='Categoría de Activo')),
+                ('proveedor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='gastos_mensuales', to='compras.proveedor', verbose_name='Proveedor')),
+            ],
+            options={
+                'verbose_name': 'Gasto Mensual de Compras',
+                'verbose_name_plural': 'Gastos Mensuales de Compras',
+                'db_table': 'tba_compras_gasto_mensual',
+                'ordering': ['-mes', 'proveedor'],
+                'indexes': [models.Index(fields=['proveedor', 'mes'], name='tba_compras_proveed_afd79d_idx'), models.Index(fields=['mes'], name='tba_compras_mes_472d9a_idx')],
+            },
+        ),
+    ]
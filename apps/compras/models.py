@@ -5,9 +5,10 @@ from django.contrib.auth.models import User
 from django.core.validators import EmailValidator, MinValueValidator
 from django.db import models
 
-from apps.activos.models import Activo
-from apps.bodega.models import Articulo, Bodega
+from apps.activos.models import Activo, CategoriaActivo
+from apps.bodega.models import Articulo, Bodega, Categoria
 from core.models import BaseModel
+from core.utils import normalizar_rut
 
 
 class Proveedor(BaseModel):
@@ -19,6 +20,14 @@ class Proveedor(BaseModel):
     """
 
     rut = models.CharField(max_length=12, unique=True, verbose_name='RUT')
+    rut_normalizado = models.CharField(
+        max_length=12,
+        unique=True,
+        null=True,
+        editable=False,
+        verbose_name='RUT Normalizado',
+        help_text='RUT sin puntos ni guion (número + DV), usado para búsquedas exactas'
+    )
     razon_social = models.CharField(max_length=255, verbose_name='Razón Social')
 
     # Contacto
@@ -43,6 +52,14 @@ class Proveedor(BaseModel):
     def __str__(self) -> str:
         return f"{self.rut} - {self.razon_social}"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Mantiene el RUT normalizado sincronizado con el RUT ingresado."""
+        self.rut_normalizado = normalizar_rut(self.rut) or None
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'rut' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'rut_normalizado'}
+        super().save(*args, **kwargs)
+
 
 class EstadoOrdenCompra(BaseModel):
     """
@@ -172,6 +189,11 @@ class OrdenCompra(BaseModel):
         verbose_name = 'Orden de Compra'
         verbose_name_plural = 'Órdenes de Compra'
         ordering = ['-fecha_orden', '-numero']
+        # Índices parciales: solo registros vigentes (eliminado=False)
+        indexes = [
+            models.Index(fields=['-fecha_orden', '-numero'], name='ix_orden_fecha_numero_vig', condition=models.Q(eliminado=False)),
+            models.Index(fields=['estado', '-fecha_orden'], name='ix_orden_estado_fecha_vig', condition=models.Q(eliminado=False)),
+        ]
 
     def __str__(self) -> str:
         return f"OC-{self.numero} - {self.proveedor.razon_social}"
@@ -230,6 +252,12 @@ class DetalleOrdenCompra(BaseModel):
         validators=[MinValueValidator(Decimal('0'))],
         verbose_name='Cantidad Recibida'
     )
+    cantidad_pendiente = models.GeneratedField(
+        expression=models.F('cantidad') - models.F('cantidad_recibida'),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        verbose_name='Cantidad Pendiente'
+    )
     observaciones = models.TextField(blank=True, null=True, verbose_name='Observaciones')
 
     class Meta:
@@ -237,6 +265,9 @@ class DetalleOrdenCompra(BaseModel):
         verbose_name = 'Detalle de Orden de Compra'
         verbose_name_plural = 'Detalles de Órdenes de Compra'
         ordering = ['orden_compra', 'id']
+        indexes = [
+            models.Index(fields=['orden_compra', 'activo']),
+        ]
 
     def __str__(self) -> str:
         return f"{self.orden_compra.numero} - {self.activo.codigo} ({self.cantidad})"
@@ -302,6 +333,12 @@ class DetalleOrdenCompraArticulo(BaseModel):
         validators=[MinValueValidator(Decimal('0'))],
         verbose_name='Cantidad Recibida'
     )
+    cantidad_pendiente = models.GeneratedField(
+        expression=models.F('cantidad') - models.F('cantidad_recibida'),
+        output_field=models.DecimalField(max_digits=10, decimal_places=2),
+        db_persist=True,
+        verbose_name='Cantidad Pendiente'
+    )
     observaciones = models.TextField(blank=True, null=True, verbose_name='Observaciones')
 
     class Meta:
@@ -309,6 +346,9 @@ class DetalleOrdenCompraArticulo(BaseModel):
         verbose_name = 'Detalle Orden - Artículo'
         verbose_name_plural = 'Detalles Orden - Artículos'
         ordering = ['orden_compra', 'id']
+        indexes = [
+            models.Index(fields=['orden_compra', 'articulo']),
+        ]
 
     def __str__(self) -> str:
         return f"{self.orden_compra.numero} - {self.articulo.codigo} ({self.cantidad})"
@@ -321,6 +361,105 @@ class DetalleOrdenCompraArticulo(BaseModel):
         super().save(*args, **kwargs)
 
 
+# ==================== ANALÍTICA DE GASTO ====================
+
+class GastoCompraMensual(models.Model):
+    """
+    Resumen precalculado del gasto en compras por proveedor, categoría y mes.
+
+    Las filas se derivan de las órdenes de compra vigentes (no canceladas) y
+    se recalculan por (proveedor, mes) cuando una orden cambia (GastoCompraService).
+    No heredan de BaseModel: no se editan ni se eliminan lógicamente.
+    """
+
+    TIPO_ARTICULO = 'ARTICULO'
+    TIPO_ACTIVO = 'ACTIVO'
+
+    proveedor = models.ForeignKey(
+        Proveedor,
+        on_delete=models.CASCADE,
+        related_name='gastos_mensuales',
+        verbose_name='Proveedor'
+    )
+    mes = models.DateField(verbose_name='Mes', help_text='Primer día del mes de la orden')
+    tipo_item = models.CharField(
+        max_length=10,
+        choices=[(TIPO_ARTICULO, 'Artículo'), (TIPO_ACTIVO, 'Activo/Bien')],
+        verbose_name='Tipo de Ítem'
+    )
+    categoria = models.ForeignKey(
+        Categoria,
+        on_delete=models.CASCADE,
+        related_name='gastos_mensuales',
+        null=True,
+        blank=True,
+        verbose_name='Categoría de Artículo'
+    )
+    categoria_activo = models.ForeignKey(
+        CategoriaActivo,
+        on_delete=models.CASCADE,
+        related_name='gastos_mensuales',
+        null=True,
+        blank=True,
+        verbose_name='Categoría de Activo'
+    )
+
+    monto = models.DecimalField(max_digits=14, decimal_places=2, default=0, verbose_name='Monto')
+    cantidad_ordenes = models.PositiveIntegerField(default=0, verbose_name='Órdenes')
+    cantidad_lineas = models.PositiveIntegerField(default=0, verbose_name='Líneas')
+
+    # Plazos de entrega (nivel orden)
+    ordenes_entregadas = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Órdenes Entregadas',
+        help_text='Órdenes con fecha de entrega real'
+    )
+    dias_entrega_total = models.IntegerField(
+        default=0,
+        verbose_name='Días de Entrega (suma)',
+        help_text='Suma de días entre la fecha de la orden y la entrega real'
+    )
+    ordenes_con_plazo = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Órdenes con Plazo',
+        help_text='Órdenes con fecha de entrega esperada y real'
+    )
+    dias_atraso_total = models.IntegerField(
+        default=0,
+        verbose_name='Días de Atraso (suma)',
+        help_text='Suma de días entre la entrega esperada y la real (negativo = anticipada)'
+    )
+
+    fecha_actualizacion = models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')
+
+    class Meta:
+        db_table = 'tba_compras_gasto_mensual'
+        verbose_name = 'Gasto Mensual de Compras'
+        verbose_name_plural = 'Gastos Mensuales de Compras'
+        ordering = ['-mes', 'proveedor']
+        indexes = [
+            models.Index(fields=['proveedor', 'mes']),
+            models.Index(fields=['mes']),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.proveedor_id} - {self.mes:%m/%Y} - {self.monto}"
+
+    @property
+    def plazo_entrega_promedio(self) -> Decimal:
+        """Días promedio entre la orden y la entrega real."""
+        if not self.ordenes_entregadas:
+            return Decimal('0')
+        return Decimal(self.dias_entrega_total) / self.ordenes_entregadas
+
+    @property
+    def atraso_promedio(self) -> Decimal:
+        """Días promedio de atraso respecto a la entrega esperada."""
+        if not self.ordenes_con_plazo:
+            return Decimal('0')
+        return Decimal(self.dias_atraso_total) / self.ordenes_con_plazo
+
+
 # ==================== RECEPCIÓN DE ARTÍCULOS ====================
 
 class RecepcionBase(BaseModel):
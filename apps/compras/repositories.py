@@ -4,15 +4,19 @@ Repository Pattern para el módulo de compras.
 Separa la lógica de acceso a datos de la lógica de negocio,
 siguiendo el principio de Inversión de Dependencias (SOLID).
 """
-from typing import Optional
+from typing import Optional, Dict, Iterable, Iterator, Tuple
+from datetime import date, timedelta
 from decimal import Decimal
-from django.db.models import QuerySet, Q, Sum
+from django.db.models import QuerySet, Q, Sum, Count, F, Case, When, Value, DecimalField, Subquery, OuterRef
+from django.db.models.functions import Coalesce, TruncMonth
+from django.utils import timezone
 from django.contrib.auth.models import User
+from core.utils import normalizar_rut
 from .models import (
     Proveedor, EstadoOrdenCompra, OrdenCompra,
     DetalleOrdenCompra, DetalleOrdenCompraArticulo,
     EstadoRecepcion, RecepcionArticulo, DetalleRecepcionArticulo,
-    RecepcionActivo, DetalleRecepcionActivo
+    RecepcionActivo, DetalleRecepcionActivo, GastoCompraMensual
 )
 from apps.bodega.models import Bodega, Articulo
 from apps.activos.models import Activo
@@ -45,26 +49,33 @@ class ProveedorRepository:
 
     @staticmethod
     def get_by_rut(rut: str) -> Optional[Proveedor]:
-        """Obtiene un proveedor por su RUT."""
+        """Obtiene un proveedor por su RUT (en cualquier formato)."""
+        rut_normalizado = normalizar_rut(rut)
+        if not rut_normalizado:
+            return None
         try:
-            return Proveedor.objects.get(rut=rut, eliminado=False)
+            return Proveedor.objects.get(rut_normalizado=rut_normalizado)
         except Proveedor.DoesNotExist:
             return None
 
     @staticmethod
     def search(query: str) -> QuerySet[Proveedor]:
-        """Búsqueda de proveedores por RUT, razón social o nombre fantasía."""
-        return Proveedor.objects.filter(
-            Q(rut__icontains=query) |
-            Q(razon_social__icontains=query) |
-            Q(nombre_fantasia__icontains=query),
-            eliminado=False
-        ).order_by('razon_social')
+        """
+        Búsqueda de proveedores por razón social o RUT.
+
+        El RUT se compara por igualdad sobre rut_normalizado (índice único),
+        por lo que admite cualquier formato de entrada pero no coincidencias parciales.
+        """
+        filtro = Q(razon_social__icontains=query)
+        rut_normalizado = normalizar_rut(query)
+        if len(rut_normalizado) > 1 and rut_normalizado[:-1].isdigit():
+            filtro |= Q(rut_normalizado=rut_normalizado)
+        return Proveedor.objects.filter(filtro).order_by('razon_social')
 
     @staticmethod
     def exists_by_rut(rut: str, exclude_id: Optional[int] = None) -> bool:
-        """Verifica si existe un proveedor con el RUT dado."""
-        queryset = Proveedor.objects.filter(rut=rut)
+        """Verifica si existe un proveedor con el RUT dado (en cualquier formato)."""
+        queryset = Proveedor.all_objects.filter(rut_normalizado=normalizar_rut(rut))
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -166,7 +177,7 @@ class OrdenCompraRepository:
     @staticmethod
     def exists_by_numero(numero: str, exclude_id: Optional[int] = None) -> bool:
         """Verifica si existe una orden con el número dado."""
-        queryset = OrdenCompra.objects.filter(numero=numero)
+        queryset = OrdenCompra.all_objects.filter(numero=numero)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -181,11 +192,181 @@ class OrdenCompraRepository:
             'proveedor', 'bodega_destino', 'estado', 'solicitante'
         ).order_by('-fecha_orden')
 
+    @staticmethod
+    def ajustar_totales(orden_id: int, delta_subtotal: Decimal, tasa_impuesto: Decimal) -> int:
+        """
+        Aplica a los totales de la orden la variación de subtotal de una línea.
+
+        Un único UPDATE con F(): el impuesto y el total se derivan del nuevo
+        subtotal (no se les suma la variación), de modo que redondean igual
+        que recalcular_totales y no acumulan diferencias de centavos.
+
+        Args:
+            orden_id: ID de la orden
+            delta_subtotal: Variación del subtotal (positiva o negativa)
+            tasa_impuesto: Tasa de impuesto (ej: Decimal('0.19'))
+
+        Returns:
+            Cantidad de órdenes actualizadas (0 o 1)
+        """
+        # En el UPDATE, F('subtotal') es el valor previo en todas las asignaciones
+        neto = F('subtotal') + delta_subtotal - F('descuento')
+        return OrdenCompra.all_objects.filter(pk=orden_id).update(
+            subtotal=F('subtotal') + delta_subtotal,
+            impuesto=neto * tasa_impuesto,
+            total=neto + neto * tasa_impuesto,
+            fecha_actualizacion=timezone.now()
+        )
+
+    @staticmethod
+    def recalcular_totales(orden_ids: Optional[Iterable[int]], tasa_impuesto: Decimal) -> int:
+        """
+        Recalcula subtotal, impuesto y total de las órdenes en la base de datos.
+
+        El subtotal se obtiene con subconsultas agregadas (SUM) sobre los detalles
+        vigentes de activos y artículos; impuesto y total se derivan del subtotal
+        y el descuento de la orden en un segundo UPDATE.
+
+        Args:
+            orden_ids: IDs de las órdenes a recalcular (None = todas las órdenes)
+            tasa_impuesto: Tasa de impuesto (ej: Decimal('0.19'))
+
+        Returns:
+            Cantidad de órdenes actualizadas
+        """
+        ordenes = OrdenCompra.all_objects.all()
+        if orden_ids is not None:
+            ordenes = ordenes.filter(pk__in=list(orden_ids))
+        ordenes.update(
+            subtotal=(
+                DetalleOrdenCompraRepository.subtotal_por_orden()
+                + DetalleOrdenCompraArticuloRepository.subtotal_por_orden()
+            ),
+            fecha_actualizacion=timezone.now()
+        )
+        neto = F('subtotal') - F('descuento')
+        return ordenes.update(
+            impuesto=neto * tasa_impuesto,
+            total=neto + neto * tasa_impuesto
+        )
+
 
 # ==================== DETALLE ORDEN COMPRA REPOSITORIES ====================
 
-class DetalleOrdenCompraRepository:
+class DetalleOrdenRepositoryBase:
+    """
+    Repository base para la conciliación de cantidades recibidas en detalles de orden.
+
+    Las subclases definen 'model' y 'campo_item' ('activo' o 'articulo').
+    La línea destino de un item es la primera con saldo pendiente
+    (o la primera, si todas están completas), igual que en la búsqueda previa.
+    """
+    model = None  # Debe ser sobrescrito por subclases
+    campo_item = None  # Debe ser sobrescrito por subclases
+
+    @classmethod
+    def subtotal_por_orden(cls) -> Coalesce:
+        """
+        Expresión con la suma de subtotales vigentes de la orden externa (OuterRef('pk')).
+
+        Returns:
+            Expresión Coalesce(Subquery(SUM(subtotal)), 0) para update()/annotate()
+        """
+        decimal = DecimalField(max_digits=12, decimal_places=2)
+        subtotales = cls.model.objects.filter(
+            orden_compra=OuterRef('pk')
+        ).order_by().values('orden_compra').annotate(total=Sum('subtotal')).values('total')
+        return Coalesce(Subquery(subtotales, output_field=decimal), Decimal('0'), output_field=decimal)
+
+    @classmethod
+    def proveedores_habituales(cls, item_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Proveedor de la última orden vigente que incluyó cada item.
+
+        Args:
+            item_ids: IDs de artículos o activos
+
+        Returns:
+            Diccionario {item_id: proveedor_id} (solo items con compras previas)
+        """
+        item_model = cls.model._meta.get_field(cls.campo_item).related_model
+        ultima_orden = cls.model.objects.filter(
+            **{cls.campo_item: OuterRef('pk')},
+            orden_compra__eliminado=False
+        ).order_by('-orden_compra__fecha_orden', '-id').values('orden_compra__proveedor_id')[:1]
+
+        return {
+            item_id: proveedor_id
+            for item_id, proveedor_id in item_model.all_objects.filter(
+                pk__in=list(item_ids)
+            ).annotate(
+                proveedor_habitual_id=Subquery(ultima_orden)
+            ).values_list('pk', 'proveedor_habitual_id')
+            if proveedor_id
+        }
+
+    @classmethod
+    def _lineas_destino(cls, orden: OrdenCompra) -> QuerySet:
+        """Detalles vigentes de la orden ordenados por prioridad de recepción."""
+        return cls.model.objects.filter(orden_compra=orden).order_by(
+            Case(When(cantidad_pendiente__gt=0, then=Value(0)), default=Value(1)),
+            'id'
+        )
+
+    @classmethod
+    def sumar_recibido(cls, orden: OrdenCompra, item_id: int, cantidad: Decimal) -> int:
+        """
+        Suma una cantidad recibida a la línea del item con un único UPDATE.
+
+        Args:
+            orden: Orden de compra
+            item_id: ID del artículo o activo
+            cantidad: Cantidad recibida a sumar
+
+        Returns:
+            Cantidad de líneas actualizadas (0 si el item no está en la orden)
+        """
+        linea = cls._lineas_destino(orden).filter(**{f'{cls.campo_item}_id': item_id}).values('pk')[:1]
+        return cls.model.objects.filter(pk=Subquery(linea)).update(
+            cantidad_recibida=F('cantidad_recibida') + cantidad,
+            fecha_actualizacion=timezone.now()
+        )
+
+    @classmethod
+    def sumar_recibidos(cls, orden: OrdenCompra, cantidades: Dict[int, Decimal]) -> int:
+        """
+        Suma cantidades recibidas de varios items con un único UPDATE.
+
+        Args:
+            orden: Orden de compra
+            cantidades: Diccionario {item_id: cantidad recibida}
+
+        Returns:
+            Cantidad de líneas actualizadas
+        """
+        campo_id = f'{cls.campo_item}_id'
+        destinos: Dict[int, int] = {}
+        for linea_id, item_id in cls._lineas_destino(orden).filter(
+            **{f'{campo_id}__in': list(cantidades)}
+        ).values_list('pk', campo_id):
+            destinos.setdefault(item_id, linea_id)
+
+        if not destinos:
+            return 0
+
+        return cls.model.objects.filter(pk__in=destinos.values()).update(
+            cantidad_recibida=F('cantidad_recibida') + Case(
+                *[When(pk=linea_id, then=Value(cantidades[item_id])) for item_id, linea_id in destinos.items()],
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            ),
+            fecha_actualizacion=timezone.now()
+        )
+
+
+class DetalleOrdenCompraRepository(DetalleOrdenRepositoryBase):
     """Repository para detalles de órdenes de compra (Activos)."""
+    model = DetalleOrdenCompra
+    campo_item = 'activo'
 
     @staticmethod
     def filter_by_orden(orden: OrdenCompra) -> QuerySet[DetalleOrdenCompra]:
@@ -206,8 +387,10 @@ class DetalleOrdenCompraRepository:
             return None
 
 
-class DetalleOrdenCompraArticuloRepository:
+class DetalleOrdenCompraArticuloRepository(DetalleOrdenRepositoryBase):
     """Repository para detalles de órdenes de compra (Artículos)."""
+    model = DetalleOrdenCompraArticulo
+    campo_item = 'articulo'
 
     @staticmethod
     def filter_by_orden(orden: OrdenCompra) -> QuerySet[DetalleOrdenCompraArticulo]:
@@ -354,7 +537,7 @@ class RecepcionRepositoryBase:
         if not cls.model:
             raise NotImplementedError("Subclases deben definir el atributo 'model'")
 
-        queryset = cls.model.objects.filter(numero=numero)
+        queryset = cls.model.all_objects.filter(numero=numero)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -394,6 +577,17 @@ class DetalleRecepcionArticuloRepository:
             eliminado=False
         ).select_related('articulo').order_by('id')
 
+    @staticmethod
+    def totales_por_item(recepcion: RecepcionArticulo) -> Dict[int, Decimal]:
+        """Retorna la cantidad recibida por articulo ({articulo_id: total})."""
+        return dict(
+            DetalleRecepcionArticulo.objects.filter(recepcion=recepcion)
+            .order_by()
+            .values('articulo_id')
+            .annotate(total=Sum('cantidad'))
+            .values_list('articulo_id', 'total')
+        )
+
 
 # ==================== RECEPCIÓN ACTIVO REPOSITORY ====================
 
@@ -418,3 +612,129 @@ class DetalleRecepcionActivoRepository:
             recepcion=recepcion,
             eliminado=False
         ).select_related('activo').order_by('id')
+
+    @staticmethod
+    def totales_por_item(recepcion: RecepcionActivo) -> Dict[int, Decimal]:
+        """Retorna la cantidad recibida por activo ({activo_id: total})."""
+        return dict(
+            DetalleRecepcionActivo.objects.filter(recepcion=recepcion)
+            .order_by()
+            .values('activo_id')
+            .annotate(total=Sum('cantidad'))
+            .values_list('activo_id', 'total')
+        )
+
+
+# ==================== GASTO COMPRA REPOSITORY ====================
+
+class GastoCompraRepository:
+    """
+    Repository para el resumen precalculado de gasto en compras.
+
+    Las claves de recálculo son tuplas (proveedor_id, mes), con mes como
+    primer día del mes de la orden.
+    """
+
+    # Órdenes que no cuentan como gasto
+    ESTADOS_EXCLUIDOS = ['CANCELADA']
+
+    @staticmethod
+    def siguiente_mes(mes: date) -> date:
+        """Primer día del mes siguiente."""
+        return (mes.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+    @classmethod
+    def ordenes_computables(cls, claves: Optional[Iterable[Tuple[int, date]]] = None) -> QuerySet[OrdenCompra]:
+        """
+        Órdenes vigentes y no canceladas, opcionalmente limitadas a claves (proveedor, mes).
+
+        Args:
+            claves: Claves (proveedor_id, mes) a incluir (None = todas las órdenes)
+        """
+        ordenes = OrdenCompra.objects.exclude(estado__codigo__in=cls.ESTADOS_EXCLUIDOS)
+        if claves is None:
+            return ordenes
+
+        filtro = Q()
+        for proveedor_id, mes in claves:
+            filtro |= Q(
+                proveedor_id=proveedor_id,
+                fecha_orden__gte=mes,
+                fecha_orden__lt=cls.siguiente_mes(mes)
+            )
+        return ordenes.filter(filtro) if filtro else ordenes.none()
+
+    @staticmethod
+    def _lineas(ordenes: QuerySet[OrdenCompra]) -> Iterator[Tuple[str, QuerySet, str]]:
+        """Detalles vigentes de las órdenes por tipo de ítem, con su campo de categoría."""
+        yield (
+            GastoCompraMensual.TIPO_ARTICULO,
+            DetalleOrdenCompraArticulo.objects.filter(orden_compra__in=ordenes),
+            'articulo__categoria_id'
+        )
+        yield (
+            GastoCompraMensual.TIPO_ACTIVO,
+            DetalleOrdenCompra.objects.filter(orden_compra__in=ordenes),
+            'activo__categoria_id'
+        )
+
+    @classmethod
+    def montos_agrupados(cls, ordenes: QuerySet[OrdenCompra]) -> Iterator[Dict]:
+        """
+        Gasto agrupado por (tipo, proveedor, mes, categoría) con GROUP BY en la base de datos.
+
+        Returns:
+            Diccionarios con tipo_item, proveedor_id, mes, categoria_id, monto,
+            cantidad_lineas y cantidad_ordenes
+        """
+        for tipo_item, lineas, campo_categoria in cls._lineas(ordenes):
+            for fila in lineas.order_by().values(
+                proveedor_ref=F('orden_compra__proveedor_id'),
+                mes=TruncMonth('orden_compra__fecha_orden'),
+                categoria_ref=F(campo_categoria)
+            ).annotate(
+                monto=Sum('subtotal'),
+                cantidad_lineas=Count('id'),
+                cantidad_ordenes=Count('orden_compra', distinct=True)
+            ):
+                yield {**fila, 'tipo_item': tipo_item}
+
+    @classmethod
+    def entregas_por_orden(cls, ordenes: QuerySet[OrdenCompra]) -> Iterator[Dict]:
+        """
+        Fechas de entrega de cada orden entregada, una fila por (orden, categoría).
+
+        El plazo es un dato de la orden: se toma una vez por categoría para no
+        contarlo por cada línea.
+        """
+        for tipo_item, lineas, campo_categoria in cls._lineas(ordenes):
+            for fila in lineas.filter(
+                orden_compra__fecha_entrega_real__isnull=False
+            ).order_by().values(
+                'orden_compra_id',
+                proveedor_ref=F('orden_compra__proveedor_id'),
+                mes=TruncMonth('orden_compra__fecha_orden'),
+                categoria_ref=F(campo_categoria),
+                fecha_orden=F('orden_compra__fecha_orden'),
+                fecha_entrega_esperada=F('orden_compra__fecha_entrega_esperada'),
+                fecha_entrega_real=F('orden_compra__fecha_entrega_real')
+            ).distinct():
+                yield {**fila, 'tipo_item': tipo_item}
+
+    @staticmethod
+    def eliminar(claves: Optional[Iterable[Tuple[int, date]]] = None) -> int:
+        """Elimina las filas de las claves indicadas (None = todas)."""
+        filas = GastoCompraMensual.objects.all()
+        if claves is not None:
+            filtro = Q()
+            for proveedor_id, mes in claves:
+                filtro |= Q(proveedor_id=proveedor_id, mes=mes)
+            if not filtro:
+                return 0
+            filas = filas.filter(filtro)
+        return filas.delete()[0]
+
+    @staticmethod
+    def filter_desde(desde: date) -> QuerySet[GastoCompraMensual]:
+        """Filas del resumen desde un mes dado."""
+        return GastoCompraMensual.objects.filter(mes__gte=desde)
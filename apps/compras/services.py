@@ -5,30 +5,37 @@ Contiene la lógica de negocio siguiendo el principio de
 Single Responsibility (SOLID). Las operaciones críticas
 usan transacciones atómicas para garantizar consistencia.
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
 from django.db import transaction
+from django.db.models import F, Sum, Case, When, Value, DecimalField
+from core.utils.business import generar_codigos_con_anio
+from django.utils import timezone
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
-from core.utils import validar_rut, format_rut, generar_codigo_unico
+from django.core.validators import validate_email
+from core.utils import (
+    validar_rut, format_rut, generar_codigo_unico, procesar_ruts, leer_filas_archivo, validar_largo_planilla
+)
 from .models import (
     Proveedor, EstadoOrdenCompra, OrdenCompra,
     DetalleOrdenCompra, DetalleOrdenCompraArticulo,
     EstadoRecepcion, RecepcionArticulo, DetalleRecepcionArticulo,
-    RecepcionActivo, DetalleRecepcionActivo
+    RecepcionActivo, DetalleRecepcionActivo, GastoCompraMensual
 )
 from .repositories import (
     ProveedorRepository, EstadoOrdenCompraRepository, OrdenCompraRepository,
     DetalleOrdenCompraRepository, DetalleOrdenCompraArticuloRepository,
     EstadoRecepcionRepository, RecepcionArticuloRepository,
     DetalleRecepcionArticuloRepository, RecepcionActivoRepository,
-    DetalleRecepcionActivoRepository
+    DetalleRecepcionActivoRepository, GastoCompraRepository
 )
-from apps.bodega.models import Bodega, Articulo
-from apps.bodega.repositories import ArticuloRepository, BodegaRepository
+from apps.bodega.models import Bodega, Articulo, Movimiento, TipoMovimiento
+from apps.bodega.repositories import ArticuloRepository, BodegaRepository, TipoMovimientoRepository
 from apps.activos.models import Activo
 from apps.activos.repositories import ActivoRepository
+from apps.solicitudes.repositories import DetalleSolicitudRepository
 
 
 # ==================== PROVEEDOR SERVICE ====================
@@ -156,11 +163,205 @@ class ProveedorService:
         proveedor.save()
 
 
+# ==================== IMPORTACIÓN PROVEEDORES SERVICE ====================
+
+class ImportacionProveedorService:
+    """
+    Service para la importación masiva de proveedores desde CSV o XLSX.
+
+    El archivo se recorre en streaming y se procesa por lotes: los RUTs de
+    cada lote se validan, normalizan y formatean en una sola pasada
+    (procesar_ruts) y los proveedores se insertan con bulk_create. Con
+    actualizar_existentes, los RUTs ya registrados se actualizan (upsert sobre
+    rut_normalizado) en vez de informarse como error.
+
+    Columnas: rut, razon_social, direccion (requeridas); comuna, ciudad,
+    telefono, email, sitio_web (opcionales).
+    """
+
+    TAMANO_LOTE = 2000
+    CAMPOS_ACTUALIZABLES = [
+        'razon_social', 'direccion', 'comuna', 'ciudad', 'telefono', 'email', 'sitio_web',
+        'fecha_actualizacion',
+    ]
+
+    @staticmethod
+    def _validar_largo(valor: Optional[str], campo: str, etiqueta: str) -> Optional[str]:
+        """Verifica que un texto no exceda el max_length del campo del modelo."""
+        if valor:
+            validar_largo_planilla(valor, Proveedor._meta.get_field(campo), etiqueta)
+        return valor
+
+    def _construir_proveedor(
+        self,
+        datos: Dict[str, str],
+        rut_procesado: Tuple[str, str, bool],
+        ruts_existentes: set,
+        ruts_archivo: set,
+        actualizar_existentes: bool
+    ) -> Proveedor:
+        """
+        Valida una fila y construye el proveedor (sin guardar).
+
+        Raises:
+            ValidationError: Si la fila no es válida
+        """
+        rut_normalizado, rut_formateado, rut_valido = rut_procesado
+        if not rut_normalizado:
+            raise ValidationError('El RUT es obligatorio.')
+        if not rut_valido:
+            raise ValidationError(f'RUT inválido: "{datos.get("rut", "")}".')
+        self._validar_largo(rut_formateado, 'rut', 'El RUT')
+        if rut_normalizado in ruts_archivo:
+            raise ValidationError(f'El RUT {rut_formateado} está repetido en el archivo.')
+        if rut_normalizado in ruts_existentes and not actualizar_existentes:
+            raise ValidationError(f'Ya existe un proveedor con el RUT {rut_formateado}.')
+
+        razon_social = datos.get('razon_social', '').strip()
+        direccion = datos.get('direccion', '').strip()
+        if not razon_social or not direccion:
+            raise ValidationError('La razón social y la dirección son obligatorias.')
+        self._validar_largo(razon_social, 'razon_social', 'La razón social')
+        self._validar_largo(direccion, 'direccion', 'La dirección')
+
+        email = datos.get('email', '').strip() or None
+        if email:
+            validate_email(email)
+        comuna = self._validar_largo(datos.get('comuna', '').strip() or None, 'comuna', 'La comuna')
+        ciudad = self._validar_largo(datos.get('ciudad', '').strip() or None, 'ciudad', 'La ciudad')
+        telefono = self._validar_largo(datos.get('telefono', '').strip() or None, 'telefono', 'El teléfono')
+        sitio_web = self._validar_largo(datos.get('sitio_web', '').strip() or None, 'sitio_web', 'El sitio web')
+
+        ruts_archivo.add(rut_normalizado)
+        # bulk_create no invoca save(): rut_normalizado se asigna explícitamente
+        return Proveedor(
+            rut=rut_formateado,
+            rut_normalizado=rut_normalizado,
+            razon_social=razon_social,
+            direccion=direccion,
+            comuna=comuna,
+            ciudad=ciudad,
+            telefono=telefono,
+            email=email,
+            sitio_web=sitio_web,
+            fecha_actualizacion=timezone.now()
+        )
+
+    def _procesar_lote(
+        self,
+        filas: List[Tuple[int, Dict[str, str]]],
+        ruts_existentes: set,
+        ruts_archivo: set,
+        reporte: Dict[str, Any],
+        dry_run: bool,
+        actualizar_existentes: bool
+    ) -> None:
+        """Valida un lote de filas y guarda los proveedores válidos."""
+        nuevos: List[Proveedor] = []
+        existentes: List[Proveedor] = []
+        ruts = procesar_ruts(datos.get('rut', '') for _, datos in filas)
+
+        for (numero_fila, datos), rut_procesado in zip(filas, ruts):
+            try:
+                proveedor = self._construir_proveedor(
+                    datos, rut_procesado, ruts_existentes, ruts_archivo, actualizar_existentes
+                )
+            except ValidationError as e:
+                reporte['errores'].append({
+                    'fila': numero_fila,
+                    'codigo': datos.get('rut', ''),
+                    'mensaje': ' '.join(e.messages)
+                })
+                continue
+
+            reporte['validas'] += 1
+            if proveedor.rut_normalizado in ruts_existentes:
+                existentes.append(proveedor)
+            else:
+                nuevos.append(proveedor)
+
+        if dry_run:
+            return
+
+        Proveedor.objects.bulk_create(nuevos)
+        reporte['creados'] += len(nuevos)
+        if existentes:
+            Proveedor.objects.bulk_create(
+                existentes,
+                update_conflicts=True,
+                unique_fields=['rut_normalizado'],
+                update_fields=self.CAMPOS_ACTUALIZABLES
+            )
+            reporte['actualizados'] += len(existentes)
+
+    def importar(
+        self,
+        archivo,
+        nombre_archivo: str,
+        dry_run: bool = False,
+        actualizar_existentes: bool = False,
+        tamano_lote: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Importa proveedores desde una planilla.
+
+        Las filas inválidas se omiten y se informan en el reporte; las válidas
+        se guardan por lotes dentro de una única transacción. Con dry_run
+        solo se valida, sin escribir en la base de datos.
+
+        Args:
+            archivo: Archivo binario CSV o XLSX
+            nombre_archivo: Nombre del archivo (determina el formato)
+            dry_run: Si True, solo valida y reporta
+            actualizar_existentes: Si True, actualiza los proveedores cuyo RUT ya existe
+            tamano_lote: Filas por lote (default: TAMANO_LOTE)
+
+        Returns:
+            Diccionario con total_filas, validas, creados, actualizados, errores y dry_run
+
+        Raises:
+            ValidationError: Si el formato del archivo no es soportado
+        """
+        tamano_lote = tamano_lote or self.TAMANO_LOTE
+        ruts_existentes = set(
+            Proveedor.all_objects.exclude(rut_normalizado__isnull=True)
+            .values_list('rut_normalizado', flat=True)
+        )
+        ruts_archivo: set = set()
+
+        reporte: Dict[str, Any] = {
+            'total_filas': 0, 'validas': 0, 'creados': 0, 'actualizados': 0,
+            'errores': [], 'dry_run': dry_run
+        }
+        lote: List[Tuple[int, Dict[str, str]]] = []
+
+        with transaction.atomic():
+            for fila in leer_filas_archivo(archivo, nombre_archivo):
+                reporte['total_filas'] += 1
+                lote.append(fila)
+                if len(lote) >= tamano_lote:
+                    self._procesar_lote(
+                        lote, ruts_existentes, ruts_archivo, reporte, dry_run, actualizar_existentes
+                    )
+                    lote = []
+
+            if lote:
+                self._procesar_lote(
+                    lote, ruts_existentes, ruts_archivo, reporte, dry_run, actualizar_existentes
+                )
+
+        return reporte
+
+
 # ==================== ORDEN COMPRA SERVICE ====================
 
 class OrdenCompraService:
     """Service para lógica de negocio de Órdenes de Compra."""
 
+    # 19% IVA Chile
+    TASA_IMPUESTO = Decimal('0.19')
+    CAMPOS_TOTALES = ['subtotal', 'impuesto', 'total', 'fecha_actualizacion']
+
     def __init__(self):
         self.orden_repo = OrdenCompraRepository()
         self.estado_repo = EstadoOrdenCompraRepository()
@@ -170,7 +371,7 @@ class OrdenCompraService:
     def calcular_totales(
         self,
         subtotal: Decimal,
-        tasa_impuesto: Decimal = Decimal('0.19'),  # 19% IVA Chile
+        tasa_impuesto: Decimal = TASA_IMPUESTO,
         descuento: Decimal = Decimal('0')
     ) -> Dict[str, Decimal]:
         """
@@ -289,6 +490,9 @@ class OrdenCompraService:
         orden.estado = nuevo_estado
         orden.save()
 
+        # El estado determina si la orden cuenta en el resumen de gasto
+        GastoCompraService().refrescar_orden(orden)
+
         return orden
 
     @transaction.atomic
@@ -296,36 +500,399 @@ class OrdenCompraService:
         """
         Recalcula los totales de una orden basándose en sus detalles.
 
+        La suma de subtotales se resuelve en la base de datos (SUM agregado),
+        sin cargar los detalles de la orden.
+
         Args:
             orden: Orden de compra
 
         Returns:
             OrdenCompra: Orden actualizada
         """
-        # Sumar subtotales de detalles de activos
-        detalle_repo = DetalleOrdenCompraRepository()
-        detalles_activos = detalle_repo.filter_by_orden(orden)
-        subtotal_activos = sum(d.subtotal for d in detalles_activos)
+        self.orden_repo.recalcular_totales([orden.pk], self.TASA_IMPUESTO)
+        orden.refresh_from_db(fields=self.CAMPOS_TOTALES)
+        return orden
 
-        # Sumar subtotales de detalles de artículos
-        detalle_articulo_repo = DetalleOrdenCompraArticuloRepository()
-        detalles_articulos = detalle_articulo_repo.filter_by_orden(orden)
-        subtotal_articulos = sum(d.subtotal for d in detalles_articulos)
+    def recalcular_totales_masivo(self, orden_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recalcula desde los detalles los totales de varias órdenes (reparación).
 
-        # Subtotal total
-        subtotal_total = subtotal_activos + subtotal_articulos
+        Args:
+            orden_ids: IDs de las órdenes (None = todas)
 
-        # Calcular totales
-        totales = self.calcular_totales(subtotal_total, descuento=orden.descuento)
+        Returns:
+            Cantidad de órdenes actualizadas
+        """
+        return self.orden_repo.recalcular_totales(orden_ids, self.TASA_IMPUESTO)
 
-        # Actualizar orden
-        orden.subtotal = totales['subtotal']
-        orden.impuesto = totales['impuesto']
-        orden.total = totales['total']
-        orden.save()
+    def registrar_cambio_linea(
+        self,
+        orden: OrdenCompra,
+        subtotal_anterior: Decimal,
+        subtotal_nuevo: Decimal
+    ) -> OrdenCompra:
+        """
+        Aplica a los totales de la orden el cambio de subtotal de una línea.
+
+        Para agregar una línea se usa subtotal_anterior=0; para eliminarla,
+        subtotal_nuevo=0. Evita recargar y sumar todos los detalles de la orden.
 
+        Args:
+            orden: Orden de compra
+            subtotal_anterior: Subtotal de la línea antes del cambio
+            subtotal_nuevo: Subtotal de la línea después del cambio
+
+        Returns:
+            OrdenCompra: Orden con los totales actualizados
+        """
+        delta = (subtotal_nuevo or Decimal('0')) - (subtotal_anterior or Decimal('0'))
+        if delta:
+            self.orden_repo.ajustar_totales(orden.pk, delta, self.TASA_IMPUESTO)
+            orden.refresh_from_db(fields=self.CAMPOS_TOTALES)
+            GastoCompraService().refrescar_orden(orden)
         return orden
 
+    @transaction.atomic
+    def actualizar_detalle(self, detalle, **campos: Any):
+        """
+        Actualiza una línea de la orden (activo o artículo) y ajusta los totales.
+
+        Args:
+            detalle: DetalleOrdenCompra o DetalleOrdenCompraArticulo
+            **campos: Campos a modificar (cantidad, precio_unitario, descuento, observaciones)
+
+        Returns:
+            Detalle actualizado
+        """
+        subtotal_anterior = detalle.subtotal
+        for campo, valor in campos.items():
+            setattr(detalle, campo, valor)
+        detalle.save()
+        self.registrar_cambio_linea(detalle.orden_compra, subtotal_anterior, detalle.subtotal)
+        return detalle
+
+    @transaction.atomic
+    def eliminar_detalle(self, detalle) -> None:
+        """
+        Elimina lógicamente una línea de la orden y descuenta su subtotal.
+
+        Args:
+            detalle: DetalleOrdenCompra o DetalleOrdenCompraArticulo
+        """
+        if type(detalle).all_objects.filter(pk=detalle.pk).eliminar_logicamente():
+            self.registrar_cambio_linea(detalle.orden_compra, detalle.subtotal, Decimal('0'))
+
+
+# ==================== CONSOLIDACIÓN DE COMPRAS SERVICE ====================
+
+class ConsolidacionCompraService:
+    """
+    Service para generar órdenes de compra desde solicitudes aprobadas.
+
+    Consolida la demanda aprobada de muchas solicitudes por artículo/activo
+    con una consulta agrupada, opcionalmente la separa por proveedor habitual
+    y crea órdenes y líneas con bulk_create. Los totales se calculan en la
+    base de datos.
+    """
+
+    TAMANO_LOTE = 500
+
+    def __init__(self):
+        self.orden_repo = OrdenCompraRepository()
+        self.estado_repo = EstadoOrdenCompraRepository()
+        self.detalle_repo = DetalleOrdenCompraRepository()
+        self.detalle_articulo_repo = DetalleOrdenCompraArticuloRepository()
+        self.detalle_solicitud_repo = DetalleSolicitudRepository()
+
+    def _agrupar_por_proveedor(
+        self,
+        demanda: List[Dict[str, Any]],
+        proveedor: Proveedor,
+        separar_por_proveedor: bool
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Asigna cada línea de demanda a un proveedor.
+
+        Con separar_por_proveedor, cada item va al proveedor de su última compra
+        (si sigue activo); el resto queda en el proveedor indicado.
+
+        Returns:
+            Diccionario {proveedor_id: líneas}, con el proveedor indicado primero
+        """
+        grupos: Dict[int, List[Dict[str, Any]]] = {proveedor.pk: []}
+        habituales_articulos: Dict[int, int] = {}
+        habituales_activos: Dict[int, int] = {}
+
+        if separar_por_proveedor:
+            habituales_articulos = self.detalle_articulo_repo.proveedores_habituales(
+                [linea['articulo_id'] for linea in demanda if linea['articulo_id']]
+            )
+            habituales_activos = self.detalle_repo.proveedores_habituales(
+                [linea['activo_id'] for linea in demanda if linea['activo_id']]
+            )
+            activos = set(Proveedor.objects.filter(
+                pk__in=set(habituales_articulos.values()) | set(habituales_activos.values()),
+                activo=True
+            ).values_list('pk', flat=True))
+            habituales_articulos = {k: v for k, v in habituales_articulos.items() if v in activos}
+            habituales_activos = {k: v for k, v in habituales_activos.items() if v in activos}
+
+        for linea in demanda:
+            if linea['articulo_id']:
+                proveedor_id = habituales_articulos.get(linea['articulo_id'], proveedor.pk)
+            else:
+                proveedor_id = habituales_activos.get(linea['activo_id'], proveedor.pk)
+            grupos.setdefault(proveedor_id, []).append(linea)
+        return grupos
+
+    @transaction.atomic
+    def generar_ordenes(
+        self,
+        solicitudes: Iterable,
+        proveedor: Proveedor,
+        bodega_destino: Bodega,
+        solicitante: User,
+        fecha_orden: date,
+        separar_por_proveedor: bool = False,
+        orden_base: Optional[OrdenCompra] = None,
+        **kwargs: Any
+    ) -> List[OrdenCompra]:
+        """
+        Genera órdenes de compra con la demanda aprobada consolidada de las solicitudes.
+
+        Las cantidades aprobadas se suman por artículo/activo. Los artículos no
+        tienen precio de referencia (precio 0); los activos usan su precio_unitario.
+        Cada orden nueva queda asociada a todas las solicitudes consolidadas.
+
+        Args:
+            solicitudes: Solicitudes (o sus IDs) a consolidar
+            proveedor: Proveedor por defecto
+            bodega_destino: Bodega de destino
+            solicitante: Usuario solicitante
+            fecha_orden: Fecha de las órdenes
+            separar_por_proveedor: Si genera una orden por proveedor habitual del item
+            orden_base: Orden ya creada que recibe las líneas del proveedor por defecto
+            **kwargs: estado, fecha_entrega_esperada, observaciones
+
+        Returns:
+            Lista de órdenes generadas (incluida orden_base, si se indicó)
+
+        Raises:
+            ValidationError: Si no hay estado inicial configurado
+        """
+        solicitud_ids = [getattr(solicitud, 'pk', solicitud) for solicitud in solicitudes]
+        demanda = list(self.detalle_solicitud_repo.demanda_aprobada(solicitud_ids))
+        if not demanda:
+            return [orden_base] if orden_base else []
+
+        if orden_base:
+            proveedor = orden_base.proveedor
+        grupos = self._agrupar_por_proveedor(demanda, proveedor, separar_por_proveedor)
+
+        # Órdenes: la orden base (si existe) toma el proveedor por defecto
+        ordenes: Dict[int, OrdenCompra] = {}
+        if orden_base:
+            ordenes[proveedor.pk] = orden_base
+        proveedores_nuevos = [
+            proveedor_id for proveedor_id, lineas in grupos.items()
+            if lineas and proveedor_id not in ordenes
+        ]
+
+        if proveedores_nuevos:
+            estado = kwargs.get('estado') or (orden_base.estado if orden_base else self.estado_repo.get_inicial())
+            if not estado:
+                raise ValidationError('No se ha configurado un estado inicial para órdenes de compra')
+
+            numeros = generar_codigos_con_anio('OC', OrdenCompra, len(proveedores_nuevos), 'numero', longitud=6)
+            nuevas = OrdenCompra.objects.bulk_create([
+                OrdenCompra(
+                    numero=numero,
+                    fecha_orden=fecha_orden,
+                    proveedor_id=proveedor_id,
+                    bodega_destino=bodega_destino,
+                    estado=estado,
+                    solicitante=solicitante,
+                    fecha_entrega_esperada=kwargs.get('fecha_entrega_esperada'),
+                    subtotal=Decimal('0'),
+                    impuesto=Decimal('0'),
+                    descuento=Decimal('0'),
+                    total=Decimal('0'),
+                    observaciones=kwargs.get('observaciones', '')
+                )
+                for numero, proveedor_id in zip(numeros, proveedores_nuevos)
+            ])
+            ordenes.update(zip(proveedores_nuevos, nuevas))
+
+            relacion = OrdenCompra.solicitudes.through
+            relacion.objects.bulk_create([
+                relacion(ordencompra_id=orden.pk, solicitud_id=solicitud_id)
+                for orden in nuevas
+                for solicitud_id in solicitud_ids
+            ], ignore_conflicts=True)
+
+        # Líneas (bulk_create no ejecuta save(): el subtotal se calcula aquí)
+        detalles_articulos = []
+        detalles_activos = []
+        for proveedor_id, lineas in grupos.items():
+            for linea in lineas:
+                orden = ordenes[proveedor_id]
+                if linea['articulo_id']:
+                    detalles_articulos.append(DetalleOrdenCompraArticulo(
+                        orden_compra=orden,
+                        articulo_id=linea['articulo_id'],
+                        cantidad=linea['cantidad'],
+                        precio_unitario=Decimal('0'),
+                        descuento=Decimal('0'),
+                        subtotal=Decimal('0')
+                    ))
+                else:
+                    precio = linea['precio_unitario'] or Decimal('0')
+                    detalles_activos.append(DetalleOrdenCompra(
+                        orden_compra=orden,
+                        activo_id=linea['activo_id'],
+                        cantidad=linea['cantidad'],
+                        precio_unitario=precio,
+                        descuento=Decimal('0'),
+                        subtotal=linea['cantidad'] * precio
+                    ))
+
+        DetalleOrdenCompraArticulo.objects.bulk_create(detalles_articulos, batch_size=self.TAMANO_LOTE)
+        DetalleOrdenCompra.objects.bulk_create(detalles_activos, batch_size=self.TAMANO_LOTE)
+
+        orden_ids = [orden.pk for orden in ordenes.values()]
+        self.orden_repo.recalcular_totales(orden_ids, OrdenCompraService.TASA_IMPUESTO)
+        GastoCompraService().refrescar(GastoCompraService.clave_orden(orden) for orden in ordenes.values())
+        return list(
+            OrdenCompra.objects.filter(pk__in=orden_ids).select_related('proveedor').order_by('numero')
+        )
+
+
+# ==================== ANALÍTICA DE GASTO SERVICE ====================
+
+class GastoCompraService:
+    """
+    Service para el resumen precalculado de gasto en compras (GastoCompraMensual).
+
+    Cada cambio en una orden recalcula solo las filas de su (proveedor, mes):
+    se eliminan y se reinsertan con bulk_create a partir de dos consultas
+    agrupadas acotadas a esas órdenes. Los dashboards leen las filas ya calculadas.
+    """
+
+    def __init__(self):
+        self.gasto_repo = GastoCompraRepository()
+
+    @staticmethod
+    def clave_orden(orden: OrdenCompra):
+        """Clave (proveedor_id, mes) de una orden."""
+        return orden.proveedor_id, orden.fecha_orden.replace(day=1)
+
+    def _construir_filas(self, ordenes) -> List[GastoCompraMensual]:
+        """Calcula las filas del resumen para un conjunto de órdenes."""
+        filas: Dict[tuple, GastoCompraMensual] = {}
+        for dato in self.gasto_repo.montos_agrupados(ordenes):
+            es_articulo = dato['tipo_item'] == GastoCompraMensual.TIPO_ARTICULO
+            clave = (dato['tipo_item'], dato['proveedor_ref'], dato['mes'], dato['categoria_ref'])
+            filas[clave] = GastoCompraMensual(
+                proveedor_id=dato['proveedor_ref'],
+                mes=dato['mes'],
+                tipo_item=dato['tipo_item'],
+                categoria_id=dato['categoria_ref'] if es_articulo else None,
+                categoria_activo_id=None if es_articulo else dato['categoria_ref'],
+                monto=dato['monto'] or Decimal('0'),
+                cantidad_lineas=dato['cantidad_lineas'],
+                cantidad_ordenes=dato['cantidad_ordenes']
+            )
+
+        for entrega in self.gasto_repo.entregas_por_orden(ordenes):
+            fila = filas.get((entrega['tipo_item'], entrega['proveedor_ref'], entrega['mes'], entrega['categoria_ref']))
+            if fila is None:
+                continue
+            fila.ordenes_entregadas += 1
+            fila.dias_entrega_total += (entrega['fecha_entrega_real'] - entrega['fecha_orden']).days
+            if entrega['fecha_entrega_esperada']:
+                fila.ordenes_con_plazo += 1
+                fila.dias_atraso_total += (entrega['fecha_entrega_real'] - entrega['fecha_entrega_esperada']).days
+
+        return list(filas.values())
+
+    @transaction.atomic
+    def refrescar(self, claves: Optional[Iterable] = None) -> int:
+        """
+        Recalcula las filas del resumen para las claves (proveedor_id, mes) indicadas.
+
+        Args:
+            claves: Claves a recalcular (None = reconstrucción completa)
+
+        Returns:
+            Cantidad de filas generadas
+        """
+        if claves is not None:
+            claves = set(claves)
+            if not claves:
+                return 0
+
+        self.gasto_repo.eliminar(claves)
+        filas = self._construir_filas(self.gasto_repo.ordenes_computables(claves))
+        GastoCompraMensual.objects.bulk_create(filas, batch_size=1000)
+        return len(filas)
+
+    def refrescar_orden(self, orden: OrdenCompra, claves_anteriores: Iterable = ()) -> int:
+        """
+        Recalcula el resumen afectado por el cambio de una orden.
+
+        Args:
+            orden: Orden modificada
+            claves_anteriores: Claves (proveedor_id, mes) previas, si la orden
+                cambió de proveedor o de fecha
+
+        Returns:
+            Cantidad de filas generadas
+        """
+        return self.refrescar({self.clave_orden(orden), *claves_anteriores})
+
+    def resumen(self, meses: int = 12, limite: int = 5) -> Dict[str, Any]:
+        """
+        Resumen de gasto de los últimos meses leído desde las filas precalculadas.
+
+        Args:
+            meses: Cantidad de meses hacia atrás (incluye el actual)
+            limite: Cantidad de proveedores/categorías en los rankings
+
+        Returns:
+            Dict con total, por_mes, top_proveedores, top_categorias,
+            plazo_entrega_promedio y atraso_promedio
+        """
+        desde = timezone.localdate().replace(day=1)
+        for _ in range(meses - 1):
+            desde = (desde - timedelta(days=1)).replace(day=1)
+        filas = self.gasto_repo.filter_desde(desde).order_by()
+
+        totales = filas.aggregate(
+            total=Sum('monto'),
+            ordenes_entregadas=Sum('ordenes_entregadas'),
+            dias_entrega=Sum('dias_entrega_total'),
+            ordenes_con_plazo=Sum('ordenes_con_plazo'),
+            dias_atraso=Sum('dias_atraso_total')
+        )
+
+        def promedio(dias, ordenes) -> Decimal:
+            return (Decimal(dias) / ordenes).quantize(Decimal('0.1')) if ordenes else Decimal('0')
+
+        return {
+            'desde': desde,
+            'total': totales['total'] or Decimal('0'),
+            'por_mes': list(filas.values('mes').annotate(monto=Sum('monto')).order_by('mes')),
+            'top_proveedores': list(
+                filas.values('proveedor__razon_social').annotate(monto=Sum('monto')).order_by('-monto')[:limite]
+            ),
+            'top_categorias': list(
+                filas.values('tipo_item', 'categoria__nombre', 'categoria_activo__nombre')
+                .annotate(monto=Sum('monto')).order_by('-monto')[:limite]
+            ),
+            'plazo_entrega_promedio': promedio(totales['dias_entrega'], totales['ordenes_entregadas']),
+            'atraso_promedio': promedio(totales['dias_atraso'], totales['ordenes_con_plazo']),
+        }
+
 
 # ==================== RECEPCIÓN SERVICE BASE (DRY) ====================
 
@@ -343,6 +910,7 @@ class RecepcionServiceBase:
     repository_class = None
     detalle_repository_class = None
     item_repository_class = None
+    detalle_orden_repository_class = None
 
     def __init__(self):
         if not self.repository_class or not self.detalle_repository_class:
@@ -352,6 +920,7 @@ class RecepcionServiceBase:
         self.detalle_repo = self.detalle_repository_class()
         self.estado_repo = EstadoRecepcionRepository()
         self.item_repo = self.item_repository_class() if self.item_repository_class else None
+        self.detalle_orden_repo = self.detalle_orden_repository_class()
 
     def _get_prefijo_numero(self) -> str:
         """Retorna el prefijo para generar el número de recepción."""
@@ -538,31 +1107,38 @@ class RecepcionServiceBase:
         """
         Actualiza la cantidad recibida en el detalle de la orden de compra.
 
-        Método genérico que funciona para artículos y activos.
+        Se resuelve con un único UPDATE sobre la línea del item (F()), sin
+        cargar los detalles de la orden. cantidad_pendiente es una columna
+        generada, por lo que se actualiza en la misma operación.
 
         Args:
             orden: Orden de compra
             item: Item recibido (Articulo o Activo)
             cantidad_adicional: Cantidad adicional recibida
         """
-        # Determinar qué repositorio usar basándose en el tipo de item
-        if hasattr(item, 'stock_actual'):  # Es un Artículo
-            from apps.compras.repositories import DetalleOrdenCompraArticuloRepository
-            detalle_orden_repo = DetalleOrdenCompraArticuloRepository()
-            detalles = detalle_orden_repo.filter_by_orden(orden)
-            campo_item = 'articulo'
-        else:  # Es un Activo
-            from apps.compras.repositories import DetalleOrdenCompraRepository
-            detalle_orden_repo = DetalleOrdenCompraRepository()
-            detalles = detalle_orden_repo.filter_by_orden(orden)
-            campo_item = 'activo'
-
-        # Buscar el detalle del item
-        for detalle in detalles:
-            if getattr(detalle, campo_item).id == item.id:
-                detalle.cantidad_recibida += cantidad_adicional
-                detalle.save()
-                break
+        self.detalle_orden_repo.sumar_recibido(orden, item.id, cantidad_adicional)
+
+    @transaction.atomic
+    def conciliar_recepcion(self, recepcion) -> int:
+        """
+        Aplica a la orden de compra las cantidades de todos los detalles de la recepción.
+
+        Agrupa lo recibido por item y lo suma a las líneas de la orden con un
+        único UPDATE, para recepciones cuyos detalles se crean sin agregar_detalle().
+
+        Args:
+            recepcion: Recepción con orden de compra asociada
+
+        Returns:
+            Cantidad de líneas de la orden actualizadas
+        """
+        if not recepcion.orden_compra_id:
+            return 0
+
+        cantidades = self.detalle_repo.totales_por_item(recepcion)
+        if not cantidades:
+            return 0
+        return self.detalle_orden_repo.sumar_recibidos(recepcion.orden_compra, cantidades)
 
 
 # ==================== RECEPCIÓN ARTÍCULO SERVICE ====================
@@ -576,6 +1152,10 @@ class RecepcionArticuloService(RecepcionServiceBase):
     repository_class = RecepcionArticuloRepository
     detalle_repository_class = DetalleRecepcionArticuloRepository
     item_repository_class = ArticuloRepository
+    detalle_orden_repository_class = DetalleOrdenCompraArticuloRepository
+
+    # Tipo de movimiento usado al confirmar la recepción
+    CODIGO_TIPO_MOVIMIENTO = 'RECEPCION'
 
     def _get_prefijo_numero(self) -> str:
         """Retorna el prefijo para el número de recepción de artículos."""
@@ -732,6 +1312,93 @@ class RecepcionArticuloService(RecepcionServiceBase):
         kwargs['actualizar_stock'] = actualizar_stock
         return super().agregar_detalle(recepcion, articulo, cantidad, **kwargs)
 
+    def _get_tipo_movimiento_recepcion(self) -> Optional[TipoMovimiento]:
+        """
+        Obtiene el tipo de movimiento para recepciones.
+
+        Usa el tipo 'RECEPCION' y, si no existe, el primer tipo activo.
+        """
+        tipo_movimiento = TipoMovimientoRepository.get_by_codigo(self.CODIGO_TIPO_MOVIMIENTO)
+        if not tipo_movimiento:
+            tipo_movimiento = TipoMovimiento.objects.filter(activo=True).first()
+        return tipo_movimiento
+
+    @transaction.atomic
+    def confirmar_recepcion(self, recepcion: RecepcionArticulo, usuario: User) -> int:
+        """
+        Ingresa al stock los artículos de la recepción y registra sus movimientos.
+
+        Bloquea todos los artículos involucrados con un único select_for_update
+        (ordenado por id para evitar deadlocks), calcula el stock antes/después
+        de cada línea en memoria, registra los movimientos con bulk_create y
+        suma las cantidades con un único UPDATE (F() + Case/When).
+
+        Args:
+            recepcion: Recepción confirmada
+            usuario: Usuario que confirma
+
+        Returns:
+            Cantidad de artículos cuyo stock se actualizó
+
+        Raises:
+            ValidationError: Si alguna línea corresponde a un artículo eliminado
+        """
+        detalles = list(
+            recepcion.detalles.filter(eliminado=False)
+            .order_by('id')
+            .values_list('articulo_id', 'cantidad')
+        )
+        if not detalles:
+            return 0
+
+        articulo_ids = {articulo_id for articulo_id, _ in detalles}
+        stock_por_articulo = dict(
+            Articulo.objects.select_for_update()
+            .filter(id__in=articulo_ids)
+            .order_by('id')
+            .values_list('id', 'stock_actual')
+        )
+        eliminados = articulo_ids - stock_por_articulo.keys()
+        if eliminados:
+            codigos = Articulo.all_objects.filter(id__in=eliminados).order_by('codigo').values_list('codigo', flat=True)
+            raise ValidationError(
+                f'La recepción incluye artículos eliminados: {", ".join(codigos)}. '
+                'Quite esas líneas o restaure los artículos antes de confirmar.'
+            )
+
+        tipo_movimiento = self._get_tipo_movimiento_recepcion()
+        motivo = f'Recepción {recepcion.numero}'
+        movimientos = []
+        totales: Dict[int, Decimal] = {}
+        for articulo_id, cantidad in detalles:
+            stock_anterior = stock_por_articulo[articulo_id]
+            stock_por_articulo[articulo_id] = stock_anterior + cantidad
+            totales[articulo_id] = totales.get(articulo_id, Decimal('0')) + cantidad
+
+            if tipo_movimiento:
+                movimientos.append(Movimiento(
+                    articulo_id=articulo_id,
+                    tipo=tipo_movimiento,
+                    cantidad=cantidad,
+                    operacion='ENTRADA',
+                    usuario=usuario,
+                    motivo=motivo,
+                    stock_antes=stock_anterior,
+                    stock_despues=stock_por_articulo[articulo_id]
+                ))
+
+        Movimiento.objects.bulk_create(movimientos)
+
+        campo_decimal = DecimalField(max_digits=10, decimal_places=2)
+        return Articulo.objects.filter(id__in=totales).update(
+            stock_actual=F('stock_actual') + Case(
+                *[When(id=articulo_id, then=Value(total, output_field=campo_decimal))
+                  for articulo_id, total in totales.items()],
+                output_field=campo_decimal
+            ),
+            fecha_actualizacion=timezone.now()
+        )
+
 
 # ==================== RECEPCIÓN ACTIVO SERVICE ====================
 
@@ -744,6 +1411,7 @@ class RecepcionActivoService(RecepcionServiceBase):
     repository_class = RecepcionActivoRepository
     detalle_repository_class = DetalleRecepcionActivoRepository
     item_repository_class = ActivoRepository
+    detalle_orden_repository_class = DetalleOrdenCompraRepository
 
     def _get_prefijo_numero(self) -> str:
         """Retorna el prefijo para el número de recepción de activos."""
@@ -9,8 +9,8 @@ from apps.compras.models import (
     EstadoOrdenCompra, EstadoRecepcion, TipoRecepcion,
     Proveedor, OrdenCompra, RecepcionArticulo, RecepcionActivo
 )
-from apps.bodega.models import Bodega, Categoria as CategoriaBodega, Articulo
-from apps.activos.models import CategoriaActivo, Activo, UnidadMedida, EstadoActivo
+from apps.bodega.models import Bodega, Categoria as CategoriaBodega, Articulo, UnidadMedida
+from apps.activos.models import CategoriaActivo, Activo, EstadoActivo
 
 
 # ==================== FIXTURES DE USUARIOS ====================
@@ -406,3 +406,58 @@ def estados_recepcion_completos(db):
         ),
     }
     return estados
+
+
+# ==================== FIXTURES DE FLUJO DE STOCK ====================
+
+@pytest.fixture
+def bodega_stock(db, usuario_test):
+    """Crea la bodega de destino para los flujos de stock."""
+    return Bodega.objects.create(codigo='BOD-STK', nombre='Bodega Stock', responsable=usuario_test)
+
+
+@pytest.fixture
+def articulos_stock(db, bodega_stock):
+    """Crea tres artículos sin stock en la bodega de flujo."""
+    categoria = CategoriaBodega.objects.create(codigo='CAT-STK', nombre='Insumos')
+    return [
+        Articulo.objects.create(
+            codigo=f'STK-{i}',
+            nombre=f'Insumo {i}',
+            categoria=categoria,
+            ubicacion_fisica=bodega_stock,
+            stock_actual=Decimal('0'),
+        )
+        for i in range(1, 4)
+    ]
+
+
+@pytest.fixture
+def estados_recepcion_stock(db):
+    """Crea los estados ABIERTA y COMPLETADA de recepción."""
+    return {
+        'abierta': EstadoRecepcion.objects.create(codigo='ABIERTA', nombre='Abierta'),
+        'completada': EstadoRecepcion.objects.create(codigo='COMPLETADA', nombre='Completada'),
+    }
+
+
+@pytest.fixture
+def tipo_movimiento_recepcion(db):
+    """Crea el tipo de movimiento RECEPCION de bodega."""
+    from apps.bodega.models import TipoMovimiento
+    return TipoMovimiento.objects.create(codigo='RECEPCION', nombre='Recepción')
+
+
+@pytest.fixture
+def orden_stock(db, usuario_test, bodega_stock):
+    """Crea una orden de compra pendiente con proveedor mínimo."""
+    proveedor = Proveedor.objects.create(rut='11111111-1', razon_social='Proveedor Stock', direccion='Calle 1')
+    estado = EstadoOrdenCompra.objects.create(codigo='PENDIENTE', nombre='Pendiente')
+    return OrdenCompra.objects.create(
+        numero='OC-STK-1',
+        fecha_orden=date.today(),
+        proveedor=proveedor,
+        bodega_destino=bodega_stock,
+        estado=estado,
+        solicitante=usuario_test,
+    )
@@ -15,8 +15,8 @@ from apps.compras.models import (
     RecepcionArticulo, DetalleRecepcionArticulo,
     RecepcionActivo, DetalleRecepcionActivo
 )
-from apps.bodega.models import Bodega, Categoria as CategoriaBodega, Articulo
-from apps.activos.models import CategoriaActivo, Activo, UnidadMedida, EstadoActivo
+from apps.bodega.models import Bodega, Categoria as CategoriaBodega, Articulo, UnidadMedida
+from apps.activos.models import CategoriaActivo, Activo, EstadoActivo
 
 
 # ==================== FACTORIES DE USUARIOS ====================
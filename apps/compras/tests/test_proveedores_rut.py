@@ -0,0 +1,94 @@
+"""
+Tests de la búsqueda y unicidad de proveedores por RUT normalizado.
+
+Los proveedores se crean directamente (sin ProveedorFactory) para controlar
+el formato exacto del RUT almacenado.
+"""
+import pytest
+from apps.compras.forms import ProveedorForm
+from apps.compras.models import Proveedor
+from apps.compras.repositories import ProveedorRepository
+
+
+@pytest.fixture
+def proveedor(db):
+    """Proveedor registrado con el RUT formateado con puntos."""
+    return Proveedor.objects.create(rut='12.345.678-5', razon_social='Librería Central', direccion='Calle 1')
+
+
+@pytest.fixture
+def proveedor_eliminado(db):
+    """Proveedor eliminado lógicamente, con DV 'K' registrado sin formato."""
+    return Proveedor.objects.create(
+        rut='6-k', razon_social='Distribuidora Antigua', direccion='Calle 2', eliminado=True
+    )
+
+
+def _datos_formulario(rut: str) -> dict:
+    """Datos mínimos válidos de ProveedorForm con el RUT dado."""
+    return {'rut': rut, 'razon_social': 'Proveedor Nuevo', 'direccion': 'Calle 3', 'activo': True}
+
+
+# ==================== TESTS DE PROVEEDOR REPOSITORY ====================
+
+@pytest.mark.django_db
+class TestProveedorRepositoryRut:
+    """Tests de get_by_rut, exists_by_rut y search con RUTs en distintos formatos."""
+
+    @pytest.mark.parametrize('rut', ['12.345.678-5', '12345678-5', '123456785', '012.345.678-5', ' 12 345 678 5 '])
+    def test_get_by_rut_ignora_el_formato(self, proveedor, rut):
+        """El mismo RUT con o sin puntos, guion, espacios o ceros a la izquierda ubica al proveedor."""
+        assert ProveedorRepository.get_by_rut(rut) == proveedor
+
+    def test_get_by_rut_excluye_eliminados_y_vacios(self, proveedor_eliminado):
+        """get_by_rut no retorna proveedores eliminados ni acepta un RUT vacío."""
+        assert ProveedorRepository.get_by_rut('6-K') is None
+        assert ProveedorRepository.get_by_rut('') is None
+
+    @pytest.mark.parametrize('rut', ['6-K', '6k', '0000006-K'])
+    def test_exists_by_rut_incluye_eliminados(self, proveedor_eliminado, rut):
+        """Un proveedor eliminado sigue reservando su RUT (en cualquier formato y DV en minúscula)."""
+        assert ProveedorRepository.exists_by_rut(rut)
+
+    def test_exists_by_rut_excluye_al_propio_proveedor(self, proveedor):
+        """Al editar, el RUT del propio proveedor no cuenta como duplicado."""
+        assert ProveedorRepository.exists_by_rut('12345678-5')
+        assert not ProveedorRepository.exists_by_rut('12345678-5', exclude_id=proveedor.pk)
+
+    def test_search_por_rut_exacto_o_razon_social(self, proveedor, proveedor_eliminado):
+        """
+        GIVEN: Un proveedor vigente y uno eliminado
+        WHEN: Se busca por RUT en otro formato, por RUT parcial o por razón social
+        THEN: El RUT se compara por igualdad y los eliminados no aparecen
+        """
+        assert list(ProveedorRepository.search('12345678-5')) == [proveedor]
+        assert list(ProveedorRepository.search('12.345')) == []
+        assert list(ProveedorRepository.search('central')) == [proveedor]
+        assert list(ProveedorRepository.search('6-k')) == []
+
+
+# ==================== TESTS DE PROVEEDOR FORM ====================
+
+@pytest.mark.django_db
+class TestProveedorFormRut:
+    """Tests de ProveedorForm.clean_rut."""
+
+    def test_rechaza_rut_duplicado_en_otro_formato(self, proveedor):
+        """Un RUT ya registrado con puntos se rechaza aunque se ingrese sin formato."""
+        formulario = ProveedorForm(data=_datos_formulario('123456785'))
+
+        assert not formulario.is_valid()
+        assert 'rut' in formulario.errors
+
+    def test_rechaza_rut_de_proveedor_eliminado(self, proveedor_eliminado):
+        """El RUT de un proveedor eliminado lógicamente no puede reutilizarse."""
+        formulario = ProveedorForm(data=_datos_formulario('6-K'))
+
+        assert not formulario.is_valid()
+        assert 'rut' in formulario.errors
+
+    def test_permite_conservar_el_rut_al_editar(self, proveedor):
+        """Editar un proveedor sin cambiar el RUT (en otro formato) es válido."""
+        formulario = ProveedorForm(data=_datos_formulario('12345678-5'), instance=proveedor)
+
+        assert formulario.is_valid(), formulario.errors
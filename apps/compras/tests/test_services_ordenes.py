@@ -0,0 +1,225 @@
+"""
+Tests de consolidación de demanda y totales de órdenes de compra.
+
+Usan los fixtures de flujo de stock de conftest.py.
+"""
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from apps.compras.models import (
+    Proveedor, OrdenCompra, DetalleOrdenCompraArticulo, EstadoOrdenCompra, GastoCompraMensual
+)
+from apps.compras.services import ConsolidacionCompraService, OrdenCompraService, GastoCompraService
+from apps.solicitudes.models import Solicitud, DetalleSolicitud, TipoSolicitud, EstadoSolicitud
+
+
+def _crear_solicitud_aprobada(usuario, bodega, numero, lineas):
+    """Crea una solicitud APROBADA con las líneas (articulo, cantidad) dadas."""
+    tipo, _ = TipoSolicitud.all_objects.get_or_create(codigo='ARTICULOS', defaults={'nombre': 'Artículos'})
+    estado, _ = EstadoSolicitud.all_objects.get_or_create(codigo='APROBADA', defaults={'nombre': 'Aprobada'})
+    solicitud = Solicitud.objects.create(
+        numero=numero, tipo_solicitud=tipo, estado=estado, solicitante=usuario,
+        bodega_origen=bodega, motivo='Reposición', fecha_requerida=date.today()
+    )
+    for articulo, cantidad in lineas:
+        DetalleSolicitud.objects.create(
+            solicitud=solicitud, articulo=articulo,
+            cantidad_solicitada=Decimal(cantidad), cantidad_aprobada=Decimal(cantidad)
+        )
+    return solicitud
+
+
+# ==================== TESTS DE CONSOLIDACIÓN ====================
+
+@pytest.mark.django_db
+class TestConsolidacionCompraService:
+    """Tests de ConsolidacionCompraService.generar_ordenes."""
+
+    def test_consolida_por_articulo_y_proveedor_habitual(self, usuario_test, bodega_stock, articulos_stock, orden_stock):
+        """
+        GIVEN dos solicitudes aprobadas y un artículo comprado antes a otro proveedor
+        WHEN se generan órdenes separando por proveedor
+        THEN las cantidades se suman por artículo y cada proveedor recibe su orden
+        """
+        a1, a2, a3 = articulos_stock
+        proveedor = orden_stock.proveedor
+        habitual = Proveedor.objects.create(rut='22222222-2', razon_social='Proveedor Habitual', direccion='Calle 2')
+        anterior = OrdenCompra.objects.create(
+            numero='OC-STK-0', fecha_orden=date.today(), proveedor=habitual,
+            bodega_destino=bodega_stock, estado=orden_stock.estado, solicitante=usuario_test
+        )
+        DetalleOrdenCompraArticulo.objects.create(
+            orden_compra=anterior, articulo=a2, cantidad=Decimal('1'), precio_unitario=Decimal('10')
+        )
+        s1 = _crear_solicitud_aprobada(usuario_test, bodega_stock, 'SOL-1', [(a1, '2'), (a2, '3')])
+        s2 = _crear_solicitud_aprobada(usuario_test, bodega_stock, 'SOL-2', [(a1, '4'), (a3, '1')])
+
+        ordenes = ConsolidacionCompraService().generar_ordenes(
+            [s1, s2], proveedor, bodega_stock, usuario_test, date.today(), separar_por_proveedor=True
+        )
+
+        assert len(ordenes) == 2
+        por_proveedor = {orden.proveedor_id: orden for orden in ordenes}
+        lineas = dict(
+            por_proveedor[proveedor.pk].detalles_articulos.values_list('articulo_id', 'cantidad')
+        )
+        assert lineas == {a1.pk: Decimal('6'), a3.pk: Decimal('1')}
+        lineas_habitual = dict(
+            por_proveedor[habitual.pk].detalles_articulos.values_list('articulo_id', 'cantidad')
+        )
+        assert lineas_habitual == {a2.pk: Decimal('3')}
+        assert por_proveedor[habitual.pk].solicitudes.count() == 2
+
+    def test_sin_demanda_no_genera_ordenes(self, usuario_test, bodega_stock, orden_stock):
+        """
+        GIVEN una solicitud sin líneas aprobadas
+        WHEN se generan órdenes
+        THEN no se crea ninguna orden
+        """
+        solicitud = _crear_solicitud_aprobada(usuario_test, bodega_stock, 'SOL-3', [])
+
+        ordenes = ConsolidacionCompraService().generar_ordenes(
+            [solicitud], orden_stock.proveedor, bodega_stock, usuario_test, date.today()
+        )
+
+        assert ordenes == []
+        assert OrdenCompra.objects.count() == 1
+
+
+# ==================== TESTS DE TOTALES INCREMENTALES ====================
+
+@pytest.mark.django_db
+class TestTotalesIncrementalesOrden:
+    """Tests de los totales de la orden mantenidos por delta de línea."""
+
+    def _agregar_linea(self, service, orden, articulo, cantidad, precio):
+        detalle = DetalleOrdenCompraArticulo.objects.create(
+            orden_compra=orden, articulo=articulo, cantidad=Decimal(cantidad), precio_unitario=Decimal(precio)
+        )
+        service.registrar_cambio_linea(orden, Decimal('0'), detalle.subtotal)
+        return detalle
+
+    def _totales(self, orden):
+        orden.refresh_from_db()
+        return orden.subtotal, orden.impuesto, orden.total
+
+    def test_deltas_coinciden_con_recalculo(self, orden_stock, articulos_stock):
+        """
+        GIVEN una orden con líneas agregadas, modificadas y eliminadas
+        WHEN se aplican los deltas de cada cambio
+        THEN los totales coinciden con un recálculo completo
+        """
+        service = OrdenCompraService()
+        d1 = self._agregar_linea(service, orden_stock, articulos_stock[0], '2', '100')
+        d2 = self._agregar_linea(service, orden_stock, articulos_stock[1], '1', '50')
+        assert self._totales(orden_stock) == (Decimal('250'), Decimal('47.50'), Decimal('297.50'))
+
+        service.actualizar_detalle(d1, cantidad=Decimal('3'))
+        service.eliminar_detalle(d2)
+        incrementales = self._totales(orden_stock)
+
+        assert incrementales == (Decimal('300'), Decimal('57.00'), Decimal('357.00'))
+        service.recalcular_totales(orden_stock)
+        assert self._totales(orden_stock) == incrementales
+
+    def test_recalcular_totales_masivo_repara_desvios(self, orden_stock, articulos_stock):
+        """
+        GIVEN una orden cuyos totales almacenados quedaron desfasados
+        WHEN se recalculan masivamente
+        THEN vuelven a reflejar las líneas con descuento
+        """
+        service = OrdenCompraService()
+        self._agregar_linea(service, orden_stock, articulos_stock[0], '2', '100')
+        DetalleOrdenCompraArticulo.objects.create(
+            orden_compra=orden_stock, articulo=articulos_stock[1], cantidad=Decimal('1'),
+            precio_unitario=Decimal('50'), descuento=Decimal('10')
+        )
+        OrdenCompra.objects.filter(pk=orden_stock.pk).update(subtotal=0, impuesto=0, total=0)
+
+        service.recalcular_totales_masivo([orden_stock.pk])
+
+        assert self._totales(orden_stock) == (Decimal('240'), Decimal('45.60'), Decimal('285.60'))
+
+    def test_impuesto_incremental_redondea_como_recalculo(self, orden_stock, articulos_stock):
+        """
+        GIVEN tres líneas de 10.03 (impuesto por línea 1.9057)
+        WHEN se agregan una a una y luego se recalcula
+        THEN el impuesto sale del subtotal acumulado (5.72) y no de sumar
+             impuestos ya redondeados por línea (5.73)
+        """
+        service = OrdenCompraService()
+        for articulo in articulos_stock:
+            self._agregar_linea(service, orden_stock, articulo, '1', '10.03')
+        incrementales = self._totales(orden_stock)
+
+        assert incrementales == (Decimal('30.09'), Decimal('5.72'), Decimal('35.81'))
+        service.recalcular_totales(orden_stock)
+        assert self._totales(orden_stock) == incrementales
+
+    def test_ajuste_descuenta_el_descuento_de_la_orden(self, orden_stock, articulos_stock):
+        """El impuesto incremental se calcula sobre el subtotal menos el descuento de la orden."""
+        OrdenCompra.objects.filter(pk=orden_stock.pk).update(descuento=Decimal('50'))
+        service = OrdenCompraService()
+
+        self._agregar_linea(service, orden_stock, articulos_stock[0], '2', '100')
+
+        assert self._totales(orden_stock) == (Decimal('200'), Decimal('28.50'), Decimal('178.50'))
+
+
+# ==================== TESTS DE GASTO MENSUAL ====================
+
+@pytest.mark.django_db
+class TestGastoCompraService:
+    """Tests del resumen precalculado de gasto en compras."""
+
+    def _agregar_linea(self, orden, articulo):
+        detalle = DetalleOrdenCompraArticulo.objects.create(
+            orden_compra=orden, articulo=articulo, cantidad=Decimal('2'), precio_unitario=Decimal('100')
+        )
+        OrdenCompraService().registrar_cambio_linea(orden, Decimal('0'), detalle.subtotal)
+
+    def test_cambio_de_linea_refresca_resumen(self, orden_stock, articulos_stock):
+        """
+        GIVEN una orden pendiente
+        WHEN se le agrega una línea
+        THEN su (proveedor, mes) queda resumido con el monto y la categoría
+        """
+        self._agregar_linea(orden_stock, articulos_stock[0])
+
+        fila = GastoCompraMensual.objects.get()
+        assert fila.monto == Decimal('200')
+        assert fila.categoria_id == articulos_stock[0].categoria_id
+        assert fila.mes == orden_stock.fecha_orden.replace(day=1)
+        resumen = GastoCompraService().resumen()
+        assert resumen['total'] == Decimal('200')
+        assert resumen['top_proveedores'][0]['monto'] == Decimal('200')
+
+    def test_orden_cancelada_sale_del_resumen(self, usuario_test, orden_stock, articulos_stock):
+        """
+        GIVEN una orden resumida
+        WHEN se cancela
+        THEN sus filas se eliminan del resumen
+        """
+        self._agregar_linea(orden_stock, articulos_stock[0])
+        cancelada = EstadoOrdenCompra.objects.create(codigo='CANCELADA', nombre='Cancelada')
+
+        OrdenCompraService().cambiar_estado(orden_stock, cancelada, usuario_test)
+
+        assert not GastoCompraMensual.objects.exists()
+
+    def test_refrescar_acumula_plazos_de_entrega(self, orden_stock, articulos_stock):
+        """
+        GIVEN una orden entregada cinco días después de lo esperado
+        WHEN se reconstruye el resumen completo
+        THEN la fila registra la orden con plazo y sus días de atraso
+        """
+        self._agregar_linea(orden_stock, articulos_stock[0])
+        OrdenCompra.objects.filter(pk=orden_stock.pk).update(
+            fecha_entrega_esperada=orden_stock.fecha_orden - timedelta(days=5),
+            fecha_entrega_real=orden_stock.fecha_orden
+        )
+
+        assert GastoCompraService().refrescar() == 1
+
+        fila = GastoCompraMensual.objects.get()
+        assert (fila.ordenes_entregadas, fila.ordenes_con_plazo, fila.dias_atraso_total) == (1, 1, 5)
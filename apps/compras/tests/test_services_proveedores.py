@@ -0,0 +1,136 @@
+"""
+Tests de la validación de RUTs y de la importación masiva de proveedores.
+"""
+import io
+import pytest
+from core.utils import procesar_ruts
+from core.utils.business import calcular_dv_rut
+from apps.compras.models import Proveedor
+from apps.compras.services import ImportacionProveedorService
+
+
+def _dv_modulo_11(numero: int) -> str:
+    """Dígito verificador calculado dígito a dígito (referencia)."""
+    suma = sum(int(digito) * (2 + indice % 6) for indice, digito in enumerate(reversed(str(numero))))
+    resto = 11 - suma % 11
+    return {11: '0', 10: 'K'}.get(resto, str(resto))
+
+
+def _planilla(*filas: str) -> io.BytesIO:
+    """Arma un CSV de proveedores con el encabezado estándar."""
+    lineas = ['rut,razon_social,direccion,comuna,ciudad,telefono,email,sitio_web', *filas]
+    return io.BytesIO('\n'.join(lineas).encode('utf-8'))
+
+
+# ==================== TESTS DE RUT ====================
+
+class TestCalculoRut:
+    """Tests de calcular_dv_rut y procesar_ruts."""
+
+    @pytest.mark.parametrize('numero', [1, 6, 999, 1000, 12345678, 11111111, 76543210, 999999999, 1234567890])
+    def test_calcular_dv_coincide_con_modulo_11(self, numero):
+        """Las tablas precalculadas dan el mismo DV que el algoritmo dígito a dígito."""
+        assert calcular_dv_rut(numero) == _dv_modulo_11(numero)
+
+    def test_calcular_dv_valores_conocidos(self):
+        """DV conocidos, incluidos los casos 'K' y '0'."""
+        assert calcular_dv_rut(12345678) == '5'
+        assert calcular_dv_rut(6) == 'K'
+        assert calcular_dv_rut(11111111) == '1'
+        assert _dv_modulo_11(6) == 'K'
+
+    def test_procesar_ruts_normaliza_formatea_y_valida(self):
+        """
+        GIVEN: RUTs en distintos formatos, con DV en minúscula, ceros a la izquierda e inválidos
+        WHEN: Se procesan en una sola pasada
+        THEN: Se obtienen (normalizado, formateado, válido) en el orden de entrada
+        """
+        resultados = procesar_ruts(['12.345.678-5', '012345678-5', '6-k', '12345678-0', 'abc', ''])
+
+        assert resultados == [
+            ('123456785', '12.345.678-5', True),
+            ('123456785', '012.345.678-5', True),
+            ('6K', '6-K', True),
+            ('123456780', '12.345.678-0', False),
+            ('ABC', 'AB-C', False),
+            ('', '', False),
+        ]
+
+
+# ==================== TESTS DE IMPORTACIÓN DE PROVEEDORES ====================
+
+@pytest.mark.django_db
+class TestImportacionProveedorService:
+    """Tests de ImportacionProveedorService.importar."""
+
+    def importar(self, *filas, **opciones):
+        """Importa un CSV con las filas dadas y retorna el reporte."""
+        return ImportacionProveedorService().importar(_planilla(*filas), 'proveedores.csv', **opciones)
+
+    def test_crea_proveedores_validos_y_reporta_errores(self):
+        """
+        GIVEN: Un archivo con una fila válida, un RUT inválido y un RUT repetido
+        WHEN: Se importa
+        THEN: Solo se crea la fila válida y las otras se informan con su número de fila
+        """
+        reporte = self.importar(
+            '12345678-5,Proveedor Uno,Calle 1,Santiago,,,,',
+            '12345678-0,Proveedor Dos,Calle 2,,,,,',
+            '12.345.678-5,Proveedor Tres,Calle 3,,,,,',
+        )
+
+        assert (reporte['total_filas'], reporte['validas'], reporte['creados']) == (3, 1, 1)
+        assert [error['fila'] for error in reporte['errores']] == [3, 4]
+        proveedor = Proveedor.objects.get()
+        assert (proveedor.rut, proveedor.rut_normalizado, proveedor.comuna, proveedor.ciudad) == (
+            '12.345.678-5', '123456785', 'Santiago', None
+        )
+
+    def test_textos_demasiado_largos_se_reportan_como_error_de_fila(self):
+        """Razón social, teléfono, sitio web o RUT formateado fuera de largo no abortan la importación."""
+        rut_largo = f'1234567890-{calcular_dv_rut(1234567890)}'
+        reporte = self.importar(
+            f'11111111-1,{"R" * 256},Calle 1,,,,,',
+            '22222222-2,Proveedor,Calle 2,,,' + '9' * 21 + ',,',
+            '33333333-3,Proveedor,Calle 3,,,,,https://ejemplo.cl/' + 'a' * 200,
+            f'{rut_largo},Proveedor,Calle 4,,,,,',
+            '44444444-4,Proveedor Válido,Calle 5,,,,,',
+        )
+
+        mensajes = [error['mensaje'] for error in reporte['errores']]
+        assert len(mensajes) == 4
+        assert 'La razón social excede el largo máximo de 255 caracteres.' in mensajes[0]
+        assert 'El teléfono excede el largo máximo de 20 caracteres.' in mensajes[1]
+        assert 'El sitio web excede el largo máximo de 200 caracteres.' in mensajes[2]
+        assert 'El RUT excede el largo máximo de 12 caracteres.' in mensajes[3]
+        assert list(Proveedor.objects.values_list('rut', flat=True)) == ['44.444.444-4']
+
+    def test_recorta_espacios_de_los_campos_opcionales(self):
+        """Los opcionales se guardan sin espacios y los vacíos quedan en None."""
+        proveedor = ImportacionProveedorService()._construir_proveedor(
+            {
+                'rut': '12345678-5', 'razon_social': ' Proveedor ', 'direccion': ' Calle 1 ',
+                'comuna': '  Ñuñoa ', 'ciudad': '   ', 'telefono': ' +56 2 2222 2222 ',
+                'sitio_web': ' https://ejemplo.cl ',
+            },
+            ('123456785', '12.345.678-5', True), set(), set(), False
+        )
+
+        assert (proveedor.razon_social, proveedor.comuna, proveedor.ciudad) == ('Proveedor', 'Ñuñoa', None)
+        assert (proveedor.telefono, proveedor.sitio_web) == ('+56 2 2222 2222', 'https://ejemplo.cl')
+
+    def test_actualizar_existentes_hace_upsert_por_rut_normalizado(self):
+        """Con actualizar_existentes, un RUT ya registrado en otro formato se actualiza."""
+        self.importar('12345678-5,Proveedor Uno,Calle 1,,,,,')
+
+        reporte = self.importar('12.345.678-5,Proveedor Renombrado,Calle 9,,,,,', actualizar_existentes=True)
+
+        assert (reporte['creados'], reporte['actualizados'], reporte['errores']) == (0, 1, [])
+        assert Proveedor.objects.get().razon_social == 'Proveedor Renombrado'
+
+    def test_dry_run_no_escribe(self):
+        """dry_run valida y reporta sin crear proveedores."""
+        reporte = self.importar('12345678-5,Proveedor Uno,Calle 1,,,,,', dry_run=True)
+
+        assert (reporte['validas'], reporte['creados'], reporte['dry_run']) == (1, 0, True)
+        assert not Proveedor.objects.exists()
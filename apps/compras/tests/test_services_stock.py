@@ -0,0 +1,144 @@
+"""
+Tests de los servicios de compras que mueven stock de bodega.
+
+Usan los fixtures de flujo de stock de conftest.py.
+"""
+import pytest
+from decimal import Decimal
+from django.core.exceptions import ValidationError
+from apps.bodega.models import Articulo, Movimiento
+from apps.compras.models import DetalleOrdenCompraArticulo, RecepcionArticulo, DetalleRecepcionArticulo
+from apps.compras.repositories import DetalleOrdenCompraArticuloRepository
+from apps.compras.services import RecepcionArticuloService
+
+
+def _crear_recepcion(usuario, bodega, estado, lineas, numero='REC-STK-1', orden=None):
+    """Crea una recepción de artículos con las líneas (articulo, cantidad) dadas."""
+    recepcion = RecepcionArticulo.objects.create(
+        numero=numero, bodega=bodega, recibido_por=usuario, estado=estado, orden_compra=orden
+    )
+    for articulo, cantidad in lineas:
+        DetalleRecepcionArticulo.objects.create(recepcion=recepcion, articulo=articulo, cantidad=Decimal(cantidad))
+    return recepcion
+
+
+# ==================== TESTS DE CONFIRMACIÓN DE RECEPCIÓN ====================
+
+@pytest.mark.django_db
+class TestConfirmarRecepcion:
+    """Tests de RecepcionArticuloService.confirmar_recepcion."""
+
+    def test_encadena_stock_por_articulo(
+        self, usuario_test, bodega_stock, articulos_stock, estados_recepcion_stock, tipo_movimiento_recepcion
+    ):
+        """
+        GIVEN una recepción con dos líneas del mismo artículo
+        WHEN se confirma
+        THEN el stock suma ambas y los movimientos quedan encadenados
+        """
+        a1, a2, _ = articulos_stock
+        Articulo.objects.filter(pk=a1.pk).update(stock_actual=Decimal('5'))
+        recepcion = _crear_recepcion(
+            usuario_test, bodega_stock, estados_recepcion_stock['abierta'], [(a1, '2'), (a2, '3'), (a1, '4')]
+        )
+
+        actualizados = RecepcionArticuloService().confirmar_recepcion(recepcion, usuario_test)
+
+        assert actualizados == 2
+        a1.refresh_from_db()
+        a2.refresh_from_db()
+        assert a1.stock_actual == Decimal('11')
+        assert a2.stock_actual == Decimal('3')
+        movimientos = list(
+            Movimiento.objects.filter(articulo=a1).order_by('id').values_list('stock_antes', 'stock_despues')
+        )
+        assert movimientos == [(Decimal('5'), Decimal('7')), (Decimal('7'), Decimal('11'))]
+
+    def test_articulo_eliminado_lanza_validation_error(
+        self, usuario_test, bodega_stock, articulos_stock, estados_recepcion_stock, tipo_movimiento_recepcion
+    ):
+        """
+        GIVEN una recepción con una línea de un artículo eliminado lógicamente
+        WHEN se confirma
+        THEN se lanza ValidationError con el código y no se mueve stock
+        """
+        a1, a2, _ = articulos_stock
+        recepcion = _crear_recepcion(
+            usuario_test, bodega_stock, estados_recepcion_stock['abierta'], [(a1, '2'), (a2, '3')]
+        )
+        Articulo.all_objects.filter(pk=a2.pk).update(eliminado=True)
+
+        with pytest.raises(ValidationError, match='STK-2'):
+            RecepcionArticuloService().confirmar_recepcion(recepcion, usuario_test)
+
+        a1.refresh_from_db()
+        assert a1.stock_actual == Decimal('0')
+        assert not Movimiento.objects.exists()
+
+
+# ==================== TESTS DE CONCILIACIÓN CON LA ORDEN ====================
+
+@pytest.mark.django_db
+class TestConciliacionOrdenCompra:
+    """Tests de la conciliación de recepciones contra las líneas de la orden."""
+
+    def _lineas(self, orden, articulos):
+        a1, a2, _ = articulos
+        return [
+            DetalleOrdenCompraArticulo.objects.create(
+                orden_compra=orden, articulo=articulo, cantidad=Decimal(cantidad), precio_unitario=Decimal('1')
+            )
+            for articulo, cantidad in [(a1, '5'), (a1, '3'), (a2, '2')]
+        ]
+
+    def test_sumar_recibido_completa_primera_linea_pendiente(self, orden_stock, articulos_stock):
+        """
+        GIVEN una orden con dos líneas del mismo artículo
+        WHEN se suma lo recibido de ese artículo y de uno fuera de la orden
+        THEN solo se actualiza la primera línea con pendiente
+        """
+        l1, l2, _ = self._lineas(orden_stock, articulos_stock)
+        assert l1.cantidad_pendiente == Decimal('5')
+
+        assert DetalleOrdenCompraArticuloRepository.sumar_recibido(orden_stock, articulos_stock[0].id, Decimal('5')) == 1
+        assert DetalleOrdenCompraArticuloRepository.sumar_recibido(orden_stock, articulos_stock[2].id, Decimal('5')) == 0
+
+        l1.refresh_from_db()
+        l2.refresh_from_db()
+        assert (l1.cantidad_recibida, l1.cantidad_pendiente) == (Decimal('5'), Decimal('0'))
+        assert l2.cantidad_recibida == Decimal('0')
+
+    def test_conciliar_recepcion_agrupa_por_articulo(
+        self, usuario_test, bodega_stock, orden_stock, articulos_stock, estados_recepcion_stock
+    ):
+        """
+        GIVEN una recepción con varias líneas por artículo
+        WHEN se concilia con la orden
+        THEN cada artículo se aplica una vez sobre su línea pendiente
+        """
+        l1, l2, l3 = self._lineas(orden_stock, articulos_stock)
+        a1, a2, _ = articulos_stock
+        recepcion = _crear_recepcion(
+            usuario_test, bodega_stock, estados_recepcion_stock['abierta'],
+            [(a1, '2'), (a1, '1'), (a2, '2')], orden=orden_stock
+        )
+
+        assert RecepcionArticuloService().conciliar_recepcion(recepcion) == 2
+
+        for linea in (l1, l2, l3):
+            linea.refresh_from_db()
+        assert (l1.cantidad_recibida, l1.cantidad_pendiente) == (Decimal('3'), Decimal('2'))
+        assert l2.cantidad_recibida == Decimal('0')
+        assert (l3.cantidad_recibida, l3.cantidad_pendiente) == (Decimal('2'), Decimal('0'))
+
+    def test_conciliar_recepcion_sin_orden(self, usuario_test, bodega_stock, articulos_stock, estados_recepcion_stock):
+        """
+        GIVEN una recepción sin orden de compra
+        WHEN se concilia
+        THEN no se actualiza ninguna línea
+        """
+        recepcion = _crear_recepcion(
+            usuario_test, bodega_stock, estados_recepcion_stock['abierta'], [(articulos_stock[0], '1')]
+        )
+
+        assert RecepcionArticuloService().conciliar_recepcion(recepcion) == 0
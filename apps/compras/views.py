@@ -9,6 +9,7 @@ Este archivo implementa todas las vistas usando CBVs siguiendo SOLID y DRY:
 - Auditoría automática
 """
 from typing import Any
+from django.db import transaction
 from django.db.models import QuerySet
 from django.urls import reverse_lazy
 from django.views.generic import (
@@ -38,10 +39,10 @@ from .repositories import (
     RecepcionArticuloRepository, RecepcionActivoRepository, EstadoRecepcionRepository
 )
 from .services import (
-    ProveedorService, OrdenCompraService,
-    RecepcionArticuloService, RecepcionActivoService
+    ProveedorService, OrdenCompraService, ConsolidacionCompraService,
+    GastoCompraService, RecepcionArticuloService, RecepcionActivoService
 )
-from apps.bodega.models import Bodega, Articulo, Movimiento, TipoMovimiento
+from apps.bodega.models import Bodega, Articulo
 
 
 # ==================== MIXINS GENÉRICOS PARA RECEPCIONES (DRY) ====================
@@ -273,18 +274,24 @@ class RecepcionConfirmarMixin:
                 es_final=True, activo=True, eliminado=False
             ).exclude(codigo='CANCELADA').first()
 
-        if estado_completado:
-            self.object.estado = estado_completado
-            self.object.save()
+        # El cambio de estado y las acciones del hook se confirman juntos
+        try:
+            with transaction.atomic():
+                if estado_completado:
+                    self.object.estado = estado_completado
+                    self.object.save()
 
-        # Hook para acciones específicas (ej: actualizar stock)
-        self._post_confirmar_acciones(request)
+                # Hook para acciones específicas (ej: actualizar stock)
+                self._post_confirmar_acciones(request)
+        except ValidationError as e:
+            messages.error(request, ' '.join(e.messages))
+            return redirect(self.get_success_url_after_confirm(), pk=self.object.pk)
 
         # Log de auditoría
         self.log_action(self.object, request)
 
         messages.success(request, self.get_success_message())
-        return redirect(self.get_success_url_after_confirm())
+        return redirect(self.get_success_url_after_confirm(), pk=self.object.pk)
 
     def _post_confirmar_acciones(self, request):
         """
@@ -623,9 +630,7 @@ class OrdenCompraCreateView(BaseAuditedViewMixin, AtomicTransactionMixin, Create
 
     def form_valid(self, form):
         """Procesa el formulario válido con log de auditoría y genera número automático."""
-        from decimal import Decimal
         from core.utils.business import generar_codigo_con_anio
-        from apps.solicitudes.models import DetalleSolicitud
 
         # Asignar solicitante
         form.instance.solicitante = self.request.user
@@ -635,39 +640,26 @@ class OrdenCompraCreateView(BaseAuditedViewMixin, AtomicTransactionMixin, Create
 
         response = super().form_valid(form)
 
-        # Agregar automáticamente los detalles de las solicitudes asociadas
+        # Consolidar la demanda aprobada de las solicitudes asociadas
         solicitudes = form.cleaned_data.get('solicitudes', [])
         if solicitudes:
-            for solicitud in solicitudes:
-                # Obtener detalles aprobados de la solicitud
-                detalles = solicitud.detalles.filter(cantidad_aprobada__gt=0)
-
-                for detalle in detalles:
-                    if detalle.articulo:
-                        # Crear detalle de orden para artículo
-                        # Los artículos no tienen precio_unitario, usar 0
-                        DetalleOrdenCompraArticulo.objects.create(
-                            orden_compra=self.object,
-                            articulo=detalle.articulo,
-                            cantidad=detalle.cantidad_aprobada,
-                            precio_unitario=Decimal('0'),
-                            descuento=Decimal('0')
-                        )
-                    elif detalle.activo:
-                        # Crear detalle de orden para activo
-                        # Obtener precio del activo o usar 0 si es None
-                        precio = getattr(detalle.activo, 'precio_unitario', None) or Decimal('0')
-                        DetalleOrdenCompra.objects.create(
-                            orden_compra=self.object,
-                            activo=detalle.activo,
-                            cantidad=detalle.cantidad_aprobada,
-                            precio_unitario=precio,
-                            descuento=Decimal('0')
-                        )
-
-            # Recalcular totales de la orden
-            orden_service = OrdenCompraService()
-            orden_service.recalcular_totales(self.object)
+            ordenes = ConsolidacionCompraService().generar_ordenes(
+                solicitudes=solicitudes,
+                proveedor=self.object.proveedor,
+                bodega_destino=self.object.bodega_destino,
+                solicitante=self.request.user,
+                fecha_orden=self.object.fecha_orden,
+                separar_por_proveedor=form.cleaned_data.get('separar_por_proveedor', False),
+                orden_base=self.object,
+                fecha_entrega_esperada=self.object.fecha_entrega_esperada,
+                observaciones=self.object.observaciones
+            )
+            adicionales = [orden.numero for orden in ordenes if orden.pk != self.object.pk]
+            if adicionales:
+                messages.info(
+                    self.request,
+                    f'Se generaron órdenes adicionales por proveedor: {", ".join(adicionales)}.'
+                )
 
         self.log_action(self.object, self.request)
         return response
@@ -705,8 +697,13 @@ class OrdenCompraUpdateView(BaseAuditedViewMixin, UpdateView):
         return context
 
     def form_valid(self, form):
-        """Procesa el formulario válido con log de auditoría."""
+        """Procesa el formulario válido con log de auditoría y actualiza el resumen de gasto."""
         response = super().form_valid(form)
+
+        if set(form.changed_data) & {'estado', 'proveedor', 'fecha_orden', 'fecha_entrega_esperada'}:
+            clave_anterior = (form.initial['proveedor'], form.initial['fecha_orden'].replace(day=1))
+            GastoCompraService().refrescar_orden(self.object, [clave_anterior])
+
         self.log_action(self.object, self.request)
         return response
 
@@ -751,6 +748,7 @@ class OrdenCompraDeleteView(BaseAuditedViewMixin, DeleteView):
         # Soft delete de los detalles
         self.object.detalles_articulos.update(eliminado=True, activo=False)
         self.object.detalles.update(eliminado=True, activo=False)
+        GastoCompraService().refrescar_orden(self.object)
 
         # Log de auditoría
         if hasattr(self, 'log_action'):
@@ -909,7 +907,7 @@ class OrdenCompraAgregarArticuloView(BaseAuditedViewMixin, AtomicTransactionMixi
     Permisos: compras.add_detalleordencompraarticulo
     Auditoría: Registra acción CREAR automáticamente
     Transacción atómica: Garantiza que se actualicen los totales correctamente
-    Utiliza: OrdenCompraService para recalcular totales
+    Utiliza: OrdenCompraService para actualizar totales
     """
     model = DetalleOrdenCompraArticulo
     form_class = DetalleOrdenCompraArticuloForm
@@ -941,9 +939,9 @@ class OrdenCompraAgregarArticuloView(BaseAuditedViewMixin, AtomicTransactionMixi
         form.instance.orden_compra = orden
         response = super().form_valid(form)
 
-        # Recalcular totales usando service
+        # Sumar la línea a los totales de la orden usando service
         orden_service = OrdenCompraService()
-        orden_service.recalcular_totales(orden)
+        orden_service.registrar_cambio_linea(orden, Decimal('0'), self.object.subtotal)
 
         # Log de auditoría
         self.audit_description_template = f'Agregó artículo {self.object.articulo.codigo} a orden {orden.numero}'
@@ -959,7 +957,7 @@ class OrdenCompraAgregarActivoView(BaseAuditedViewMixin, AtomicTransactionMixin,
     Permisos: compras.add_detalleordencompra
     Auditoría: Registra acción CREAR automáticamente
     Transacción atómica: Garantiza que se actualicen los totales correctamente
-    Utiliza: OrdenCompraService para recalcular totales
+    Utiliza: OrdenCompraService para actualizar totales
     """
     model = DetalleOrdenCompra
     form_class = DetalleOrdenCompraActivoForm
@@ -991,9 +989,9 @@ class OrdenCompraAgregarActivoView(BaseAuditedViewMixin, AtomicTransactionMixin,
         form.instance.orden_compra = orden
         response = super().form_valid(form)
 
-        # Recalcular totales usando service
+        # Sumar la línea a los totales de la orden usando service
         orden_service = OrdenCompraService()
-        orden_service.recalcular_totales(orden)
+        orden_service.registrar_cambio_linea(orden, Decimal('0'), self.object.subtotal)
 
         # Log de auditoría
         self.audit_description_template = f'Agregó activo {self.object.activo.codigo} a orden {orden.numero}'
@@ -1139,6 +1137,9 @@ class RecepcionArticuloCreateView(BaseAuditedViewMixin, AtomicTransactionMixin,
                         observaciones=detalle_data.get('observaciones', '')
                     )
 
+                # Registrar lo recibido en la orden de compra (un UPDATE por recepción)
+                RecepcionArticuloService().conciliar_recepcion(self.object)
+
                 messages.success(self.request, self.get_success_message(self.object))
                 self.log_action(self.object, self.request)
                 return response
@@ -1254,35 +1255,8 @@ class RecepcionArticuloConfirmarView(RecepcionConfirmarMixin, BaseAuditedViewMix
     audit_description_template = 'Confirmó recepción de artículos {obj.numero}'
 
     def _post_confirmar_acciones(self, request):
-        """Actualiza stock de artículos y crea movimientos."""
-        from apps.bodega.repositories import TipoMovimientoRepository
-        from apps.bodega.models import Movimiento
-
-        tipo_mov_repo = TipoMovimientoRepository()
-        tipo_movimiento = tipo_mov_repo.get_by_codigo('RECEPCION')
-        if not tipo_movimiento:
-            tipo_movimiento = TipoMovimiento.objects.filter(activo=True).first()
-
-        for detalle in self.object.detalles.filter(eliminado=False):
-            articulo = detalle.articulo
-            stock_anterior = articulo.stock_actual
-
-            # Actualizar stock
-            articulo.stock_actual += detalle.cantidad
-            articulo.save()
-
-            # Registrar movimiento
-            if tipo_movimiento:
-                Movimiento.objects.create(
-                    articulo=articulo,
-                    tipo=tipo_movimiento,
-                    cantidad=detalle.cantidad,
-                    operacion='ENTRADA',
-                    usuario=request.user,
-                    motivo=f'Recepción {self.object.numero}',
-                    stock_antes=stock_anterior,
-                    stock_despues=articulo.stock_actual
-                )
+        """Actualiza stock de artículos y crea movimientos usando el service."""
+        RecepcionArticuloService().confirmar_recepcion(self.object, request.user)
 
     def get_success_message(self):
         """Mensaje de éxito personalizado."""
@@ -1427,6 +1401,9 @@ class RecepcionActivoCreateView(BaseAuditedViewMixin, AtomicTransactionMixin, Cr
                         observaciones=detalle_data.get('observaciones', '')
                     )
 
+                # Registrar lo recibido en la orden de compra (un UPDATE por recepción)
+                RecepcionActivoService().conciliar_recepcion(self.object)
+
                 messages.success(self.request, self.get_success_message(self.object))
                 self.log_action(self.object, self.request)
                 return response
@@ -37,7 +37,7 @@ class Command(BaseCommand):
         ]
         
         for data in talleres_data:
-            Taller.objects.get_or_create(
+            Taller.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -79,7 +79,7 @@ class Command(BaseCommand):
         ]
         
         for data in bodegas_data:
-            Bodega.objects.get_or_create(
+            Bodega.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -100,7 +100,7 @@ class Command(BaseCommand):
         ]
         
         for data in departamentos_data:
-            Departamento.objects.get_or_create(
+            Departamento.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -122,7 +122,7 @@ class Command(BaseCommand):
         ]
         
         for data in estados_oc_data:
-            EstadoOrdenCompra.objects.get_or_create(
+            EstadoOrdenCompra.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -144,7 +144,7 @@ class Command(BaseCommand):
         ]
         
         for data in estados_rec_data:
-            EstadoRecepcion.objects.get_or_create(
+            EstadoRecepcion.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -166,7 +166,7 @@ class Command(BaseCommand):
         ]
         
         for data in proveniencias_data:
-            Proveniencia.objects.get_or_create(
+            Proveniencia.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
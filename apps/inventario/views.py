@@ -22,6 +22,7 @@ from apps.bodega.models import Bodega
 from apps.compras.models import EstadoOrdenCompra, EstadoRecepcion
 from apps.activos.models import Proveniencia
 from apps.solicitudes.models import Departamento
+from apps.solicitudes.services import JerarquiaOrganizacionalService
 
 
 # ==================== TALLERES ====================
@@ -763,6 +764,11 @@ def departamento_list(request):
     paginator = Paginator(queryset, 20)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
+
+    # Conteos acumulados (áreas, equipos, solicitudes, entregas) desde la jerarquía en caché
+    conteos = JerarquiaOrganizacionalService().conteos_departamentos()
+    for depto in page_obj:
+        depto.conteos = conteos.get(depto.id)
     
     return render(request, 'inventario/departamento_list.html', {
         'page_obj': page_obj,
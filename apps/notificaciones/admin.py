@@ -1 +1,15 @@
-from django.contrib import admin
\ No newline at end of file
+from django.contrib import admin
+from core.admin import SoftDeleteAdminMixin
+
+from .models import Notificacion
+
+
+@admin.register(Notificacion)
+class NotificacionAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
+    """Administración de notificaciones."""
+
+    list_display = ['titulo', 'usuario', 'tipo', 'leida', 'fecha_creacion']
+    list_filter = ['tipo', 'leida']
+    search_fields = ['titulo', 'mensaje', 'usuario__username']
+    autocomplete_fields = ['usuario']
+    readonly_fields = ['fecha_creacion', 'fecha_actualizacion', 'fecha_lectura']
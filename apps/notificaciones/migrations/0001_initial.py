@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:47
+
+import django.db.models.deletion
+import django.db.models.manager
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Notificacion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('activo', models.BooleanField(default=True, help_text='Estado activo/inactivo del registro', verbose_name='Activo')),
+                ('eliminado', models.BooleanField(default=False, help_text='Estado eliminado/no eliminado del registro', verbose_name='Eliminado')),
+                ('fecha_creacion', models.DateTimeField(auto_now_add=True, help_text='Fecha y hora de creación del registro', verbose_name='Fecha de Creación')),
+                ('fecha_actualizacion', models.DateTimeField(auto_now=True, help_text='Fecha y hora de última actualización', verbose_name='Fecha de Actualización')),
+                ('tipo', models.CharField(choices=[('SOLICITUD_VENCIDA', 'Solicitud vencida')], max_length=30, verbose_name='Tipo')),
+                ('titulo', models.CharField(max_length=200, verbose_name='Título')),
+                ('mensaje', models.TextField(blank=True, verbose_name='Mensaje')),
+                ('enlace', models.CharField(blank=True, help_text='Ruta relativa al registro asociado', max_length=255, verbose_name='Enlace')),
+                ('leida', models.BooleanField(default=False, verbose_name='Leída')),
+                ('fecha_lectura', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de Lectura')),
+                ('usuario', models.ForeignKey(help_text='Usuario destinatario de la notificación', on_delete=django.db.models.deletion.CASCADE, related_name='notificaciones', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Notificación',
+                'verbose_name_plural': 'Notificaciones',
+                'db_table': 'tba_notificaciones_notificacion',
+                'ordering': ['-fecha_creacion'],
+                'indexes': [models.Index(condition=models.Q(('eliminado', False), ('leida', False)), fields=['usuario', '-fecha_creacion'], name='ix_notif_usuario_no_leida')],
+            },
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -1,3 +1,82 @@
 from django.db import models
+from django.contrib.auth.models import User
 
+from core.models import BaseModel
 
+
+class Notificacion(BaseModel):
+    """
+    Notificación dirigida a un usuario del sistema.
+
+    Se generan desde los procesos periódicos (ej: barrido de solicitudes
+    vencidas) y se insertan en lote; el usuario las marca como leídas.
+
+    Attributes:
+        usuario: Usuario destinatario.
+        tipo: Tipo de notificación (origen).
+        titulo: Título breve.
+        mensaje: Texto de la notificación.
+        enlace: Ruta relativa al registro asociado (opcional).
+        leida: Indica si el usuario ya la leyó.
+        fecha_lectura: Fecha y hora de lectura (opcional).
+    """
+
+    TIPO_SOLICITUD_VENCIDA = 'SOLICITUD_VENCIDA'
+
+    TIPO_CHOICES = [
+        (TIPO_SOLICITUD_VENCIDA, 'Solicitud vencida'),
+    ]
+
+    usuario = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='notificaciones',
+        verbose_name='Usuario',
+        help_text='Usuario destinatario de la notificación'
+    )
+    tipo = models.CharField(
+        max_length=30,
+        choices=TIPO_CHOICES,
+        verbose_name='Tipo'
+    )
+    titulo = models.CharField(
+        max_length=200,
+        verbose_name='Título'
+    )
+    mensaje = models.TextField(
+        blank=True,
+        verbose_name='Mensaje'
+    )
+    enlace = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name='Enlace',
+        help_text='Ruta relativa al registro asociado'
+    )
+    leida = models.BooleanField(
+        default=False,
+        verbose_name='Leída'
+    )
+    fecha_lectura = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Fecha de Lectura'
+    )
+
+    class Meta:
+        db_table = 'tba_notificaciones_notificacion'
+        verbose_name = 'Notificación'
+        verbose_name_plural = 'Notificaciones'
+        ordering = ['-fecha_creacion']
+        indexes = [
+            # Bandeja de no leídas de cada usuario
+            models.Index(
+                fields=['usuario', '-fecha_creacion'],
+                name='ix_notif_usuario_no_leida',
+                condition=models.Q(leida=False, eliminado=False)
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en cadena de la notificación."""
+        return f"{self.usuario.username} - {self.titulo}"
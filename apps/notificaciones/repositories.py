@@ -0,0 +1,36 @@
+"""
+Repositories para el módulo de notificaciones.
+
+Encapsulan el acceso a datos de las notificaciones de usuario.
+"""
+from typing import List
+
+from django.db.models import QuerySet
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from .models import Notificacion
+
+
+# ==================== NOTIFICACION REPOSITORY ====================
+
+class NotificacionRepository:
+    """Repository para gestionar acceso a datos de Notificaciones."""
+
+    @staticmethod
+    def no_leidas(usuario: User) -> QuerySet[Notificacion]:
+        """Notificaciones vigentes no leídas de un usuario, de la más reciente a la más antigua."""
+        return Notificacion.objects.filter(usuario=usuario, leida=False).order_by('-fecha_creacion')
+
+    @staticmethod
+    def bulk_create(notificaciones: List[Notificacion], batch_size: int) -> List[Notificacion]:
+        """Inserta notificaciones en lotes."""
+        return Notificacion.objects.bulk_create(notificaciones, batch_size=batch_size)
+
+    @staticmethod
+    def marcar_leidas(usuario: User, ids: List[int]) -> int:
+        """Marca como leídas notificaciones del usuario con un único UPDATE."""
+        ahora = timezone.now()
+        return Notificacion.objects.filter(usuario=usuario, pk__in=ids, leida=False).update(
+            leida=True, fecha_lectura=ahora, fecha_actualizacion=ahora
+        )
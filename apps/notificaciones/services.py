@@ -0,0 +1,84 @@
+"""
+Services para el módulo de notificaciones.
+
+Concentra la creación de notificaciones para que los procesos que las
+originan (barridos periódicos, flujos de otros módulos) las inserten en lote.
+"""
+from typing import Iterable, List, Optional
+
+from django.contrib.auth.models import User
+
+from .models import Notificacion
+from .repositories import NotificacionRepository
+
+
+# ==================== NOTIFICACION SERVICE ====================
+
+class NotificacionService:
+    """Service para lógica de negocio de Notificaciones."""
+
+    TAMANO_LOTE = 1000
+
+    def __init__(self):
+        self.notificacion_repo = NotificacionRepository()
+
+    @staticmethod
+    def construir(
+        usuario_id: int,
+        tipo: str,
+        titulo: str,
+        mensaje: str = '',
+        enlace: str = ''
+    ) -> Notificacion:
+        """
+        Construye (sin guardar) una notificación.
+
+        Args:
+            usuario_id: ID del usuario destinatario
+            tipo: Tipo de notificación (Notificacion.TIPO_*)
+            titulo: Título breve
+            mensaje: Texto de la notificación
+            enlace: Ruta relativa al registro asociado
+
+        Returns:
+            Notificacion sin guardar
+
+        Raises:
+            ValueError: Si el tipo no existe
+        """
+        if tipo not in dict(Notificacion.TIPO_CHOICES):
+            raise ValueError(f'Tipo de notificación desconocido: {tipo}')
+        return Notificacion(
+            usuario_id=usuario_id,
+            tipo=tipo,
+            titulo=titulo[:200],
+            mensaje=mensaje,
+            enlace=enlace
+        )
+
+    def notificar_masivo(self, notificaciones: Iterable[Notificacion]) -> List[Notificacion]:
+        """
+        Inserta notificaciones construidas con construir() en lotes.
+
+        Returns:
+            Lista de notificaciones creadas
+        """
+        notificaciones = list(notificaciones)
+        if not notificaciones:
+            return []
+        return self.notificacion_repo.bulk_create(notificaciones, self.TAMANO_LOTE)
+
+    def marcar_leidas(self, usuario: User, ids: Optional[List[int]] = None) -> int:
+        """
+        Marca como leídas notificaciones del usuario.
+
+        Args:
+            usuario: Usuario dueño de las notificaciones
+            ids: IDs a marcar (None = todas las no leídas)
+
+        Returns:
+            Cantidad de notificaciones marcadas
+        """
+        if ids is None:
+            ids = list(self.notificacion_repo.no_leidas(usuario).values_list('pk', flat=True))
+        return self.notificacion_repo.marcar_leidas(usuario, ids)
@@ -1,9 +1,10 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdminMixin
 from .models import TipoReporte, ReporteGenerado, MovimientoInventario
 
 
 @admin.register(TipoReporte)
-class TipoReporteAdmin(admin.ModelAdmin):
+class TipoReporteAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['codigo', 'nombre', 'modulo', 'activo']
     list_filter = ['modulo', 'activo']
     search_fields = ['codigo', 'nombre']
@@ -11,7 +12,7 @@ class TipoReporteAdmin(admin.ModelAdmin):
 
 
 @admin.register(ReporteGenerado)
-class ReporteGeneradoAdmin(admin.ModelAdmin):
+class ReporteGeneradoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = ['tipo_reporte', 'usuario', 'fecha_generacion', 'formato', 'fecha_inicio', 'fecha_fin']
     list_filter = ['tipo_reporte', 'formato', 'fecha_generacion']
     search_fields = ['tipo_reporte__nombre', 'usuario__correo']
@@ -20,7 +21,7 @@ class ReporteGeneradoAdmin(admin.ModelAdmin):
 
 
 @admin.register(MovimientoInventario)
-class MovimientoInventarioAdmin(admin.ModelAdmin):
+class MovimientoInventarioAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     list_display = [
         'fecha_movimiento', 'tipo_movimiento', 'activo',
         'bodega_origen', 'bodega_destino', 'cantidad',
@@ -274,6 +274,12 @@ class ConsultasReportes:
         from apps.compras.models import Proveedor
         return Proveedor.objects.filter(eliminado=False, activo=True).count()
     
+    @staticmethod
+    def gasto_compras(meses=12):
+        """Resumen de gasto en compras de los últimos meses (filas precalculadas)"""
+        from apps.compras.services import GastoCompraService
+        return GastoCompraService().resumen(meses=meses)
+    
     # ========== CONSULTAS DE SOLICITUDES ==========
     
     @staticmethod
@@ -344,6 +350,12 @@ class ConsultasReportes:
         from apps.activos.models import Ubicacion
         return Ubicacion.objects.filter(eliminado=False).count()
     
+    @staticmethod
+    def depreciacion_activos(mes=None):
+        """Valor libro de los activos por categoría (cierres precalculados)"""
+        from apps.activos.services import DepreciacionActivoService
+        return DepreciacionActivoService().resumen(mes)
+    
     # ========== CONSULTAS DE BAJAS ==========
     
     @staticmethod
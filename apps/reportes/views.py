@@ -133,6 +133,7 @@ def dashboard_reportes(request, app=None):
             'recepciones_activos': ConsultasReportes.total_recepciones_activos(),
             'total_proveedores': ConsultasReportes.total_proveedores(),
         }
+        context['gasto_compras'] = ConsultasReportes.gasto_compras()
     
     if app == 'solicitudes' or app == 'todas':
         context['stats_solicitudes'] = {
@@ -149,6 +150,7 @@ def dashboard_reportes(request, app=None):
             'total_categorias': ConsultasReportes.total_categorias_activos(),
             'total_ubicaciones': ConsultasReportes.total_ubicaciones(),
         }
+        context['depreciacion_activos'] = ConsultasReportes.depreciacion_activos()
     
     if app == 'bajas' or app == 'todas':
         context['stats_bajas'] = {
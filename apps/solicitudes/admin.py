@@ -1,4 +1,5 @@
 from django.contrib import admin
+from core.admin import SoftDeleteAdminMixin
 
 from .models import (
     Area,
@@ -6,14 +7,16 @@ from .models import (
     DetalleSolicitud,
     Equipo,
     EstadoSolicitud,
+    EventoSolicitud,
     HistorialSolicitud,
     Solicitud,
     TipoSolicitud,
 )
+from .services import SlaSolicitudService, ContadoresSolicitudService
 
 
 @admin.register(Departamento)
-class DepartamentoAdmin(admin.ModelAdmin):
+class DepartamentoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de departamentos."""
 
     list_display = ['codigo', 'nombre', 'responsable', 'activo', 'fecha_creacion']
@@ -38,7 +41,7 @@ class DepartamentoAdmin(admin.ModelAdmin):
 
 
 @admin.register(Area)
-class AreaAdmin(admin.ModelAdmin):
+class AreaAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de áreas."""
 
     list_display = ['codigo', 'nombre', 'departamento', 'responsable', 'activo', 'fecha_creacion']
@@ -64,7 +67,7 @@ class AreaAdmin(admin.ModelAdmin):
 
 
 @admin.register(Equipo)
-class EquipoAdmin(admin.ModelAdmin):
+class EquipoAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de equipos."""
 
     list_display = ['codigo', 'nombre', 'departamento', 'lider', 'activo', 'fecha_creacion']
@@ -90,7 +93,7 @@ class EquipoAdmin(admin.ModelAdmin):
 
 
 @admin.register(TipoSolicitud)
-class TipoSolicitudAdmin(admin.ModelAdmin):
+class TipoSolicitudAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de tipos de solicitud."""
 
     list_display = ['codigo', 'nombre', 'requiere_aprobacion', 'activo', 'fecha_creacion']
@@ -115,7 +118,7 @@ class TipoSolicitudAdmin(admin.ModelAdmin):
 
 
 @admin.register(EstadoSolicitud)
-class EstadoSolicitudAdmin(admin.ModelAdmin):
+class EstadoSolicitudAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de estados de solicitud."""
 
     list_display = [
@@ -154,22 +157,23 @@ class DetalleSolicitudInline(admin.TabularInline):
     ]
 
 
-class HistorialSolicitudInline(admin.TabularInline):
-    """Inline para historial de solicitud."""
+class EventoSolicitudInline(admin.TabularInline):
+    """Inline (solo lectura) para los eventos de la solicitud."""
 
-    model = HistorialSolicitud
+    model = EventoSolicitud
     extra = 0
-    readonly_fields = ['estado_anterior', 'estado_nuevo', 'usuario', 'fecha_cambio', 'observaciones']
-    fields = ['estado_anterior', 'estado_nuevo', 'usuario', 'observaciones', 'fecha_cambio']
+    readonly_fields = ['secuencia', 'tipo', 'estado', 'usuario', 'datos', 'fecha']
+    fields = ['secuencia', 'tipo', 'estado', 'usuario', 'datos', 'fecha']
+    ordering = ['-secuencia']
     can_delete = False
 
     def has_add_permission(self, request, obj=None):
-        """No permite agregar historial manualmente."""
+        """Los eventos solo se registran desde el flujo de la solicitud."""
         return False
 
 
 @admin.register(Solicitud)
-class SolicitudAdmin(admin.ModelAdmin):
+class SolicitudAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de solicitudes."""
 
     list_display = [
@@ -187,7 +191,7 @@ class SolicitudAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['fecha_solicitud', 'fecha_creacion', 'fecha_actualizacion']
     autocomplete_fields = ['tipo_solicitud', 'estado', 'departamento', 'area', 'equipo']
-    inlines = [DetalleSolicitudInline, HistorialSolicitudInline]
+    inlines = [DetalleSolicitudInline, EventoSolicitudInline]
     date_hierarchy = 'fecha_solicitud'
 
     fieldsets = (
@@ -243,9 +247,15 @@ class SolicitudAdmin(admin.ModelAdmin):
 
         return readonly
 
+    def save_model(self, request, obj, form, change):
+        """Guarda y sincroniza el índice de vencimientos si cambió el plazo o el estado."""
+        super().save_model(request, obj, form, change)
+        if not change or {'fecha_requerida', 'estado', 'eliminado'}.intersection(form.changed_data):
+            SlaSolicitudService().sincronizar([obj])
+
 
 @admin.register(DetalleSolicitud)
-class DetalleSolicitudAdmin(admin.ModelAdmin):
+class DetalleSolicitudAdmin(SoftDeleteAdminMixin, admin.ModelAdmin):
     """Administración de detalles de solicitud."""
 
     list_display = [
@@ -283,17 +293,44 @@ class DetalleSolicitudAdmin(admin.ModelAdmin):
         }),
     )
 
+    # Campos del detalle que alimentan los contadores de la solicitud
+    CAMPOS_CONTADORES = {'solicitud', 'cantidad_aprobada', 'cantidad_despachada', 'eliminado'}
+
     def get_producto(self, obj):
         """Obtiene el nombre del producto (artículo o activo)."""
         return obj.producto_nombre if hasattr(obj, 'producto_nombre') else 'N/A'
 
     get_producto.short_description = 'Producto'
 
+    def save_model(self, request, obj, form, change):
+        """Guarda y recalcula los contadores de la solicitud si cambiaron cantidades o vigencia."""
+        super().save_model(request, obj, form, change)
+        if change and not self.CAMPOS_CONTADORES.intersection(form.changed_data):
+            return
+        solicitud_ids = {obj.solicitud_id}
+        if change and 'solicitud' in form.changed_data:
+            solicitud_ids.add(form.initial.get('solicitud'))
+        ContadoresSolicitudService().recalcular(Solicitud.all_objects.filter(pk__in=solicitud_ids))
+
+    def delete_model(self, request, obj):
+        """Elimina físicamente el detalle y recalcula los contadores de su solicitud."""
+        super().delete_model(request, obj)
+        ContadoresSolicitudService().recalcular(Solicitud.all_objects.filter(pk=obj.solicitud_id))
+
+    def delete_queryset(self, request, queryset):
+        """Elimina físicamente los detalles y recalcula los contadores de sus solicitudes."""
+        solicitud_ids = set(queryset.values_list('solicitud_id', flat=True))
+        super().delete_queryset(request, queryset)
+        ContadoresSolicitudService().recalcular(Solicitud.all_objects.filter(pk__in=solicitud_ids))
+
 
 @admin.register(HistorialSolicitud)
 class HistorialSolicitudAdmin(admin.ModelAdmin):
     """Administración de historial de solicitudes."""
 
+    # Sin SoftDeleteAdminMixin: el historial es una traza de auditoría de solo
+    # inserción de los cambios de estado de la solicitud
+
     list_display = [
         'solicitud', 'estado_anterior', 'estado_nuevo',
         'usuario', 'fecha_cambio'
@@ -317,6 +317,25 @@ class RechazarSolicitudForm(forms.Form):
     )
 
 
+class AccionMasivaSolicitudForm(forms.Form):
+    """Formulario para aprobar o despachar varias solicitudes seleccionadas en la lista"""
+
+    solicitudes = forms.ModelMultipleChoiceField(
+        queryset=Solicitud.objects.only('id'),
+        error_messages={'required': 'Debe seleccionar al menos una solicitud.'}
+    )
+    notas = forms.CharField(
+        label='Notas',
+        widget=forms.TextInput(
+            attrs={
+                'class': 'form-control',
+                'placeholder': 'Notas para todas las solicitudes seleccionadas (opcional)'
+            }
+        ),
+        required=False
+    )
+
+
 class FiltroSolicitudesForm(forms.Form):
     """Formulario para filtrar solicitudes en la lista"""
 
@@ -334,6 +353,24 @@ class FiltroSolicitudesForm(forms.Form):
         widget=forms.Select(attrs={'class': 'form-select'})
     )
 
+    departamento = forms.ModelChoiceField(
+        queryset=Departamento.objects.filter(activo=True).order_by('codigo'),
+        required=False,
+        empty_label='Todos los departamentos',
+        help_text='Incluye las solicitudes de sus áreas y equipos',
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+
+    vencimiento = forms.ChoiceField(
+        choices=[
+            ('', 'Todos los plazos'),
+            ('vencidas', 'Vencidas'),
+            ('en_riesgo', 'Por vencer'),
+        ],
+        required=False,
+        widget=forms.Select(attrs={'class': 'form-select'})
+    )
+
     fecha_desde = forms.DateField(
         required=False,
         widget=forms.DateInput(
@@ -0,0 +1,34 @@
+"""
+Comando para el barrido periódico de solicitudes vencidas.
+
+Marca en bloque las solicitudes abiertas cuya fecha requerida ya pasó y
+notifica a sus solicitantes (una vez por vencimiento). Programar en cron,
+por ejemplo cada hora.
+
+Ejecutar con:
+    python manage.py barrer_vencimientos_solicitudes
+    python manage.py barrer_vencimientos_solicitudes --reconstruir
+"""
+from django.core.management.base import BaseCommand
+
+from apps.solicitudes.services import SlaSolicitudService
+
+
+class Command(BaseCommand):
+    help = 'Marca las solicitudes vencidas y notifica a sus solicitantes'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reconstruir',
+            action='store_true',
+            help='Reconstruye el índice de vencimientos desde las solicitudes antes del barrido'
+        )
+
+    def handle(self, *args, **options):
+        service = SlaSolicitudService()
+        if options['reconstruir']:
+            total = service.reconstruir()
+            self.stdout.write(f'{total} solicitud(es) abierta(s) indexada(s).')
+
+        marcadas = service.barrer()
+        self.stdout.write(self.style.SUCCESS(f'{marcadas} solicitud(es) marcada(s) como vencida(s).'))
@@ -0,0 +1,39 @@
+"""
+Comando para recalcular los contadores de cumplimiento de las solicitudes.
+
+total_aprobado, total_despachado y lineas_pendientes se mantienen de forma
+incremental al aprobar, despachar o eliminar detalles; este comando los
+reconstruye desde los detalles vigentes (reparación tras cargas masivas o
+ediciones directas en la base de datos).
+
+Ejecutar con:
+    python manage.py recalcular_contadores_solicitudes
+    python manage.py recalcular_contadores_solicitudes --numero SOL-2025-000001
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.solicitudes.models import Solicitud
+from apps.solicitudes.services import ContadoresSolicitudService
+
+
+class Command(BaseCommand):
+    help = 'Recalcula los contadores de cumplimiento de las solicitudes desde sus detalles'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--numero',
+            action='append',
+            dest='numeros',
+            help='Número de solicitud a recalcular (puede repetirse; default: todas)',
+        )
+
+    def handle(self, *args, **options):
+        solicitudes = None
+        if options['numeros']:
+            solicitudes = Solicitud.all_objects.filter(numero__in=options['numeros']).only('id')
+
+        with transaction.atomic():
+            actualizadas = ContadoresSolicitudService().recalcular(solicitudes)
+
+        self.stdout.write(self.style.SUCCESS(f'{actualizadas} solicitud(es) recalculada(s).'))
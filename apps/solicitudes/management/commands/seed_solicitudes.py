@@ -82,7 +82,7 @@ class Command(BaseCommand):
 
         departamentos = {}
         for data in departamentos_data:
-            dept, created = Departamento.objects.get_or_create(
+            dept, created = Departamento.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -120,7 +120,7 @@ class Command(BaseCommand):
 
         areas = {}
         for data in areas_data:
-            area, created = Area.objects.get_or_create(
+            area, created = Area.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -147,7 +147,7 @@ class Command(BaseCommand):
         ]
 
         for data in equipos_data:
-            equipo, created = Equipo.objects.get_or_create(
+            equipo, created = Equipo.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -173,7 +173,7 @@ class Command(BaseCommand):
 
         unidades = {}
         for data in unidades_data:
-            unidad, created = UnidadMedida.objects.get_or_create(
+            unidad, created = UnidadMedida.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -197,7 +197,7 @@ class Command(BaseCommand):
 
         estados = {}
         for data in estados_data:
-            estado, created = EstadoActivo.objects.get_or_create(
+            estado, created = EstadoActivo.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -227,7 +227,7 @@ class Command(BaseCommand):
 
         categorias = {}
         for data in categorias_data:
-            cat, created = CategoriaActivo.objects.get_or_create(
+            cat, created = CategoriaActivo.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'nombre': data['nombre'],
@@ -284,7 +284,7 @@ class Command(BaseCommand):
         ]
 
         for data in activos_data:
-            activo, created = Activo.objects.get_or_create(
+            activo, created = Activo.all_objects.get_or_create(
                 codigo=data['codigo'],
                 defaults={
                     'tipo': data['tipo'],
@@ -58,7 +58,7 @@ class Command(BaseCommand):
         ]
 
         for estado_data in estados:
-            estado, created = EstadoSolicitud.objects.get_or_create(
+            estado, created = EstadoSolicitud.all_objects.get_or_create(
                 codigo=estado_data['codigo'],
                 defaults=estado_data
             )
@@ -100,7 +100,7 @@ class Command(BaseCommand):
         ]
 
         for tipo_data in tipos:
-            tipo, created = TipoSolicitud.objects.get_or_create(
+            tipo, created = TipoSolicitud.all_objects.get_or_create(
                 codigo=tipo_data['codigo'],
                 defaults=tipo_data
             )
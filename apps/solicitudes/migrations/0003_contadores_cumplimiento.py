@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:11
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, F, IntegerField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def calcular_contadores(apps, schema_editor):
+    """Carga inicial de los contadores desde los detalles vigentes."""
+    Solicitud = apps.get_model('solicitudes', 'Solicitud')
+    DetalleSolicitud = apps.get_model('solicitudes', 'DetalleSolicitud')
+
+    detalles = DetalleSolicitud.all_objects.filter(
+        solicitud=OuterRef('pk'), eliminado=False
+    ).order_by().values('solicitud')
+    decimal = DecimalField(max_digits=12, decimal_places=2)
+
+    Solicitud.all_objects.update(
+        total_aprobado=Coalesce(
+            Subquery(detalles.annotate(total=Sum('cantidad_aprobada')).values('total'), output_field=decimal),
+            Decimal('0'), output_field=decimal
+        ),
+        total_despachado=Coalesce(
+            Subquery(detalles.annotate(total=Sum('cantidad_despachada')).values('total'), output_field=decimal),
+            Decimal('0'), output_field=decimal
+        ),
+        lineas_pendientes=Coalesce(
+            Subquery(
+                detalles.annotate(total=Count(
+                    'id', filter=Q(cantidad_despachada__lt=F('cantidad_aprobada'))
+                )).values('total'),
+                output_field=IntegerField()
+            ),
+            0
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('solicitudes', '0002_managers_vigentes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solicitud',
+            name='lineas_pendientes',
+            field=models.PositiveIntegerField(default=0, help_text='Cantidad de detalles con despacho pendiente', verbose_name='Líneas Pendientes'),
+        ),
+        migrations.AddField(
+            model_name='solicitud',
+            name='total_aprobado',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Suma de cantidades aprobadas', max_digits=12, verbose_name='Total Aprobado'),
+        ),
+        migrations.AddField(
+            model_name='solicitud',
+            name='total_despachado',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Suma de cantidades despachadas', max_digits=12, verbose_name='Total Despachado'),
+        ),
+        migrations.RunPython(calcular_contadores, migrations.RunPython.noop),
+    ]
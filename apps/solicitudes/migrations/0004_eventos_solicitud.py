@@ -0,0 +1,100 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:35
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+# Tipo de evento según el código del estado resultante del registro de historial
+TIPOS_POR_ESTADO = {
+    'APROBADA': ('APROBADA', 'notas'),
+    'DESPACHADA': ('DESPACHADA', 'notas'),
+    'RECHAZADA': ('RECHAZADA', 'motivo'),
+    'CANCELADA': ('CANCELADA', 'motivo'),
+}
+
+
+def migrar_historial(apps, schema_editor):
+    """Convierte el historial vigente en eventos numerados por solicitud."""
+    Solicitud = apps.get_model('solicitudes', 'Solicitud')
+    HistorialSolicitud = apps.get_model('solicitudes', 'HistorialSolicitud')
+    EventoSolicitud = apps.get_model('solicitudes', 'EventoSolicitud')
+
+    registros = HistorialSolicitud.all_objects.filter(eliminado=False).order_by(
+        'solicitud_id', 'fecha_cambio', 'id'
+    ).values_list(
+        'solicitud_id', 'estado_anterior_id', 'estado_nuevo_id', 'estado_nuevo__codigo',
+        'usuario_id', 'observaciones', 'fecha_cambio'
+    )
+
+    eventos = []
+    solicitud_actual = None
+    secuencia = 0
+    for solicitud_id, anterior_id, estado_id, codigo, usuario_id, observaciones, fecha in registros.iterator(chunk_size=2000):
+        if solicitud_id != solicitud_actual:
+            solicitud_actual = solicitud_id
+            secuencia = 0
+        secuencia += 1
+
+        if anterior_id is None:
+            tipo, clave = 'CREADA', None
+        else:
+            tipo, clave = TIPOS_POR_ESTADO.get(codigo, ('ESTADO', 'observaciones'))
+        eventos.append(EventoSolicitud(
+            solicitud_id=solicitud_id,
+            secuencia=secuencia,
+            tipo=tipo,
+            estado_id=estado_id,
+            usuario_id=usuario_id,
+            datos={clave: observaciones} if clave and observaciones else {},
+            fecha=fecha
+        ))
+        if len(eventos) >= 2000:
+            EventoSolicitud.objects.bulk_create(eventos)
+            eventos = []
+    EventoSolicitud.objects.bulk_create(eventos)
+
+    ultima = EventoSolicitud.objects.filter(
+        solicitud=OuterRef('pk')
+    ).order_by().values('solicitud').annotate(ultima=Max('secuencia')).values('ultima')
+    Solicitud.all_objects.update(secuencia_eventos=Coalesce(Subquery(ultima), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('solicitudes', '0003_contadores_cumplimiento'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='solicitud',
+            name='secuencia_eventos',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Número de secuencia del último evento registrado', verbose_name='Secuencia de Eventos'),
+        ),
+        migrations.CreateModel(
+            name='EventoSolicitud',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('secuencia', models.PositiveIntegerField(help_text='Número correlativo del evento dentro de la solicitud', verbose_name='Secuencia')),
+                ('tipo', models.CharField(choices=[('CREADA', 'Creación'), ('ESTADO', 'Cambio de estado'), ('APROBADA', 'Aprobación'), ('RECHAZADA', 'Rechazo'), ('DESPACHADA', 'Despacho'), ('CANCELADA', 'Cancelación')], max_length=10, verbose_name='Tipo')),
+                ('datos', models.JSONField(blank=True, default=dict, verbose_name='Datos')),
+                ('fecha', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Fecha')),
+                ('estado', models.ForeignKey(help_text='Estado de la solicitud después del evento', on_delete=django.db.models.deletion.PROTECT, related_name='+', to='solicitudes.estadosolicitud', verbose_name='Estado')),
+                ('solicitud', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='eventos', to='solicitudes.solicitud', verbose_name='Solicitud')),
+                ('usuario', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Usuario')),
+            ],
+            options={
+                'verbose_name': 'Evento de Solicitud',
+                'verbose_name_plural': 'Eventos de Solicitudes',
+                'db_table': 'tba_solicitudes_evento',
+                'ordering': ['solicitud', 'secuencia'],
+                'constraints': [models.UniqueConstraint(fields=('solicitud', 'secuencia'), name='uq_evento_solicitud_secuencia')],
+            },
+        ),
+        migrations.RunPython(migrar_historial, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:47
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def indexar_abiertas(apps, schema_editor):
+    """Agrega al índice de vencimientos las solicitudes vigentes en estado no final."""
+    Solicitud = apps.get_model('solicitudes', 'Solicitud')
+    VencimientoSolicitud = apps.get_model('solicitudes', 'VencimientoSolicitud')
+
+    abiertas = Solicitud.all_objects.filter(eliminado=False, estado__es_final=False).values_list(
+        'pk', 'fecha_requerida'
+    )
+    vencimientos = []
+    for solicitud_id, fecha_requerida in abiertas.iterator(chunk_size=2000):
+        vencimientos.append(VencimientoSolicitud(solicitud_id=solicitud_id, fecha_requerida=fecha_requerida))
+        if len(vencimientos) >= 2000:
+            VencimientoSolicitud.objects.bulk_create(vencimientos)
+            vencimientos = []
+    VencimientoSolicitud.objects.bulk_create(vencimientos)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('solicitudes', '0004_eventos_solicitud'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VencimientoSolicitud',
+            fields=[
+                ('solicitud', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='vencimiento', serialize=False, to='solicitudes.solicitud', verbose_name='Solicitud')),
+                ('fecha_requerida', models.DateField(verbose_name='Fecha Requerida')),
+                ('vencida', models.BooleanField(default=False, help_text='Marcada y notificada por el barrido de vencimientos', verbose_name='Vencida')),
+                ('fecha_marcada', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de Marca')),
+            ],
+            options={
+                'verbose_name': 'Vencimiento de Solicitud',
+                'verbose_name_plural': 'Vencimientos de Solicitudes',
+                'db_table': 'tba_solicitudes_vencimiento',
+                'ordering': ['fecha_requerida'],
+                'indexes': [models.Index(fields=['fecha_requerida'], name='ix_venc_sol_fecha'), models.Index(condition=models.Q(('vencida', False)), fields=['fecha_requerida'], name='ix_venc_sol_fecha_pend')],
+            },
+        ),
+        migrations.RunPython(indexar_abiertas, migrations.RunPython.noop),
+    ]
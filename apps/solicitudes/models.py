@@ -2,6 +2,7 @@ from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 
 from apps.activos.models import Activo
 from apps.bodega.models import Articulo, Bodega
@@ -358,8 +359,15 @@ class Solicitud(BaseModel):
         observaciones: Observaciones adicionales (opcional).
         notas_aprobacion: Notas del aprobador (opcional).
         notas_despacho: Notas del despachador (opcional).
+        total_aprobado: Suma de cantidades aprobadas de los detalles vigentes.
+        total_despachado: Suma de cantidades despachadas de los detalles vigentes.
+        lineas_pendientes: Detalles con cantidad despachada menor a la aprobada.
     """
 
+    # Campos que solo se modifican con UPDATE atómicos (ver save)
+    CAMPOS_CONTADORES = ['total_aprobado', 'total_despachado', 'lineas_pendientes']
+    CAMPOS_MANTENIDOS = ['secuencia_eventos', *CAMPOS_CONTADORES]
+
     TIPO_CHOICES = [
         ('ACTIVO', 'Solicitud de Activos/Bienes'),
         ('ARTICULO', 'Solicitud de Artículos'),
@@ -528,6 +536,33 @@ class Solicitud(BaseModel):
         help_text='Notas del despachador'
     )
 
+    # Contadores de cumplimiento (mantenidos por ContadoresSolicitudService)
+    total_aprobado = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name='Total Aprobado',
+        help_text='Suma de cantidades aprobadas'
+    )
+    total_despachado = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        default=0,
+        verbose_name='Total Despachado',
+        help_text='Suma de cantidades despachadas'
+    )
+    lineas_pendientes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Líneas Pendientes',
+        help_text='Cantidad de detalles con despacho pendiente'
+    )
+    secuencia_eventos = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Secuencia de Eventos',
+        help_text='Número de secuencia del último evento registrado'
+    )
+
     class Meta:
         db_table = 'tba_solicitudes_solicitud'
         verbose_name = 'Solicitud'
@@ -556,6 +591,43 @@ class Solicitud(BaseModel):
         """Representación en cadena de la solicitud."""
         return f"SOL-{self.numero} - {self.solicitante.email}"
 
+    def save(self, *args, **kwargs) -> None:
+        """
+        Guarda la solicitud sin sobrescribir los campos mantenidos con UPDATE propios.
+
+        secuencia_eventos (EventoSolicitudService) y los contadores de
+        cumplimiento (ContadoresSolicitudService) se actualizan con expresiones
+        F(); una instancia cargada antes de esos cambios no debe revertirlos.
+        """
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.CAMPOS_MANTENIDOS
+            ]
+        super().save(*args, **kwargs)
+
+    @property
+    def porcentaje_despachado(self) -> int:
+        """
+        Porcentaje despachado respecto de lo aprobado (0 a 100).
+
+        Returns:
+            int: Porcentaje entero calculado desde los contadores
+        """
+        if not self.total_aprobado:
+            return 0
+        return min(100, int(self.total_despachado * 100 / self.total_aprobado))
+
+    @property
+    def despacho_completo(self) -> bool:
+        """
+        Indica si no quedan detalles con despacho pendiente.
+
+        Returns:
+            bool: True si lineas_pendientes es cero
+        """
+        return self.lineas_pendientes == 0
+
 
 class DetalleSolicitud(BaseModel):
     """
@@ -768,3 +840,160 @@ class HistorialSolicitud(BaseModel):
     def __str__(self) -> str:
         """Representación en cadena del registro de historial."""
         return f"{self.solicitud.numero} - {self.estado_nuevo.nombre} ({self.fecha_cambio})"
+
+
+class EventoSolicitud(models.Model):
+    """
+    Evento del flujo de una solicitud (registro de solo inserción).
+
+    Reemplaza a HistorialSolicitud como fuente del historial: cada solicitud
+    tiene su propia secuencia (1, 2, 3...) y cada evento guarda solo el estado
+    resultante y un payload compacto cuyas claves dependen del tipo. El estado
+    anterior es el del evento previo de la secuencia.
+
+    Attributes:
+        solicitud: Solicitud a la que pertenece el evento.
+        secuencia: Número correlativo del evento dentro de la solicitud.
+        tipo: Tipo de evento (creación, aprobación, despacho, etc.).
+        estado: Estado de la solicitud después del evento.
+        usuario: Usuario que originó el evento (opcional).
+        datos: Payload del evento con las claves de PAYLOAD_POR_TIPO.
+        fecha: Fecha y hora del evento.
+    """
+
+    TIPO_CREADA = 'CREADA'
+    TIPO_ESTADO = 'ESTADO'
+    TIPO_APROBADA = 'APROBADA'
+    TIPO_RECHAZADA = 'RECHAZADA'
+    TIPO_DESPACHADA = 'DESPACHADA'
+    TIPO_CANCELADA = 'CANCELADA'
+
+    TIPO_CHOICES = [
+        (TIPO_CREADA, 'Creación'),
+        (TIPO_ESTADO, 'Cambio de estado'),
+        (TIPO_APROBADA, 'Aprobación'),
+        (TIPO_RECHAZADA, 'Rechazo'),
+        (TIPO_DESPACHADA, 'Despacho'),
+        (TIPO_CANCELADA, 'Cancelación'),
+    ]
+
+    # Claves permitidas en el payload de cada tipo de evento
+    PAYLOAD_POR_TIPO = {
+        TIPO_CREADA: (),
+        TIPO_ESTADO: ('observaciones',),
+        TIPO_APROBADA: ('notas',),
+        TIPO_RECHAZADA: ('motivo',),
+        TIPO_DESPACHADA: ('notas',),
+        TIPO_CANCELADA: ('motivo',),
+    }
+
+    solicitud = models.ForeignKey(
+        Solicitud,
+        on_delete=models.CASCADE,
+        related_name='eventos',
+        db_index=False,
+        verbose_name='Solicitud'
+    )
+    secuencia = models.PositiveIntegerField(
+        verbose_name='Secuencia',
+        help_text='Número correlativo del evento dentro de la solicitud'
+    )
+    tipo = models.CharField(
+        max_length=10,
+        choices=TIPO_CHOICES,
+        verbose_name='Tipo'
+    )
+    estado = models.ForeignKey(
+        EstadoSolicitud,
+        on_delete=models.PROTECT,
+        related_name='+',
+        verbose_name='Estado',
+        help_text='Estado de la solicitud después del evento'
+    )
+    usuario = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        null=True,
+        blank=True,
+        verbose_name='Usuario'
+    )
+    datos = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='Datos'
+    )
+    fecha = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Fecha'
+    )
+
+    class Meta:
+        db_table = 'tba_solicitudes_evento'
+        verbose_name = 'Evento de Solicitud'
+        verbose_name_plural = 'Eventos de Solicitudes'
+        ordering = ['solicitud', 'secuencia']
+        constraints = [
+            # También es el índice de lectura del historial (rango por solicitud)
+            models.UniqueConstraint(
+                fields=['solicitud', 'secuencia'],
+                name='uq_evento_solicitud_secuencia'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en cadena del evento."""
+        return f"{self.solicitud_id} #{self.secuencia} - {self.get_tipo_display()}"
+
+
+class VencimientoSolicitud(models.Model):
+    """
+    Índice de solicitudes abiertas por fecha requerida (seguimiento de SLA).
+
+    Solo contiene solicitudes vigentes que no están en un estado final, por lo
+    que las consultas de vencidas o en riesgo son un rango sobre fecha_requerida
+    en una tabla pequeña. SlaSolicitudService la mantiene al registrarse eventos
+    y el barrido periódico marca las vencidas y notifica.
+
+    Attributes:
+        solicitud: Solicitud abierta (clave primaria).
+        fecha_requerida: Copia de Solicitud.fecha_requerida.
+        vencida: Indica si el barrido ya marcó y notificó el vencimiento.
+        fecha_marcada: Fecha y hora en que se marcó como vencida (opcional).
+    """
+
+    solicitud = models.OneToOneField(
+        Solicitud,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='vencimiento',
+        verbose_name='Solicitud'
+    )
+    fecha_requerida = models.DateField(
+        verbose_name='Fecha Requerida'
+    )
+    vencida = models.BooleanField(
+        default=False,
+        verbose_name='Vencida',
+        help_text='Marcada y notificada por el barrido de vencimientos'
+    )
+    fecha_marcada = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Fecha de Marca'
+    )
+
+    class Meta:
+        db_table = 'tba_solicitudes_vencimiento'
+        verbose_name = 'Vencimiento de Solicitud'
+        verbose_name_plural = 'Vencimientos de Solicitudes'
+        ordering = ['fecha_requerida']
+        indexes = [
+            models.Index(fields=['fecha_requerida'], name='ix_venc_sol_fecha'),
+            # Pendientes de marcar por el barrido
+            models.Index(fields=['fecha_requerida'], name='ix_venc_sol_fecha_pend', condition=models.Q(vencida=False)),
+        ]
+
+    def __str__(self) -> str:
+        """Representación en cadena del vencimiento."""
+        return f"{self.solicitud_id} - {self.fecha_requerida}"
@@ -4,13 +4,19 @@ Repository Pattern para el módulo de solicitudes.
 Separa la lógica de acceso a datos de la lógica de negocio,
 siguiendo el principio de Inversión de Dependencias (SOLID).
 """
-from typing import Optional
-from django.db.models import QuerySet
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Optional, Iterable, List
+from django.db.models import (
+    QuerySet, F, Q, Sum, Max, Count, OuterRef, Subquery, DecimalField, IntegerField, DateField,
+    Case, When, Value
+)
+from django.db.models.functions import Coalesce, TruncMonth
 from django.contrib.auth.models import User
 from .models import (
     Departamento, Area, Equipo,
     TipoSolicitud, EstadoSolicitud, Solicitud,
-    DetalleSolicitud, HistorialSolicitud
+    DetalleSolicitud, HistorialSolicitud, EventoSolicitud, VencimientoSolicitud
 )
 from apps.bodega.models import Bodega
 
@@ -43,6 +49,11 @@ class DepartamentoRepository:
         except Departamento.DoesNotExist:
             return None
 
+    @staticmethod
+    def nodos() -> QuerySet:
+        """Datos mínimos de los departamentos vigentes para armar la jerarquía."""
+        return Departamento.objects.order_by('codigo').values('id', 'codigo', 'nombre', 'activo')
+
 
 # ==================== AREA REPOSITORY ====================
 
@@ -85,6 +96,11 @@ class AreaRepository:
             eliminado=False
         ).order_by('codigo')
 
+    @staticmethod
+    def nodos() -> QuerySet:
+        """Datos mínimos de las áreas vigentes para armar la jerarquía."""
+        return Area.objects.order_by('codigo').values('id', 'codigo', 'nombre', 'activo', 'departamento_id')
+
 
 # ==================== EQUIPO REPOSITORY ====================
 
@@ -127,6 +143,11 @@ class EquipoRepository:
             eliminado=False
         ).order_by('codigo')
 
+    @staticmethod
+    def nodos() -> QuerySet:
+        """Datos mínimos de los equipos vigentes para armar la jerarquía."""
+        return Equipo.objects.order_by('codigo').values('id', 'codigo', 'nombre', 'activo', 'departamento_id')
+
 
 # ==================== TIPO SOLICITUD REPOSITORY ====================
 
@@ -337,7 +358,7 @@ class SolicitudRepository:
     @staticmethod
     def exists_by_numero(numero: str, exclude_id: Optional[int] = None) -> bool:
         """Verifica si existe una solicitud con el número dado."""
-        queryset = Solicitud.objects.filter(numero=numero)
+        queryset = Solicitud.all_objects.filter(numero=numero)
         if exclude_id:
             queryset = queryset.exclude(id=exclude_id)
         return queryset.exists()
@@ -358,12 +379,133 @@ class SolicitudRepository:
             'aprobador', 'despachador', 'bodega_origen'
         ).order_by('-fecha_solicitud')
 
+    @staticmethod
+    def abiertas() -> QuerySet[Solicitud]:
+        """Solicitudes vigentes que no están en un estado final (datos mínimos para el SLA)."""
+        return Solicitud.objects.filter(estado__es_final=False).select_related('estado').only(
+            'fecha_requerida', 'eliminado', 'estado__es_final'
+        ).order_by('pk')
+
+    @staticmethod
+    def conteo_por_unidad() -> QuerySet:
+        """
+        Cantidad de solicitudes vigentes por combinación (departamento, área, equipo).
+
+        Returns:
+            QuerySet de diccionarios con 'departamento_id', 'area_id', 'equipo_id' y 'total'
+        """
+        return Solicitud.objects.order_by().values(
+            'departamento_id', 'area_id', 'equipo_id'
+        ).annotate(total=Count('id'))
+
+    @staticmethod
+    def ajustar_contadores(
+        solicitud_id: int,
+        aprobado: Decimal = Decimal('0'),
+        despachado: Decimal = Decimal('0'),
+        pendientes: int = 0
+    ) -> int:
+        """
+        Aplica deltas a los contadores de cumplimiento con un único UPDATE (F()).
+
+        Args:
+            solicitud_id: ID de la solicitud
+            aprobado: Variación de total_aprobado
+            despachado: Variación de total_despachado
+            pendientes: Variación de lineas_pendientes
+
+        Returns:
+            Cantidad de filas actualizadas
+        """
+        return Solicitud.all_objects.filter(pk=solicitud_id).update(
+            total_aprobado=F('total_aprobado') + aprobado,
+            total_despachado=F('total_despachado') + despachado,
+            lineas_pendientes=F('lineas_pendientes') + pendientes
+        )
+
+    @staticmethod
+    def recalcular_contadores(solicitud_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recalcula los contadores de cumplimiento desde los detalles vigentes.
+
+        Args:
+            solicitud_ids: IDs a recalcular (None = todas las solicitudes)
+
+        Returns:
+            Cantidad de solicitudes actualizadas
+        """
+        detalles = DetalleSolicitud.objects.filter(
+            solicitud=OuterRef('pk')
+        ).order_by().values('solicitud')
+        decimal = DecimalField(max_digits=12, decimal_places=2)
+
+        queryset = Solicitud.all_objects.all()
+        if solicitud_ids is not None:
+            queryset = queryset.filter(pk__in=list(solicitud_ids))
+        return queryset.update(
+            total_aprobado=Coalesce(
+                Subquery(detalles.annotate(total=Sum('cantidad_aprobada')).values('total'), output_field=decimal),
+                Decimal('0'), output_field=decimal
+            ),
+            total_despachado=Coalesce(
+                Subquery(detalles.annotate(total=Sum('cantidad_despachada')).values('total'), output_field=decimal),
+                Decimal('0'), output_field=decimal
+            ),
+            lineas_pendientes=Coalesce(
+                Subquery(
+                    detalles.annotate(total=Count(
+                        'id', filter=Q(cantidad_despachada__lt=F('cantidad_aprobada'))
+                    )).values('total'),
+                    output_field=IntegerField()
+                ),
+                0
+            )
+        )
+
+    @staticmethod
+    def in_bulk_para_workflow(solicitud_ids: Iterable[int]) -> Dict[int, Solicitud]:
+        """
+        Carga y bloquea (SELECT ... FOR UPDATE) varias solicitudes con una consulta.
+
+        Args:
+            solicitud_ids: IDs de las solicitudes
+
+        Returns:
+            Diccionario id -> Solicitud con estado y tipo_solicitud precargados
+        """
+        return Solicitud.objects.select_related(
+            'estado', 'tipo_solicitud'
+        ).select_for_update(of=('self',)).in_bulk(list(solicitud_ids))
+
 
 # ==================== DETALLE SOLICITUD REPOSITORY ====================
 
 class DetalleSolicitudRepository:
     """Repository para detalles de solicitudes."""
 
+    @staticmethod
+    def get_aprobado_mensual(articulo_id_desde: int, articulo_id_hasta: int, fecha_desde: date) -> QuerySet:
+        """
+        Cantidad aprobada por artículo y mes de aprobación desde una fecha.
+
+        Args:
+            articulo_id_desde: ID de artículo inicial inclusivo
+            articulo_id_hasta: ID de artículo final exclusivo
+            fecha_desde: Fecha inicial de aprobación (inclusive)
+
+        Returns:
+            QuerySet de tuplas (articulo_id, mes, total)
+        """
+        return DetalleSolicitud.objects.filter(
+            articulo_id__gte=articulo_id_desde,
+            articulo_id__lt=articulo_id_hasta,
+            cantidad_aprobada__gt=0,
+            solicitud__eliminado=False,
+            solicitud__fecha_aprobacion__date__gte=fecha_desde
+        ).annotate(mes=TruncMonth('solicitud__fecha_aprobacion')).values('articulo_id', 'mes').annotate(
+            total=Sum('cantidad_aprobada')
+        ).order_by().values_list('articulo_id', 'mes', 'total')
+
     @staticmethod
     def filter_by_solicitud(solicitud: Solicitud) -> QuerySet[DetalleSolicitud]:
         """Retorna detalles de una solicitud específica."""
@@ -392,6 +534,43 @@ class DetalleSolicitudRepository:
             eliminado=False
         ).select_related('activo').order_by('id')
 
+    @staticmethod
+    def demanda_aprobada(solicitud_ids: Iterable[int]) -> QuerySet:
+        """
+        Consolida las cantidades aprobadas de varias solicitudes por artículo/activo.
+
+        Una única consulta agrupada (GROUP BY articulo, activo) sobre los detalles vigentes.
+
+        Args:
+            solicitud_ids: IDs de las solicitudes a consolidar
+
+        Returns:
+            QuerySet de diccionarios con 'articulo_id', 'activo_id', 'cantidad'
+            (suma aprobada) y 'precio_unitario' (precio del activo, si aplica)
+        """
+        return DetalleSolicitud.objects.filter(
+            solicitud_id__in=list(solicitud_ids),
+            cantidad_aprobada__gt=0
+        ).values('articulo_id', 'activo_id').annotate(
+            cantidad=Sum('cantidad_aprobada'),
+            precio_unitario=Max('activo__precio_unitario')
+        ).order_by('articulo_id', 'activo_id')
+
+    @staticmethod
+    def in_bulk_by_solicitudes(solicitud_ids: Iterable[int]) -> Dict[int, DetalleSolicitud]:
+        """
+        Carga los detalles vigentes de varias solicitudes con una única consulta.
+
+        Args:
+            solicitud_ids: IDs de las solicitudes
+
+        Returns:
+            Diccionario id -> DetalleSolicitud con artículo y activo precargados
+        """
+        return DetalleSolicitud.objects.filter(
+            solicitud_id__in=list(solicitud_ids)
+        ).select_related('articulo', 'activo').in_bulk()
+
 
 # ==================== HISTORIAL SOLICITUD REPOSITORY ====================
 
@@ -434,3 +613,134 @@ class HistorialSolicitudRepository:
             usuario=usuario,
             observaciones=observaciones
         )
+
+
+# ==================== EVENTO SOLICITUD REPOSITORY ====================
+
+class EventoSolicitudRepository:
+    """Repository para el flujo de eventos de solicitudes."""
+
+    @staticmethod
+    def reservar_secuencias(solicitud_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        Bloquea las solicitudes y retorna su última secuencia de eventos.
+
+        El bloqueo (SELECT ... FOR UPDATE) serializa las inserciones concurrentes
+        sobre una misma solicitud hasta el fin de la transacción.
+
+        Returns:
+            Diccionario solicitud_id -> secuencia del último evento
+        """
+        return dict(
+            Solicitud.all_objects.select_for_update().filter(
+                pk__in=list(solicitud_ids)
+            ).order_by('pk').values_list('pk', 'secuencia_eventos')
+        )
+
+    @staticmethod
+    def actualizar_secuencias(secuencias: Dict[int, int]) -> int:
+        """Guarda la última secuencia de varias solicitudes con un único UPDATE."""
+        if not secuencias:
+            return 0
+        return Solicitud.all_objects.filter(pk__in=list(secuencias)).update(
+            secuencia_eventos=Case(
+                *[When(pk=solicitud_id, then=Value(secuencia)) for solicitud_id, secuencia in secuencias.items()],
+                output_field=IntegerField()
+            )
+        )
+
+    @staticmethod
+    def bulk_create(eventos: List[EventoSolicitud], batch_size: int) -> List[EventoSolicitud]:
+        """Inserta eventos en lotes."""
+        return EventoSolicitud.objects.bulk_create(eventos, batch_size=batch_size)
+
+    @staticmethod
+    def timeline(solicitud_id: int) -> QuerySet:
+        """
+        Eventos de una solicitud en orden de secuencia.
+
+        Lectura por rango sobre el índice único (solicitud, secuencia).
+
+        Returns:
+            QuerySet de diccionarios con los campos del evento y el nombre del usuario
+        """
+        return EventoSolicitud.objects.filter(solicitud_id=solicitud_id).order_by('secuencia').values(
+            'secuencia', 'tipo', 'estado_id', 'datos', 'fecha',
+            'usuario__username', 'usuario__first_name', 'usuario__last_name'
+        )
+
+
+# ==================== VENCIMIENTO SOLICITUD REPOSITORY ====================
+
+class VencimientoSolicitudRepository:
+    """Repository para el índice de solicitudes abiertas por fecha requerida."""
+
+    @staticmethod
+    def fechas(solicitud_ids: Iterable[int]) -> Dict[int, date]:
+        """Fecha requerida indexada de las solicitudes que están en el índice."""
+        return dict(
+            VencimientoSolicitud.objects.filter(solicitud_id__in=list(solicitud_ids)).values_list(
+                'solicitud_id', 'fecha_requerida'
+            )
+        )
+
+    @staticmethod
+    def bulk_create(vencimientos: List[VencimientoSolicitud], batch_size: int) -> List[VencimientoSolicitud]:
+        """Inserta vencimientos en lotes."""
+        return VencimientoSolicitud.objects.bulk_create(vencimientos, batch_size=batch_size)
+
+    @staticmethod
+    def reprogramar(fechas: Dict[int, date]) -> int:
+        """Cambia la fecha requerida de varias solicitudes y reinicia su marca con un único UPDATE."""
+        if not fechas:
+            return 0
+        return VencimientoSolicitud.objects.filter(solicitud_id__in=list(fechas)).update(
+            fecha_requerida=Case(
+                *[When(solicitud_id=solicitud_id, then=Value(fecha)) for solicitud_id, fecha in fechas.items()],
+                output_field=DateField()
+            ),
+            vencida=False,
+            fecha_marcada=None
+        )
+
+    @staticmethod
+    def eliminar(solicitud_ids: Iterable[int]) -> int:
+        """Quita solicitudes del índice (cerradas o eliminadas)."""
+        total, _ = VencimientoSolicitud.objects.filter(solicitud_id__in=list(solicitud_ids)).delete()
+        return total
+
+    @staticmethod
+    def eliminar_cerradas() -> int:
+        """Quita del índice las solicitudes eliminadas o en estado final."""
+        total, _ = VencimientoSolicitud.objects.filter(
+            Q(solicitud__eliminado=True) | Q(solicitud__estado__es_final=True)
+        ).delete()
+        return total
+
+    @staticmethod
+    def pendientes_de_marcar(hoy: date) -> QuerySet:
+        """
+        Vencimientos anteriores a hoy que el barrido aún no marca.
+
+        Rango sobre el índice parcial ix_venc_sol_fecha_pend. Las filas quedan
+        bloqueadas (SKIP LOCKED) para que dos barridos simultáneos no notifiquen
+        dos veces la misma solicitud.
+
+        Returns:
+            QuerySet de diccionarios con solicitud_id, fecha_requerida,
+            solicitud__numero y solicitud__solicitante_id
+        """
+        return VencimientoSolicitud.objects.select_for_update(skip_locked=True, of=('self',)).filter(
+            vencida=False,
+            fecha_requerida__lt=hoy
+        ).order_by('fecha_requerida').values(
+            'solicitud_id', 'fecha_requerida', 'solicitud__numero', 'solicitud__solicitante_id'
+        )
+
+    @staticmethod
+    def marcar_vencidas(solicitud_ids: List[int], fecha: datetime) -> int:
+        """Marca vencimientos como vencidos con un único UPDATE."""
+        return VencimientoSolicitud.objects.filter(solicitud_id__in=solicitud_ids).update(
+            vencida=True,
+            fecha_marcada=fecha
+        )
@@ -5,26 +5,31 @@ Contiene la lógica de negocio siguiendo el principio de
 Single Responsibility (SOLID). Las operaciones críticas
 usan transacciones atómicas para garantizar consistencia.
 """
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Tuple
 from decimal import Decimal
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from django.db import transaction
+from django.db.models import Q, QuerySet
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
+from django.urls import reverse
 from django.utils import timezone
-from core.utils import generar_codigo_unico
+from core.utils import generar_codigo_unico, CacheLRU, obtener_generacion, incrementar_generacion
 from .models import (
     Departamento, Area, Equipo,
     TipoSolicitud, EstadoSolicitud, Solicitud,
-    DetalleSolicitud, HistorialSolicitud
+    DetalleSolicitud, EventoSolicitud, VencimientoSolicitud
 )
 from .repositories import (
     DepartamentoRepository, AreaRepository, EquipoRepository,
     TipoSolicitudRepository, EstadoSolicitudRepository, SolicitudRepository,
-    DetalleSolicitudRepository, HistorialSolicitudRepository
+    DetalleSolicitudRepository, EventoSolicitudRepository, VencimientoSolicitudRepository
 )
 from apps.bodega.models import Bodega
+from apps.bodega.repositories import EntregaArticuloRepository, EntregaBienRepository
 from apps.activos.models import Activo
+from apps.notificaciones.models import Notificacion
+from apps.notificaciones.services import NotificacionService
 
 
 # ==================== SOLICITUD SERVICE ====================
@@ -37,7 +42,8 @@ class SolicitudService:
         self.estado_repo = EstadoSolicitudRepository()
         self.tipo_repo = TipoSolicitudRepository()
         self.detalle_repo = DetalleSolicitudRepository()
-        self.historial_repo = HistorialSolicitudRepository()
+        self.evento_service = EventoSolicitudService()
+        self.contadores_service = ContadoresSolicitudService()
 
     @transaction.atomic
     def crear_solicitud(
@@ -131,13 +137,7 @@ class SolicitudService:
         )
 
         # Registrar en historial
-        self.historial_repo.create(
-            solicitud=solicitud,
-            estado_anterior=None,
-            estado_nuevo=estado_inicial,
-            usuario=solicitante,
-            observaciones=f'Solicitud creada por {solicitante.get_full_name()}'
-        )
+        self.evento_service.registrar(solicitud, EventoSolicitud.TIPO_CREADA, estado_inicial, solicitante)
 
         return solicitud
 
@@ -168,18 +168,13 @@ class SolicitudService:
         if solicitud.estado.es_final:
             raise ValidationError('No se puede cambiar el estado de una solicitud finalizada')
 
-        estado_anterior = solicitud.estado
-
         # Actualizar estado
         solicitud.estado = nuevo_estado
         solicitud.save()
 
         # Registrar en historial
-        self.historial_repo.create(
-            solicitud=solicitud,
-            estado_anterior=estado_anterior,
-            estado_nuevo=nuevo_estado,
-            usuario=usuario,
+        self.evento_service.registrar(
+            solicitud, EventoSolicitud.TIPO_ESTADO, nuevo_estado, usuario,
             observaciones=observaciones
         )
 
@@ -208,64 +203,102 @@ class SolicitudService:
         Raises:
             ValidationError: Si hay errores de validación
         """
-        # Validar que no esté ya aprobada
-        if solicitud.aprobador:
-            raise ValidationError('Esta solicitud ya fue aprobada')
-
-        # Validar que tenga detalles
-        detalles = self.detalle_repo.filter_by_solicitud(solicitud)
-        if not detalles.exists():
-            raise ValidationError('La solicitud no tiene detalles para aprobar')
+        cantidades = {
+            detalle_data['detalle_id']: detalle_data['cantidad_aprobada']
+            for detalle_data in detalles_aprobados
+        }
+        return self.aprobar_solicitudes([solicitud.id], aprobador, cantidades, notas_aprobacion)[0]
 
-        # Actualizar cantidades aprobadas
-        for detalle_data in detalles_aprobados:
-            detalle = self.detalle_repo.get_by_id(detalle_data['detalle_id'])
-            if detalle and detalle.solicitud.id == solicitud.id:
-                cantidad_aprobada = Decimal(str(detalle_data['cantidad_aprobada']))
+    @transaction.atomic
+    def aprobar_solicitudes(
+        self,
+        solicitud_ids: Iterable[int],
+        aprobador: User,
+        cantidades: Optional[Dict[int, Any]] = None,
+        notas_aprobacion: str = ''
+    ) -> List[Solicitud]:
+        """
+        Aprueba varias solicitudes en una sola operación.
 
-                # Validar que no exceda lo solicitado
-                if cantidad_aprobada > detalle.cantidad_solicitada:
-                    producto = detalle.producto_nombre
-                    raise ValidationError(
-                        f'La cantidad aprobada para {producto} '
-                        f'no puede exceder la cantidad solicitada ({detalle.cantidad_solicitada})'
-                    )
+        Los detalles se cargan con un único in_bulk y se validan en memoria; si
+        alguna solicitud o detalle no es válido no se aprueba ninguna. Las
+        cantidades, estados e historial se escriben con bulk_update/bulk_create.
 
-                # Validar que no sea negativa
-                if cantidad_aprobada < 0:
-                    producto = detalle.producto_nombre
-                    raise ValidationError(
-                        f'La cantidad aprobada para {producto} no puede ser negativa'
-                    )
-
-                detalle.cantidad_aprobada = cantidad_aprobada
-                detalle.save()
+        Args:
+            solicitud_ids: IDs de las solicitudes a aprobar
+            aprobador: Usuario aprobador
+            cantidades: Diccionario detalle_id -> cantidad aprobada. Si es None
+                se aprueba la cantidad solicitada de todos los detalles
+            notas_aprobacion: Notas de aprobación
 
-        # Actualizar solicitud
-        solicitud.aprobador = aprobador
-        solicitud.fecha_aprobacion = timezone.now()
-        solicitud.notas_aprobacion = notas_aprobacion
+        Returns:
+            Lista de solicitudes aprobadas
 
-        # Cambiar a estado aprobado
+        Raises:
+            ValidationError: Con los errores de todas las solicitudes inválidas
+        """
         estado_aprobado = self.estado_repo.get_by_codigo('APROBADA')
         if not estado_aprobado:
             raise ValidationError('No existe el estado APROBADA en el sistema')
 
-        estado_anterior = solicitud.estado
-        solicitud.estado = estado_aprobado
-        solicitud.save()
+        solicitudes, detalles_por_solicitud = self._cargar_para_workflow(solicitud_ids)
+
+        errores = []
+        detalles_modificados = []
+        cambios: Dict[int, List[Tuple[Decimal, Decimal, Decimal, Decimal]]] = {}
+        for solicitud in solicitudes:
+            if solicitud.aprobador_id:
+                errores.append(f'{solicitud.numero}: esta solicitud ya fue aprobada')
+                continue
+            if solicitud.estado.es_final:
+                errores.append(f'{solicitud.numero}: la solicitud está finalizada')
+                continue
+            detalles = detalles_por_solicitud.get(solicitud.id, [])
+            if not detalles:
+                errores.append(f'{solicitud.numero}: la solicitud no tiene detalles para aprobar')
+                continue
+
+            for detalle in detalles:
+                if cantidades is None:
+                    cantidad_aprobada = detalle.cantidad_solicitada
+                elif detalle.id in cantidades:
+                    cantidad_aprobada = Decimal(str(cantidades[detalle.id]))
+                else:
+                    continue
 
-        # Registrar en historial
-        self.historial_repo.create(
-            solicitud=solicitud,
-            estado_anterior=estado_anterior,
-            estado_nuevo=estado_aprobado,
-            usuario=aprobador,
-            observaciones=f'Aprobada por {aprobador.get_full_name()}. {notas_aprobacion}'
+                if cantidad_aprobada > detalle.cantidad_solicitada:
+                    errores.append(
+                        f'{solicitud.numero}: la cantidad aprobada para {detalle.producto_nombre} '
+                        f'no puede exceder la cantidad solicitada ({detalle.cantidad_solicitada})'
+                    )
+                elif cantidad_aprobada < 0:
+                    errores.append(
+                        f'{solicitud.numero}: la cantidad aprobada para {detalle.producto_nombre} '
+                        f'no puede ser negativa'
+                    )
+                else:
+                    cambios.setdefault(solicitud.id, []).append((
+                        detalle.cantidad_aprobada, detalle.cantidad_despachada,
+                        cantidad_aprobada, detalle.cantidad_despachada
+                    ))
+                    detalle.cantidad_aprobada = cantidad_aprobada
+                    detalles_modificados.append(detalle)
+
+        if errores:
+            raise ValidationError(errores)
+
+        ahora = timezone.now()
+        for solicitud in solicitudes:
+            solicitud.aprobador = aprobador
+            solicitud.fecha_aprobacion = ahora
+            solicitud.notas_aprobacion = notas_aprobacion
+
+        return self._registrar_workflow_masivo(
+            solicitudes, detalles_modificados, cambios, 'cantidad_aprobada',
+            ['aprobador', 'fecha_aprobacion', 'notas_aprobacion'],
+            estado_aprobado, aprobador, EventoSolicitud.TIPO_APROBADA, notas_aprobacion
         )
 
-        return solicitud
-
     @transaction.atomic
     def rechazar_solicitud(
         self,
@@ -295,18 +328,14 @@ class SolicitudService:
         if not estado_rechazado:
             raise ValidationError('No existe el estado RECHAZADA en el sistema')
 
-        estado_anterior = solicitud.estado
         solicitud.estado = estado_rechazado
         solicitud.notas_aprobacion = f'RECHAZADO: {motivo_rechazo}'
         solicitud.save()
 
         # Registrar en historial
-        self.historial_repo.create(
-            solicitud=solicitud,
-            estado_anterior=estado_anterior,
-            estado_nuevo=estado_rechazado,
-            usuario=rechazador,
-            observaciones=f'Rechazada por {rechazador.get_full_name()}. Motivo: {motivo_rechazo}'
+        self.evento_service.registrar(
+            solicitud, EventoSolicitud.TIPO_RECHAZADA, estado_rechazado, rechazador,
+            motivo=motivo_rechazo
         )
 
         return solicitud
@@ -334,54 +363,166 @@ class SolicitudService:
         Raises:
             ValidationError: Si hay errores de validación
         """
-        # Validar que esté aprobada
-        if not solicitud.aprobador:
-            raise ValidationError('Solo se pueden despachar solicitudes aprobadas')
-
-        # Validar que no esté ya despachada
-        if solicitud.despachador:
-            raise ValidationError('Esta solicitud ya fue despachada')
+        cantidades = {
+            detalle_data['detalle_id']: detalle_data['cantidad_despachada']
+            for detalle_data in detalles_despachados
+        }
+        return self.despachar_solicitudes([solicitud.id], despachador, cantidades, notas_despacho)[0]
 
-        # Actualizar cantidades despachadas
-        for detalle_data in detalles_despachados:
-            detalle = self.detalle_repo.get_by_id(detalle_data['detalle_id'])
-            if detalle and detalle.solicitud.id == solicitud.id:
-                cantidad_despachada = Decimal(str(detalle_data['cantidad_despachada']))
+    @transaction.atomic
+    def despachar_solicitudes(
+        self,
+        solicitud_ids: Iterable[int],
+        despachador: User,
+        cantidades: Optional[Dict[int, Any]] = None,
+        notas_despacho: str = ''
+    ) -> List[Solicitud]:
+        """
+        Despacha varias solicitudes aprobadas en una sola operación.
 
-                # Validar que no exceda lo aprobado
-                if cantidad_despachada > detalle.cantidad_aprobada:
-                    raise ValidationError(
-                        f'La cantidad despachada para {detalle.activo.codigo} '
-                        f'excede la cantidad aprobada'
-                    )
+        Igual que aprobar_solicitudes: un in_bulk de detalles, validación en
+        memoria (todo o nada) y escrituras con bulk_update/bulk_create.
 
-                detalle.cantidad_despachada = cantidad_despachada
-                detalle.save()
+        Args:
+            solicitud_ids: IDs de las solicitudes a despachar
+            despachador: Usuario despachador
+            cantidades: Diccionario detalle_id -> cantidad despachada. Si es None
+                se despacha la cantidad aprobada de todos los detalles
+            notas_despacho: Notas de despacho
 
-        # Actualizar solicitud
-        solicitud.despachador = despachador
-        solicitud.fecha_despacho = timezone.now()
-        solicitud.notas_despacho = notas_despacho
+        Returns:
+            Lista de solicitudes despachadas
 
-        # Cambiar a estado despachado
+        Raises:
+            ValidationError: Con los errores de todas las solicitudes inválidas
+        """
         estado_despachado = self.estado_repo.get_by_codigo('DESPACHADA')
         if not estado_despachado:
             raise ValidationError('No existe el estado DESPACHADA en el sistema')
 
-        estado_anterior = solicitud.estado
-        solicitud.estado = estado_despachado
-        solicitud.save()
+        solicitudes, detalles_por_solicitud = self._cargar_para_workflow(solicitud_ids)
+
+        errores = []
+        detalles_modificados = []
+        cambios: Dict[int, List[Tuple[Decimal, Decimal, Decimal, Decimal]]] = {}
+        for solicitud in solicitudes:
+            if not solicitud.aprobador_id:
+                errores.append(f'{solicitud.numero}: solo se pueden despachar solicitudes aprobadas')
+                continue
+            if solicitud.despachador_id:
+                errores.append(f'{solicitud.numero}: esta solicitud ya fue despachada')
+                continue
+
+            for detalle in detalles_por_solicitud.get(solicitud.id, []):
+                if cantidades is None:
+                    cantidad_despachada = detalle.cantidad_aprobada
+                elif detalle.id in cantidades:
+                    cantidad_despachada = Decimal(str(cantidades[detalle.id]))
+                else:
+                    continue
 
-        # Registrar en historial
-        self.historial_repo.create(
-            solicitud=solicitud,
-            estado_anterior=estado_anterior,
-            estado_nuevo=estado_despachado,
-            usuario=despachador,
-            observaciones=f'Despachada por {despachador.get_full_name()}. {notas_despacho}'
+                if cantidad_despachada > detalle.cantidad_aprobada:
+                    errores.append(
+                        f'{solicitud.numero}: la cantidad despachada para {detalle.producto_nombre} '
+                        f'excede la cantidad aprobada'
+                    )
+                elif cantidad_despachada < 0:
+                    errores.append(
+                        f'{solicitud.numero}: la cantidad despachada para {detalle.producto_nombre} '
+                        f'no puede ser negativa'
+                    )
+                else:
+                    cambios.setdefault(solicitud.id, []).append((
+                        detalle.cantidad_aprobada, detalle.cantidad_despachada,
+                        detalle.cantidad_aprobada, cantidad_despachada
+                    ))
+                    detalle.cantidad_despachada = cantidad_despachada
+                    detalles_modificados.append(detalle)
+
+        if errores:
+            raise ValidationError(errores)
+
+        ahora = timezone.now()
+        for solicitud in solicitudes:
+            solicitud.despachador = despachador
+            solicitud.fecha_despacho = ahora
+            solicitud.notas_despacho = notas_despacho
+
+        return self._registrar_workflow_masivo(
+            solicitudes, detalles_modificados, cambios, 'cantidad_despachada',
+            ['despachador', 'fecha_despacho', 'notas_despacho'],
+            estado_despachado, despachador, EventoSolicitud.TIPO_DESPACHADA, notas_despacho
         )
 
-        return solicitud
+    def _cargar_para_workflow(
+        self,
+        solicitud_ids: Iterable[int]
+    ) -> Tuple[List[Solicitud], Dict[int, List[DetalleSolicitud]]]:
+        """
+        Carga (bloqueando) las solicitudes y todos sus detalles con dos consultas.
+
+        Returns:
+            Tupla (solicitudes ordenadas por id, detalles agrupados por solicitud_id)
+
+        Raises:
+            ValidationError: Si no se indicaron solicitudes o alguna no existe
+        """
+        ids = sorted(set(solicitud_ids))
+        if not ids:
+            raise ValidationError('Debe seleccionar al menos una solicitud')
+
+        solicitudes = self.solicitud_repo.in_bulk_para_workflow(ids)
+        faltantes = [solicitud_id for solicitud_id in ids if solicitud_id not in solicitudes]
+        if faltantes:
+            raise ValidationError(f'No existen las solicitudes: {", ".join(map(str, faltantes))}')
+
+        detalles_por_solicitud: Dict[int, List[DetalleSolicitud]] = {}
+        for detalle in sorted(self.detalle_repo.in_bulk_by_solicitudes(ids).values(), key=lambda d: d.id):
+            detalles_por_solicitud.setdefault(detalle.solicitud_id, []).append(detalle)
+
+        return [solicitudes[solicitud_id] for solicitud_id in ids], detalles_por_solicitud
+
+    def _registrar_workflow_masivo(
+        self,
+        solicitudes: List[Solicitud],
+        detalles: List[DetalleSolicitud],
+        cambios: Dict[int, List[Tuple[Decimal, Decimal, Decimal, Decimal]]],
+        campo_cantidad: str,
+        campos_solicitud: List[str],
+        estado_nuevo: EstadoSolicitud,
+        usuario: User,
+        tipo_evento: str,
+        notas: str
+    ) -> List[Solicitud]:
+        """
+        Persiste un paso masivo del workflow ya validado en memoria.
+
+        bulk_update de detalles y solicitudes, inserción masiva de eventos y
+        ajuste de los contadores de cumplimiento con los deltas de cada
+        solicitud (las cantidades anteriores y nuevas ya están en memoria).
+
+        Args:
+            cambios: solicitud_id -> tuplas (aprobada_anterior, despachada_anterior,
+                aprobada, despachada) de sus detalles modificados
+        """
+        ahora = timezone.now()
+        for detalle in detalles:
+            detalle.fecha_actualizacion = ahora
+        DetalleSolicitud.objects.bulk_update(detalles, [campo_cantidad, 'fecha_actualizacion'])
+
+        for solicitud in solicitudes:
+            solicitud.estado = estado_nuevo
+            solicitud.fecha_actualizacion = ahora
+        Solicitud.objects.bulk_update(solicitudes, campos_solicitud + ['estado', 'fecha_actualizacion'])
+        self.evento_service.registrar_masivo([
+            EventoSolicitudService.construir(solicitud, tipo_evento, estado_nuevo, usuario, notas=notas)
+            for solicitud in solicitudes
+        ])
+
+        for solicitud in solicitudes:
+            self.contadores_service.registrar_cambios(solicitud, cambios.get(solicitud.id, []))
+
+        return solicitudes
 
     @transaction.atomic
     def cancelar_solicitud(
@@ -416,21 +557,170 @@ class SolicitudService:
         if not estado_cancelado:
             raise ValidationError('No existe el estado CANCELADA en el sistema')
 
-        estado_anterior = solicitud.estado
         solicitud.estado = estado_cancelado
         solicitud.observaciones = f'{solicitud.observaciones}\nCANCELADO: {motivo_cancelacion}'
         solicitud.save()
 
         # Registrar en historial
-        self.historial_repo.create(
+        self.evento_service.registrar(
+            solicitud, EventoSolicitud.TIPO_CANCELADA, estado_cancelado, usuario,
+            motivo=motivo_cancelacion
+        )
+
+        return solicitud
+
+
+# ==================== EVENTO SOLICITUD SERVICE ====================
+
+class EventoSolicitudService:
+    """
+    Service del flujo de eventos (historial) de las solicitudes.
+
+    Los eventos solo se insertan: cada solicitud lleva su propia secuencia y
+    el historial se materializa en memoria por (solicitud, última secuencia).
+    Como la clave cambia con cada evento nuevo, una entrada nunca queda
+    obsoleta y la caché no necesita invalidarse entre procesos.
+    """
+
+    TAMANO_LOTE = 1000
+    cache = CacheLRU(max_entradas=2000, ttl=3600)
+
+    def __init__(self):
+        self.evento_repo = EventoSolicitudRepository()
+        self.sla_service = SlaSolicitudService()
+
+    @staticmethod
+    def construir(
+        solicitud: Solicitud,
+        tipo: str,
+        estado: EstadoSolicitud,
+        usuario: Optional[User] = None,
+        **datos: Any
+    ) -> EventoSolicitud:
+        """
+        Construye (sin guardar) un evento validando las claves de su payload.
+
+        Los valores vacíos se omiten para mantener el payload compacto.
+
+        Args:
+            solicitud: Solicitud del evento
+            tipo: Tipo de evento (EventoSolicitud.TIPO_*)
+            estado: Estado de la solicitud después del evento
+            usuario: Usuario que origina el evento
+            **datos: Payload; solo se aceptan las claves de PAYLOAD_POR_TIPO[tipo]
+
+        Returns:
+            EventoSolicitud sin secuencia asignada
+
+        Raises:
+            ValueError: Si el tipo no existe o el payload trae claves no permitidas
+        """
+        if tipo not in EventoSolicitud.PAYLOAD_POR_TIPO:
+            raise ValueError(f'Tipo de evento desconocido: {tipo}')
+        no_permitidas = set(datos) - set(EventoSolicitud.PAYLOAD_POR_TIPO[tipo])
+        if no_permitidas:
+            raise ValueError(f'Claves no permitidas para eventos {tipo}: {", ".join(sorted(no_permitidas))}')
+
+        return EventoSolicitud(
             solicitud=solicitud,
-            estado_anterior=estado_anterior,
-            estado_nuevo=estado_cancelado,
+            tipo=tipo,
+            estado=estado,
             usuario=usuario,
-            observaciones=f'Cancelada por {usuario.get_full_name()}. Motivo: {motivo_cancelacion}'
+            datos={clave: valor for clave, valor in datos.items() if valor}
         )
 
-        return solicitud
+    def registrar(
+        self,
+        solicitud: Solicitud,
+        tipo: str,
+        estado: EstadoSolicitud,
+        usuario: Optional[User] = None,
+        **datos: Any
+    ) -> EventoSolicitud:
+        """
+        Agrega un evento al final del historial de una solicitud.
+
+        Returns:
+            EventoSolicitud creado
+        """
+        return self.registrar_masivo([self.construir(solicitud, tipo, estado, usuario, **datos)])[0]
+
+    @transaction.atomic
+    def registrar_masivo(self, eventos: List[EventoSolicitud]) -> List[EventoSolicitud]:
+        """
+        Inserta eventos de una o varias solicitudes asignando sus secuencias.
+
+        Una consulta bloquea y lee las secuencias actuales, los eventos se
+        insertan en lotes y las nuevas secuencias se guardan con un UPDATE.
+        Luego se sincroniza el índice de vencimientos de las solicitudes.
+
+        Args:
+            eventos: Eventos construidos con construir(), en orden cronológico
+
+        Returns:
+            Lista de eventos creados
+        """
+        if not eventos:
+            return []
+
+        secuencias = self.evento_repo.reservar_secuencias({evento.solicitud_id for evento in eventos})
+        for evento in eventos:
+            secuencias[evento.solicitud_id] += 1
+            evento.secuencia = secuencias[evento.solicitud_id]
+            evento.solicitud.secuencia_eventos = evento.secuencia
+
+        self.evento_repo.bulk_create(eventos, self.TAMANO_LOTE)
+        self.evento_repo.actualizar_secuencias(secuencias)
+
+        # Todo cambio de estado pasa por aquí: mantener el índice de vencimientos
+        self.sla_service.sincronizar({evento.solicitud_id: evento.solicitud for evento in eventos}.values())
+        return eventos
+
+    def timeline(self, solicitud: Solicitud) -> List[Dict[str, Any]]:
+        """
+        Historial de la solicitud listo para mostrar, del más reciente al más antiguo.
+
+        Args:
+            solicitud: Solicitud con secuencia_eventos actualizada
+
+        Returns:
+            Lista de diccionarios con secuencia, fecha, tipo, tipo_display,
+            usuario, estado_anterior, estado y detalle
+        """
+        clave = (solicitud.id, solicitud.secuencia_eventos)
+        aciertos, _ = self.cache.obtener_varios([clave])
+        if clave in aciertos:
+            return aciertos[clave]
+
+        filas = list(self.evento_repo.timeline(solicitud.id))
+        estados = {
+            estado.id: {'nombre': estado.nombre, 'color': estado.color}
+            for estado in EstadoSolicitud.all_objects.filter(
+                pk__in={fila['estado_id'] for fila in filas}
+            ).only('nombre', 'color')
+        }
+        tipos = dict(EventoSolicitud.TIPO_CHOICES)
+
+        timeline = []
+        estado_anterior = None
+        for fila in filas:
+            nombre_usuario = f"{fila['usuario__first_name']} {fila['usuario__last_name']}".strip()
+            estado = estados[fila['estado_id']]
+            timeline.append({
+                'secuencia': fila['secuencia'],
+                'fecha': fila['fecha'],
+                'tipo': fila['tipo'],
+                'tipo_display': tipos.get(fila['tipo'], fila['tipo']),
+                'usuario': nombre_usuario or fila['usuario__username'] or '',
+                'estado_anterior': estado_anterior,
+                'estado': estado,
+                'detalle': ' '.join(str(valor) for valor in fila['datos'].values()),
+            })
+            estado_anterior = estado
+        timeline.reverse()
+
+        self.cache.guardar_varios({clave: timeline})
+        return timeline
 
 
 # ==================== DETALLE SOLICITUD SERVICE ====================
@@ -440,6 +730,7 @@ class DetalleSolicitudService:
 
     def __init__(self):
         self.detalle_repo = DetalleSolicitudRepository()
+        self.contadores_service = ContadoresSolicitudService()
 
     @transaction.atomic
     def agregar_detalle(
@@ -499,7 +790,458 @@ class DetalleSolicitudService:
         if detalle.solicitud.estado.es_final:
             raise ValidationError('No se pueden eliminar detalles de una solicitud finalizada')
 
-        # Soft delete
-        detalle.eliminado = True
-        detalle.activo = False
-        detalle.save()
+        # Soft delete idempotente: un detalle ya eliminado no vuelve a descontarse.
+        # La señal eliminacion_logica_masiva recalcula los contadores de la solicitud
+        if DetalleSolicitud.all_objects.filter(pk=detalle.pk).eliminar_logicamente():
+            detalle.solicitud.refresh_from_db(fields=Solicitud.CAMPOS_CONTADORES)
+
+
+# ==================== CONTADORES SOLICITUD SERVICE ====================
+
+class ContadoresSolicitudService:
+    """
+    Service que mantiene los contadores de cumplimiento de Solicitud.
+
+    Los cambios de cantidades en los detalles se traducen en deltas
+    (total aprobado, total despachado, líneas pendientes) que se aplican
+    con un único UPDATE por solicitud, sin recorrer sus detalles.
+    """
+
+    CAMPOS = Solicitud.CAMPOS_CONTADORES
+
+    def __init__(self):
+        self.solicitud_repo = SolicitudRepository()
+
+    @staticmethod
+    def calcular_delta(
+        aprobada_anterior: Decimal,
+        despachada_anterior: Decimal,
+        aprobada: Decimal,
+        despachada: Decimal
+    ) -> Tuple[Decimal, Decimal, int]:
+        """
+        Calcula la variación de contadores producida por el cambio de un detalle.
+
+        Args:
+            aprobada_anterior: Cantidad aprobada antes del cambio
+            despachada_anterior: Cantidad despachada antes del cambio
+            aprobada: Cantidad aprobada después del cambio
+            despachada: Cantidad despachada después del cambio
+
+        Returns:
+            Tupla (delta aprobado, delta despachado, delta líneas pendientes)
+        """
+        pendiente_antes = despachada_anterior < aprobada_anterior
+        pendiente_despues = despachada < aprobada
+        return (
+            aprobada - aprobada_anterior,
+            despachada - despachada_anterior,
+            int(pendiente_despues) - int(pendiente_antes)
+        )
+
+    def registrar_cambios(
+        self,
+        solicitud: Solicitud,
+        cambios: Iterable[Tuple[Decimal, Decimal, Decimal, Decimal]]
+    ) -> None:
+        """
+        Aplica a la solicitud los cambios de sus detalles y refresca la instancia.
+
+        Args:
+            solicitud: Solicitud afectada
+            cambios: Tuplas (aprobada_anterior, despachada_anterior, aprobada, despachada)
+        """
+        aprobado = Decimal('0')
+        despachado = Decimal('0')
+        pendientes = 0
+        for cambio in cambios:
+            delta_aprobado, delta_despachado, delta_pendientes = self.calcular_delta(*cambio)
+            aprobado += delta_aprobado
+            despachado += delta_despachado
+            pendientes += delta_pendientes
+
+        if aprobado or despachado or pendientes:
+            self.solicitud_repo.ajustar_contadores(solicitud.id, aprobado, despachado, pendientes)
+            solicitud.refresh_from_db(fields=self.CAMPOS)
+
+    def recalcular(self, solicitudes: Optional[Iterable[Solicitud]] = None) -> int:
+        """
+        Recalcula los contadores desde los detalles (corrección o carga inicial).
+
+        Args:
+            solicitudes: Solicitudes a recalcular (None = todas)
+
+        Returns:
+            Cantidad de solicitudes actualizadas
+        """
+        ids = None if solicitudes is None else [solicitud.id for solicitud in solicitudes]
+        return self.solicitud_repo.recalcular_contadores(ids)
+
+
+# ==================== JERARQUÍA ORGANIZACIONAL SERVICE ====================
+
+class JerarquiaOrganizacionalService:
+    """
+    Service de la jerarquía Departamento -> Área / Equipo en memoria.
+
+    La jerarquía se arma con tres consultas y se guarda en caché con rutas
+    materializadas ('/<departamento>/<área>/') y los ids descendientes de cada
+    departamento precalculados, de modo que filtrar "todo lo del departamento X"
+    es una búsqueda en diccionario más un único IN en la consulta.
+    Las claves llevan la generación compartida GENERACION_CACHE, que las
+    señales de solicitudes incrementan cuando cambia la estructura, de modo
+    que el cambio invalida la caché de todos los workers y no solo la local.
+
+    Los conteos de solicitudes y entregas por nodo se cachean aparte, con una
+    vigencia corta, ya que cambian con cada solicitud o entrega nueva.
+    """
+
+    TIPO_DEPARTAMENTO = 'departamento'
+    TIPO_AREA = 'area'
+    TIPO_EQUIPO = 'equipo'
+
+    GENERACION_CACHE = 'jerarquia_organizacional'
+    cache = CacheLRU(max_entradas=1, ttl=3600)
+    cache_conteos = CacheLRU(max_entradas=1, ttl=60)
+
+    def __init__(self):
+        self.departamento_repo = DepartamentoRepository()
+        self.area_repo = AreaRepository()
+        self.equipo_repo = EquipoRepository()
+        self.solicitud_repo = SolicitudRepository()
+
+    # ---------- Construcción ----------
+
+    def _construir(self) -> Dict[str, Any]:
+        """Arma nodos, rutas materializadas y descendientes de cada departamento."""
+        nodos: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        descendientes: Dict[int, Dict[str, frozenset]] = {}
+
+        for departamento in self.departamento_repo.nodos():
+            nodos[(self.TIPO_DEPARTAMENTO, departamento['id'])] = {
+                **departamento,
+                'tipo': self.TIPO_DEPARTAMENTO,
+                'departamento_id': None,
+                'ruta': f"/{departamento['id']}/",
+                'ruta_nombre': departamento['nombre'],
+            }
+
+        hijos: Dict[int, Dict[str, set]] = {
+            departamento_id: {'areas': set(), 'equipos': set()}
+            for (_, departamento_id) in nodos
+        }
+        for tipo, clave, registros in (
+            (self.TIPO_AREA, 'areas', self.area_repo.nodos()),
+            (self.TIPO_EQUIPO, 'equipos', self.equipo_repo.nodos()),
+        ):
+            for registro in registros:
+                padre = nodos.get((self.TIPO_DEPARTAMENTO, registro['departamento_id']))
+                if padre is None:
+                    # Departamento eliminado: el nodo queda fuera del árbol
+                    continue
+                nodos[(tipo, registro['id'])] = {
+                    **registro,
+                    'tipo': tipo,
+                    'ruta': f"{padre['ruta']}{registro['id']}/",
+                    'ruta_nombre': f"{padre['ruta_nombre']} / {registro['nombre']}",
+                }
+                hijos[registro['departamento_id']][clave].add(registro['id'])
+
+        for departamento_id, ids in hijos.items():
+            descendientes[departamento_id] = {
+                'areas': frozenset(ids['areas']),
+                'equipos': frozenset(ids['equipos']),
+            }
+
+        return {'nodos': nodos, 'descendientes': descendientes}
+
+    def _jerarquia(self) -> Dict[str, Any]:
+        """Retorna la jerarquía desde la caché, construyéndola si no está."""
+        clave = ('jerarquia', obtener_generacion(self.GENERACION_CACHE))
+        aciertos, _ = self.cache.obtener_varios([clave])
+        if clave in aciertos:
+            return aciertos[clave]
+        jerarquia = self._construir()
+        self.cache.guardar_varios({clave: jerarquia})
+        return jerarquia
+
+    @classmethod
+    def invalidar_cache(cls) -> None:
+        """Invalida la jerarquía y los conteos en caché en todos los procesos."""
+        incrementar_generacion(cls.GENERACION_CACHE)
+        cls.cache.limpiar()
+        cls.cache_conteos.limpiar()
+
+    # ---------- Consultas ----------
+
+    def nodo(self, tipo: str, nodo_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retorna un nodo de la jerarquía.
+
+        Args:
+            tipo: TIPO_DEPARTAMENTO, TIPO_AREA o TIPO_EQUIPO
+            nodo_id: ID del departamento, área o equipo
+
+        Returns:
+            Diccionario con id, codigo, nombre, activo, departamento_id,
+            ruta y ruta_nombre, o None si no existe (o fue eliminado)
+        """
+        return self._jerarquia()['nodos'].get((tipo, nodo_id))
+
+    def ids_descendientes(self, departamento_id: int) -> Dict[str, frozenset]:
+        """
+        Retorna los ids de áreas y equipos que cuelgan de un departamento.
+
+        Args:
+            departamento_id: ID del departamento
+
+        Returns:
+            Diccionario {'areas': frozenset, 'equipos': frozenset}
+            (vacíos si el departamento no existe)
+        """
+        return self._jerarquia()['descendientes'].get(
+            departamento_id, {'areas': frozenset(), 'equipos': frozenset()}
+        )
+
+    def filtro_departamento(self, departamento_id: int, prefijo: str = '') -> Q:
+        """
+        Condición para filtrar registros de un departamento, sus áreas y equipos.
+
+        Args:
+            departamento_id: ID del departamento
+            prefijo: Ruta hasta la solicitud (ej: 'solicitud__' para detalles)
+
+        Returns:
+            Q combinable con cualquier filtro sobre Solicitud
+
+        Example:
+            >>> Solicitud.objects.filter(service.filtro_departamento(3))
+        """
+        descendientes = self.ids_descendientes(departamento_id)
+        condicion = Q(**{f'{prefijo}departamento_id': departamento_id})
+        if descendientes['areas']:
+            condicion |= Q(**{f'{prefijo}area_id__in': descendientes['areas']})
+        if descendientes['equipos']:
+            condicion |= Q(**{f'{prefijo}equipo_id__in': descendientes['equipos']})
+        return condicion
+
+    def conteos(self) -> Dict[Tuple[str, int], Dict[str, int]]:
+        """
+        Conteos acumulados por nodo: solicitudes, áreas, equipos y entregas.
+
+        Las solicitudes de un departamento incluyen las de sus áreas y equipos,
+        contando una sola vez las que apuntan a varios nodos del mismo
+        departamento. Las entregas se cuentan por departamento destino.
+
+        Returns:
+            Diccionario (tipo, id) -> {'solicitudes', 'areas', 'equipos', 'entregas'}
+        """
+        clave_cache = ('conteos', obtener_generacion(self.GENERACION_CACHE))
+        aciertos, _ = self.cache_conteos.obtener_varios([clave_cache])
+        if clave_cache in aciertos:
+            return aciertos[clave_cache]
+
+        jerarquia = self._jerarquia()
+        nodos = jerarquia['nodos']
+        conteos = {
+            clave: {'solicitudes': 0, 'areas': 0, 'equipos': 0, 'entregas': 0}
+            for clave in nodos
+        }
+        for departamento_id, ids in jerarquia['descendientes'].items():
+            conteos[(self.TIPO_DEPARTAMENTO, departamento_id)]['areas'] = len(ids['areas'])
+            conteos[(self.TIPO_DEPARTAMENTO, departamento_id)]['equipos'] = len(ids['equipos'])
+
+        for fila in self.solicitud_repo.conteo_por_unidad():
+            departamentos = set()
+            for tipo, nodo_id in (
+                (self.TIPO_DEPARTAMENTO, fila['departamento_id']),
+                (self.TIPO_AREA, fila['area_id']),
+                (self.TIPO_EQUIPO, fila['equipo_id']),
+            ):
+                nodo = nodos.get((tipo, nodo_id))
+                if nodo is None:
+                    continue
+                if tipo == self.TIPO_DEPARTAMENTO:
+                    departamentos.add(nodo_id)
+                else:
+                    conteos[(tipo, nodo_id)]['solicitudes'] += fila['total']
+                    departamentos.add(nodo['departamento_id'])
+            for departamento_id in departamentos:
+                conteos[(self.TIPO_DEPARTAMENTO, departamento_id)]['solicitudes'] += fila['total']
+
+        for repositorio in (EntregaArticuloRepository, EntregaBienRepository):
+            for departamento_id, total in repositorio.conteo_por_departamento().items():
+                clave = (self.TIPO_DEPARTAMENTO, departamento_id)
+                if clave in conteos:
+                    conteos[clave]['entregas'] += total
+
+        self.cache_conteos.guardar_varios({clave_cache: conteos})
+        return conteos
+
+    def conteos_departamentos(self) -> Dict[int, Dict[str, int]]:
+        """Conteos acumulados de cada departamento, por id."""
+        return {
+            nodo_id: conteo
+            for (tipo, nodo_id), conteo in self.conteos().items()
+            if tipo == self.TIPO_DEPARTAMENTO
+        }
+
+
+# ==================== SLA SOLICITUD SERVICE ====================
+
+class SlaSolicitudService:
+    """
+    Service de seguimiento de plazos (SLA) de las solicitudes.
+
+    Mantiene VencimientoSolicitud, el índice de solicitudes abiertas por fecha
+    requerida: se sincroniza al registrar eventos (cambios de estado) y al
+    editar la fecha requerida. Las listas de vencidas y en riesgo son un rango
+    sobre ese índice, y el barrido periódico marca las vencidas en bloque y
+    notifica a los solicitantes una sola vez.
+    """
+
+    TAMANO_LOTE = 1000
+    DIAS_EN_RIESGO = 2
+
+    FILTRO_VENCIDAS = 'vencidas'
+    FILTRO_EN_RIESGO = 'en_riesgo'
+
+    def __init__(self):
+        self.vencimiento_repo = VencimientoSolicitudRepository()
+        self.solicitud_repo = SolicitudRepository()
+        self.notificacion_service = NotificacionService()
+
+    def sincronizar(self, solicitudes: Iterable[Solicitud]) -> None:
+        """
+        Actualiza el índice para las solicitudes indicadas.
+
+        Las abiertas se agregan o se reprograman si cambió su fecha requerida
+        (reiniciando la marca de vencida); las cerradas o eliminadas se quitan.
+
+        Args:
+            solicitudes: Solicitudes con estado cargado
+        """
+        abiertas: Dict[int, date] = {}
+        cerradas = []
+        for solicitud in solicitudes:
+            if solicitud.eliminado or solicitud.estado.es_final:
+                cerradas.append(solicitud.id)
+            else:
+                abiertas[solicitud.id] = solicitud.fecha_requerida
+
+        if cerradas:
+            self.vencimiento_repo.eliminar(cerradas)
+        if not abiertas:
+            return
+
+        actuales = self.vencimiento_repo.fechas(abiertas)
+        self.vencimiento_repo.bulk_create([
+            VencimientoSolicitud(solicitud_id=solicitud_id, fecha_requerida=fecha)
+            for solicitud_id, fecha in abiertas.items()
+            if solicitud_id not in actuales
+        ], self.TAMANO_LOTE)
+        self.vencimiento_repo.reprogramar({
+            solicitud_id: fecha
+            for solicitud_id, fecha in abiertas.items()
+            if solicitud_id in actuales and actuales[solicitud_id] != fecha
+        })
+
+    def quitar(self, solicitud_ids: Iterable[int]) -> int:
+        """Quita solicitudes del índice (ej: eliminadas en forma masiva)."""
+        return self.vencimiento_repo.eliminar(solicitud_ids)
+
+    @transaction.atomic
+    def reconstruir(self) -> int:
+        """
+        Reconstruye el índice desde las solicitudes (carga inicial o reparación).
+
+        Conserva la marca de las solicitudes ya notificadas cuya fecha no cambió.
+
+        Returns:
+            Cantidad de solicitudes abiertas indexadas
+        """
+        self.vencimiento_repo.eliminar_cerradas()
+        total = 0
+        lote = []
+        for solicitud in self.solicitud_repo.abiertas().iterator(chunk_size=self.TAMANO_LOTE):
+            lote.append(solicitud)
+            if len(lote) >= self.TAMANO_LOTE:
+                self.sincronizar(lote)
+                total += len(lote)
+                lote = []
+        self.sincronizar(lote)
+        return total + len(lote)
+
+    def filtro(self, opcion: str, hoy: Optional[date] = None) -> Q:
+        """
+        Condición sobre Solicitud para las vencidas o en riesgo.
+
+        Args:
+            opcion: FILTRO_VENCIDAS o FILTRO_EN_RIESGO
+            hoy: Fecha de referencia (por defecto hoy)
+
+        Returns:
+            Q sobre el índice de vencimientos
+
+        Raises:
+            ValueError: Si la opción no existe
+        """
+        hoy = hoy or date.today()
+        if opcion == self.FILTRO_VENCIDAS:
+            return Q(vencimiento__fecha_requerida__lt=hoy)
+        if opcion == self.FILTRO_EN_RIESGO:
+            return Q(
+                vencimiento__fecha_requerida__gte=hoy,
+                vencimiento__fecha_requerida__lte=hoy + timedelta(days=self.DIAS_EN_RIESGO)
+            )
+        raise ValueError(f'Filtro de vencimiento desconocido: {opcion}')
+
+    def vencidas(self, hoy: Optional[date] = None) -> QuerySet:
+        """Solicitudes abiertas con fecha requerida anterior a hoy, de la más atrasada a la menos."""
+        return Solicitud.objects.filter(self.filtro(self.FILTRO_VENCIDAS, hoy)).select_related(
+            'estado', 'solicitante'
+        ).order_by('vencimiento__fecha_requerida')
+
+    def en_riesgo(self, hoy: Optional[date] = None) -> QuerySet:
+        """Solicitudes abiertas que vencen dentro de DIAS_EN_RIESGO días."""
+        return Solicitud.objects.filter(self.filtro(self.FILTRO_EN_RIESGO, hoy)).select_related(
+            'estado', 'solicitante'
+        ).order_by('vencimiento__fecha_requerida')
+
+    @transaction.atomic
+    def barrer(self, hoy: Optional[date] = None) -> int:
+        """
+        Marca las solicitudes vencidas aún no marcadas y notifica a sus solicitantes.
+
+        Pensado para ejecutarse periódicamente (comando barrer_vencimientos_solicitudes).
+        Cada vencimiento se notifica una vez; si la fecha requerida se
+        reprograma, la marca se reinicia.
+
+        Args:
+            hoy: Fecha de referencia (por defecto hoy)
+
+        Returns:
+            Cantidad de solicitudes marcadas como vencidas
+        """
+        hoy = hoy or date.today()
+        pendientes = list(self.vencimiento_repo.pendientes_de_marcar(hoy))
+        if not pendientes:
+            return 0
+
+        self.notificacion_service.notificar_masivo(
+            self.notificacion_service.construir(
+                usuario_id=fila['solicitud__solicitante_id'],
+                tipo=Notificacion.TIPO_SOLICITUD_VENCIDA,
+                titulo=f"Solicitud {fila['solicitud__numero']} vencida",
+                mensaje=(
+                    f"La fecha requerida ({fila['fecha_requerida']:%d/%m/%Y}) ya pasó "
+                    'y la solicitud sigue abierta.'
+                ),
+                enlace=reverse('solicitudes:detalle_solicitud', kwargs={'pk': fila['solicitud_id']})
+            )
+            for fila in pendientes
+        )
+        self.vencimiento_repo.marcar_vencidas(
+            [fila['solicitud_id'] for fila in pendientes], timezone.now()
+        )
+        return len(pendientes)
@@ -0,0 +1,62 @@
+"""
+Señales del módulo de solicitudes.
+
+Mantienen coherente la caché de la jerarquía organizacional
+(JerarquiaOrganizacionalService) cuando cambian departamentos, áreas o equipos,
+y el índice de vencimientos (SlaSolicitudService) y los contadores de
+cumplimiento (ContadoresSolicitudService) ante eliminaciones masivas.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from core.signals import eliminacion_logica_masiva
+from .models import Departamento, Area, Equipo, Solicitud, DetalleSolicitud
+from .repositories import SolicitudRepository
+from .services import JerarquiaOrganizacionalService, SlaSolicitudService, ContadoresSolicitudService
+
+# Campos que forman parte de los nodos de la jerarquía
+CAMPOS_JERARQUIA = {'codigo', 'nombre', 'activo', 'eliminado', 'departamento'}
+
+
+@receiver(post_save, sender=Departamento)
+@receiver(post_save, sender=Area)
+@receiver(post_save, sender=Equipo)
+def invalidar_cache_jerarquia(sender, instance, created=False, update_fields=None, **kwargs):
+    """Invalida la caché salvo en guardados parciales que no tocan la jerarquía."""
+    if update_fields is not None and not CAMPOS_JERARQUIA.intersection(update_fields):
+        return
+    JerarquiaOrganizacionalService.invalidar_cache()
+
+
+@receiver(post_delete, sender=Departamento)
+@receiver(post_delete, sender=Area)
+@receiver(post_delete, sender=Equipo)
+def invalidar_cache_jerarquia_eliminacion(sender, instance, **kwargs):
+    """Invalida la caché al eliminar físicamente un nodo de la jerarquía."""
+    JerarquiaOrganizacionalService.invalidar_cache()
+
+
+@receiver(eliminacion_logica_masiva, sender=Departamento)
+@receiver(eliminacion_logica_masiva, sender=Area)
+@receiver(eliminacion_logica_masiva, sender=Equipo)
+def invalidar_cache_jerarquia_masivo(sender, ids, eliminado, **kwargs):
+    """Invalida la caché al eliminar o restaurar nodos en forma masiva."""
+    JerarquiaOrganizacionalService.invalidar_cache()
+
+
+@receiver(eliminacion_logica_masiva, sender=Solicitud)
+def sincronizar_vencimientos_masivo(sender, ids, eliminado, **kwargs):
+    """Quita del índice de vencimientos las solicitudes eliminadas o repone las restauradas."""
+    service = SlaSolicitudService()
+    if eliminado:
+        service.quitar(ids)
+    else:
+        service.sincronizar(SolicitudRepository.abiertas().filter(pk__in=ids))
+
+
+@receiver(eliminacion_logica_masiva, sender=DetalleSolicitud)
+def recalcular_contadores_masivo(sender, ids, eliminado, **kwargs):
+    """Recalcula los contadores de las solicitudes cuyos detalles se eliminaron o restauraron."""
+    ContadoresSolicitudService().recalcular(
+        Solicitud.all_objects.filter(detalles__pk__in=ids).distinct().only('id')
+    )
@@ -0,0 +1,89 @@
+"""
+Configuración de fixtures y utilidades para tests de solicitudes.
+"""
+import pytest
+from datetime import date
+from decimal import Decimal
+from django.contrib.auth.models import User
+from apps.bodega.models import Bodega, Categoria, Articulo
+from apps.solicitudes.models import Solicitud, DetalleSolicitud, EstadoSolicitud, TipoSolicitud
+
+
+# ==================== FIXTURES DE USUARIOS ====================
+
+@pytest.fixture
+def usuario_admin(db):
+    """Crea un usuario administrador."""
+    return User.objects.create_superuser(
+        username='admin',
+        email='admin@example.com',
+        password='adminpass123'
+    )
+
+
+# ==================== FIXTURES DE CATÁLOGOS ====================
+
+@pytest.fixture
+def estados(db):
+    """Crea los estados del flujo PENDIENTE -> APROBADA -> DESPACHADA (y RECHAZADA)."""
+    return {
+        codigo: EstadoSolicitud.objects.create(
+            codigo=codigo,
+            nombre=codigo.capitalize(),
+            es_inicial=codigo == 'PENDIENTE',
+            es_final=codigo in ('DESPACHADA', 'RECHAZADA')
+        )
+        for codigo in ('PENDIENTE', 'APROBADA', 'DESPACHADA', 'RECHAZADA')
+    }
+
+
+@pytest.fixture
+def tipo_solicitud(db):
+    """Crea un tipo de solicitud de test."""
+    return TipoSolicitud.objects.create(codigo='NORMAL', nombre='Normal')
+
+
+@pytest.fixture
+def bodega(usuario_admin):
+    """Crea una bodega de test."""
+    return Bodega.objects.create(codigo='BOD-01', nombre='Bodega Central', responsable=usuario_admin)
+
+
+@pytest.fixture
+def articulos(bodega):
+    """Crea tres artículos con stock 100."""
+    categoria = Categoria.objects.create(codigo='CAT-01', nombre='Oficina')
+    return [
+        Articulo.objects.create(
+            codigo=f'ART-{numero}',
+            nombre=f'Artículo {numero}',
+            categoria=categoria,
+            ubicacion_fisica=bodega,
+            stock_actual=Decimal('100')
+        )
+        for numero in range(1, 4)
+    ]
+
+
+# ==================== FIXTURES DE SOLICITUDES ====================
+
+@pytest.fixture
+def crear_solicitud(usuario_admin, estados, tipo_solicitud, bodega, articulos):
+    """Fábrica de solicitudes pendientes con un detalle por artículo."""
+    def _crear(numero: str, cantidad: Decimal = Decimal('10')) -> Solicitud:
+        solicitud = Solicitud.objects.create(
+            numero=numero,
+            fecha_requerida=date.today(),
+            tipo_solicitud=tipo_solicitud,
+            estado=estados['PENDIENTE'],
+            solicitante=usuario_admin,
+            area_solicitante='Administración',
+            motivo='Reposición',
+            bodega_origen=bodega
+        )
+        for articulo in articulos:
+            DetalleSolicitud.objects.create(
+                solicitud=solicitud, articulo=articulo, cantidad_solicitada=cantidad
+            )
+        return solicitud
+    return _crear
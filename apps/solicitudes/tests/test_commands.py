@@ -0,0 +1,100 @@
+"""
+Tests de los comandos de administración sobre modelos de solicitudes.
+"""
+import pytest
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+from django.utils import timezone
+from apps.solicitudes.models import Departamento, Area, Solicitud
+
+
+# ==================== TESTS DE PURGE_DELETED ====================
+
+@pytest.mark.django_db
+class TestPurgeDeleted:
+    """Tests del comando purge_deleted con relaciones en cascada."""
+
+    def envejecer(self, *registros):
+        """Marca los registros como eliminados hace 400 días."""
+        for registro in registros:
+            type(registro).all_objects.filter(pk=registro.pk).update(
+                eliminado=True, fecha_actualizacion=timezone.now() - timedelta(days=400)
+            )
+
+    def purgar(self, *args):
+        """Ejecuta purge_deleted sobre Departamento y retorna la salida."""
+        salida = StringIO()
+        call_command('purge_deleted', '--model', 'solicitudes.Departamento', *args, stdout=salida)
+        return salida.getvalue()
+
+    def test_conserva_departamento_con_area_vigente(self):
+        """
+        GIVEN: Un departamento eliminado hace 400 días con un área vigente
+        WHEN: Se purga
+        THEN: Ni el departamento ni su área se borran
+        """
+        departamento = Departamento.objects.create(codigo='DEP-1', nombre='Finanzas')
+        area = Area.objects.create(codigo='AREA-1', nombre='Tesorería', departamento=departamento)
+        self.envejecer(departamento)
+
+        self.purgar()
+
+        assert Departamento.all_objects.filter(pk=departamento.pk).exists()
+        assert Area.objects.filter(pk=area.pk).exists()
+
+    def test_borra_departamento_con_hijos_eliminados(self):
+        """Los hijos en cascada ya eliminados no impiden la purga."""
+        departamento = Departamento.objects.create(codigo='DEP-1', nombre='Finanzas')
+        area = Area.objects.create(codigo='AREA-1', nombre='Tesorería', departamento=departamento)
+        self.envejecer(departamento, area)
+
+        self.purgar()
+
+        assert not Departamento.all_objects.filter(pk=departamento.pk).exists()
+        assert not Area.all_objects.filter(pk=area.pk).exists()
+
+    def test_referencia_protegida_indirecta_omite_solo_su_registro(self, crear_solicitud):
+        """
+        GIVEN: Un lote con un departamento cuya área eliminada usa una solicitud (PROTECT)
+        WHEN: Se purga en un solo lote
+        THEN: Se omite ese departamento y se borran los demás del lote
+        """
+        bloqueado = Departamento.objects.create(codigo='DEP-1', nombre='Finanzas')
+        area = Area.objects.create(codigo='AREA-1', nombre='Tesorería', departamento=bloqueado)
+        libres = [Departamento.objects.create(codigo=f'DEP-{n}', nombre=f'Depto {n}') for n in (2, 3)]
+        solicitud = crear_solicitud('SOL-1')
+        solicitud.area = area
+        solicitud.save(update_fields=['area'])
+        self.envejecer(bloqueado, area, *libres)
+
+        salida = self.purgar('--chunk-size', '10')
+
+        assert 'solicitudes.Departamento: 2 borrados, 1 omitidos' in salida
+        assert list(Departamento.all_objects.values_list('codigo', flat=True)) == ['DEP-1']
+
+
+# ==================== TESTS DE RECALCULAR_CONTADORES_SOLICITUDES ====================
+
+@pytest.mark.django_db
+class TestRecalcularContadoresSolicitudes:
+    """Tests del comando recalcular_contadores_solicitudes."""
+
+    def test_recalcula_solo_las_solicitudes_indicadas(self, crear_solicitud):
+        """
+        GIVEN: Dos solicitudes con contadores desfasados
+        WHEN: Se recalcula una de ellas por número
+        THEN: Solo esa vuelve a coincidir con sus detalles
+        """
+        primera, segunda = crear_solicitud('SOL-1'), crear_solicitud('SOL-2')
+        Solicitud.all_objects.filter(pk__in=[primera.pk, segunda.pk]).update(
+            total_aprobado=Decimal('99'), lineas_pendientes=5
+        )
+        salida = StringIO()
+
+        call_command('recalcular_contadores_solicitudes', '--numero', 'SOL-1', stdout=salida)
+
+        assert '1 solicitud(es) recalculada(s)' in salida.getvalue()
+        valores = dict(Solicitud.all_objects.values_list('numero', 'lineas_pendientes'))
+        assert valores == {'SOL-1': 0, 'SOL-2': 5}
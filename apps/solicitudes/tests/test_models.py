@@ -0,0 +1,34 @@
+"""
+Tests para los modelos del módulo de solicitudes.
+"""
+import pytest
+from decimal import Decimal
+from apps.solicitudes.models import Solicitud
+from apps.solicitudes.services import SolicitudService
+
+
+# ==================== TESTS DE SOLICITUD ====================
+
+@pytest.mark.django_db
+class TestSolicitudSave:
+    """Tests para Solicitud.save con campos mantenidos por UPDATE atómicos."""
+
+    def test_save_de_instancia_desactualizada_no_revierte_contadores(self, crear_solicitud, usuario_admin):
+        """
+        GIVEN: Una instancia cargada antes de aprobar la solicitud
+        WHEN: Se guarda completa (ej: edición de observaciones)
+        THEN: Se persisten sus campos, pero no se revierten contadores ni secuencia de eventos
+        """
+        solicitud = crear_solicitud('SOL-1')
+        desactualizada = Solicitud.objects.get(pk=solicitud.pk)
+        SolicitudService().aprobar_solicitudes([solicitud.id], usuario_admin)
+        aprobada = Solicitud.objects.get(pk=solicitud.pk)
+
+        desactualizada.observaciones = 'Editada'
+        desactualizada.save()
+
+        guardada = Solicitud.objects.get(pk=solicitud.pk)
+        assert guardada.observaciones == 'Editada'
+        assert guardada.total_aprobado == Decimal('30')
+        assert guardada.lineas_pendientes == 3
+        assert guardada.secuencia_eventos == aprobada.secuencia_eventos > 0
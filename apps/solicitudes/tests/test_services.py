@@ -0,0 +1,485 @@
+"""
+Tests para la capa de servicios del módulo de solicitudes.
+
+Siguiendo el patrón Arrange-Act-Assert.
+"""
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.forms import modelform_factory
+from core.utils import incrementar_generacion
+from apps.bodega.models import EstadoEntrega, TipoEntrega
+from apps.bodega.services import EntregaArticuloService
+from apps.notificaciones.models import Notificacion
+from apps.solicitudes.models import (
+    Solicitud, DetalleSolicitud, EventoSolicitud, VencimientoSolicitud, Departamento, Area
+)
+from apps.solicitudes.services import (
+    SolicitudService, DetalleSolicitudService, ContadoresSolicitudService, EventoSolicitudService,
+    SlaSolicitudService, JerarquiaOrganizacionalService
+)
+
+
+def contadores(solicitud: Solicitud) -> tuple:
+    """Lee los contadores persistidos de una solicitud."""
+    return tuple(
+        Solicitud.all_objects.filter(pk=solicitud.pk).values_list(
+            'total_aprobado', 'total_despachado', 'lineas_pendientes'
+        ).get()
+    )
+
+
+def contadores_recalculados(solicitud: Solicitud) -> tuple:
+    """Recalcula los contadores desde los detalles y los lee."""
+    ContadoresSolicitudService().recalcular([solicitud])
+    return contadores(solicitud)
+
+
+# ==================== TESTS DE CONTADORES SOLICITUD SERVICE ====================
+
+@pytest.mark.django_db
+class TestContadoresSolicitudService:
+    """Tests para ContadoresSolicitudService: los deltas deben coincidir con recalcular."""
+
+    @pytest.fixture
+    def solicitud(self, crear_solicitud):
+        """Solicitud con tres detalles de 10 unidades."""
+        return crear_solicitud('SOL-1')
+
+    def aprobar(self, solicitud, usuario, cantidades):
+        """Aprueba la solicitud con una cantidad por detalle (en orden de ID)."""
+        detalles = solicitud.detalles.order_by('id')
+        SolicitudService().aprobar_solicitud(solicitud, usuario, [
+            {'detalle_id': detalle.id, 'cantidad_aprobada': cantidad}
+            for detalle, cantidad in zip(detalles, cantidades)
+        ])
+
+    def test_calcular_delta(self):
+        """Un detalle que pasa de pendiente a completo descuenta una línea pendiente."""
+        delta = ContadoresSolicitudService.calcular_delta(
+            Decimal('5'), Decimal('2'), Decimal('5'), Decimal('5')
+        )
+
+        assert delta == (Decimal('0'), Decimal('3'), -1)
+
+    def test_aprobar_actualiza_contadores_como_recalcular(self, solicitud, usuario_admin):
+        """
+        GIVEN: Una solicitud pendiente
+        WHEN: Se aprueba con cantidades 10, 4 y 0
+        THEN: Los contadores por deltas coinciden con el recálculo desde los detalles
+        """
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+
+        incrementales = contadores(solicitud)
+        assert incrementales == (Decimal('14'), Decimal('0'), 2)
+        assert contadores_recalculados(solicitud) == incrementales
+
+    def test_despachar_actualiza_contadores_como_recalcular(self, solicitud, usuario_admin):
+        """El despacho completo deja cero líneas pendientes."""
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+
+        SolicitudService().despachar_solicitudes([solicitud.id], usuario_admin)
+
+        incrementales = contadores(solicitud)
+        assert incrementales == (Decimal('14'), Decimal('14'), 0)
+        assert contadores_recalculados(solicitud) == incrementales
+
+    def test_entrega_parcial_actualiza_contadores_como_recalcular(self, solicitud, usuario_admin, bodega):
+        """Una entrega parcial suma lo despachado sin cerrar la línea."""
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+        detalle = solicitud.detalles.order_by('id').first()
+        EstadoEntrega.objects.create(codigo='PENDIENTE', nombre='Pendiente', es_inicial=True)
+
+        EntregaArticuloService().crear_entrega(
+            bodega_origen=bodega,
+            tipo=TipoEntrega.objects.create(codigo='NORMAL', nombre='Normal'),
+            entregado_por=usuario_admin,
+            recibido_por=usuario_admin,
+            motivo='Entrega parcial',
+            detalles=[{'articulo_id': detalle.articulo_id, 'cantidad': 6, 'detalle_solicitud_id': detalle.id}],
+            solicitud=solicitud
+        )
+
+        incrementales = contadores(solicitud)
+        assert incrementales == (Decimal('14'), Decimal('6'), 2)
+        assert contadores_recalculados(solicitud) == incrementales
+
+    def test_eliminar_detalle_actualiza_contadores_como_recalcular(self, solicitud, usuario_admin):
+        """Eliminar una línea aprobada descuenta su cantidad y su pendiente."""
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+        detalle = DetalleSolicitud.objects.filter(solicitud=solicitud).order_by('id')[1]
+
+        DetalleSolicitudService().eliminar_detalle(detalle)
+
+        incrementales = contadores(solicitud)
+        assert incrementales == (Decimal('10'), Decimal('0'), 1)
+        assert contadores_recalculados(solicitud) == incrementales
+
+    def test_recalcular_corrige_contadores_desfasados(self, solicitud, usuario_admin):
+        """recalcular reconstruye los contadores aunque se hayan alterado."""
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+        Solicitud.all_objects.filter(pk=solicitud.pk).update(total_aprobado=0, lineas_pendientes=9)
+
+        assert ContadoresSolicitudService().recalcular() == 1
+        assert contadores(solicitud) == (Decimal('14'), Decimal('0'), 2)
+
+    def test_eliminar_detalle_ya_eliminado_no_descuenta_de_nuevo(self, solicitud, usuario_admin):
+        """
+        GIVEN: Un detalle aprobado ya eliminado
+        WHEN: Se vuelve a eliminar con una instancia desactualizada
+        THEN: Los contadores no se descuentan dos veces
+        """
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+        detalle = DetalleSolicitud.objects.filter(solicitud=solicitud).order_by('id')[1]
+        DetalleSolicitudService().eliminar_detalle(detalle)
+
+        DetalleSolicitudService().eliminar_detalle(detalle)
+
+        assert contadores(solicitud) == (Decimal('10'), Decimal('0'), 1)
+
+    def test_eliminacion_masiva_y_restauracion_recalculan_contadores(self, solicitud, usuario_admin):
+        """La eliminación lógica en bloque (acciones del admin) y la restauración ajustan los contadores."""
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+        detalles = DetalleSolicitud.all_objects.filter(solicitud=solicitud, cantidad_aprobada__gt=0)
+
+        detalles.eliminar_logicamente()
+        assert contadores(solicitud) == (Decimal('0'), Decimal('0'), 0)
+
+        detalles.restaurar()
+        assert contadores(solicitud) == (Decimal('14'), Decimal('0'), 2)
+
+    def test_admin_recalcula_contadores_al_editar_cantidades(self, solicitud, usuario_admin, rf):
+        """Editar la cantidad aprobada desde el admin deja los contadores al día."""
+        self.aprobar(solicitud, usuario_admin, [10, 4, 0])
+        detalle = DetalleSolicitud.objects.filter(solicitud=solicitud).order_by('id')[1]
+        model_admin = admin.site._registry[DetalleSolicitud]
+        formulario = modelform_factory(DetalleSolicitud, fields=['cantidad_aprobada'])(
+            {'cantidad_aprobada': '7'}, instance=detalle
+        )
+        assert formulario.is_valid()
+
+        model_admin.save_model(rf.post('/'), formulario.save(commit=False), formulario, True)
+
+        assert contadores(solicitud) == (Decimal('17'), Decimal('0'), 2)
+
+
+# ==================== TESTS DE WORKFLOW MASIVO ====================
+
+@pytest.mark.django_db
+class TestWorkflowMasivo:
+    """Tests para aprobar_solicitudes/despachar_solicitudes (todo o nada)."""
+
+    @pytest.fixture
+    def solicitudes(self, crear_solicitud):
+        """Tres solicitudes pendientes con tres detalles de 10 unidades."""
+        return [crear_solicitud(f'SOL-{numero}') for numero in range(1, 4)]
+
+    def eventos(self, solicitud):
+        """Eventos de la solicitud como (secuencia, tipo, estado)."""
+        return list(
+            EventoSolicitud.objects.filter(solicitud=solicitud).order_by('secuencia')
+            .values_list('secuencia', 'tipo', 'estado__codigo')
+        )
+
+    def test_aprobar_persiste_cantidades_estado_y_contadores(self, solicitudes, usuario_admin):
+        """
+        GIVEN: Tres solicitudes pendientes
+        WHEN: Se aprueban en lote con una cantidad parcial
+        THEN: Detalles, estado, eventos y contadores quedan persistidos
+        """
+        parcial = solicitudes[0].detalles.order_by('id').first()
+        cantidades = {detalle_id: 10 for detalle_id in DetalleSolicitud.objects.values_list('id', flat=True)}
+        cantidades[parcial.id] = 4
+
+        SolicitudService().aprobar_solicitudes(
+            [solicitud.id for solicitud in solicitudes], usuario_admin, cantidades, notas_aprobacion='ok'
+        )
+
+        parcial.refresh_from_db()
+        assert parcial.cantidad_aprobada == Decimal('4')
+        assert set(
+            DetalleSolicitud.objects.exclude(pk=parcial.pk).values_list('cantidad_aprobada', flat=True)
+        ) == {Decimal('10')}
+        for solicitud in solicitudes:
+            solicitud.refresh_from_db()
+            assert solicitud.estado.codigo == 'APROBADA'
+            assert solicitud.aprobador == usuario_admin
+            assert self.eventos(solicitud) == [(1, EventoSolicitud.TIPO_APROBADA, 'APROBADA')]
+            assert solicitud.secuencia_eventos == 1
+            assert contadores(solicitud) == contadores_recalculados(solicitud)
+        assert contadores(solicitudes[0]) == (Decimal('24'), Decimal('0'), 3)
+
+    def test_contadores_se_ajustan_por_delta_sin_recalcular(self, solicitudes, usuario_admin):
+        """
+        GIVEN: Una solicitud con un contador desfasado a propósito
+        WHEN: Se aprueba y se despacha en lote
+        THEN: Los contadores suman solo la variación de los detalles (no se recalculan)
+             y las instancias retornadas quedan al día
+        """
+        Solicitud.all_objects.filter(pk=solicitudes[0].pk).update(total_aprobado=Decimal('100'))
+        ids = [solicitud.id for solicitud in solicitudes]
+        service = SolicitudService()
+
+        aprobadas = service.aprobar_solicitudes(ids, usuario_admin)
+        detalle = solicitudes[1].detalles.order_by('id').first()
+        despachadas = service.despachar_solicitudes(ids, usuario_admin, {detalle.id: 4})
+
+        assert contadores(solicitudes[0]) == (Decimal('130'), Decimal('0'), 3)
+        assert (aprobadas[0].total_aprobado, aprobadas[1].lineas_pendientes) == (Decimal('130'), 3)
+        assert contadores(solicitudes[1]) == (Decimal('30'), Decimal('4'), 3)
+        assert (despachadas[1].total_despachado, despachadas[1].lineas_pendientes) == (Decimal('4'), 3)
+
+    def test_lote_con_solicitud_invalida_no_persiste_nada(self, solicitudes, usuario_admin):
+        """
+        GIVEN: Un lote donde una solicitud pide aprobar más de lo solicitado
+        WHEN: Se aprueba el lote
+        THEN: Se informa la solicitud inválida y ninguna queda aprobada
+        """
+        invalido = solicitudes[1].detalles.order_by('id').first()
+
+        with pytest.raises(ValidationError) as error:
+            SolicitudService().aprobar_solicitudes(
+                [solicitud.id for solicitud in solicitudes], usuario_admin, {invalido.id: 99}
+            )
+
+        assert 'SOL-2' in ' '.join(error.value.messages)
+        assert not Solicitud.objects.filter(aprobador__isnull=False).exists()
+        assert not Solicitud.objects.exclude(estado__codigo='PENDIENTE').exists()
+        assert not DetalleSolicitud.objects.filter(cantidad_aprobada__gt=0).exists()
+        assert not EventoSolicitud.objects.exists()
+
+    def test_despachar_continua_la_secuencia_de_eventos(self, solicitudes, usuario_admin):
+        """
+        GIVEN: Solicitudes aprobadas en lote
+        WHEN: Se despachan en lote
+        THEN: Cada una recibe un segundo evento y cierra sus líneas pendientes
+        """
+        ids = [solicitud.id for solicitud in solicitudes]
+        service = SolicitudService()
+        service.aprobar_solicitudes(ids, usuario_admin)
+
+        despachadas = service.despachar_solicitudes(ids, usuario_admin)
+
+        assert [solicitud.lineas_pendientes for solicitud in despachadas] == [0, 0, 0]
+        for solicitud in solicitudes:
+            solicitud.refresh_from_db()
+            assert solicitud.estado.codigo == 'DESPACHADA'
+            assert solicitud.despachador == usuario_admin
+            assert self.eventos(solicitud) == [
+                (1, EventoSolicitud.TIPO_APROBADA, 'APROBADA'),
+                (2, EventoSolicitud.TIPO_DESPACHADA, 'DESPACHADA'),
+            ]
+            assert contadores(solicitud) == (Decimal('30'), Decimal('30'), 0)
+            assert contadores_recalculados(solicitud) == (Decimal('30'), Decimal('30'), 0)
+
+    def test_despachar_sin_aprobar_falla(self, solicitudes, usuario_admin):
+        """Una solicitud sin aprobar invalida todo el lote de despacho."""
+        service = SolicitudService()
+        service.aprobar_solicitudes([solicitudes[0].id], usuario_admin)
+
+        with pytest.raises(ValidationError):
+            service.despachar_solicitudes([solicitudes[0].id, solicitudes[1].id], usuario_admin)
+
+        assert not Solicitud.objects.filter(despachador__isnull=False).exists()
+        assert not DetalleSolicitud.objects.filter(cantidad_despachada__gt=0).exists()
+
+
+# ==================== TESTS DE EVENTOS DE SOLICITUD ====================
+
+@pytest.mark.django_db
+class TestEventoSolicitudService:
+    """Tests del flujo de eventos append-only y su timeline."""
+
+    @pytest.fixture
+    def solicitud(self, usuario_admin, estados, tipo_solicitud, bodega, articulos):
+        """Solicitud creada por el service (registra el evento CREADA)."""
+        solicitud = SolicitudService().crear_solicitud(
+            tipo_solicitud=tipo_solicitud,
+            solicitante=usuario_admin,
+            fecha_requerida=date.today() + timedelta(days=1),
+            motivo='Reposición',
+            area_solicitante='Administración',
+            titulo_actividad='Actividad',
+            objetivo_actividad='Objetivo',
+            bodega_origen=bodega
+        )
+        DetalleSolicitud.objects.create(solicitud=solicitud, articulo=articulos[0], cantidad_solicitada=Decimal('2'))
+        return solicitud
+
+    def test_secuencia_y_payload_por_evento(self, solicitud, usuario_admin):
+        """
+        GIVEN: Una solicitud creada
+        WHEN: Se aprueba y se despacha
+        THEN: Los eventos quedan numerados 1..3 con su payload tipado
+        """
+        service = SolicitudService()
+        service.aprobar_solicitudes([solicitud.id], usuario_admin, notas_aprobacion='vale')
+        service.despachar_solicitudes([solicitud.id], usuario_admin)
+
+        solicitud.refresh_from_db()
+        assert solicitud.secuencia_eventos == 3
+        assert list(solicitud.eventos.order_by('secuencia').values_list('secuencia', 'tipo', 'datos')) == [
+            (1, EventoSolicitud.TIPO_CREADA, {}),
+            (2, EventoSolicitud.TIPO_APROBADA, {'notas': 'vale'}),
+            (3, EventoSolicitud.TIPO_DESPACHADA, {}),
+        ]
+
+    def test_timeline_encadena_estados_y_usa_cache(self, solicitud, usuario_admin, django_assert_num_queries):
+        """
+        GIVEN: Una solicitud aprobada
+        WHEN: Se pide su timeline dos veces
+        THEN: Va del más reciente al más antiguo y la segunda lectura no consulta la base
+        """
+        SolicitudService().aprobar_solicitudes([solicitud.id], usuario_admin)
+        solicitud.refresh_from_db()
+
+        timeline = EventoSolicitudService().timeline(solicitud)
+
+        assert [evento['tipo'] for evento in timeline] == [EventoSolicitud.TIPO_APROBADA, EventoSolicitud.TIPO_CREADA]
+        assert timeline[0]['estado_anterior']['nombre'] == 'Pendiente'
+        assert timeline[0]['estado']['nombre'] == 'Aprobada'
+        with django_assert_num_queries(0):
+            EventoSolicitudService().timeline(solicitud)
+
+    def test_save_obsoleto_no_retrocede_secuencia(self, solicitud, usuario_admin):
+        """Guardar una instancia cargada antes de un evento no pisa secuencia_eventos."""
+        obsoleta = Solicitud.objects.get(pk=solicitud.pk)
+        SolicitudService().rechazar_solicitud(Solicitud.objects.get(pk=solicitud.pk), usuario_admin, 'Sin presupuesto')
+
+        obsoleta.motivo = 'Otro motivo'
+        obsoleta.save()
+
+        assert Solicitud.objects.get(pk=solicitud.pk).secuencia_eventos == 2
+
+    def test_payload_invalido(self, solicitud, usuario_admin):
+        """construir rechaza claves que no corresponden al tipo de evento."""
+        with pytest.raises(ValueError):
+            EventoSolicitudService.construir(
+                solicitud, EventoSolicitud.TIPO_APROBADA, solicitud.estado, usuario_admin, motivo='x'
+            )
+
+
+# ==================== TESTS DE SLA SOLICITUD SERVICE ====================
+
+@pytest.mark.django_db
+class TestSlaSolicitudService:
+    """Tests del índice de vencimientos y el barrido de solicitudes vencidas."""
+
+    @pytest.fixture
+    def solicitudes(self, crear_solicitud):
+        """Tres solicitudes pendientes requeridas para hoy, ya indexadas."""
+        solicitudes = [crear_solicitud(f'SOL-{numero}') for numero in range(1, 4)]
+        SlaSolicitudService().reconstruir()
+        return solicitudes
+
+    def test_reconstruir_indexa_abiertas(self, solicitudes):
+        """
+        GIVEN: Tres solicitudes abiertas con fecha requerida hoy
+        WHEN: Se reconstruye el índice
+        THEN: Quedan todas en riesgo y ninguna vencida
+        """
+        service = SlaSolicitudService()
+        hoy = date.today()
+
+        assert service.reconstruir() == 3
+        assert service.en_riesgo(hoy).count() == 3
+        assert service.vencidas(hoy).count() == 0
+
+    def test_barrer_notifica_una_sola_vez(self, solicitudes, usuario_admin):
+        """
+        GIVEN: Solicitudes cuya fecha requerida ya pasó
+        WHEN: Se barre dos veces
+        THEN: Se notifica cada vencimiento una vez y quedan en la lista de vencidas
+        """
+        service = SlaSolicitudService()
+        manana = date.today() + timedelta(days=1)
+
+        assert service.barrer(manana) == 3
+        assert service.barrer(manana) == 0
+        assert Notificacion.objects.filter(
+            usuario=usuario_admin, tipo=Notificacion.TIPO_SOLICITUD_VENCIDA
+        ).count() == 3
+        assert service.vencidas(manana).count() == 3
+
+    def test_reprogramar_reinicia_marca(self, solicitudes):
+        """Cambiar la fecha requerida de una vencida la desmarca y la reprograma."""
+        service = SlaSolicitudService()
+        service.barrer(date.today() + timedelta(days=1))
+        solicitud = solicitudes[0]
+        solicitud.fecha_requerida = date.today() + timedelta(days=10)
+
+        service.sincronizar([solicitud])
+
+        vencimiento = VencimientoSolicitud.objects.get(pk=solicitud.pk)
+        assert not vencimiento.vencida
+        assert vencimiento.fecha_requerida == solicitud.fecha_requerida
+
+    def test_workflow_y_eliminacion_mantienen_indice(self, solicitudes, usuario_admin):
+        """Despachar o eliminar saca la solicitud del índice; restaurarla la devuelve."""
+        ids = [solicitud.id for solicitud in solicitudes]
+        service = SolicitudService()
+        service.aprobar_solicitudes(ids, usuario_admin)
+        assert VencimientoSolicitud.objects.count() == 3
+
+        service.despachar_solicitudes(ids[:1], usuario_admin)
+        assert VencimientoSolicitud.objects.count() == 2
+
+        Solicitud.objects.filter(pk=ids[1]).eliminar_logicamente()
+        assert VencimientoSolicitud.objects.count() == 1
+        Solicitud.all_objects.filter(pk=ids[1]).restaurar()
+        assert VencimientoSolicitud.objects.count() == 2
+
+
+# ==================== TESTS DE JERARQUÍA ORGANIZACIONAL ====================
+
+@pytest.mark.django_db
+class TestJerarquiaOrganizacionalService:
+    """Tests de la caché de la jerarquía Departamento -> Área / Equipo."""
+
+    @pytest.fixture
+    def departamento(self):
+        """Departamento con un área, con la caché de jerarquía vacía."""
+        JerarquiaOrganizacionalService.invalidar_cache()
+        departamento = Departamento.objects.create(codigo='DEP-1', nombre='Finanzas')
+        Area.objects.create(codigo='AREA-1', nombre='Tesorería', departamento=departamento)
+        return departamento
+
+    def test_ruta_y_descendientes(self, departamento):
+        """Los nodos llevan su ruta materializada y el departamento sus descendientes."""
+        service = JerarquiaOrganizacionalService()
+        area = departamento.areas.get()
+
+        nodo = service.nodo(JerarquiaOrganizacionalService.TIPO_AREA, area.id)
+
+        assert nodo['ruta'] == f'/{departamento.id}/{area.id}/'
+        assert nodo['ruta_nombre'] == 'Finanzas / Tesorería'
+        assert service.ids_descendientes(departamento.id)['areas'] == frozenset({area.id})
+
+    def test_generacion_compartida_invalida_cache_de_otros_procesos(self, departamento):
+        """
+        GIVEN: La jerarquía cacheada en este proceso
+        WHEN: Otro proceso renombra el departamento e incrementa la generación compartida
+        THEN: La siguiente lectura ignora la entrada local y ve el cambio
+        """
+        service = JerarquiaOrganizacionalService()
+        service.nodo(JerarquiaOrganizacionalService.TIPO_DEPARTAMENTO, departamento.id)
+
+        # Cambio sin señales en este proceso: solo la generación compartida lo refleja
+        Departamento.objects.filter(pk=departamento.pk).update(nombre='Contabilidad')
+        incrementar_generacion(JerarquiaOrganizacionalService.GENERACION_CACHE)
+
+        nodo = service.nodo(JerarquiaOrganizacionalService.TIPO_DEPARTAMENTO, departamento.id)
+        assert nodo['nombre'] == 'Contabilidad'
+
+    def test_guardar_departamento_invalida_cache(self, departamento):
+        """Las señales invalidan la caché al renombrar un departamento."""
+        service = JerarquiaOrganizacionalService()
+        service.nodo(JerarquiaOrganizacionalService.TIPO_DEPARTAMENTO, departamento.id)
+
+        departamento.nombre = 'Contabilidad'
+        departamento.save()
+
+        nodo = service.nodo(JerarquiaOrganizacionalService.TIPO_DEPARTAMENTO, departamento.id)
+        assert nodo['nombre'] == 'Contabilidad'
@@ -22,6 +22,8 @@ urlpatterns = [
     path('<int:pk>/aprobar/', views.SolicitudAprobarView.as_view(), name='aprobar_solicitud'),
     path('<int:pk>/rechazar/', views.SolicitudRechazarView.as_view(), name='rechazar_solicitud'),
     path('<int:pk>/despachar/', views.SolicitudDespacharView.as_view(), name='despachar_solicitud'),
+    path('masivo/aprobar/', views.SolicitudAprobarMasivoView.as_view(), name='aprobar_solicitudes_masivo'),
+    path('masivo/despachar/', views.SolicitudDespacharMasivoView.as_view(), name='despachar_solicitudes_masivo'),
 
     # ==================== CREACIÓN DE SOLICITUDES ====================
     # Crear Solicitud de Bienes (tipo=ACTIVO)
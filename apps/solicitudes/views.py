@@ -10,13 +10,13 @@ Este archivo implementa todas las vistas usando CBVs siguiendo SOLID y DRY:
 - Workflow de aprobación y despacho
 """
 from typing import Any
-from django.db.models import QuerySet
+from django.db.models import Q, QuerySet
 from django.urls import reverse_lazy
 from django.shortcuts import redirect
 from django.contrib import messages
 from django.core.exceptions import ValidationError
 from django.views.generic import (
-    TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView
+    View, TemplateView, ListView, DetailView, CreateView, UpdateView, DeleteView
 )
 from core.mixins import (
     BaseAuditedViewMixin, AtomicTransactionMixin, SoftDeleteMixin,
@@ -27,13 +27,16 @@ from .models import Solicitud, TipoSolicitud, EstadoSolicitud, DetalleSolicitud,
 from .forms import (
     SolicitudForm, DetalleSolicitudArticuloFormSet, DetalleSolicitudActivoFormSet,
     AprobarSolicitudForm, DespacharSolicitudForm, RechazarSolicitudForm,
-    FiltroSolicitudesForm
+    AccionMasivaSolicitudForm, FiltroSolicitudesForm
 )
 from .repositories import (
     TipoSolicitudRepository, EstadoSolicitudRepository, SolicitudRepository,
     DetalleSolicitudRepository, HistorialSolicitudRepository
 )
-from .services import SolicitudService, DetalleSolicitudService
+from .services import (
+    SolicitudService, DetalleSolicitudService, EventoSolicitudService, JerarquiaOrganizacionalService,
+    SlaSolicitudService
+)
 from decimal import Decimal
 
 
@@ -91,7 +94,7 @@ class SolicitudListView(BaseAuditedViewMixin, PaginatedListMixin, FilteredListMi
     Vista para listar todas las solicitudes con filtros.
 
     Permisos: solicitudes.view_solicitud
-    Filtros: Estado, tipo, fechas, búsqueda
+    Filtros: Estado, tipo, departamento (con sus áreas y equipos), vencimiento, fechas, búsqueda
     """
     model = Solicitud
     template_name = 'solicitudes/lista_solicitudes.html'
@@ -105,33 +108,39 @@ class SolicitudListView(BaseAuditedViewMixin, PaginatedListMixin, FilteredListMi
         queryset = super().get_queryset().select_related(
             'tipo_solicitud', 'estado', 'solicitante', 'bodega_origen'
         )
+        return queryset.order_by('-fecha_solicitud')
 
-        # Aplicar filtros del formulario
-        form = self.filter_form_class(self.request.GET)
-        if form.is_valid():
-            data = form.cleaned_data
+    def apply_filters(self, queryset: QuerySet, data: dict) -> QuerySet:
+        """Aplica los filtros del formulario (FilteredListMixin)."""
+        if data.get('estado'):
+            queryset = queryset.filter(estado=data['estado'])
 
-            if data.get('estado'):
-                queryset = queryset.filter(estado=data['estado'])
+        if data.get('tipo'):
+            queryset = queryset.filter(tipo_solicitud=data['tipo'])
 
-            if data.get('tipo'):
-                queryset = queryset.filter(tipo_solicitud=data['tipo'])
+        if data.get('departamento'):
+            queryset = queryset.filter(
+                JerarquiaOrganizacionalService().filtro_departamento(data['departamento'].id)
+            )
 
-            if data.get('fecha_desde'):
-                queryset = queryset.filter(fecha_solicitud__gte=data['fecha_desde'])
+        if data.get('vencimiento'):
+            queryset = queryset.filter(SlaSolicitudService().filtro(data['vencimiento']))
 
-            if data.get('fecha_hasta'):
-                queryset = queryset.filter(fecha_solicitud__lte=data['fecha_hasta'])
+        if data.get('fecha_desde'):
+            queryset = queryset.filter(fecha_solicitud__gte=data['fecha_desde'])
 
-            if data.get('buscar'):
-                q = data['buscar']
-                queryset = queryset.filter(
-                    Q(numero__icontains=q) |
-                    Q(solicitante__username__icontains=q) |
-                    Q(area_solicitante__icontains=q)
-                )
+        if data.get('fecha_hasta'):
+            queryset = queryset.filter(fecha_solicitud__lte=data['fecha_hasta'])
 
-        return queryset.order_by('-fecha_solicitud')
+        if data.get('buscar'):
+            q = data['buscar']
+            queryset = queryset.filter(
+                Q(numero__icontains=q) |
+                Q(solicitante__username__icontains=q) |
+                Q(area_solicitante__icontains=q)
+            )
+
+        return queryset
 
     def get_context_data(self, **kwargs) -> dict:
         """Agrega datos adicionales al contexto."""
@@ -174,10 +183,8 @@ class SolicitudDetailView(BaseAuditedViewMixin, DetailView):
             'activo__categoria'
         ).order_by('id')
 
-        # Historial de cambios
-        context['historial'] = self.object.historial.select_related(
-            'estado_anterior', 'estado_nuevo', 'usuario'
-        )
+        # Historial de cambios (flujo de eventos materializado y cacheado)
+        context['historial'] = EventoSolicitudService().timeline(self.object)
 
         return context
 
@@ -373,6 +380,8 @@ class SolicitudUpdateView(BaseAuditedViewMixin, AtomicTransactionMixin, UpdateVi
         if formset.is_valid():
             form.save()
             formset.save()
+            if 'fecha_requerida' in form.changed_data:
+                SlaSolicitudService().sincronizar([form.instance])
 
             # Continuar con el flujo normal (mensaje y redirección)
             response = super().form_valid(form)
@@ -702,6 +711,76 @@ class SolicitudDespacharView(BaseAuditedViewMixin, AtomicTransactionMixin, Detai
         return self.render_to_response(self.get_context_data(form=form))
 
 
+class SolicitudAccionMasivaView(BaseAuditedViewMixin, View):
+    """
+    Vista base para aprobar o despachar en bloque las solicitudes seleccionadas.
+
+    Las subclases definen el método del service y los textos; la operación es
+    todo o nada: si alguna solicitud no es válida no se procesa ninguna.
+    """
+    http_method_names = ['post']
+    metodo_service: str = ''
+    verbo: str = ''
+    participio: str = ''
+
+    def post(self, request, *args, **kwargs):
+        """Procesa las solicitudes seleccionadas usando SolicitudService."""
+        form = AccionMasivaSolicitudForm(request.POST)
+        if not form.is_valid():
+            for errores in form.errors.values():
+                for error in errores:
+                    messages.error(request, error)
+            return redirect('solicitudes:lista_solicitudes')
+
+        try:
+            solicitudes = getattr(SolicitudService(), self.metodo_service)(
+                [solicitud.pk for solicitud in form.cleaned_data['solicitudes']],
+                request.user,
+                None,
+                form.cleaned_data['notas']
+            )
+        except ValidationError as e:
+            for error in e.messages:
+                messages.error(request, error)
+            return redirect('solicitudes:lista_solicitudes')
+
+        numeros = ', '.join(solicitud.numero for solicitud in solicitudes)
+        registrar_log_auditoria(
+            usuario=request.user,
+            accion_glosa=self.audit_action,
+            descripcion=f'{self.verbo} en bloque las solicitudes {numeros}',
+            request=request
+        )
+        messages.success(request, f'{len(solicitudes)} solicitud(es) {self.participio}: {numeros}.')
+        return redirect('solicitudes:lista_solicitudes')
+
+
+class SolicitudAprobarMasivoView(SolicitudAccionMasivaView):
+    """
+    Aprueba en bloque las solicitudes seleccionadas por la cantidad solicitada.
+
+    Permisos: solicitudes.aprobar_solicitud
+    """
+    permission_required = 'solicitudes.aprobar_solicitud'
+    audit_action = 'APROBAR'
+    metodo_service = 'aprobar_solicitudes'
+    verbo = 'Aprobó'
+    participio = 'aprobada(s)'
+
+
+class SolicitudDespacharMasivoView(SolicitudAccionMasivaView):
+    """
+    Despacha en bloque las solicitudes seleccionadas por la cantidad aprobada.
+
+    Permisos: solicitudes.despachar_solicitud
+    """
+    permission_required = 'solicitudes.despachar_solicitud'
+    audit_action = 'DESPACHAR'
+    metodo_service = 'despachar_solicitudes'
+    verbo = 'Despachó'
+    participio = 'despachada(s)'
+
+
 # ==================== VISTAS ESPECÍFICAS PARA ACTIVOS ====================
 
 class SolicitudActivoListView(SolicitudListView):
@@ -1,4 +1,4 @@
-from django.contrib import admin
+from django.contrib import admin, messages
 
 # Base admin genérico para modelos que heredan de BaseModel
 class BaseAdmin(admin.ModelAdmin):
@@ -14,3 +14,29 @@ class BaseAdmin(admin.ModelAdmin):
             obj.created_by = request.user
         obj.updated_by = request.user
         super().save_model(request, obj, form, change)
+
+
+class SoftDeleteAdminMixin:
+    """
+    Acciones masivas de eliminación lógica y restauración para modelos BaseModel.
+
+    Cada acción se resuelve con un único UPDATE sobre los registros seleccionados
+    y agrega el filtro 'eliminado' para poder ubicar los registros a restaurar.
+    """
+    actions = ['eliminar_logicamente', 'restaurar_eliminados']
+
+    def get_list_filter(self, request):
+        list_filter = list(super().get_list_filter(request))
+        if 'eliminado' not in list_filter:
+            list_filter.append('eliminado')
+        return list_filter
+
+    @admin.action(description='Marcar seleccionados como eliminados', permissions=['change'])
+    def eliminar_logicamente(self, request, queryset):
+        total = queryset.eliminar_logicamente()
+        self.message_user(request, f'{total} registro(s) marcados como eliminados.', messages.SUCCESS)
+
+    @admin.action(description='Restaurar seleccionados eliminados', permissions=['change'])
+    def restaurar_eliminados(self, request, queryset):
+        total = queryset.restaurar()
+        self.message_user(request, f'{total} registro(s) restaurados.', messages.SUCCESS)
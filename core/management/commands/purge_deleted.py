@@ -0,0 +1,137 @@
+"""
+Purga física de registros eliminados lógicamente (BaseModel).
+
+Borra por lotes los registros con eliminado=True cuya eliminación
+(fecha_actualizacion) supera la antigüedad indicada. Se conservan los
+registros referenciados por relaciones PROTECT/RESTRICT y los que tienen
+registros vigentes en relaciones CASCADE.
+
+Pensado para ejecutarse periódicamente (ej: cron semanal):
+    python manage.py purge_deleted --days 365
+"""
+from datetime import timedelta
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import ProtectedError, RestrictedError
+from django.utils import timezone
+
+from core.models import BaseModel
+
+
+class Command(BaseCommand):
+    help = 'Elimina físicamente, por lotes, los registros eliminados lógicamente hace más de N días'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help='Antigüedad mínima de la eliminación en días (default: 365)'
+        )
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='modelos',
+            help='Modelo a purgar como app_label.Modelo (repetible; default: todos los BaseModel)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Registros por lote de borrado (default: 500)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Solo informa cuántos registros se purgarían'
+        )
+
+    def handle(self, *args, **options):
+        if options['days'] < 0 or options['chunk_size'] < 1:
+            raise CommandError('--days debe ser >= 0 y --chunk-size mayor que cero.')
+
+        limite = timezone.now() - timedelta(days=options['days'])
+        total_borrados = 0
+        for modelo in self._obtener_modelos(options['modelos']):
+            eliminados = modelo.all_objects.filter(eliminado=True, fecha_actualizacion__lt=limite)
+            purgables = eliminados.purgables(limite)
+
+            if options['dry_run']:
+                cantidad = purgables.count()
+                protegidos = eliminados.count() - cantidad
+                if cantidad or protegidos:
+                    self.stdout.write(
+                        f'{modelo._meta.label}: {cantidad} a purgar, {protegidos} protegidos'
+                    )
+                continue
+
+            borrados, omitidos = self._purgar(modelo, purgables, options['chunk_size'])
+            total_borrados += borrados
+            if borrados or omitidos:
+                self.stdout.write(
+                    f'{modelo._meta.label}: {borrados} borrados, {omitidos} omitidos por referencias'
+                )
+
+        if not options['dry_run']:
+            self.stdout.write(self.style.SUCCESS(f'Purga finalizada: {total_borrados} registros borrados.'))
+
+    def _obtener_modelos(self, etiquetas):
+        """Modelos concretos que heredan de BaseModel, o los indicados con --model."""
+        if etiquetas:
+            try:
+                modelos = [apps.get_model(etiqueta) for etiqueta in etiquetas]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            no_validos = [m._meta.label for m in modelos if not issubclass(m, BaseModel)]
+            if no_validos:
+                raise CommandError(f'No heredan de BaseModel: {", ".join(no_validos)}')
+            return modelos
+
+        return [
+            modelo for modelo in apps.get_models()
+            if issubclass(modelo, BaseModel) and not modelo._meta.proxy
+        ]
+
+    def _purgar(self, modelo, purgables, tamano_lote):
+        """
+        Borra los registros purgables en lotes ordenados por PK.
+
+        Cada lote va en su propia transacción. Si un lote falla por una
+        referencia protegida indirecta (ej: en un registro en cascada), se
+        reintenta registro a registro y solo se omiten los bloqueados.
+
+        Returns:
+            Tupla (registros borrados del modelo, registros omitidos)
+        """
+        borrados = 0
+        omitidos = 0
+        ultimo_pk = None
+        while True:
+            lote = purgables.order_by('pk')
+            if ultimo_pk is not None:
+                lote = lote.filter(pk__gt=ultimo_pk)
+            ids = list(lote.values_list('pk', flat=True)[:tamano_lote])
+            if not ids:
+                break
+            ultimo_pk = ids[-1]
+
+            try:
+                borrados += self._borrar(modelo, ids)
+            except (ProtectedError, RestrictedError):
+                # Se reintenta fila a fila para omitir solo los registros bloqueados
+                for pk in ids:
+                    try:
+                        borrados += self._borrar(modelo, [pk])
+                    except (ProtectedError, RestrictedError):
+                        omitidos += 1
+
+        return borrados, omitidos
+
+    @staticmethod
+    def _borrar(modelo, ids):
+        """Borra los registros indicados en una transacción y retorna cuántos del modelo."""
+        with transaction.atomic():
+            _, por_modelo = modelo._base_manager.filter(pk__in=ids).delete()
+        return por_modelo.get(modelo._meta.label, 0)
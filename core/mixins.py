@@ -122,7 +122,7 @@ class SoftDeleteMixin:
     Mixin para implementar soft delete en lugar de eliminación física.
 
     En lugar de eliminar el registro de la base de datos, marca
-    el campo 'eliminado' como True.
+    el campo 'eliminado' como True mediante BaseModelQuerySet.eliminar_logicamente.
     """
     def delete(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         """
@@ -139,9 +139,8 @@ class SoftDeleteMixin:
             HttpResponse: Redirección a success_url
         """
         self.object = self.get_object()
-        self.object.eliminado = True
-        self.object.activo = False
-        self.object.save()
+        type(self.object).all_objects.filter(pk=self.object.pk).eliminar_logicamente()
+        self.object.refresh_from_db(fields=['eliminado', 'activo', 'fecha_actualizacion'])
 
         success_url: str = str(self.get_success_url())
 
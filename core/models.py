@@ -1,18 +1,171 @@
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
+from django.db.models import Exists, OuterRef
 from django.conf import settings
+from django.utils import timezone
+
+from core.signals import eliminacion_logica_masiva
 
 # Create your models here.
 
 
+def _tiene_eliminacion_logica(modelo) -> bool:
+    """Indica si el modelo tiene el campo booleano 'eliminado' de BaseModel."""
+    try:
+        return isinstance(modelo._meta.get_field('eliminado'), models.BooleanField)
+    except FieldDoesNotExist:
+        return False
+
+
+class BaseModelQuerySet(models.QuerySet):
+    """
+    QuerySet común para modelos que heredan de BaseModel.
+    """
+
+    def vigentes(self):
+        """Registros no eliminados (soft delete)."""
+        return self.filter(eliminado=False)
+
+    def activos(self):
+        """Registros activos y no eliminados."""
+        return self.filter(activo=True, eliminado=False)
+
+    def eliminados(self):
+        """Registros marcados como eliminados."""
+        return self.filter(eliminado=True)
+
+    def eliminar_logicamente(self) -> int:
+        """
+        Marca los registros como eliminados (eliminado=True, activo=False) con un único UPDATE.
+
+        El campo activo solo se modifica cuando es el booleano de BaseModel.
+
+        Returns:
+            Cantidad de registros eliminados
+        """
+        return self._marcar_eliminado(True)
+
+    def restaurar(self) -> int:
+        """
+        Restaura registros eliminados (eliminado=False, activo=True) con un único UPDATE.
+
+        Debe invocarse sobre all_objects, ya que objects no incluye eliminados.
+
+        Returns:
+            Cantidad de registros restaurados
+        """
+        return self._marcar_eliminado(False)
+
+    def _marcar_eliminado(self, eliminado: bool) -> int:
+        """
+        Cambia el estado de eliminación de los registros que aún no lo tienen.
+
+        fecha_actualizacion se fija explícitamente (update() no aplica auto_now)
+        y queda como fecha de eliminación para la purga física.
+        """
+        queryset = self.exclude(eliminado=eliminado)
+        valores = {
+            'eliminado': eliminado,
+            'fecha_actualizacion': timezone.now(),
+        }
+        # Algunos modelos redefinen 'activo' como FK (ej: DetalleSolicitud.activo)
+        if isinstance(self.model._meta.get_field('activo'), models.BooleanField):
+            valores['activo'] = not eliminado
+
+        if not eliminacion_logica_masiva.has_listeners(self.model):
+            return queryset.update(**valores)
+
+        ids = list(queryset.values_list('pk', flat=True))
+        if not ids:
+            return 0
+        total = self.model._base_manager.filter(pk__in=ids).update(**valores)
+        eliminacion_logica_masiva.send(sender=self.model, ids=ids, eliminado=eliminado)
+        return total
+
+    def sin_referencias_protegidas(self):
+        """
+        Excluye registros con referencias que impiden o desaconsejan borrarlos.
+
+        Se excluyen los referenciados por relaciones PROTECT o RESTRICT (la base
+        de datos no los dejaría borrar) y los que tienen registros vigentes
+        (eliminado=False) en relaciones CASCADE, que se borrarían junto con
+        ellos. Así se purga solo lo que ya no está en uso, sin que un registro
+        protegido aborte el lote completo.
+        """
+        queryset = self
+        for relacion in self.model._meta.get_fields(include_hidden=True):
+            if not (relacion.auto_created and not relacion.concrete
+                    and (relacion.one_to_many or relacion.one_to_one)):
+                continue
+            referencias = relacion.related_model._base_manager.filter(
+                **{relacion.field.name: OuterRef(relacion.field_name)}
+            )
+            if relacion.on_delete == models.CASCADE:
+                if not _tiene_eliminacion_logica(relacion.related_model):
+                    continue
+                referencias = referencias.filter(eliminado=False)
+            elif relacion.on_delete not in (models.PROTECT, models.RESTRICT):
+                continue
+            queryset = queryset.exclude(Exists(referencias))
+        return queryset
+
+    def purgables(self, antes_de: datetime):
+        """
+        Registros eliminados antes de una fecha que pueden borrarse físicamente.
+
+        Args:
+            antes_de: Fecha límite de eliminación (fecha_actualizacion)
+
+        Returns:
+            QuerySet de registros eliminados sin referencias protegidas
+        """
+        return self.filter(
+            eliminado=True,
+            fecha_actualizacion__lt=antes_de
+        ).sin_referencias_protegidas()
+
+
+class TodosManager(models.Manager.from_queryset(BaseModelQuerySet)):
+    """
+    Manager sin filtro: incluye los registros eliminados.
+
+    Es el manager por defecto de Django (admin, validación de unicidad,
+    relaciones inversas, dumpdata), por lo que estas operaciones siguen
+    viendo todas las filas de la tabla.
+    """
+
+
+class VigentesManager(models.Manager.from_queryset(BaseModelQuerySet)):
+    """
+    Manager de registros vigentes: excluye los eliminados (eliminado=False).
+
+    El filtro coincide con la condición de los índices parciales declarados
+    en los modelos, por lo que PostgreSQL puede resolver las consultas con ellos.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(eliminado=False)
+
+
 class BaseModel(models.Model):
     """
     Modelo base para auditoría - todos los modelos heredan de esta clase
+
+    Managers:
+        objects: Solo registros vigentes (eliminado=False)
+        all_objects: Todos los registros, incluidos los eliminados. Usar para
+            verificar unicidad de códigos/números o recuperar registros eliminados.
     """
     activo = models.BooleanField(default=True, verbose_name="Activo", help_text="Estado activo/inactivo del registro")
     eliminado = models.BooleanField(default=False, verbose_name="Eliminado", help_text="Estado eliminado/no eliminado del registro")
     fecha_creacion = models.DateTimeField(auto_now_add=True, verbose_name="Fecha de Creación", help_text="Fecha y hora de creación del registro")
     fecha_actualizacion = models.DateTimeField(auto_now=True, verbose_name="Fecha de Actualización", help_text="Fecha y hora de última actualización")
 
+    # all_objects se declara primero para que sea el _default_manager de Django
+    all_objects = TodosManager()
+    objects = VigentesManager()
+
     class Meta:
         abstract = True
-
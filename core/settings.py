@@ -63,6 +63,7 @@ INSTALLED_APPS = [
     'django.contrib.sites',
     
     # Apps del proyecto
+    'core',  # Modelo base y comandos de mantenimiento transversales
     'apps.accounts',  # Gestión de usuarios y permisos
     'apps.pages',    # Páginas del sistema
 
@@ -175,6 +176,17 @@ DATABASES = {
 DATABASE_ROUTERS = ['core.db_router.DatabaseRouter']
 
 
+# Caché
+# Las cachés en memoria de proceso (códigos de barras, jerarquía organizacional)
+# se invalidan entre workers mediante generaciones guardadas aquí. Con varios
+# procesos debe usarse un backend compartido, por ejemplo
+# DJANGO_CACHE_URL=dbcache://tba_cache (previo "manage.py createcachetable")
+# o rediscache://host:6379/1.
+CACHES = {
+    'default': env.cache('DJANGO_CACHE_URL', default='locmemcache://'),
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
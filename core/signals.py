@@ -0,0 +1,12 @@
+"""
+Señales del proyecto.
+
+eliminacion_logica_masiva: se emite tras eliminar o restaurar registros de
+BaseModel con un único UPDATE (que no dispara post_save). Argumentos:
+    sender: Modelo afectado
+    ids: Lista de PKs modificados
+    eliminado: True si se eliminaron, False si se restauraron
+"""
+from django.dispatch import Signal
+
+eliminacion_logica_masiva = Signal()
@@ -7,16 +7,32 @@ from .logging import registrar_log_auditoria
 from .http import get_client_ip
 from .business import (
     format_rut,
+    normalizar_rut,
     validar_rut,
+    procesar_ruts,
+    validar_ruts,
     truncar_texto,
     generar_codigo_unico,
 )
+from .importacion import leer_filas_archivo, parsear_decimal_planilla, validar_largo_planilla
+from .cache import CacheLRU, obtener_generacion, incrementar_generacion
+from .codigo_barras import dibujar_code128
 
 __all__ = [
     'registrar_log_auditoria',
     'get_client_ip',
     'format_rut',
+    'normalizar_rut',
     'validar_rut',
+    'procesar_ruts',
+    'validar_ruts',
     'truncar_texto',
     'generar_codigo_unico',
+    'leer_filas_archivo',
+    'parsear_decimal_planilla',
+    'validar_largo_planilla',
+    'CacheLRU',
+    'obtener_generacion',
+    'incrementar_generacion',
+    'dibujar_code128',
 ]
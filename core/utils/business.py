@@ -4,7 +4,7 @@ Utilidades de lógica de negocio reutilizables.
 Contiene funciones para validación de RUT, generación de códigos,
 formateo de texto y otras utilidades de negocio.
 """
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 import re
 
 
@@ -48,6 +48,69 @@ def format_rut(rut: str) -> str:
     return f'{numero_formateado}-{dv}'
 
 
+def normalizar_rut(rut: str) -> str:
+    """
+    Normaliza un RUT chileno a su forma canónica: número sin ceros a la izquierda + DV.
+
+    Es la representación usada para comparar y buscar RUTs por igualdad,
+    independiente del formato en que fueron ingresados.
+
+    Args:
+        rut: RUT con o sin formato (ej: '12.345.678-k', '012345678K')
+
+    Returns:
+        str: RUT normalizado (ej: '12345678K'), o '' si viene vacío
+
+    Example:
+        >>> normalizar_rut('12.345.678-k')
+        '12345678K'
+    """
+    rut_limpio: str = (rut or '').replace('.', '').replace('-', '').replace(' ', '').upper()
+    return rut_limpio.lstrip('0')
+
+
+def _construir_tabla_dv() -> List[List[int]]:
+    """
+    Precalcula el aporte al módulo 11 de cada grupo de 3 dígitos del RUT.
+
+    Los pesos (2..7, desde la derecha) se repiten cada 6 dígitos, por lo que
+    los grupos pares e impares de 3 dígitos tienen siempre los mismos pesos:
+    bastan dos tablas de 1000 entradas.
+    """
+    tablas = []
+    for desplazamiento in (0, 3):
+        pesos = [2 + (desplazamiento + posicion) % 6 for posicion in range(3)]
+        tablas.append([
+            (valor % 10 * pesos[0] + valor // 10 % 10 * pesos[1] + valor // 100 * pesos[2]) % 11
+            for valor in range(1000)
+        ])
+    return tablas
+
+
+_TABLA_DV: List[List[int]] = _construir_tabla_dv()
+# Dígito verificador según el resto de la suma ponderada (11 - resto, con 11 -> 0 y 10 -> K)
+_DV_POR_RESTO: str = '0K987654321'
+
+
+def calcular_dv_rut(numero: int) -> str:
+    """
+    Calcula el dígito verificador de un RUT (módulo 11) usando tablas precalculadas.
+
+    Procesa el número de a 3 dígitos en lugar de dígito a dígito.
+
+    Example:
+        >>> calcular_dv_rut(12345678)
+        '5'
+    """
+    suma: int = 0
+    grupo: int = 0
+    while numero:
+        suma += _TABLA_DV[grupo & 1][numero % 1000]
+        numero //= 1000
+        grupo += 1
+    return _DV_POR_RESTO[suma % 11]
+
+
 def validar_rut(rut: str) -> bool:
     """
     Valida un RUT chileno usando el algoritmo del módulo 11.
@@ -59,9 +122,9 @@ def validar_rut(rut: str) -> bool:
         bool: True si el RUT es válido, False en caso contrario
 
     Example:
-        >>> validar_rut('12.345.678-9')
+        >>> validar_rut('12.345.678-5')
         True
-        >>> validar_rut('12345678-9')
+        >>> validar_rut('12345678-5')
         True
         >>> validar_rut('12345678-0')
         False
@@ -80,28 +143,55 @@ def validar_rut(rut: str) -> bool:
     if not numero_str.isdigit():
         return False
 
-    # Calcular dígito verificador
-    numero: int = int(numero_str)
-    suma: int = 0
-    multiplicador: int = 2
+    return dv_ingresado == calcular_dv_rut(int(numero_str))
+
 
-    while numero > 0:
-        suma += (numero % 10) * multiplicador
-        numero //= 10
-        multiplicador += 1
-        if multiplicador > 7:
-            multiplicador = 2
+def procesar_ruts(ruts: Iterable[str]) -> List[Tuple[str, str, bool]]:
+    """
+    Normaliza, formatea y valida una lista de RUTs en una sola pasada.
 
-    resto: int = suma % 11
-    dv_calculado: str = str(11 - resto)
+    Pensado para importaciones masivas: cada RUT se limpia una vez y el
+    dígito verificador se obtiene con las tablas precalculadas de calcular_dv_rut.
 
-    # Casos especiales
-    if dv_calculado == '11':
-        dv_calculado = '0'
-    elif dv_calculado == '10':
-        dv_calculado = 'K'
+    Args:
+        ruts: RUTs con o sin formato
 
-    return dv_ingresado == dv_calculado
+    Returns:
+        Lista de tuplas (rut_normalizado, rut_formateado, es_valido), en el
+        mismo orden de entrada. Los RUTs inválidos conservan el formato de format_rut.
+
+    Example:
+        >>> procesar_ruts(['12345678-5', '1-1'])
+        [('123456785', '12.345.678-5', True), ('11', '1-1', False)]
+    """
+    resultados: List[Tuple[str, str, bool]] = []
+    for rut in ruts:
+        rut_limpio: str = (rut or '').replace('.', '').replace('-', '').replace(' ', '').upper()
+        numero_str: str = rut_limpio[:-1]
+        dv: str = rut_limpio[-1:]
+
+        if not numero_str.isdigit():
+            resultados.append((rut_limpio.lstrip('0'), format_rut(rut_limpio), False))
+            continue
+
+        numero: int = int(numero_str)
+        if numero_str[0] == '0':
+            # Ceros a la izquierda: se respeta el formato de format_rut
+            formateado = format_rut(rut_limpio)
+        else:
+            formateado = f'{numero:,}'.replace(',', '.') + f'-{dv}'
+        resultados.append((rut_limpio.lstrip('0'), formateado, calcular_dv_rut(numero) == dv))
+    return resultados
+
+
+def validar_ruts(ruts: Iterable[str]) -> List[bool]:
+    """
+    Valida una lista de RUTs (ver procesar_ruts).
+
+    Returns:
+        Lista de booleanos en el mismo orden de entrada
+    """
+    return [valido for _, _, valido in procesar_ruts(ruts)]
 
 
 def truncar_texto(texto: str, longitud: int = 100, sufijo: str = '...') -> str:
@@ -154,7 +244,7 @@ def generar_codigo_unico(
         'ART-000001'
     """
     # Buscar el último código con ese prefijo
-    ultimos = modelo.objects.filter(
+    ultimos = modelo._default_manager.filter(
         **{f'{campo}__startswith': f'{prefijo}-'}
     ).order_by(f'-{campo}')[:1]
 
@@ -199,6 +289,32 @@ def generar_codigo_con_anio(
         >>> codigo
         'OC-2025-000001'
     """
+    return generar_codigos_con_anio(prefijo, modelo, 1, campo, longitud)[0]
+
+
+def generar_codigos_con_anio(
+    prefijo: str,
+    modelo,
+    cantidad: int,
+    campo: str = 'numero',
+    longitud: int = 6
+) -> List[str]:
+    """
+    Genera varios códigos correlativos con prefijo y año actual en una sola consulta.
+
+    Pensado para creaciones masivas (bulk_create), donde generar los códigos
+    de a uno repetiría la búsqueda del último correlativo por cada registro.
+
+    Args:
+        prefijo: Prefijo del código (ej: 'OC', 'SOL', 'FAC')
+        modelo: Clase del modelo Django
+        cantidad: Cantidad de códigos a generar
+        campo: Nombre del campo que contiene el código (default: 'numero')
+        longitud: Longitud del número secuencial (default: 6)
+
+    Returns:
+        List[str]: Códigos consecutivos (ej: ['OC-2025-000001', 'OC-2025-000002'])
+    """
     from datetime import datetime
 
     # Obtener el año actual
@@ -206,21 +322,19 @@ def generar_codigo_con_anio(
 
     # Buscar el último código con ese prefijo y año
     patron_busqueda: str = f'{prefijo}-{anio_actual}-'
-    ultimos = modelo.objects.filter(
+    ultimo_codigo: Optional[str] = modelo._default_manager.filter(
         **{f'{campo}__startswith': patron_busqueda}
-    ).order_by(f'-{campo}')[:1]
+    ).order_by(f'-{campo}').values_list(campo, flat=True).first()
 
-    if ultimos.exists():
-        ultimo_codigo: str = getattr(ultimos[0], campo)
+    siguiente: int = 1
+    if ultimo_codigo:
         # Extraer el número del código (después del segundo guion)
         match = re.search(r'(\d+)$', ultimo_codigo)
         if match:
-            ultimo_numero: int = int(match.group(1))
-            nuevo_numero: int = ultimo_numero + 1
-        else:
-            nuevo_numero = 1
-    else:
-        nuevo_numero = 1
+            siguiente = int(match.group(1)) + 1
 
     # Formatear con ceros a la izquierda
-    return f'{prefijo}-{anio_actual}-{nuevo_numero:0{longitud}d}'
+    return [
+        f'{prefijo}-{anio_actual}-{numero:0{longitud}d}'
+        for numero in range(siguiente, siguiente + cantidad)
+    ]
@@ -0,0 +1,121 @@
+"""
+Caché en memoria de proceso con política LRU y generaciones compartidas.
+
+Pensada para búsquedas exactas muy frecuentes (por ejemplo, lecturas de
+códigos de barras) donde el costo de ir a la base de datos domina.
+
+Las cachés de proceso no se enteran de cambios hechos por otros workers.
+Para invalidarlas en todos ellos, las claves se prefijan con una generación
+guardada en la caché de Django (settings.CACHES): invalidar es incrementar
+la generación, y cada proceso deja de usar las entradas antiguas.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+
+
+def _clave_generacion(nombre: str) -> str:
+    return f'generacion:{nombre}'
+
+
+def obtener_generacion(nombre: str) -> int:
+    """
+    Retorna la generación vigente de un conjunto de datos cacheados.
+
+    Si la clave no existe (primer uso o expulsada por el backend) se inicia
+    con un valor basado en el reloj, para no reutilizar generaciones antiguas.
+
+    Args:
+        nombre: Identificador del conjunto (ej: 'escaneo_codigos_barras')
+
+    Returns:
+        Número de generación
+    """
+    clave = _clave_generacion(nombre)
+    generacion = cache.get(clave)
+    if generacion is None:
+        cache.add(clave, time.time_ns(), timeout=None)
+        generacion = cache.get(clave, 0)
+    return generacion
+
+
+def incrementar_generacion(nombre: str) -> int:
+    """
+    Invalida un conjunto de datos cacheados en todos los procesos.
+
+    Args:
+        nombre: Identificador del conjunto
+
+    Returns:
+        Nueva generación
+    """
+    clave = _clave_generacion(nombre)
+    try:
+        return cache.incr(clave)
+    except ValueError:
+        generacion = time.time_ns()
+        cache.set(clave, generacion, timeout=None)
+        return generacion
+
+
+class CacheLRU:
+    """
+    Caché LRU thread-safe con tamaño máximo y expiración opcional.
+
+    Attributes:
+        max_entradas: Cantidad máxima de claves almacenadas
+        ttl: Segundos de vigencia de cada entrada (None = sin expiración)
+    """
+
+    _AUSENTE = object()
+
+    def __init__(self, max_entradas: int = 10000, ttl: Optional[float] = None) -> None:
+        self.max_entradas = max_entradas
+        self.ttl = ttl
+        self._datos: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obtener_varios(self, claves: Iterable[Hashable]) -> Tuple[Dict[Hashable, Any], list]:
+        """
+        Busca varias claves a la vez.
+
+        Args:
+            claves: Claves a buscar
+
+        Returns:
+            Tupla (diccionario de aciertos, lista de claves no encontradas)
+        """
+        ahora = time.monotonic()
+        aciertos: Dict[Hashable, Any] = {}
+        faltantes = []
+        with self._lock:
+            for clave in claves:
+                entrada = self._datos.get(clave, self._AUSENTE)
+                if entrada is self._AUSENTE or (self.ttl is not None and ahora - entrada[0] > self.ttl):
+                    self._datos.pop(clave, None)
+                    faltantes.append(clave)
+                    continue
+                self._datos.move_to_end(clave)
+                aciertos[clave] = entrada[1]
+        return aciertos, faltantes
+
+    def guardar_varios(self, valores: Dict[Hashable, Any]) -> None:
+        """Guarda varias claves, descartando las menos usadas si se excede el máximo."""
+        ahora = time.monotonic()
+        with self._lock:
+            for clave, valor in valores.items():
+                self._datos[clave] = (ahora, valor)
+                self._datos.move_to_end(clave)
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+
+    def limpiar(self) -> None:
+        """Elimina todas las entradas."""
+        with self._lock:
+            self._datos.clear()
+
+    def __len__(self) -> int:
+        return len(self._datos)
@@ -0,0 +1,160 @@
+"""
+Utilidades para importación masiva desde planillas.
+
+Lee archivos CSV o XLSX fila a fila (streaming), normalizando los encabezados,
+para que los servicios de importación no materialicen el archivo completo.
+"""
+import csv
+import io
+from decimal import Decimal, InvalidOperation
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+
+FORMATOS_IMPORTACION = ('.csv', '.xlsx')
+
+
+def normalizar_encabezado(valor: Any) -> str:
+    """
+    Normaliza un encabezado de columna: minúsculas, sin espacios extremos y con '_'.
+
+    Example:
+        >>> normalizar_encabezado(' Stock Mínimo ')
+        'stock_mínimo'
+    """
+    return str(valor or '').strip().lower().replace(' ', '_')
+
+
+def _leer_csv(archivo: BinaryIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Lee un CSV (separador ',' o ';') retornando (número de fila, datos)."""
+    texto = io.TextIOWrapper(archivo, encoding='utf-8-sig', newline='')
+    muestra = texto.read(4096)
+    texto.seek(0)
+    try:
+        dialecto = csv.Sniffer().sniff(muestra, delimiters=',;')
+    except csv.Error:
+        dialecto = csv.excel
+
+    lector = csv.reader(texto, dialecto)
+    encabezados: Optional[List[str]] = None
+    for numero, valores in enumerate(lector, start=1):
+        if encabezados is None:
+            encabezados = [normalizar_encabezado(valor) for valor in valores]
+            continue
+        if not any(valor.strip() for valor in valores):
+            continue
+        yield numero, {
+            encabezado: valor.strip()
+            for encabezado, valor in zip(encabezados, valores)
+        }
+
+
+def _leer_xlsx(archivo: BinaryIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """Lee la primera hoja de un XLSX en modo read-only retornando (número de fila, datos)."""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValidationError(
+            'La importación de archivos XLSX requiere el paquete openpyxl. '
+            'Instálelo o exporte la planilla como CSV.'
+        )
+
+    libro = load_workbook(archivo, read_only=True, data_only=True)
+    try:
+        filas = libro.worksheets[0].iter_rows(values_only=True)
+        encabezados = [normalizar_encabezado(valor) for valor in next(filas, ())]
+        for numero, valores in enumerate(filas, start=2):
+            if not any(valor not in (None, '') for valor in valores):
+                continue
+            yield numero, {
+                encabezado: '' if valor is None else str(valor).strip()
+                for encabezado, valor in zip(encabezados, valores)
+            }
+    finally:
+        libro.close()
+
+
+def leer_filas_archivo(archivo: BinaryIO, nombre: str) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Recorre las filas de una planilla CSV o XLSX sin cargarla completa en memoria.
+
+    Args:
+        archivo: Archivo binario (ej: UploadedFile o archivo abierto en 'rb')
+        nombre: Nombre del archivo, usado para detectar el formato
+
+    Returns:
+        Iterador de tuplas (número de fila en la planilla, diccionario encabezado -> valor)
+
+    Raises:
+        ValidationError: Si el formato no es soportado
+    """
+    nombre = (nombre or '').lower()
+    if nombre.endswith('.csv'):
+        return _leer_csv(archivo)
+    if nombre.endswith('.xlsx'):
+        return _leer_xlsx(archivo)
+    raise ValidationError(
+        f'Formato no soportado. Use uno de: {", ".join(FORMATOS_IMPORTACION)}.'
+    )
+
+
+def parsear_decimal_planilla(valor: str, campo: models.DecimalField, etiqueta: str) -> Optional[Decimal]:
+    """
+    Convierte un valor de planilla a Decimal no negativo que quepa en el campo.
+
+    Acepta coma decimal y redondea a los decimales del campo. Rechaza NaN,
+    infinitos y números con más dígitos enteros que los permitidos por
+    max_digits, que de otro modo fallarían recién al insertar el lote.
+
+    Args:
+        valor: Texto de la celda
+        campo: Campo del modelo de destino (define max_digits y decimal_places)
+        etiqueta: Nombre del campo para los mensajes de error
+
+    Returns:
+        Decimal o None si la celda está vacía
+
+    Raises:
+        ValidationError: Si el valor no es un número válido para el campo
+    """
+    if not valor:
+        return None
+    try:
+        numero = Decimal(valor.replace(',', '.'))
+    except InvalidOperation:
+        raise ValidationError(f'{etiqueta} no es un número válido: "{valor}".')
+    if not numero.is_finite():
+        raise ValidationError(f'{etiqueta} no es un número válido: "{valor}".')
+    if numero < 0:
+        raise ValidationError(f'{etiqueta} no puede ser negativo.')
+
+    digitos_enteros = campo.max_digits - campo.decimal_places
+    if numero >= Decimal(10) ** digitos_enteros:
+        raise ValidationError(
+            f'{etiqueta} excede el máximo permitido ({digitos_enteros} dígitos enteros).'
+        )
+    return numero.quantize(Decimal(1).scaleb(-campo.decimal_places))
+
+
+def validar_largo_planilla(valor: str, campo: models.CharField, etiqueta: str) -> str:
+    """
+    Verifica que un texto de planilla no exceda el max_length del campo.
+
+    Args:
+        valor: Texto de la celda
+        campo: Campo del modelo de destino
+        etiqueta: Nombre del campo para los mensajes de error
+
+    Returns:
+        El mismo valor
+
+    Raises:
+        ValidationError: Si el texto es más largo que lo permitido
+    """
+    if campo.max_length and len(valor) > campo.max_length:
+        raise ValidationError(
+            f'{etiqueta} excede el largo máximo de {campo.max_length} caracteres.'
+        )
+    return valor